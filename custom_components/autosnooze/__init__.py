@@ -7,19 +7,20 @@ from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import label_registry as lr
-from homeassistant.helpers.storage import Store
 
 from .application.setup import async_setup_integration_entry
 from .application.notifications import notify_started, send_pre_resume_notification
-from .application.resume import async_resume
-from .application.scheduled import async_execute_scheduled_disable
+from .application.resume import async_resume, async_resume_batch
+from .application.scheduled import async_execute_scheduled_disable, async_execute_scheduled_disable_batch
 from .const import (
     DOMAIN,
     LABEL_CONFIRM_CONFIG,
     LABEL_EXCLUDE_CONFIG,
     LABEL_INCLUDE_CONFIG,
+    OPTION_STORAGE_BACKEND,
+    OPTION_STRICT_SERVICE_CALLS,
     PLATFORMS,
-    STORAGE_VERSION,
+    STORAGE_BACKEND_SNAPSHOT,
     VERSION,
 )
 from .infrastructure import frontend as _frontend_resource_adapter
@@ -30,10 +31,21 @@ from .infrastructure.frontend import (
     _async_register_static_path,
     _async_retry_or_fail,
 )
-from .runtime.state import AutomationPauseConfigEntry, AutomationPauseData
+from .infrastructure.automation_catalog_cache import AutomationCatalogCache
+from .infrastructure.guardrail_cache import GuardrailCache
+from .infrastructure.registry_index import AutomationRegistryIndex
+from .infrastructure.resume_preset_cache import ResumePresetCache
+from .infrastructure.storage import create_store
+from .runtime.state import AutomationPauseConfigEntry, AutomationPauseData, ServiceCallStats
 from .runtime import ports as runtime_ports
-from .runtime.restore import RestoreCallbacks, async_load_stored as runtime_async_load_stored
+from .runtime.restore import (
+    RestoreCallbacks,
+    async_load_stored as runtime_async_load_stored,
+    async_preload_stored,
+)
+from .runtime.timers import cancel_all_timers
 from .services import register_services, unregister_services
+from .websocket_api import register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 asyncio = _frontend_resource_adapter.asyncio
@@ -45,12 +57,20 @@ async def async_load_stored(hass: HomeAssistant, data: AutomationPauseData) -> N
         hass,
         data,
         RestoreCallbacks(
-            set_automation_state=runtime_ports.async_set_automation_state,
+            set_automation_states=runtime_ports.async_set_automation_states_bulk,
             schedule_resume=lambda hass, data, entity_id, resume_at: runtime_ports.schedule_resume(
-                hass, data, entity_id, resume_at, resume_callback=async_resume
+                hass, data, entity_id, resume_at, resume_callback=async_resume, resume_batch_callback=async_resume_batch
+            ),
+            schedule_cohort_resume=lambda hass, data, cohort: runtime_ports.schedule_cohort_resume(
+                hass, data, cohort, resume_callback=async_resume, resume_batch_callback=async_resume_batch
             ),
             schedule_disable=lambda hass, data, entity_id, scheduled: runtime_ports.schedule_disable(
-                hass, data, entity_id, scheduled, disable_callback=async_execute_scheduled_disable
+                hass,
+                data,
+                entity_id,
+                scheduled,
+                disable_callback=async_execute_scheduled_disable,
+                disable_batch_callback=async_execute_scheduled_disable_batch,
             ),
             schedule_pre_resume_notification=lambda hass, data, paused: runtime_ports.schedule_pre_resume_notification(
                 hass, data, paused, notification_callback=send_pre_resume_notification
@@ -111,10 +131,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: AutomationPauseConfigEnt
         ensure_labels_exist=_async_ensure_labels_exist,
         load_stored=async_load_stored,
         register_services=register_services,
-        storage_factory=lambda: Store[dict[str, Any]](hass, STORAGE_VERSION, f"{DOMAIN}.storage"),
+        storage_factory=lambda: create_store(hass, entry.options.get(OPTION_STORAGE_BACKEND, STORAGE_BACKEND_SNAPSHOT)),
         platforms=PLATFORMS,
         update_listener=_async_options_update_listener,
-        data_factory=lambda store, runtime_hass: AutomationPauseData(store=store, hass=runtime_hass),
+        data_factory=lambda store, runtime_hass: AutomationPauseData(
+            store=store,
+            hass=runtime_hass,
+            service_call_stats=ServiceCallStats(strict=entry.options.get(OPTION_STRICT_SERVICE_CALLS, False)),
+        ),
+        flush_saves=runtime_ports.async_flush_saves,
+        preload_stored=async_preload_stored,
+        registry_index_factory=AutomationRegistryIndex,
+        guardrail_cache_factory=GuardrailCache,
+        resume_preset_cache_factory=ResumePresetCache,
+        register_websocket_commands=register_websocket_commands,
+        automation_catalog_cache_factory=AutomationCatalogCache,
     )
 
 
@@ -136,22 +167,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: AutomationPauseConfigEn
             data.startup_listener_unsub()
             data.startup_listener_unsub = None
 
-        # Cancel all timers
-        for unsub in data.timers.values():
-            unsub()
-        data.timers.clear()
-
-        # Cancel all scheduled timers
-        for unsub in data.scheduled_timers.values():
-            unsub()
-        data.scheduled_timers.clear()
+        # Cancel all resume, scheduled-disable and pre-resume notification
+        # deadlines along with the shared scheduler timer
+        cancel_all_timers(data)
 
-        # Cancel all pre-resume notification timers
-        for unsub in data.notification_timers.values():
-            unsub()
-        data.notification_timers.clear()
+        # Write any coalesced saves still waiting for their commit window,
+        # then release the store's connection
+        await runtime_ports.async_flush_saves(data)
+        await runtime_ports.async_close_store(data)
 
-        # Clear all listeners to prevent orphaned callbacks
+        # Drop any coalesced notification and clear all listeners to
+        # prevent orphaned callbacks
+        data.flush_notify()
         data.listeners.clear()
 
         if data.telemetry is not None:
@@ -16,10 +16,11 @@ from ..domain.notifications import notification_window_supports_lead
 from ..infrastructure.telemetry import track_if_enabled
 from ..logging_utils import _log_command, _raise_save_failed
 from ..models import PausedAutomation
-from ..runtime.ports import async_save, schedule_pre_resume_notification, schedule_resume
+from ..runtime.cohorts import covered_cohorts
+from ..runtime.ports import async_save, schedule_cohort_resume, schedule_pre_resume_notification, schedule_resume
 from ..runtime.state import AutomationPauseData
 from .notifications import send_pre_resume_notification
-from .resume import async_resume
+from .resume import async_resume, async_resume_batch
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,13 +73,33 @@ async def async_adjust_snooze_batch(
 
                 updates.append((entity_id, paused, new_resume_at))
 
-            for entity_id, paused, new_resume_at in updates:
-                paused.resume_at = new_resume_at
-                paused.days = 0
-                paused.hours = 0
-                paused.minutes = 0
+            # A cohort adjusted as a whole keeps its members and moves its one
+            # deadline; members adjusted on their own leave their cohort.
+            cohorts = covered_cohorts(data, [entity_id for entity_id, _paused, _resume_at in updates])
+            for cohort in cohorts:
+                cohort.resume_at += delta
+                cohort.days = cohort.hours = cohort.minutes = 0
+                schedule_cohort_resume(
+                    hass, data, cohort, resume_callback=async_resume, resume_batch_callback=async_resume_batch
+                )
+            adjusted_cohorts = {cohort.cohort_id: cohort for cohort in cohorts}
 
-                schedule_resume(hass, data, entity_id, new_resume_at, resume_callback=async_resume)
+            for entity_id, paused, new_resume_at in updates:
+                if (cohort := adjusted_cohorts.get(paused.cohort_id or "")) is not None:
+                    cohort.mirror(paused)
+                else:
+                    paused.resume_at = new_resume_at
+                    paused.days = 0
+                    paused.hours = 0
+                    paused.minutes = 0
+                    schedule_resume(
+                        hass,
+                        data,
+                        entity_id,
+                        new_resume_at,
+                        resume_callback=async_resume,
+                        resume_batch_callback=async_resume_batch,
+                    )
                 pre_resume_targets.append(paused)
 
         for paused in pre_resume_targets:
@@ -100,7 +121,7 @@ async def async_adjust_snooze_batch(
                         },
                         source="service",
                     )
-        data.notify()
+        data.notify(entity_ids)
         _LOGGER.info("Adjusted snooze for %d automations", len(entity_ids))
     except Exception:
         outcome = "error"
@@ -0,0 +1,87 @@
+"""Automation catalog read path for the dashboard card."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.const import ATTR_FRIENDLY_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import label_registry as lr
+from homeassistant.helpers.json import json_bytes
+
+from ..const import LABEL_EXCLUDE_NAME, LABEL_INCLUDE_NAME
+from ..infrastructure.guardrail_cache import GuardrailCache
+from ..runtime.state import AutomationPauseData
+from .pause import classify_guardrails
+
+
+def _label_ids_named(labels_by_id: Mapping[str, Any], name: str) -> set[str]:
+    """Return label ids whose name matches, ignoring case as the card does."""
+    return {name} | {
+        label_id for label_id, label in labels_by_id.items() if (getattr(label, "name", None) or "").lower() == name
+    }
+
+
+def build_automation_catalog(
+    hass: HomeAssistant, guardrail_cache: GuardrailCache | None = None
+) -> list[dict[str, Any]]:
+    """Return every automation with its registry metadata and guardrail flags, sorted by name."""
+    label_reg = lr.async_get(hass)
+    labels_by_id = label_reg.labels if label_reg is not None else {}
+    include_ids = _label_ids_named(labels_by_id, LABEL_INCLUDE_NAME)
+    exclude_ids = _label_ids_named(labels_by_id, LABEL_EXCLUDE_NAME)
+    entity_reg = er.async_get(hass)
+    states = hass.states.async_all("automation")
+    friendly_names = {state.entity_id: state.attributes.get(ATTR_FRIENDLY_NAME) or "" for state in states}
+    guardrails = classify_guardrails(hass, friendly_names, guardrail_cache)
+
+    automations: list[dict[str, Any]] = []
+    for state in states:
+        entity_id = state.entity_id
+        friendly_name = friendly_names[entity_id]
+        entry = entity_reg.async_get(entity_id)
+        labels = sorted(entry.labels) if entry is not None else []
+        automations.append(
+            {
+                "id": entity_id,
+                "name": friendly_name or state.object_id,
+                "area_id": entry.area_id if entry is not None else None,
+                "category_id": entry.categories.get("automation") if entry is not None else None,
+                "labels": labels,
+                "include": not include_ids.isdisjoint(labels),
+                "exclude": not exclude_ids.isdisjoint(labels),
+                "confirm": guardrails[entity_id].confirm,
+                "critical": guardrails[entity_id].critical,
+            }
+        )
+    automations.sort(key=lambda automation: (automation["name"].casefold(), automation["id"]))
+    return automations
+
+
+def get_automation_catalog(hass: HomeAssistant, data: AutomationPauseData) -> tuple[str, list[dict[str, Any]]]:
+    """Return the catalog version and automations, building them when the cache is stale.
+
+    The version is a digest of the catalog, so it stays the same across
+    rebuilds and restarts until an entry actually changes.
+    """
+    cache = data.automation_catalog_cache
+    if cache is not None and (cached := cache.get()) is not None:
+        return cached
+    automations = build_automation_catalog(hass, data.guardrail_cache)
+    version = hashlib.sha256(json_bytes(automations)).hexdigest()[:16]
+    if cache is not None:
+        cache.set(version, automations)
+    return version, automations
+
+
+def automation_catalog_response(
+    hass: HomeAssistant, data: AutomationPauseData, if_version: str | None = None
+) -> dict[str, Any]:
+    """Return the catalog, or only its version when the caller already has it."""
+    version, automations = get_automation_catalog(hass, data)
+    if if_version == version:
+        return {"version": version, "not_modified": True}
+    return {"version": version, "not_modified": False, "automations": automations}
@@ -4,15 +4,18 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import replace
 from datetime import datetime, time, timedelta
 import logging
 import re
 from time import perf_counter
 from typing import Any
 
-from homeassistant.const import ATTR_ENTITY_ID, STATE_ON, SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.components.automation import automations_with_device
+from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON, SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
 from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import label_registry as lr
 from homeassistant.helpers.sun import get_astral_event_next
@@ -27,6 +30,7 @@ from ..const import (
     RESUME_PRESET_NEXT_MORNING,
     RESUME_PRESET_NEXT_SUNRISE,
     RESUME_PRESET_NEXT_SUNSET,
+    RESUME_PRESET_VALUES,
 )
 from ..domain.notifications import (
     NOTIFICATION_TRIGGER_NONE,
@@ -34,6 +38,15 @@ from ..domain.notifications import (
     NotificationTrigger,
     notification_window_supports_lead,
 )
+from ..infrastructure.guardrail_cache import GuardrailCache, GuardrailFlags
+from ..infrastructure.registry_index import (
+    INDEX_AREA,
+    INDEX_DEVICE,
+    INDEX_FLOOR,
+    INDEX_LABEL,
+    AutomationRegistryIndex,
+)
+from ..infrastructure.resume_preset_cache import ResumePresetCache
 from ..infrastructure.telemetry import (
     input_method_from_call,
     resolve_pause_strategy,
@@ -42,10 +55,12 @@ from ..infrastructure.telemetry import (
 )
 from ..logging_utils import _log_command, _raise_save_failed
 from ..models import PausedAutomation, ScheduledSnooze, ensure_utc_aware
+from ..runtime import ports as runtime_ports
+from ..runtime.cohorts import form_cohort
 from ..runtime.ports import (
     async_save as runtime_async_save,
-    async_set_automation_state,
     get_friendly_name,
+    schedule_cohort_resume,
     schedule_disable,
     schedule_pre_resume_notification,
     schedule_resume,
@@ -57,8 +72,8 @@ from ..runtime.timers import (
 )
 from ..runtime.state import AutomationPauseData
 from .notifications import notify_started, send_pre_resume_notification
-from .resume import async_resume
-from .scheduled import async_execute_scheduled_disable
+from .resume import async_resume, async_resume_batch
+from .scheduled import async_execute_scheduled_disable, async_execute_scheduled_disable_batch
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,6 +85,38 @@ type ScheduleDisable = Callable[[HomeAssistant, AutomationPauseData, str, Schedu
 type SchedulePreResumeNotification = Callable[[HomeAssistant, AutomationPauseData, PausedAutomation], bool]
 
 
+def _log_phase(phase: str, count: int, started_at: float) -> None:
+    _LOGGER.debug("Pause %s phase for %d automations took %.1fms", phase, count, (perf_counter() - started_at) * 1000)
+
+
+# Fields a re-pause may change on an active snooze; paused_at, the friendly
+# name and, unless given explicitly, disable_at carry over from the original.
+# paused_at is kept even when the duration changes: the automation has been
+# off since then, and paused_at records when the snooze began, not when it
+# was last changed.
+_EXTENDABLE_FIELDS = (
+    "resume_at",
+    "days",
+    "hours",
+    "minutes",
+    "disable_at",
+    "notification_trigger",
+    "notification_lead_minutes",
+    "resume_retries",
+)
+
+
+def _changed_fields(current: PausedAutomation, updated: PausedAutomation) -> list[str]:
+    return [name for name in _EXTENDABLE_FIELDS if getattr(current, name) != getattr(updated, name)]
+
+
+def _pause_response(call: ServiceCall, extended: dict[str, list[str]]) -> ServiceResponse:
+    """Report the fields each in-place re-pause changed, if the caller asked for a response."""
+    if not call.return_response:
+        return None
+    return {"extended": {entity_id: list(changed) for entity_id, changed in extended.items()}}
+
+
 def _get_automations_by_filter(
     hass: HomeAssistant,
     filter_fn: Callable[[Any], bool],
@@ -83,61 +130,118 @@ def _get_automations_by_filter(
     ]
 
 
-def get_automations_by_area(hass: HomeAssistant, area_ids: list[str]) -> list[str]:
+def get_automations_by_area(
+    hass: HomeAssistant, area_ids: list[str], index: AutomationRegistryIndex | None = None
+) -> list[str]:
     """Get all automation entity IDs in the specified areas."""
+    if index is not None:
+        return index.lookup(INDEX_AREA, area_ids)
     return _get_automations_by_filter(hass, lambda entity: entity.area_id in area_ids)
 
 
-def get_automations_by_label(hass: HomeAssistant, label_ids: list[str]) -> list[str]:
+def get_automations_by_label(
+    hass: HomeAssistant, label_ids: list[str], index: AutomationRegistryIndex | None = None
+) -> list[str]:
     """Get all automation entity IDs with the specified labels."""
+    if index is not None:
+        return index.lookup(INDEX_LABEL, label_ids)
     return _get_automations_by_filter(
         hass,
         lambda entity: entity.labels and any(label in label_ids for label in entity.labels),
     )
 
 
-def _entity_has_label_name(
-    entity: Any,
-    label_name: str,
-    labels_by_id: Mapping[str, Any],
-) -> bool:
-    """Check whether entity has a label by id or name."""
-    labels = entity.labels or set()
-    for label_id in labels:
-        if label_id == label_name:
-            return True
-        label = labels_by_id.get(label_id)
-        if label and getattr(label, "name", None) == label_name:
-            return True
-    return False
+def get_automations_by_device(
+    hass: HomeAssistant, device_ids: list[str], index: AutomationRegistryIndex | None = None
+) -> list[str]:
+    """Get all automation entity IDs belonging to or referencing the specified devices."""
+    if index is not None:
+        return index.lookup(INDEX_DEVICE, device_ids)
+    referencing = {entity_id for device_id in device_ids for entity_id in automations_with_device(hass, device_id)}
+    return _get_automations_by_filter(
+        hass, lambda entity: entity.device_id in device_ids or entity.entity_id in referencing
+    )
+
+
+def get_automations_by_floor(
+    hass: HomeAssistant, floor_ids: list[str], index: AutomationRegistryIndex | None = None
+) -> list[str]:
+    """Get all automation entity IDs in areas on the specified floors."""
+    if index is not None:
+        return index.lookup(INDEX_FLOOR, floor_ids)
+    area_ids = {area.id for area in ar.async_get(hass).async_list_areas() if area.floor_id in floor_ids}
+    return _get_automations_by_filter(hass, lambda entity: entity.area_id in area_ids)
+
 
+_CRITICAL_TERMS_PATTERN = re.compile(
+    r"(?<![a-z0-9])(?:" + "|".join(re.escape(term.lower()) for term in CRITICAL_AUTOMATION_TERMS) + r")(?![a-z0-9])"
+)
 
-def _contains_guardrail_term(text: str, term: str) -> bool:
-    """Check whether a term appears as a token or phrase in text."""
-    escaped = re.escape(term.lower())
-    return re.search(rf"(?<![a-z0-9]){escaped}(?![a-z0-9])", text.lower()) is not None
+
+def _confirm_label_ids(labels_by_id: Mapping[str, Any]) -> set[str]:
+    """Return label ids that mark an automation as needing confirmation."""
+    label_ids = {LABEL_CONFIRM_NAME}
+    label_ids.update(
+        label_id for label_id, label in labels_by_id.items() if getattr(label, "name", None) == LABEL_CONFIRM_NAME
+    )
+    return label_ids
 
 
 def _is_critical_automation(entity_id: str, friendly_name: str) -> bool:
     """Detect whether automation appears to control critical infrastructure."""
-    targets = [entity_id, friendly_name]
-    return any(_contains_guardrail_term(target, term) for target in targets for term in CRITICAL_AUTOMATION_TERMS)
+    return (
+        _CRITICAL_TERMS_PATTERN.search(entity_id.lower()) is not None
+        or _CRITICAL_TERMS_PATTERN.search(friendly_name.lower()) is not None
+    )
 
 
-def validate_guardrails(hass: HomeAssistant, entity_ids: list[str], confirm: bool = False) -> None:
-    """Validate confirm label guardrails for pause operations."""
-    entity_reg = er.async_get(hass)
-    label_reg = lr.async_get(hass)
-    labels_by_id = label_reg.labels if label_reg is not None else {}
-    requires_confirm: list[str] = []
+def classify_guardrails(
+    hass: HomeAssistant,
+    friendly_names: Mapping[str, str],
+    cache: GuardrailCache | None = None,
+) -> dict[str, GuardrailFlags]:
+    """Return the guardrail flags of each automation in friendly_names, keyed by entity id.
+
+    Flags are read from cache when it has them for the current friendly name.
+    Confirm label ids are resolved once, and only when some automation
+    misses the cache.
+    """
+    confirm_label_ids: set[str] | None = None
+    flags: dict[str, GuardrailFlags] = {}
+
+    for entity_id, friendly_name in friendly_names.items():
+        entity_flags = cache.get(entity_id, friendly_name) if cache is not None else None
+        if entity_flags is None:
+            if confirm_label_ids is None:
+                label_reg = lr.async_get(hass)
+                confirm_label_ids = _confirm_label_ids(label_reg.labels if label_reg is not None else {})
+            entry = er.async_get(hass).async_get(entity_id)
+            entity_flags = GuardrailFlags(
+                confirm=entry is not None and not confirm_label_ids.isdisjoint(entry.labels or ()),
+                critical=_is_critical_automation(entity_id, friendly_name),
+            )
+            if cache is not None:
+                cache.set(entity_id, friendly_name, entity_flags)
+        flags[entity_id] = entity_flags
+    return flags
 
+
+def validate_guardrails(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    confirm: bool = False,
+    cache: GuardrailCache | None = None,
+) -> None:
+    """Validate confirm label guardrails for pause operations."""
+    friendly_names: dict[str, str] = {}
     for entity_id in entity_ids:
-        entry = entity_reg.async_get(entity_id)
         state = hass.states.get(entity_id)
-        friendly_name = state.attributes.get("friendly_name", "") if state is not None else ""
-        has_confirm_label = entry is not None and _entity_has_label_name(entry, LABEL_CONFIRM_NAME, labels_by_id)
-        if has_confirm_label or _is_critical_automation(entity_id, friendly_name):
-            requires_confirm.append(entity_id)
+        friendly_names[entity_id] = state.attributes.get("friendly_name", "") if state is not None else ""
+    requires_confirm = [
+        entity_id
+        for entity_id, flags in classify_guardrails(hass, friendly_names, cache).items()
+        if flags.requires_confirm
+    ]
 
     if requires_confirm and not confirm:
         raise ServiceValidationError(
@@ -169,25 +273,7 @@ def next_local_time_occurrence(target: time, now_local: datetime | None = None)
     return dt_util.as_utc(candidate)
 
 
-def resolve_resume_at(hass: HomeAssistant, call_data: Mapping[str, Any]) -> datetime | None:
-    """Resolve the resume strategy of a pause call to an absolute UTC datetime.
-
-    Handles resume_at (already-rendered datetime; Home Assistant owns Jinja
-    rendering, so templated values arrive here as plain datetimes),
-    resume_at_time (next occurrence of a local time), and resume_preset.
-    Returns None when the call uses duration fields instead.
-    """
-    resume_at = ensure_utc_aware(call_data.get("resume_at"))
-    if resume_at is not None:
-        return resume_at
-
-    resume_at_time = call_data.get("resume_at_time")
-    if resume_at_time is not None:
-        return next_local_time_occurrence(resume_at_time)
-
-    preset = call_data.get("resume_preset")
-    if preset is None:
-        return None
+def _resolve_preset(hass: HomeAssistant, preset: str) -> datetime:
     if preset == RESUME_PRESET_END_OF_DAY:
         next_local_midnight = dt_util.start_of_local_day(dt_util.now().date() + timedelta(days=1))
         return dt_util.as_utc(next_local_midnight)
@@ -207,6 +293,53 @@ def resolve_resume_at(hass: HomeAssistant, call_data: Mapping[str, Any]) -> date
     )
 
 
+def _cached_target(cache: ResumePresetCache | None, key: Any, resolve: Callable[[], datetime]) -> datetime:
+    if cache is None:
+        return resolve()
+    now = dt_util.utcnow()
+    target = cache.get(key, now)
+    if target is None:
+        target = resolve()
+        cache.set(key, now, target)
+    return target
+
+
+def resolve_resume_at(
+    hass: HomeAssistant,
+    call_data: Mapping[str, Any],
+    cache: ResumePresetCache | None = None,
+) -> datetime | None:
+    """Resolve the resume strategy of a pause call to an absolute UTC datetime.
+
+    Handles resume_at (already-rendered datetime; Home Assistant owns Jinja
+    rendering, so templated values arrive here as plain datetimes),
+    resume_at_time (next occurrence of a local time), and resume_preset.
+    Returns None when the call uses duration fields instead.
+    """
+    resume_at = ensure_utc_aware(call_data.get("resume_at"))
+    if resume_at is not None:
+        return resume_at
+
+    resume_at_time = call_data.get("resume_at_time")
+    if resume_at_time is not None:
+        return _cached_target(
+            cache, ("resume_at_time", resume_at_time), lambda: next_local_time_occurrence(resume_at_time)
+        )
+
+    preset = call_data.get("resume_preset")
+    if preset is None:
+        return None
+    return _cached_target(cache, preset, lambda: _resolve_preset(hass, preset))
+
+
+def resolve_resume_presets(hass: HomeAssistant, cache: ResumePresetCache | None = None) -> dict[str, datetime]:
+    """Resolve every resume preset to its current UTC target."""
+    return {
+        preset: _cached_target(cache, preset, lambda preset=preset: _resolve_preset(hass, preset))
+        for preset in RESUME_PRESET_VALUES
+    }
+
+
 async def async_pause_automations(
     hass: HomeAssistant,
     data: AutomationPauseData,
@@ -226,21 +359,28 @@ async def async_pause_automations(
     schedule_disable_callback: ScheduleDisable | None = None,
     schedule_pre_resume_notification_callback: SchedulePreResumeNotification | None = None,
     service_call: ServiceCall | None = None,
-) -> None:
-    """Pause automations with duration or dates."""
-    set_state = set_automation_state or (
-        lambda hass, entity_id, enabled: async_set_automation_state(hass, entity_id, enabled=enabled)
-    )
+) -> dict[str, list[str]]:
+    """Pause automations with duration or dates.
+
+    Returns the fields that changed on each snooze that was extended in
+    place, keyed by entity id; a re-pause that changed nothing maps to an
+    empty list.
+    """
     save_runtime_data = save_data or runtime_async_save
     notify_started_callback = notify_started_automations or notify_started
     resume_scheduler = schedule_resume_callback or (
         lambda hass, data, entity_id, resume_at: schedule_resume(
-            hass, data, entity_id, resume_at, resume_callback=async_resume
+            hass, data, entity_id, resume_at, resume_callback=async_resume, resume_batch_callback=async_resume_batch
         )
     )
     disable_scheduler = schedule_disable_callback or (
         lambda hass, data, entity_id, scheduled: schedule_disable(
-            hass, data, entity_id, scheduled, disable_callback=async_execute_scheduled_disable
+            hass,
+            data,
+            entity_id,
+            scheduled,
+            disable_callback=async_execute_scheduled_disable,
+            disable_batch_callback=async_execute_scheduled_disable_batch,
         )
     )
     pre_resume_scheduler = schedule_pre_resume_notification_callback or (
@@ -248,25 +388,36 @@ async def async_pause_automations(
             hass, data, paused, notification_callback=send_pre_resume_notification
         )
     )
-    cancellation: asyncio.CancelledError | None = None
 
-    async def set_state_safely(entity_id: str, enabled: bool) -> bool:
-        nonlocal cancellation
-        state_change = asyncio.ensure_future(set_state(hass, entity_id, enabled))
-        try:
-            return await asyncio.shield(state_change)
-        except asyncio.CancelledError as err:
-            cancellation = err
-            return await state_change
+    # An injected setter changes one automation at a time; by default all
+    # targets of a phase go through one bulk service call.
+    per_entity_set_state = (
+        None
+        if set_automation_state is None
+        else (lambda hass, entity_id, *, enabled: set_automation_state(hass, entity_id, enabled))
+    )
+
+    async def set_states(
+        entity_ids: list[str], enabled: bool, results: dict[str, bool] | None = None
+    ) -> dict[str, bool]:
+        return await runtime_ports.async_set_automation_states(
+            hass,
+            entity_ids,
+            enabled=enabled,
+            limit=data.state_change_concurrency,
+            results=results,
+            stats=data.service_call_stats,
+            set_state=per_entity_set_state,
+        )
 
     started_at = perf_counter()
     outcome = "success"
     try:
         if data.unloaded:
-            return
+            return {}
 
         if not entity_ids:
-            return
+            return {}
         entity_ids = list(dict.fromkeys(entity_ids))
 
         for entity_id in entity_ids:
@@ -327,7 +478,59 @@ async def async_pause_automations(
         active_replacements: dict[str, PausedAutomation] = {}
         replacement_wake_results: dict[str, bool] = {}
 
+        # Automations that are already snoozed and still off are extended in
+        # place: no state call, and only the deadlines that moved are re-armed.
+        # The entry is replaced rather than mutated so an in-flight resume of
+        # the old entry treats it as stale and re-disables the automation.
+        extended_entries: list[PausedAutomation] = []
+        extended_changes: dict[str, list[str]] = {}
+        rearm_notifications: list[PausedAutomation] = []
+        if not use_scheduled:
+            async with data.lock:
+                for entity_id in entity_ids:
+                    current = data.paused.get(entity_id)
+                    state = hass.states.get(entity_id)
+                    if current is None or state is None or state.state != STATE_OFF:
+                        continue
+                    updated = replace(
+                        current,
+                        resume_at=resume_at,
+                        days=days,
+                        hours=hours,
+                        minutes=minutes,
+                        disable_at=disable_at if disable_at is not None else current.disable_at,
+                        notification_trigger=notification_trigger,
+                        notification_lead_minutes=notification_lead_minutes,
+                        resume_retries=0,
+                        cohort_id=None,
+                    )
+                    changed = _changed_fields(current, updated)
+                    extended_changes[entity_id] = changed
+                    if not changed:
+                        extended_entries.append(current)
+                        continue
+                    cancel_scheduled_timer(data, entity_id)
+                    data.scheduled.pop(entity_id, None)
+                    # An entry that no longer matches its cohort leaves it for a deadline of its own.
+                    left_cohort = current.cohort_id is not None
+                    if left_cohort:
+                        cancel_timer(data, entity_id)
+                    data.paused[entity_id] = updated
+                    if "resume_at" in changed or left_cohort:
+                        resume_scheduler(hass, data, entity_id, resume_at)
+                    extended_entries.append(updated)
+                    rearm_notifications.append(updated)
+                    _LOGGER.info(
+                        "Extended snooze for %s until %s (changed: %s)", entity_id, resume_at, ", ".join(changed)
+                    )
+            for paused in rearm_notifications:
+                pre_resume_scheduler(hass, data, paused)
+        extended_ids = {paused.entity_id for paused in extended_entries}
+
+        friendly_names: dict[str, str] = {}
         for entity_id in entity_ids:
+            if entity_id in extended_ids:
+                continue
             friendly_name = get_friendly_name(hass, entity_id)
 
             if use_scheduled:
@@ -346,15 +549,27 @@ async def async_pause_automations(
 
             state = hass.states.get(entity_id)
             initially_enabled[entity_id] = state is not None and state.state == STATE_ON
-            if not await set_state_safely(entity_id, False):
-                if cancellation is not None:
-                    break
-                continue
+            friendly_names[entity_id] = friendly_name
+
+        if friendly_names:
+            disable_results: dict[str, bool] = {}
+            phase_started_at = perf_counter()
+            try:
+                await set_states(list(friendly_names), False, disable_results)
+            except asyncio.CancelledError:
+                restore = [
+                    entity_id for entity_id, ok in disable_results.items() if ok and initially_enabled[entity_id]
+                ]
+                for entity_id, ok in (await set_states(restore, True)).items():
+                    if not ok:
+                        _LOGGER.warning("Failed to restore %s after pause cancellation", entity_id)
+                raise
+            _log_phase("disable", len(friendly_names), phase_started_at)
 
             schedule_mode_disable_at = (
                 disable_at if disable_at is not None else (now if resume_at_dt is not None else None)
             )
-            paused_entries.append(
+            paused_entries = [
                 PausedAutomation(
                     entity_id=entity_id,
                     friendly_name=friendly_name,
@@ -367,15 +582,9 @@ async def async_pause_automations(
                     notification_trigger=notification_trigger,
                     notification_lead_minutes=notification_lead_minutes,
                 )
-            )
-            if cancellation is not None:
-                break
-
-        if cancellation is not None:
-            for paused in paused_entries:
-                if initially_enabled.get(paused.entity_id) and not await set_state(hass, paused.entity_id, True):
-                    _LOGGER.warning("Failed to restore %s after pause cancellation", paused.entity_id)
-            raise cancellation
+                for entity_id, friendly_name in friendly_names.items()
+                if disable_results.get(entity_id)
+            ]
 
         if scheduled_entries:
             async with data.lock:
@@ -385,21 +594,23 @@ async def async_pause_automations(
                     if (paused := data.paused.get(scheduled.entity_id)) is not None
                 }
 
-            for entity_id in active_replacements:
-                replacement_wake_results[entity_id] = await set_state_safely(entity_id, True)
-                if not replacement_wake_results[entity_id]:
+        if active_replacements:
+            phase_started_at = perf_counter()
+            try:
+                await set_states(list(active_replacements), True, replacement_wake_results)
+            except asyncio.CancelledError:
+                woken = [entity_id for entity_id, woke in replacement_wake_results.items() if woke]
+                for entity_id, ok in (await set_states(woken, False)).items():
+                    if not ok:
+                        _LOGGER.warning("Failed to restore %s after scheduled replacement cancellation", entity_id)
+                raise
+            _log_phase("replacement_wake", len(active_replacements), phase_started_at)
+            for entity_id, woke in replacement_wake_results.items():
+                if not woke:
                     _LOGGER.warning(
                         "Failed to wake %s before replacing active snooze with a future schedule",
                         entity_id,
                     )
-                if cancellation is not None:
-                    break
-
-        if cancellation is not None:
-            for entity_id, woke in replacement_wake_results.items():
-                if woke and not await set_state(hass, entity_id, False):
-                    _LOGGER.warning("Failed to restore %s after scheduled replacement cancellation", entity_id)
-            raise cancellation
 
         re_disable_stale_replacements: list[str] = []
         pre_resume_targets: list[PausedAutomation] = []
@@ -427,29 +638,47 @@ async def async_pause_automations(
                     scheduled.resume_at,
                 )
 
+            # An injected resume scheduler arms one deadline per automation; by
+            # default the automations snoozed together share a cohort deadline.
+            share_deadline = schedule_resume_callback is None and len(paused_entries) > 1
             for paused in paused_entries:
+                cancel_timer(data, paused.entity_id)
                 cancel_scheduled_timer(data, paused.entity_id)
                 cancel_notification_timer(data, paused.entity_id)
                 data.scheduled.pop(paused.entity_id, None)
                 data.paused[paused.entity_id] = paused
-                resume_scheduler(hass, data, paused.entity_id, paused.resume_at)
+                if not share_deadline:
+                    resume_scheduler(hass, data, paused.entity_id, paused.resume_at)
                 pre_resume_targets.append(paused)
                 _LOGGER.info("Snoozed %s until %s", paused.entity_id, paused.resume_at)
+            if share_deadline:
+                cohort = form_cohort(data, paused_entries)
+                schedule_cohort_resume(
+                    hass, data, cohort, resume_callback=async_resume, resume_batch_callback=async_resume_batch
+                )
 
         for paused in pre_resume_targets:
             pre_resume_scheduler(hass, data, paused)
 
-        if scheduled_entries or paused_entries:
+        if scheduled_entries or paused_entries or rearm_notifications:
             if not await save_runtime_data(data):
                 _raise_save_failed()
 
-        for entity_id in re_disable_stale_replacements:
-            if not await set_state(hass, entity_id, False):
+        for entity_id, ok in (await set_states(re_disable_stale_replacements, False)).items():
+            if not ok:
                 _LOGGER.warning("Failed to restore disabled state for stale replacement of %s", entity_id)
 
-        data.notify()
-        await notify_started_callback(hass, paused_entries)
-        if any(paused.notification_trigger == NOTIFICATION_TRIGGER_START for paused in paused_entries):
+        # A re-pause that changed nothing is not a new start: it is neither
+        # announced nor counted.
+        unchanged_ids = {entity_id for entity_id, changed in extended_changes.items() if not changed}
+        started_entries = [
+            *(paused for paused in extended_entries if paused.entity_id not in unchanged_ids),
+            *paused_entries,
+        ]
+        if changed_ids := [entity_id for entity_id in entity_ids if entity_id not in unchanged_ids]:
+            data.notify(changed_ids)
+        await notify_started_callback(hass, started_entries)
+        if any(paused.notification_trigger == NOTIFICATION_TRIGGER_START for paused in started_entries):
             track_if_enabled(
                 data,
                 "notification_used",
@@ -462,7 +691,7 @@ async def async_pause_automations(
                 call_data=service_call.data,
                 input_method=input_method_from_call(service_call),
                 confirm=service_call.data.get("confirm", False),
-                paused_count=len(paused_entries),
+                paused_count=len(started_entries),
                 scheduled_count=len(scheduled_entries),
                 notification_trigger=notification_trigger,
                 notification_lead_minutes=notification_lead_minutes,
@@ -475,6 +704,7 @@ async def async_pause_automations(
                 hours=hours,
                 minutes=minutes,
             )
+        return extended_changes
     except Exception:
         outcome = "error"
         raise
@@ -482,8 +712,13 @@ async def async_pause_automations(
         _log_command("pause", outcome, started_at)
 
 
-def _validate_guardrails(hass: HomeAssistant, entity_ids: list[str], confirm: bool = False) -> None:
-    validate_guardrails(hass, entity_ids, confirm=confirm)
+def _validate_guardrails(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    confirm: bool = False,
+    cache: GuardrailCache | None = None,
+) -> None:
+    validate_guardrails(hass, entity_ids, confirm=confirm, cache=cache)
 
 
 def _track_pause_validation_failure(
@@ -520,10 +755,10 @@ async def async_handle_pause_service(
     hass: HomeAssistant,
     data: AutomationPauseData,
     call: ServiceCall,
-) -> None:
+) -> ServiceResponse:
     """Handle the pause service application flow."""
     if data.unloaded:
-        return
+        return _pause_response(call, {})
 
     entity_ids = call.data[ATTR_ENTITY_ID]
     confirm = call.data.get("confirm", False)
@@ -531,13 +766,13 @@ async def async_handle_pause_service(
     hours = call.data.get("hours", 0)
     minutes = call.data.get("minutes", 0)
     disable_at = ensure_utc_aware(call.data.get("disable_at"))
-    resume_at_dt = resolve_resume_at(hass, call.data)
+    resume_at_dt = resolve_resume_at(hass, call.data, data.resume_preset_cache)
     notification_trigger = call.data.get("notification_trigger", NOTIFICATION_TRIGGER_NONE)
     notification_lead_minutes = call.data.get("notification_lead_minutes")
 
     try:
-        _validate_guardrails(hass, entity_ids, confirm=confirm)
-        await async_pause_automations(
+        _validate_guardrails(hass, entity_ids, confirm=confirm, cache=data.guardrail_cache)
+        extended = await async_pause_automations(
             hass,
             data,
             entity_ids,
@@ -563,40 +798,75 @@ async def async_handle_pause_service(
             minutes=minutes,
         )
         raise
+    return _pause_response(call, extended)
 
 
 async def async_handle_pause_by_area_service(
     hass: HomeAssistant,
     data: AutomationPauseData,
     call: ServiceCall,
-) -> None:
+) -> ServiceResponse:
     """Handle pause-by-area in the pause application slice."""
     if data.unloaded:
-        return
+        return _pause_response(call, {})
     area_value = call.data["area_id"]
     area_ids = [area_value] if isinstance(area_value, str) else area_value
-    entity_ids = get_automations_by_area(hass, area_ids)
+    entity_ids = get_automations_by_area(hass, area_ids, data.registry_index)
     if not entity_ids:
         _LOGGER.warning("No automations found in area(s): %s", area_ids)
-        return
-    await _handle_pause_by_filter(hass, data, call, entity_ids)
+        return _pause_response(call, {})
+    return await _handle_pause_by_filter(hass, data, call, entity_ids)
 
 
 async def async_handle_pause_by_label_service(
     hass: HomeAssistant,
     data: AutomationPauseData,
     call: ServiceCall,
-) -> None:
+) -> ServiceResponse:
     """Handle pause-by-label in the pause application slice."""
     if data.unloaded:
-        return
+        return _pause_response(call, {})
     label_value = call.data["label_id"]
     label_ids = [label_value] if isinstance(label_value, str) else label_value
-    entity_ids = get_automations_by_label(hass, label_ids)
+    entity_ids = get_automations_by_label(hass, label_ids, data.registry_index)
     if not entity_ids:
         _LOGGER.warning("No automations found with label(s): %s", label_ids)
-        return
-    await _handle_pause_by_filter(hass, data, call, entity_ids)
+        return _pause_response(call, {})
+    return await _handle_pause_by_filter(hass, data, call, entity_ids)
+
+
+async def async_handle_pause_by_device_service(
+    hass: HomeAssistant,
+    data: AutomationPauseData,
+    call: ServiceCall,
+) -> ServiceResponse:
+    """Handle pause-by-device in the pause application slice."""
+    if data.unloaded:
+        return _pause_response(call, {})
+    device_value = call.data["device_id"]
+    device_ids = [device_value] if isinstance(device_value, str) else device_value
+    entity_ids = get_automations_by_device(hass, device_ids, data.registry_index)
+    if not entity_ids:
+        _LOGGER.warning("No automations found for device(s): %s", device_ids)
+        return _pause_response(call, {})
+    return await _handle_pause_by_filter(hass, data, call, entity_ids)
+
+
+async def async_handle_pause_by_floor_service(
+    hass: HomeAssistant,
+    data: AutomationPauseData,
+    call: ServiceCall,
+) -> ServiceResponse:
+    """Handle pause-by-floor in the pause application slice."""
+    if data.unloaded:
+        return _pause_response(call, {})
+    floor_value = call.data["floor_id"]
+    floor_ids = [floor_value] if isinstance(floor_value, str) else floor_value
+    entity_ids = get_automations_by_floor(hass, floor_ids, data.registry_index)
+    if not entity_ids:
+        _LOGGER.warning("No automations found on floor(s): %s", floor_ids)
+        return _pause_response(call, {})
+    return await _handle_pause_by_filter(hass, data, call, entity_ids)
 
 
 async def _handle_pause_by_filter(
@@ -604,18 +874,18 @@ async def _handle_pause_by_filter(
     data: AutomationPauseData,
     call: ServiceCall,
     entity_ids: list[str],
-) -> None:
+) -> ServiceResponse:
     if data.unloaded:
-        return
+        return _pause_response(call, {})
     confirm = call.data.get("confirm", False)
     disable_at = ensure_utc_aware(call.data.get("disable_at"))
-    resume_at_dt = resolve_resume_at(hass, call.data)
+    resume_at_dt = resolve_resume_at(hass, call.data, data.resume_preset_cache)
     days = call.data.get("days", 0)
     hours = call.data.get("hours", 0)
     minutes = call.data.get("minutes", 0)
     try:
-        _validate_guardrails(hass, entity_ids, confirm=confirm)
-        await async_pause_automations(
+        _validate_guardrails(hass, entity_ids, confirm=confirm, cache=data.guardrail_cache)
+        extended = await async_pause_automations(
             hass,
             data,
             entity_ids,
@@ -641,3 +911,14 @@ async def _handle_pause_by_filter(
             minutes=minutes,
         )
         raise
+    return _pause_response(call, extended)
+
+
+async def async_handle_get_resume_presets_service(
+    hass: HomeAssistant,
+    data: AutomationPauseData,
+    _call: ServiceCall,
+) -> ServiceResponse:
+    """Return the current UTC target of every resume preset."""
+    targets = resolve_resume_presets(hass, data.resume_preset_cache)
+    return {"presets": {preset: target.isoformat() for preset, target in targets.items()}}
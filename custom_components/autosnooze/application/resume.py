@@ -18,6 +18,7 @@ from ..logging_utils import _log_command, _raise_save_failed
 from ..models import PausedAutomation
 from ..runtime.state import AutomationPauseData
 from ..runtime import ports as runtime_ports
+from ..runtime.cohorts import covered_cohorts
 from ..runtime.timers import cancel_notification_timer, cancel_timer
 from .notifications import notify_resumed
 
@@ -38,7 +39,9 @@ async def async_resume(
     async with data.lock:
         expected_pause = data.paused.get(entity_id)
 
-    woke_successfully = await runtime_ports.async_set_automation_state(hass, entity_id, enabled=True)
+    woke_successfully = await runtime_ports.async_set_automation_state(
+        hass, entity_id, enabled=True, stats=data.service_call_stats
+    )
     re_disable_entity = False
     retry_scheduled = False
     resumed: list[PausedAutomation] = []
@@ -63,14 +66,23 @@ async def async_resume(
                 paused.resume_retries += 1
                 retry_at = dt_util.utcnow() + RESUME_RETRY_DELAY
                 paused.resume_at = retry_at
-                runtime_ports.schedule_resume(hass, data, entity_id, retry_at, resume_callback=async_resume)
+                runtime_ports.schedule_resume(
+                    hass,
+                    data,
+                    entity_id,
+                    retry_at,
+                    resume_callback=async_resume,
+                    resume_batch_callback=async_resume_batch,
+                )
                 retry_scheduled = True
     if not await runtime_ports.async_save(data):
         _raise_save_failed()
     if re_disable_entity:
-        if not await runtime_ports.async_set_automation_state(hass, entity_id, enabled=False):
+        if not await runtime_ports.async_set_automation_state(
+            hass, entity_id, enabled=False, stats=data.service_call_stats
+        ):
             _LOGGER.warning("Failed to restore disabled state for stale resume of %s", entity_id)
-    data.notify()
+    data.notify([entity_id])
     await notify_resumed(hass, resumed, reason=reason, save_succeeded=True)
     if resumed:
         track_if_enabled(
@@ -108,23 +120,24 @@ async def async_resume_batch(
             candidate_ids = list(candidates)
 
         results: dict[str, bool] = {}
-        cancellation: asyncio.CancelledError | None = None
-        for entity_id in candidate_ids:
-            state_change = asyncio.ensure_future(
-                runtime_ports.async_set_automation_state(hass, entity_id, enabled=True)
+        try:
+            await runtime_ports.async_set_automation_states(
+                hass,
+                candidate_ids,
+                enabled=True,
+                limit=data.state_change_concurrency,
+                results=results,
+                stats=data.service_call_stats,
             )
-            try:
-                results[entity_id] = await asyncio.shield(state_change)
-            except asyncio.CancelledError as err:
-                cancellation = err
-                results[entity_id] = await state_change
-                break
-
-        if cancellation is not None:
-            for entity_id, woke in results.items():
-                if woke and not await runtime_ports.async_set_automation_state(hass, entity_id, enabled=False):
+        except asyncio.CancelledError:
+            woken = [entity_id for entity_id, woke in results.items() if woke]
+            restored = await runtime_ports.async_set_automation_states(
+                hass, woken, enabled=False, limit=data.state_change_concurrency, stats=data.service_call_stats
+            )
+            for entity_id, ok in restored.items():
+                if not ok:
                     _LOGGER.warning("Failed to restore %s after resume cancellation", entity_id)
-            raise cancellation
+            raise
 
         failed = 0
         woke = 0
@@ -155,13 +168,23 @@ async def async_resume_batch(
                         paused.resume_retries += 1
                         retry_at = dt_util.utcnow() + RESUME_RETRY_DELAY
                         paused.resume_at = retry_at
-                        runtime_ports.schedule_resume(hass, data, entity_id, retry_at, resume_callback=async_resume)
+                        runtime_ports.schedule_resume(
+                            hass,
+                            data,
+                            entity_id,
+                            retry_at,
+                            resume_callback=async_resume,
+                            resume_batch_callback=async_resume_batch,
+                        )
         if not await runtime_ports.async_save(data):
             _raise_save_failed()
-        for entity_id in re_disable_entities:
-            if not await runtime_ports.async_set_automation_state(hass, entity_id, enabled=False):
+        re_disabled = await runtime_ports.async_set_automation_states(
+            hass, re_disable_entities, enabled=False, limit=data.state_change_concurrency, stats=data.service_call_stats
+        )
+        for entity_id, ok in re_disabled.items():
+            if not ok:
                 _LOGGER.warning("Failed to restore disabled state for stale resume of %s", entity_id)
-        data.notify()
+        data.notify(candidate_ids)
         await notify_resumed(hass, resumed, reason=reason, save_succeeded=True)
         if resumed:
             track_if_enabled(
@@ -178,11 +201,11 @@ async def async_resume_batch(
         outcome = "error"
         raise
     finally:
-        _log_command("cancel", outcome, started_at)
+        _log_command("cancel" if reason == "manual" else "expire", outcome, started_at)
 
 
 async def async_clear_notification_config_batch(
-    _hass: HomeAssistant,
+    hass: HomeAssistant,
     data: AutomationPauseData,
     entity_ids: list[str],
 ) -> None:
@@ -197,6 +220,7 @@ async def async_clear_notification_config_batch(
 
         changed = False
         async with data.lock:
+            cleared_cohorts = {cohort.cohort_id for cohort in covered_cohorts(data, entity_ids)}
             for entity_id in dict.fromkeys(entity_ids):
                 paused = data.paused.get(entity_id)
                 if paused is None:
@@ -209,6 +233,20 @@ async def async_clear_notification_config_batch(
                 ):
                     continue
 
+                if paused.cohort_id in cleared_cohorts:
+                    cohort = data.cohorts[paused.cohort_id]
+                    cohort.notification_trigger = NOTIFICATION_TRIGGER_NONE
+                    cohort.notification_lead_minutes = None
+                elif paused.cohort_id is not None:
+                    # The entry no longer matches its cohort, so it gets a deadline of its own.
+                    runtime_ports.schedule_resume(
+                        hass,
+                        data,
+                        entity_id,
+                        paused.resume_at,
+                        resume_callback=async_resume,
+                        resume_batch_callback=async_resume_batch,
+                    )
                 paused.notification_trigger = NOTIFICATION_TRIGGER_NONE
                 paused.notification_lead_minutes = None
                 changed = True
@@ -219,7 +257,7 @@ async def async_clear_notification_config_batch(
         if not await runtime_ports.async_save(data):
             _raise_save_failed()
 
-        data.notify()
+        data.notify(entity_ids)
         track_if_enabled(
             data,
             "notification_cleared",
@@ -20,7 +20,7 @@ from ..runtime import ports as runtime_ports
 from ..runtime.timers import cancel_scheduled_timer
 from ..runtime.state import AutomationPauseData
 from .notifications import notify_started, send_pre_resume_notification
-from .resume import async_resume
+from .resume import async_resume, async_resume_batch
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,62 +32,95 @@ async def async_execute_scheduled_disable(
     resume_at: datetime,
 ) -> None:
     """Execute a scheduled disable - disable automation and schedule resume."""
-    if data.unloaded:
+    await async_execute_scheduled_disable_batch(hass, data, {entity_id: resume_at})
+
+
+async def async_execute_scheduled_disable_batch(
+    hass: HomeAssistant,
+    data: AutomationPauseData,
+    targets: dict[str, datetime],
+) -> None:
+    """Execute scheduled disables that came due together with one save and notification."""
+    if data.unloaded or not targets:
         return
 
     async with data.lock:
-        cancel_scheduled_timer(data, entity_id)
-        expected_scheduled = data.scheduled.get(entity_id)
+        expected: dict[str, ScheduledSnooze | None] = {}
+        for entity_id in targets:
+            cancel_scheduled_timer(data, entity_id)
+            expected[entity_id] = data.scheduled.get(entity_id)
 
-    initial_state = hass.states.get(entity_id)
-    was_enabled = initial_state is not None and initial_state.state == STATE_ON
+    was_enabled: dict[str, bool] = {}
+    results: dict[str, bool] = {}
     cancellation: asyncio.CancelledError | None = None
-    state_change = asyncio.create_task(runtime_ports.async_set_automation_state(hass, entity_id, enabled=False))
+    for entity_id in targets:
+        initial_state = hass.states.get(entity_id)
+        was_enabled[entity_id] = initial_state is not None and initial_state.state == STATE_ON
     try:
-        disabled_successfully = await asyncio.shield(state_change)
+        await runtime_ports.async_set_automation_states(
+            hass,
+            list(targets),
+            enabled=False,
+            limit=data.state_change_concurrency,
+            results=results,
+            stats=data.service_call_stats,
+        )
     except asyncio.CancelledError as err:
         cancellation = err
-        disabled_successfully = await state_change
 
     def raise_cancellation() -> None:
         if cancellation is not None:
             raise cancellation
 
     if data.unloaded:
-        if disabled_successfully and was_enabled:
-            if not await runtime_ports.async_set_automation_state(hass, entity_id, enabled=True):
+        restore = [entity_id for entity_id, disabled in results.items() if disabled and was_enabled[entity_id]]
+        restored = await runtime_ports.async_set_automation_states(
+            hass, restore, enabled=True, limit=data.state_change_concurrency, stats=data.service_call_stats
+        )
+        for entity_id, ok in restored.items():
+            if not ok:
                 _LOGGER.warning("Failed to restore %s after unload interrupted scheduled disable", entity_id)
         raise_cancellation()
         return
 
-    stale_after_disable = False
-    undo_stale_disable = False
+    undo_stale: list[str] = []
+    started: list[PausedAutomation] = []
+    retry_logs: list[tuple[str, datetime]] = []
+    skipped_retries: list[str] = []
     should_save = False
-    early_notify = False
-    paused_for_notification: PausedAutomation | None = None
-    success_paused: PausedAutomation | None = None
-    skip_retry_log = False
-    retry_log_at: datetime | None = None
 
     async with data.lock:
-        current_scheduled = data.scheduled.get(entity_id)
-        stale_after_disable = (expected_scheduled is not None and current_scheduled is not expected_scheduled) or (
-            expected_scheduled is None and current_scheduled is not None
-        )
-        if stale_after_disable:
-            undo_stale_disable = disabled_successfully and entity_id not in data.paused
-        else:
-            scheduled = current_scheduled if expected_scheduled is None else expected_scheduled
+        now = dt_util.utcnow()
+        for entity_id, resume_at in targets.items():
+            expected_scheduled = expected[entity_id]
+            current_scheduled = data.scheduled.get(entity_id)
+            if entity_id not in results:
+                # Never attempted because the batch was cancelled; keep the entry armed.
+                if current_scheduled is not None and current_scheduled is expected_scheduled:
+                    runtime_ports.schedule_disable(
+                        hass,
+                        data,
+                        entity_id,
+                        current_scheduled,
+                        disable_callback=async_execute_scheduled_disable,
+                        disable_batch_callback=async_execute_scheduled_disable_batch,
+                    )
+                continue
 
-            if not disabled_successfully:
-                now = dt_util.utcnow()
-                retry_at = now + SCHEDULED_DISABLE_RETRY_DELAY
+            stale = (expected_scheduled is not None and current_scheduled is not expected_scheduled) or (
+                expected_scheduled is None and current_scheduled is not None
+            )
+            if stale:
+                if results[entity_id] and entity_id not in data.paused:
+                    undo_stale.append(entity_id)
+                continue
 
+            scheduled = current_scheduled if expected_scheduled is None else expected_scheduled
+            if not results[entity_id]:
+                retry_at = now + SCHEDULED_DISABLE_RETRY_DELAY
                 if resume_at <= now or retry_at >= resume_at:
                     data.scheduled.pop(entity_id, None)
-                    should_save = True
-                    early_notify = True
-                    skip_retry_log = True
+                    skipped_retries.append(entity_id)
                 else:
                     if scheduled is None:
                         scheduled = ScheduledSnooze(
@@ -98,41 +131,48 @@ async def async_execute_scheduled_disable(
                         )
                     else:
                         scheduled.disable_at = retry_at
-
                     data.scheduled[entity_id] = scheduled
                     runtime_ports.schedule_disable(
-                        hass, data, entity_id, scheduled, disable_callback=async_execute_scheduled_disable
+                        hass,
+                        data,
+                        entity_id,
+                        scheduled,
+                        disable_callback=async_execute_scheduled_disable,
+                        disable_batch_callback=async_execute_scheduled_disable_batch,
                     )
-                    should_save = True
-                    early_notify = True
-                    retry_log_at = retry_at
-            else:
-                scheduled = data.scheduled.pop(entity_id, None)
-                now = dt_util.utcnow()
-                friendly_name = (
-                    scheduled.friendly_name if scheduled else runtime_ports.get_friendly_name(hass, entity_id)
-                )
-                disable_at = scheduled.disable_at if scheduled else None
-
-                success_paused = PausedAutomation(
-                    entity_id=entity_id,
-                    friendly_name=friendly_name,
-                    resume_at=resume_at,
-                    paused_at=now,
-                    disable_at=disable_at,
-                    notification_trigger=(scheduled.notification_trigger if scheduled is not None else "none"),
-                    notification_lead_minutes=(scheduled.notification_lead_minutes if scheduled is not None else None),
-                )
-                data.paused[entity_id] = success_paused
-                runtime_ports.schedule_resume(hass, data, entity_id, resume_at, resume_callback=async_resume)
-                paused_for_notification = success_paused
+                    retry_logs.append((entity_id, retry_at))
                 should_save = True
+                continue
+
+            data.scheduled.pop(entity_id, None)
+            paused = PausedAutomation(
+                entity_id=entity_id,
+                friendly_name=(
+                    scheduled.friendly_name if scheduled else runtime_ports.get_friendly_name(hass, entity_id)
+                ),
+                resume_at=resume_at,
+                paused_at=now,
+                disable_at=scheduled.disable_at if scheduled else None,
+                notification_trigger=(scheduled.notification_trigger if scheduled is not None else "none"),
+                notification_lead_minutes=(scheduled.notification_lead_minutes if scheduled is not None else None),
+            )
+            data.paused[entity_id] = paused
+            runtime_ports.schedule_resume(
+                hass,
+                data,
+                entity_id,
+                resume_at,
+                resume_callback=async_resume,
+                resume_batch_callback=async_resume_batch,
+            )
+            started.append(paused)
+            should_save = True
 
-    if paused_for_notification is not None:
+    for paused in started:
         runtime_ports.schedule_pre_resume_notification(
             hass,
             data,
-            paused_for_notification,
+            paused,
             notification_callback=send_pre_resume_notification,
         )
 
@@ -144,56 +184,45 @@ async def async_execute_scheduled_disable(
         raise_cancellation()
         return
 
-    if undo_stale_disable:
-        if not await runtime_ports.async_set_automation_state(hass, entity_id, enabled=True):
+    undone = await runtime_ports.async_set_automation_states(
+        hass, undo_stale, enabled=True, limit=data.state_change_concurrency, stats=data.service_call_stats
+    )
+    for entity_id, ok in undone.items():
+        if not ok:
             _LOGGER.warning("Failed to undo stale scheduled disable for %s", entity_id)
+    for entity_id in skipped_retries:
+        _LOGGER.warning(
+            "Failed to execute scheduled disable for %s; skipping retry because resume time has passed",
+            entity_id,
+        )
+    for entity_id, retry_at in retry_logs:
+        _LOGGER.warning("Failed to execute scheduled disable for %s, retrying at %s", entity_id, retry_at)
+    if not should_save:
         raise_cancellation()
         return
-    if stale_after_disable:
-        raise_cancellation()
-        return
-    if early_notify:
-        if skip_retry_log:
-            _LOGGER.warning(
-                "Failed to execute scheduled disable for %s; skipping retry because resume time has passed",
-                entity_id,
-            )
-        else:
-            _LOGGER.warning(
-                "Failed to execute scheduled disable for %s, retrying at %s",
-                entity_id,
-                retry_log_at,
+
+    data.notify(targets)
+    if started:
+        await notify_started(hass, started)
+        if any(paused.notification_trigger == NOTIFICATION_TRIGGER_START for paused in started):
+            track_if_enabled(
+                data,
+                "notification_used",
+                {"trigger": NOTIFICATION_TRIGGER_START},
+                source="timer",
             )
-        data.notify()
-        raise_cancellation()
-        return
-    if success_paused is None:
-        raise_cancellation()
-        return
-    data.notify()
-    await notify_started(hass, [success_paused])
-    if success_paused.notification_trigger == NOTIFICATION_TRIGGER_START:
+        first = started[0]
+        start = first.disable_at or first.paused_at
         track_if_enabled(
             data,
-            "notification_used",
-            {"trigger": NOTIFICATION_TRIGGER_START},
+            "scheduled_snooze_started",
+            {
+                "target_count": len(started),
+                "planned_duration_minutes": max(int((first.resume_at - start).total_seconds() // 60), 0),
+            },
             source="timer",
         )
-    scheduled = data.paused.get(entity_id)
-    planned_duration = 0
-    if scheduled is not None:
-        start = scheduled.disable_at or scheduled.paused_at
-        planned_duration = max(int((scheduled.resume_at - start).total_seconds() // 60), 0)
-    track_if_enabled(
-        data,
-        "scheduled_snooze_started",
-        {
-            "target_count": 1,
-            "planned_duration_minutes": planned_duration,
-        },
-        source="timer",
-    )
-    _LOGGER.info("Executed scheduled snooze for %s until %s", entity_id, resume_at)
+        _LOGGER.info("Executed %d scheduled snoozes", len(started))
     raise_cancellation()
 
 
@@ -232,7 +261,7 @@ async def async_cancel_scheduled_batch(
                     )
         if not await runtime_ports.async_save(data):
             _raise_save_failed()
-        data.notify()
+        data.notify(entity_ids)
         _LOGGER.info("Cancelled %d scheduled snoozes", len(entity_ids))
     except Exception:
         outcome = "error"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.helpers.storage import Store
 
 from ..infrastructure.telemetry import TELEMETRY_STORAGE_KEY, TELEMETRY_STORAGE_VERSION, TelemetryClient
@@ -22,6 +23,13 @@ async def async_setup_integration_entry(
     platforms,
     update_listener,
     data_factory,
+    flush_saves=None,
+    preload_stored=None,
+    registry_index_factory=None,
+    guardrail_cache_factory=None,
+    resume_preset_cache_factory=None,
+    register_websocket_commands=None,
+    automation_catalog_cache_factory=None,
 ) -> bool:
     """Set up the integration entry using injected collaborators."""
     store = storage_factory()
@@ -32,6 +40,24 @@ async def async_setup_integration_entry(
     data.telemetry = TelemetryClient(hass, entry, telemetry_store)
     await data.telemetry.async_setup()
 
+    if registry_index_factory is not None:
+        data.registry_index = registry_index_factory(hass)
+        entry.async_on_unload(data.registry_index.async_listen())
+    if guardrail_cache_factory is not None:
+        data.guardrail_cache = guardrail_cache_factory(hass)
+        entry.async_on_unload(data.guardrail_cache.async_listen())
+    if resume_preset_cache_factory is not None:
+        data.resume_preset_cache = resume_preset_cache_factory(hass)
+        entry.async_on_unload(data.resume_preset_cache.async_listen())
+    if automation_catalog_cache_factory is not None:
+        data.automation_catalog_cache = automation_catalog_cache_factory(hass)
+        entry.async_on_unload(data.automation_catalog_cache.async_listen())
+
+    # Index stored snoozes now; reconciling them with automation states
+    # waits for load_stored once Home Assistant has started.
+    if preload_stored is not None:
+        await preload_stored(hass, data)
+
     await register_static_path(hass)
 
     if hass.is_running:
@@ -49,7 +75,16 @@ async def async_setup_integration_entry(
 
         data.startup_listener_unsub = hass.bus.async_listen_once("homeassistant_started", _register_when_started)
 
+    if flush_saves is not None:
+
+        async def _flush_on_stop(_event: Any) -> None:
+            await flush_saves(data)
+
+        entry.async_on_unload(hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, _flush_on_stop))
+
     register_services(hass, data)
+    if register_websocket_commands is not None:
+        register_websocket_commands(hass)
     await hass.config_entries.async_forward_entry_setups(entry, platforms)
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
@@ -0,0 +1,100 @@
+"""Read-only snooze detail for callers that do not read sensor attributes."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+from ..runtime.state import AutomationPauseData
+
+
+def build_snapshot(data: AutomationPauseData) -> dict[str, Any]:
+    """Return every paused, scheduled and cohort entry with the current generation."""
+    return {
+        "generation": data.generation,
+        "paused": data.get_paused_dict(),
+        "scheduled": data.get_scheduled_dict(),
+        "cohorts": data.get_cohorts_dict(),
+    }
+
+
+async def async_handle_get_snoozes_service(
+    _hass: HomeAssistant,
+    data: AutomationPauseData,
+    _call: ServiceCall,
+) -> ServiceResponse:
+    """Return the full snooze detail the compact sensor attributes leave out."""
+    # Send any pending notification first so the generation matches the entries.
+    data.flush_notify()
+    return build_snapshot(data)
+
+
+class SnoozeDeltaTracker:
+    """Paused, scheduled and cohort entries already sent to one subscriber.
+
+    The first message is a snapshot. Each later state change becomes a delta
+    that adds, updates or removes only the changed entries. Cohorts are keyed
+    by cohort id rather than entity id, so each delta compares them against
+    the ones last sent. A snapshot is
+    sent again instead when the change is unknown, when a generation was
+    skipped, or when the runtime data was replaced by a reload.
+    """
+
+    def __init__(self) -> None:
+        self._data: AutomationPauseData | None = None
+        self._generation = 0
+        self._known: dict[str, set[str]] = {"paused": set(), "scheduled": set()}
+        self._cohorts: dict[str, dict[str, object]] = {}
+
+    def snapshot(self, data: AutomationPauseData) -> dict[str, Any]:
+        """Return build_snapshot's entries and remember them as sent."""
+        self._data = data
+        self._generation = data.generation
+        self._known = {"paused": set(data.paused), "scheduled": set(data.scheduled)}
+        snapshot = build_snapshot(data)
+        self._cohorts = snapshot["cohorts"]
+        return {"type": "snapshot", **snapshot}
+
+    def update(self, data: AutomationPauseData, changed: Iterable[str] | None) -> dict[str, Any] | None:
+        """Return the message for a state change, or None when it was already sent."""
+        if data is self._data and data.generation <= self._generation:
+            return None
+        if data is not self._data or changed is None or data.generation != self._generation + 1:
+            return self.snapshot(data)
+        self._generation = data.generation
+        message: dict[str, Any] = {"type": "delta", "generation": data.generation}
+        entity_ids = sorted(changed)
+        for section, entries in (("paused", data.paused), ("scheduled", data.scheduled)):
+            known = self._known[section]
+            added: dict[str, dict[str, object]] = {}
+            updated: dict[str, dict[str, object]] = {}
+            removed: list[str] = []
+            for entity_id in entity_ids:
+                entry = entries.get(entity_id)
+                if entry is None:
+                    if entity_id in known:
+                        known.discard(entity_id)
+                        removed.append(entity_id)
+                elif entity_id in known:
+                    updated[entity_id] = entry.to_dict()
+                else:
+                    known.add(entity_id)
+                    added[entity_id] = entry.to_dict()
+            message[section] = {"add": added, "update": updated, "remove": removed}
+        message["cohorts"] = self._cohort_delta(data.get_cohorts_dict())
+        return message
+
+    def _cohort_delta(self, cohorts: dict[str, dict[str, object]]) -> dict[str, Any]:
+        sent = self._cohorts
+        self._cohorts = cohorts
+        added: dict[str, dict[str, object]] = {}
+        updated: dict[str, dict[str, object]] = {}
+        for cohort_id, cohort in cohorts.items():
+            if (previous := sent.get(cohort_id)) is None:
+                added[cohort_id] = cohort
+            elif previous != cohort:
+                updated[cohort_id] = cohort
+        removed = [cohort_id for cohort_id in sent if cohort_id not in cohorts]
+        return {"add": added, "update": updated, "remove": removed}
@@ -12,7 +12,19 @@ from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
 
 from . import DOMAIN
-from .const import DEFAULT_DURATION_PRESETS, MINUTES_PER_DAY, MINUTES_PER_YEAR, NUM_PRESET_FIELDS
+from .const import (
+    DEFAULT_DURATION_PRESETS,
+    MINUTES_PER_DAY,
+    MINUTES_PER_YEAR,
+    NUM_PRESET_FIELDS,
+    OPTION_SENSOR_ATTRIBUTES,
+    OPTION_STORAGE_BACKEND,
+    OPTION_STRICT_SERVICE_CALLS,
+    SENSOR_ATTRIBUTES_FULL,
+    SENSOR_ATTRIBUTES_MODES,
+    STORAGE_BACKEND_SNAPSHOT,
+    STORAGE_BACKENDS,
+)
 from .infrastructure.telemetry import OPTION_TELEMETRY_ENABLED
 
 
@@ -105,6 +117,18 @@ class AutoSnoozeOptionsFlow(OptionsFlow):
                         **current_options,
                         "duration_presets": presets,
                         "telemetry_enabled": user_input.get(OPTION_TELEMETRY_ENABLED, True),
+                        OPTION_STORAGE_BACKEND: user_input.get(
+                            OPTION_STORAGE_BACKEND,
+                            current_options.get(OPTION_STORAGE_BACKEND, STORAGE_BACKEND_SNAPSHOT),
+                        ),
+                        OPTION_SENSOR_ATTRIBUTES: user_input.get(
+                            OPTION_SENSOR_ATTRIBUTES,
+                            current_options.get(OPTION_SENSOR_ATTRIBUTES, SENSOR_ATTRIBUTES_FULL),
+                        ),
+                        OPTION_STRICT_SERVICE_CALLS: user_input.get(
+                            OPTION_STRICT_SERVICE_CALLS,
+                            current_options.get(OPTION_STRICT_SERVICE_CALLS, False),
+                        ),
                     },
                 )
 
@@ -113,10 +137,16 @@ class AutoSnoozeOptionsFlow(OptionsFlow):
         if not current_presets:
             current_presets = DEFAULT_DURATION_PRESETS
         telemetry_enabled = self._entry.options.get(OPTION_TELEMETRY_ENABLED, True)
+        storage_backend = self._entry.options.get(OPTION_STORAGE_BACKEND, STORAGE_BACKEND_SNAPSHOT)
+        sensor_attributes = self._entry.options.get(OPTION_SENSOR_ATTRIBUTES, SENSOR_ATTRIBUTES_FULL)
+        strict_service_calls = self._entry.options.get(OPTION_STRICT_SERVICE_CALLS, False)
 
         # Build schema with individual fields
         schema_dict: dict[vol.Optional, Any] = {
             vol.Optional(OPTION_TELEMETRY_ENABLED, default=telemetry_enabled): cv.boolean,
+            vol.Optional(OPTION_STORAGE_BACKEND, default=storage_backend): vol.In(STORAGE_BACKENDS),
+            vol.Optional(OPTION_SENSOR_ATTRIBUTES, default=sensor_attributes): vol.In(SENSOR_ATTRIBUTES_MODES),
+            vol.Optional(OPTION_STRICT_SERVICE_CALLS, default=strict_service_calls): cv.boolean,
         }
         for i in range(1, NUM_PRESET_FIELDS + 1):
             field_key = f"preset_{i}"
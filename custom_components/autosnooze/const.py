@@ -22,14 +22,34 @@ _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "autosnooze"
 PLATFORMS = ["sensor"]
-STORAGE_VERSION = 2
+STORAGE_VERSION = 3  # 3: short keys and epoch-second datetimes
 SIGNAL_STATE_CHANGED = f"{DOMAIN}_state_changed"
+NOTIFY_COALESCE_WINDOW = timedelta(0)  # Merge state notifications; 0 merges within one loop tick
 SENSOR_SCHEMA_VERSION = 1
 
 # Retry configuration for save operations
 MAX_SAVE_RETRIES = 3
 SAVE_RETRY_DELAYS = [0.1, 0.2, 0.4]  # Exponential backoff delays in seconds
 TRANSIENT_ERRORS = (IOError, OSError)  # Errors that should trigger retry
+SAVE_COALESCE_WINDOW = timedelta(milliseconds=50)  # Merge save requests into one write
+
+# Storage backends selectable from the options flow
+OPTION_STORAGE_BACKEND = "storage_backend"
+STORAGE_BACKEND_SNAPSHOT = "snapshot"
+STORAGE_BACKEND_JOURNAL = "journal"
+STORAGE_BACKEND_SQLITE = "sqlite"
+STORAGE_BACKENDS = [STORAGE_BACKEND_SNAPSHOT, STORAGE_BACKEND_JOURNAL, STORAGE_BACKEND_SQLITE]
+JOURNAL_COMPACT_THRESHOLD = 500  # Journal records before compacting into a snapshot
+
+# Sensor attribute modes selectable from the options flow
+OPTION_SENSOR_ATTRIBUTES = "sensor_attributes"
+SENSOR_ATTRIBUTES_FULL = "full"
+SENSOR_ATTRIBUTES_COMPACT = "compact"
+SENSOR_ATTRIBUTES_MODES = [SENSOR_ATTRIBUTES_FULL, SENSOR_ATTRIBUTES_COMPACT]
+SENSOR_ATTRIBUTE_BUDGET = 16384  # Bytes; the recorder drops attribute sets larger than this
+
+# Call automation.turn_on/turn_off even when the automation is already in the target state
+OPTION_STRICT_SERVICE_CALLS = "strict_service_calls"
 
 # Duration validation constants
 MINUTES_PER_DAY = 1440
@@ -43,6 +63,18 @@ RESUME_RETRY_DELAY = timedelta(minutes=1)
 SCHEDULED_DISABLE_RETRY_DELAY = timedelta(minutes=1)
 MAX_RESUME_RETRIES = 5
 
+# Resume and scheduled-disable expiries falling within this window run as one batch
+EXPIRY_COALESCE_WINDOW = timedelta(seconds=1)
+
+# Only deadlines inside this rolling horizon are kept in the armed timer queue
+TIMER_ARMING_HORIZON = timedelta(hours=6)
+
+# Maximum automation turn_on/turn_off calls in flight for restore, pause and resume batches
+STATE_CHANGE_CONCURRENCY = 16
+
+# Maximum automations targeted by one bulk turn_on/turn_off service call
+STATE_CHANGE_BATCH_SIZE = 100
+
 # Number of individual preset fields shown in options flow
 NUM_PRESET_FIELDS = 4
 
@@ -181,6 +213,30 @@ PAUSE_BY_LABEL_SCHEMA = vol.All(
     _validate_notification_schema,
 )
 
+# Pause by device
+PAUSE_BY_DEVICE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required("device_id"): vol.Any(cv.string, [cv.string]),
+            **_DURATION_AND_DATE_SCHEMA,
+        }
+    ),
+    _validate_resume_strategy,
+    _validate_notification_schema,
+)
+
+# Pause by floor
+PAUSE_BY_FLOOR_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required("floor_id"): vol.Any(cv.string, [cv.string]),
+            **_DURATION_AND_DATE_SCHEMA,
+        }
+    ),
+    _validate_resume_strategy,
+    _validate_notification_schema,
+)
+
 # Adjust snooze duration (positive adds time, negative subtracts)
 ADJUST_SCHEMA = vol.Schema(
     {
@@ -0,0 +1,23 @@
+"""Diagnostics support for AutoSnooze."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .infrastructure.storage import async_export_store, save_stats
+from .runtime.state import AutomationPauseConfigEntry
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: AutomationPauseConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = entry.runtime_data
+    return {
+        "options": dict(entry.options),
+        "summary": data.get_summary(),
+        "service_calls": asdict(data.service_call_stats),
+        "saves": save_stats(data),
+        "sqlite_rows": await async_export_store(data),
+    }
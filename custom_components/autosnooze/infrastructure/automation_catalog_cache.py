@@ -0,0 +1,83 @@
+"""Cache of the automation catalog served to the dashboard card."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.const import ATTR_FRIENDLY_NAME, EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import label_registry as lr
+
+type Catalog = tuple[str, list[dict[str, Any]]]
+
+_AUTOMATION_PREFIX = "automation."
+
+
+@callback
+def _automation_registry_filter(event_data: er.EventEntityRegistryUpdatedData) -> bool:
+    entity_ids = (event_data.get("entity_id"), event_data.get("old_entity_id"))
+    return any(isinstance(entity_id, str) and entity_id.startswith(_AUTOMATION_PREFIX) for entity_id in entity_ids)
+
+
+@callback
+def _automation_name_filter(event_data: EventStateChangedData) -> bool:
+    if not event_data["entity_id"].startswith(_AUTOMATION_PREFIX):
+        return False
+    old_state = event_data["old_state"]
+    new_state = event_data["new_state"]
+    if old_state is None or new_state is None:
+        return True
+    return old_state.attributes.get(ATTR_FRIENDLY_NAME) != new_state.attributes.get(ATTR_FRIENDLY_NAME)
+
+
+class AutomationCatalogCache:
+    """The last built automation catalog and its version.
+
+    The catalog is dropped when an automation's registry entry changes, when
+    an automation is added, removed or renamed, and on any label registry
+    update, since a renamed label can change include, exclude or confirm
+    status. State changes that keep the friendly name are filtered out before
+    they reach the listener.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._catalog: Catalog | None = None
+
+    def get(self) -> Catalog | None:
+        """Return the cached version and automations, or None when stale."""
+        return self._catalog
+
+    def set(self, version: str, automations: list[dict[str, Any]]) -> None:
+        """Remember a built catalog under its version."""
+        self._catalog = (version, automations)
+
+    @callback
+    def async_listen(self) -> Callable[[], None]:
+        """Follow registry and automation name updates; return the unsubscribe callback."""
+        bus = self._hass.bus
+        unsubs = [
+            bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_invalidate, event_filter=_automation_registry_filter
+            ),
+            bus.async_listen(lr.EVENT_LABEL_REGISTRY_UPDATED, self._async_invalidate),
+            bus.async_listen(EVENT_STATE_CHANGED, self._async_invalidate, event_filter=_automation_name_filter),
+        ]
+
+        @callback
+        def unsubscribe() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return unsubscribe
+
+    @callback
+    def _async_invalidate(
+        self,
+        _event: Event[er.EventEntityRegistryUpdatedData]
+        | Event[lr.EventLabelRegistryUpdatedData]
+        | Event[EventStateChangedData],
+    ) -> None:
+        self._catalog = None
@@ -0,0 +1,74 @@
+"""Per-entity cache of pause guardrail classifications."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import NamedTuple
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import label_registry as lr
+
+
+class GuardrailFlags(NamedTuple):
+    """Why an automation may need confirmation before snoozing."""
+
+    confirm: bool
+    critical: bool
+
+    @property
+    def requires_confirm(self) -> bool:
+        """Return whether either flag asks for confirmation."""
+        return self.confirm or self.critical
+
+
+class GuardrailCache:
+    """Guardrail flags of each automation.
+
+    An entry is keyed by entity id and remembers the friendly name it was
+    classified under, so a renamed automation is classified again. Entity
+    registry updates drop the affected entity and label registry updates
+    drop everything, since a renamed label can change confirm status.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._entries: dict[str, tuple[str, GuardrailFlags]] = {}
+
+    def get(self, entity_id: str, friendly_name: str) -> GuardrailFlags | None:
+        """Return the cached classification, or None when it must be computed."""
+        cached = self._entries.get(entity_id)
+        if cached is None or cached[0] != friendly_name:
+            return None
+        return cached[1]
+
+    def set(self, entity_id: str, friendly_name: str, flags: GuardrailFlags) -> None:
+        """Remember an entity's classification under its current friendly name."""
+        self._entries[entity_id] = (friendly_name, flags)
+
+    @callback
+    def async_listen(self) -> Callable[[], None]:
+        """Follow registry updates; return the unsubscribe callback."""
+        bus = self._hass.bus
+        unsubs = [
+            bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_updated),
+            bus.async_listen(lr.EVENT_LABEL_REGISTRY_UPDATED, self._async_label_updated),
+        ]
+
+        @callback
+        def unsubscribe() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return unsubscribe
+
+    @callback
+    def _async_entity_updated(self, event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        self._entries.pop(event.data["entity_id"], None)
+        old_entity_id = event.data.get("old_entity_id")
+        if isinstance(old_entity_id, str):
+            self._entries.pop(old_entity_id, None)
+
+    @callback
+    def _async_label_updated(self, _event: Event[lr.EventLabelRegistryUpdatedData]) -> None:
+        self._entries.clear()
@@ -0,0 +1,211 @@
+"""Append-only mutation journal for AutoSnooze storage."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+# Records name an entry by its section key under "entity_id"; cohorts are keyed by cohort id.
+SECTIONS = ("paused", "scheduled", "cohorts")
+OP_PUT = "put"
+OP_DELETE = "del"
+
+type Snapshot = dict[str, dict[str, dict[str, Any]]]
+type JournalRecord = dict[str, Any]
+
+
+def empty_snapshot() -> Snapshot:
+    """Return a snapshot with no paused, scheduled or cohort entries."""
+    return {section: {} for section in SECTIONS}
+
+
+def diff_snapshots(previous: Snapshot, current: Snapshot) -> list[JournalRecord]:
+    """Return put/delete records that turn the previous snapshot into the current one."""
+    records: list[JournalRecord] = []
+    for section in SECTIONS:
+        before = previous.get(section, {})
+        after = current.get(section, {})
+        for entity_id, entry in after.items():
+            previous_entry = before.get(entity_id)
+            if previous_entry is not entry and previous_entry != entry:
+                records.append({"op": OP_PUT, "section": section, "entity_id": entity_id, "entry": entry})
+        records.extend(
+            {"op": OP_DELETE, "section": section, "entity_id": entity_id}
+            for entity_id in before
+            if entity_id not in after
+        )
+    return records
+
+
+def apply_records(snapshot: Snapshot, records: list[JournalRecord]) -> None:
+    """Replay journal records onto a snapshot in place."""
+    for record in records:
+        section = snapshot.get(record.get("section", ""))
+        entity_id = record.get("entity_id")
+        if section is None or not isinstance(entity_id, str):
+            continue
+        if record.get("op") == OP_PUT and isinstance(record.get("entry"), dict):
+            section[entity_id] = record["entry"]
+        elif record.get("op") == OP_DELETE:
+            section.pop(entity_id, None)
+
+
+def _read_journal(path: str) -> list[JournalRecord]:
+    """Read journal records, truncating the file at a torn line.
+
+    A write interrupted by a crash leaves a line without its newline or
+    with incomplete JSON. Everything from that line on is cut off, so the
+    next append starts on a line of its own instead of behind the torn one.
+    """
+    records: list[JournalRecord] = []
+    good_bytes = 0
+    try:
+        with open(path, "rb") as journal:
+            for line in journal:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("missing newline")
+                    record = json.loads(line)
+                except ValueError:
+                    _LOGGER.warning("Discarding incomplete AutoSnooze journal record in %s", path)
+                    break
+                good_bytes += len(line)
+                if isinstance(record, dict):
+                    records.append(record)
+            else:
+                return records
+    except FileNotFoundError:
+        return records
+    os.truncate(path, good_bytes)
+    return records
+
+
+def _append_journal(path: str, records: list[JournalRecord]) -> None:
+    """Append records as JSON lines and flush them to disk."""
+    payload = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as journal:
+        journal.write(payload)
+        journal.flush()
+        os.fsync(journal.fileno())
+
+
+def _remove_journal(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class JournalStore:
+    """Snapshot store plus an append-only journal of per-entry mutations.
+
+    Saves diff the new snapshot against the last persisted one and append only
+    the changed entries. Once the journal holds more than compact_threshold
+    records the full snapshot is written through the wrapped Store and the
+    journal is removed; the diff is journaled before the snapshot write so
+    replay stays idempotent if the journal outlives it. A threshold of 0 writes a snapshot on every save.
+    Loading replays any journal left on disk on top of the stored snapshot,
+    after importing and removing a legacy store that still holds data.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        store: Store,
+        journal_path: str,
+        *,
+        compact_threshold: int,
+        legacy: Any = None,
+    ) -> None:
+        self._hass = hass
+        self._store = store
+        self._journal_path = journal_path
+        self._compact_threshold = compact_threshold
+        self._legacy = legacy
+        self._persisted: Snapshot = empty_snapshot()
+        self._journal_records = 0
+        self.snapshot_writes = 0
+        self.journal_appends = 0
+
+    @property
+    def journal_records(self) -> int:
+        """Return the number of records appended since the last compaction."""
+        return self._journal_records
+
+    async def async_load(self) -> Snapshot | None:
+        """Load the stored snapshot and replay the journal on top of it."""
+        if self._legacy is not None and (imported := await self._legacy.async_load()):
+            await self.async_save(imported)
+            await self._legacy.async_remove()
+            _LOGGER.info("Imported AutoSnooze storage into the JSON snapshot")
+            return imported
+
+        stored = await self._store.async_load()
+        records = await self._hass.async_add_executor_job(_read_journal, self._journal_path)
+        if not stored and not records:
+            return stored
+
+        snapshot = empty_snapshot()
+        if isinstance(stored, dict):
+            for section in SECTIONS:
+                if isinstance(stored.get(section), dict):
+                    snapshot[section] = dict(stored[section])
+        apply_records(snapshot, records)
+        self._persisted = {section: dict(entries) for section, entries in snapshot.items()}
+        self._journal_records = len(records)
+        return snapshot
+
+    async def async_save(self, data: Snapshot) -> None:
+        """Write a full snapshot and drop the journal it supersedes."""
+        if self._journal_records and (records := diff_snapshots(self._persisted, data)):
+            # Journal the final diff first, so replaying a journal left behind
+            # by a crash before its removal still ends at this snapshot.
+            await self._hass.async_add_executor_job(_append_journal, self._journal_path, records)
+        await self._store.async_save(data)
+        self.snapshot_writes += 1
+        self._persisted = {section: dict(data.get(section, {})) for section in SECTIONS}
+        if self._journal_records:
+            await self._hass.async_add_executor_job(_remove_journal, self._journal_path)
+            self._journal_records = 0
+
+    async def async_close(self) -> None:
+        """Release the legacy store's open resources, such as its SQLite connection."""
+        if self._legacy is not None:
+            await self._legacy.async_close()
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot and its journal."""
+        await self._store.async_remove()
+        await self._hass.async_add_executor_job(_remove_journal, self._journal_path)
+        self._persisted = empty_snapshot()
+        self._journal_records = 0
+
+    async def async_save_changes(self, data: Snapshot) -> None:
+        """Persist a snapshot as journal records, compacting past the threshold."""
+        if not self._compact_threshold:
+            await self.async_save(data)
+            return
+        records = diff_snapshots(self._persisted, data)
+        if self._journal_records + len(records) > self._compact_threshold:
+            await self.async_save(data)
+            return
+        if not records:
+            return
+
+        await self._hass.async_add_executor_job(_append_journal, self._journal_path, records)
+        self.journal_appends += 1
+        self._journal_records += len(records)
+        for record in records:
+            entries = self._persisted[record["section"]]
+            if record["op"] == OP_PUT:
+                entries[record["entity_id"]] = record["entry"]
+            else:
+                entries.pop(record["entity_id"], None)
@@ -0,0 +1,164 @@
+"""Inverted registry index from areas, labels, devices and floors to automations."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import logging
+from typing import Any
+
+from homeassistant.components.automation import EVENT_AUTOMATION_RELOADED, devices_in_automation
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import label_registry as lr
+
+_LOGGER = logging.getLogger(__name__)
+
+INDEX_AREA = "area"
+INDEX_LABEL = "label"
+INDEX_DEVICE = "device"
+INDEX_FLOOR = "floor"
+INDEX_KINDS = (INDEX_AREA, INDEX_LABEL, INDEX_DEVICE, INDEX_FLOOR)
+
+_AUTOMATION_PREFIX = "automation."
+
+type IndexKeys = dict[str, tuple[str, ...]]
+
+
+class AutomationRegistryIndex:
+    """Automation entity ids keyed by area, label, device and floor id.
+
+    The index is built from the entity registry on the first lookup and
+    then kept current from entity, device, area and label registry update
+    events, so a lookup only touches the requested keys. Areas and floors
+    follow the automation entity's own area, as the registry scan it
+    replaces did. Devices are the automation entity's own device plus every
+    device its triggers, conditions and actions reference; an automation
+    reload rebuilds the index on the next lookup to pick up edited configs.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._index: dict[str, dict[str, dict[str, None]]] = {kind: {} for kind in INDEX_KINDS}
+        self._keys: dict[str, IndexKeys] = {}
+        self._built = False
+
+    @callback
+    def async_build(self) -> None:
+        """Index every automation in the entity registry."""
+        self._index = {kind: {} for kind in INDEX_KINDS}
+        self._keys = {}
+        for entry in er.async_get(self._hass).entities.values():
+            if entry.domain == "automation":
+                self._add(entry)
+        self._built = True
+        _LOGGER.debug("Indexed %d automations by area, label, device and floor", len(self._keys))
+
+    @callback
+    def async_listen(self) -> Callable[[], None]:
+        """Follow registry updates; return the unsubscribe callback."""
+        bus = self._hass.bus
+        unsubs = [
+            bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_updated),
+            bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_updated),
+            bus.async_listen(ar.EVENT_AREA_REGISTRY_UPDATED, self._async_area_updated),
+            bus.async_listen(lr.EVENT_LABEL_REGISTRY_UPDATED, self._async_label_updated),
+            bus.async_listen(EVENT_AUTOMATION_RELOADED, self._async_automations_reloaded),
+        ]
+
+        @callback
+        def unsubscribe() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return unsubscribe
+
+    def lookup(self, kind: str, key_ids: Iterable[str]) -> list[str]:
+        """Return automations indexed under any of the keys, without duplicates."""
+        if not self._built:
+            self.async_build()
+        index = self._index[kind]
+        matched: dict[str, None] = {}
+        for key_id in key_ids:
+            matched.update(index.get(key_id, {}))
+        return list(matched)
+
+    def _entry_keys(self, entry: Any) -> IndexKeys:
+        floor_id = None
+        if entry.area_id is not None and (area := ar.async_get(self._hass).async_get_area(entry.area_id)) is not None:
+            floor_id = area.floor_id
+        device_ids = [entry.device_id] if entry.device_id else []
+        device_ids.extend(devices_in_automation(self._hass, entry.entity_id))
+        return {
+            INDEX_AREA: (entry.area_id,) if entry.area_id else (),
+            INDEX_LABEL: tuple(entry.labels or ()),
+            INDEX_DEVICE: tuple(dict.fromkeys(device_ids)),
+            INDEX_FLOOR: (floor_id,) if floor_id else (),
+        }
+
+    def _add(self, entry: Any) -> None:
+        keys = self._entry_keys(entry)
+        self._keys[entry.entity_id] = keys
+        for kind, key_ids in keys.items():
+            for key_id in key_ids:
+                self._index[kind].setdefault(key_id, {})[entry.entity_id] = None
+
+    def _discard(self, entity_id: str) -> None:
+        keys = self._keys.pop(entity_id, None)
+        if keys is None:
+            return
+        for kind, key_ids in keys.items():
+            index = self._index[kind]
+            for key_id in key_ids:
+                members = index.get(key_id)
+                if members is None:
+                    continue
+                members.pop(entity_id, None)
+                if not members:
+                    del index[key_id]
+
+    def _reindex(self, entity_ids: Iterable[str]) -> None:
+        if not self._built:
+            return
+        entity_reg = er.async_get(self._hass)
+        for entity_id in list(entity_ids):
+            self._discard(entity_id)
+            if (entry := entity_reg.async_get(entity_id)) is not None and entry.domain == "automation":
+                self._add(entry)
+
+    @callback
+    def _async_entity_updated(self, event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        if not self._built:
+            return
+        entity_id = event.data["entity_id"]
+        old_entity_id = event.data.get("old_entity_id")
+        if isinstance(old_entity_id, str):
+            self._discard(old_entity_id)
+        if not entity_id.startswith(_AUTOMATION_PREFIX):
+            return
+        if event.data["action"] == "remove":
+            self._discard(entity_id)
+        else:
+            self._reindex([entity_id])
+
+    @callback
+    def _async_device_updated(self, event: Event[dr.EventDeviceRegistryUpdatedData]) -> None:
+        if event.data["action"] == "remove":
+            self._reindex(self._index[INDEX_DEVICE].get(event.data["device_id"], {}))
+
+    @callback
+    def _async_automations_reloaded(self, _event: Event) -> None:
+        # Edited configs can reference other devices; rebuild on the next lookup.
+        self._built = False
+
+    @callback
+    def _async_area_updated(self, event: Event[ar.EventAreaRegistryUpdatedData]) -> None:
+        # An area moving to another floor, or being removed, changes the floor
+        # of every automation in it; entity updates cover the area key itself.
+        self._reindex(self._index[INDEX_AREA].get(event.data["area_id"], {}))
+
+    @callback
+    def _async_label_updated(self, event: Event[lr.EventLabelRegistryUpdatedData]) -> None:
+        if event.data["action"] == "remove":
+            self._reindex(self._index[INDEX_LABEL].get(event.data["label_id"], {}))
@@ -0,0 +1,48 @@
+"""Cache of resolved resume preset and local-time targets."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from datetime import date, datetime
+
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+
+class ResumePresetCache:
+    """Resolved resume targets keyed by preset and local date.
+
+    The next occurrence of a preset cannot change before it is reached, so an
+    entry stays valid until its target passes or the local date rolls over.
+    Core config updates drop every entry because they can move the time zone
+    or the location the sun events are computed for.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._entries: dict[Hashable, tuple[date, datetime]] = {}
+
+    def get(self, key: Hashable, now: datetime) -> datetime | None:
+        """Return the cached target, or None when it must be resolved again."""
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        local_date, target = cached
+        if now >= target or dt_util.as_local(now).date() != local_date:
+            del self._entries[key]
+            return None
+        return target
+
+    def set(self, key: Hashable, now: datetime, target: datetime) -> None:
+        """Remember a target resolved at now."""
+        self._entries[key] = (dt_util.as_local(now).date(), target)
+
+    @callback
+    def async_listen(self) -> Callable[[], None]:
+        """Follow core config updates; return the unsubscribe callback."""
+        return self._hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._async_config_updated)
+
+    @callback
+    def _async_config_updated(self, _event: Event) -> None:
+        self._entries.clear()
@@ -0,0 +1,247 @@
+"""SQLite persistence backend for AutoSnooze storage."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from ..models import STORAGE_KEYS, legacy_stored_entry, parse_stored_datetime
+from .journal import OP_PUT, SECTIONS, JournalRecord, Snapshot, diff_snapshots, empty_snapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS paused (
+    entity_id TEXT PRIMARY KEY,
+    resume_at REAL,
+    disable_at REAL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS paused_resume_at ON paused (resume_at);
+CREATE TABLE IF NOT EXISTS scheduled (
+    entity_id TEXT PRIMARY KEY,
+    disable_at REAL,
+    resume_at REAL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scheduled_disable_at ON scheduled (disable_at);
+CREATE INDEX IF NOT EXISTS scheduled_resume_at ON scheduled (resume_at);
+CREATE TABLE IF NOT EXISTS cohorts (
+    cohort_id TEXT PRIMARY KEY,
+    resume_at REAL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cohorts_resume_at ON cohorts (resume_at);
+"""
+
+# Each section is read as live rows, resume_at > now in deadline order, plus
+# for paused and cohorts the rows already due, which restore still needs to
+# re-enable their automation. Cohort members have no deadline of their own
+# and come with the due rows. Expired scheduled rows need no restore work
+# and are deleted instead.
+_SELECT_DUE = {
+    "paused": "SELECT entity_id, entry FROM paused WHERE resume_at IS NULL OR resume_at <= ? ORDER BY resume_at",
+    "cohorts": "SELECT cohort_id, entry FROM cohorts WHERE resume_at IS NULL OR resume_at <= ? ORDER BY resume_at",
+}
+_SELECT_LIVE = {
+    "paused": "SELECT entity_id, entry FROM paused WHERE resume_at > ? ORDER BY resume_at",
+    "scheduled": "SELECT entity_id, entry FROM scheduled WHERE resume_at > ? ORDER BY disable_at",
+    "cohorts": "SELECT cohort_id, entry FROM cohorts WHERE resume_at > ? ORDER BY resume_at",
+}
+_DELETE_EXPIRED_SCHEDULED = "DELETE FROM scheduled WHERE resume_at <= ?"
+_UPSERT = {
+    "paused": "INSERT OR REPLACE INTO paused (entity_id, resume_at, disable_at, entry) VALUES (?, ?, ?, ?)",
+    "scheduled": "INSERT OR REPLACE INTO scheduled (entity_id, disable_at, resume_at, entry) VALUES (?, ?, ?, ?)",
+    "cohorts": "INSERT OR REPLACE INTO cohorts (cohort_id, resume_at, entry) VALUES (?, ?, ?)",
+}
+_DELETE = {
+    section: f"DELETE FROM {section} WHERE {'cohort_id' if section == 'cohorts' else 'entity_id'} = ?"
+    for section in SECTIONS
+}
+
+
+def _epoch(entry: dict[str, Any], name: str) -> float | None:
+    """Return epoch seconds for an entry datetime in either storage layout, or None."""
+    value = entry.get(STORAGE_KEYS[name], entry.get(name))
+    try:
+        return parse_stored_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _row(section: str, entity_id: str, entry: dict[str, Any]) -> tuple[Any, ...]:
+    payload = json.dumps(entry, separators=(",", ":"))
+    if section == "paused":
+        return (entity_id, _epoch(entry, "resume_at"), _epoch(entry, "disable_at"), payload)
+    if section == "cohorts":
+        return (entity_id, _epoch(entry, "resume_at"), payload)
+    return (entity_id, _epoch(entry, "disable_at"), _epoch(entry, "resume_at"), payload)
+
+
+def _open(path: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Executor jobs run on different threads; SqliteStore serializes them.
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+def _read_rows(connection: sqlite3.Connection, now: float) -> Snapshot | None:
+    """Read due and live rows ordered by deadline, dropping expired scheduled rows.
+
+    Returns None when no rows are left, so an empty database never stands in
+    for another backend's data.
+    """
+    snapshot = empty_snapshot()
+    with connection:
+        connection.execute(_DELETE_EXPIRED_SCHEDULED, (now,))
+        for section in SECTIONS:
+            queries = [_SELECT_DUE[section]] if section in _SELECT_DUE else []
+            for query in [*queries, _SELECT_LIVE[section]]:
+                for entity_id, payload in connection.execute(query, (now,)):
+                    try:
+                        entry = json.loads(payload)
+                    except ValueError:
+                        _LOGGER.warning("Ignoring unreadable AutoSnooze %s row for %s", section, entity_id)
+                        continue
+                    snapshot[section][entity_id] = entry
+    if not any(snapshot.values()):
+        return None
+    return snapshot
+
+
+def _replace_rows(connection: sqlite3.Connection, snapshot: Snapshot) -> None:
+    with connection:
+        for section in SECTIONS:
+            connection.execute(f"DELETE FROM {section}")
+            connection.executemany(
+                _UPSERT[section],
+                [_row(section, entity_id, entry) for entity_id, entry in snapshot.get(section, {}).items()],
+            )
+
+
+def _apply_rows(connection: sqlite3.Connection, records: list[JournalRecord]) -> None:
+    with connection:
+        for record in records:
+            section = record["section"]
+            if record["op"] == OP_PUT:
+                connection.execute(_UPSERT[section], _row(section, record["entity_id"], record["entry"]))
+            else:
+                connection.execute(_DELETE[section], (record["entity_id"],))
+
+
+def _export_v2(snapshot: Snapshot | None) -> dict[str, dict[str, dict[str, Any]]]:
+    """Convert stored rows to a STORAGE_VERSION 2 snapshot with cohorts folded into their members."""
+    if snapshot is None:
+        return {"paused": {}, "scheduled": {}}
+    cohorts = snapshot["cohorts"]
+    paused = {}
+    for entity_id, entry in snapshot["paused"].items():
+        cohort_id = entry.get(STORAGE_KEYS["cohort_id"], entry.get("cohort_id"))
+        cohort = cohorts.get(cohort_id) if isinstance(cohort_id, str) else None
+        paused[entity_id] = legacy_stored_entry(entry, cohort)
+    scheduled = {entity_id: legacy_stored_entry(entry) for entity_id, entry in snapshot["scheduled"].items()}
+    return {"paused": paused, "scheduled": scheduled}
+
+
+class SqliteStore:
+    """Paused, scheduled and cohort entries stored as indexed rows in a SQLite file.
+
+    Saves diff the new snapshot against the rows last written and upsert or
+    delete only the entries that changed, in one transaction. Rows keep the
+    storage entry dict as JSON next to epoch deadline columns, so importing
+    a JSON snapshot is lossless; exports use the STORAGE_VERSION 2 layout.
+    A legacy store holding data on load is imported and then removed. The
+    store keeps one connection open until it is closed or removed.
+    """
+
+    def __init__(self, hass: HomeAssistant, database_path: str, *, legacy: Any = None) -> None:
+        self._hass = hass
+        self._database_path = database_path
+        self._legacy = legacy
+        self._connection: sqlite3.Connection | None = None
+        self._connection_lock = threading.Lock()
+        self._persisted: Snapshot = empty_snapshot()
+        self.row_writes = 0
+
+    def _run[T](self, operation: Callable[..., T], *args: Any) -> T:
+        """Run a database operation on the store's connection; called in the executor."""
+        with self._connection_lock:
+            if self._connection is None:
+                self._connection = _open(self._database_path)
+            return operation(self._connection, *args)
+
+    def _read(self, now: float) -> Snapshot | None:
+        with self._connection_lock:
+            if self._connection is None and not os.path.exists(self._database_path):
+                return None
+        return self._run(_read_rows, now)
+
+    def _close(self, *, remove: bool = False) -> None:
+        with self._connection_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            if remove:
+                try:
+                    os.remove(self._database_path)
+                except FileNotFoundError:
+                    pass
+
+    async def async_load(self) -> Snapshot | None:
+        """Load due and live rows ordered by deadline, importing any legacy snapshot first."""
+        if self._legacy is not None and (imported := await self._legacy.async_load()):
+            await self.async_import(imported)
+            await self._legacy.async_remove()
+            _LOGGER.info("Imported AutoSnooze storage into %s", self._database_path)
+
+        snapshot = await self._hass.async_add_executor_job(self._read, dt_util.utcnow().timestamp())
+        if snapshot is not None:
+            self._persisted = {section: dict(entries) for section, entries in snapshot.items()}
+        return snapshot
+
+    async def async_import(self, data: Snapshot) -> None:
+        """Replace all rows with the entries of a JSON storage snapshot in either layout."""
+        await self.async_save({section: data[section] for section in SECTIONS if isinstance(data.get(section), dict)})
+
+    async def async_export(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the rows as a STORAGE_VERSION 2 JSON snapshot."""
+        snapshot = await self._hass.async_add_executor_job(self._read, dt_util.utcnow().timestamp())
+        return _export_v2(snapshot)
+
+    async def async_save(self, data: Snapshot) -> None:
+        """Replace all rows with the given snapshot."""
+        await self._hass.async_add_executor_job(self._run, _replace_rows, data)
+        self._persisted = {section: dict(data.get(section, {})) for section in SECTIONS}
+
+    async def async_save_changes(self, data: Snapshot) -> None:
+        """Upsert and delete only the rows that changed since the last write."""
+        records = diff_snapshots(self._persisted, data)
+        if not records:
+            return
+        await self._hass.async_add_executor_job(self._run, _apply_rows, records)
+        self.row_writes += len(records)
+        for record in records:
+            entries = self._persisted[record["section"]]
+            if record["op"] == OP_PUT:
+                entries[record["entity_id"]] = record["entry"]
+            else:
+                entries.pop(record["entity_id"], None)
+
+    async def async_close(self) -> None:
+        """Close the database connection; the next operation reopens it."""
+        await self._hass.async_add_executor_job(self._close)
+
+    async def async_remove(self) -> None:
+        """Close the connection and delete the database file."""
+        await self._hass.async_add_executor_job(partial(self._close, remove=True))
+        self._persisted = empty_snapshot()
@@ -6,58 +6,233 @@ import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from inspect import isawaitable
+from typing import Any
 
-from ..const import MAX_SAVE_RETRIES, SAVE_RETRY_DELAYS, TRANSIENT_ERRORS
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+from ..const import (
+    DOMAIN,
+    JOURNAL_COMPACT_THRESHOLD,
+    MAX_SAVE_RETRIES,
+    SAVE_RETRY_DELAYS,
+    STORAGE_BACKEND_JOURNAL,
+    STORAGE_BACKEND_SQLITE,
+    STORAGE_VERSION,
+    TRANSIENT_ERRORS,
+)
+from ..models import compact_stored_entry
 from ..runtime.state import AutomationPauseData
+from .journal import SECTIONS, JournalStore
+from .sqlite_store import SqliteStore
 
 _LOGGER = logging.getLogger(__name__)
 
+Sleep = Callable[[float], Awaitable[object]]
+
+
+class AutoSnoozeStore(Store[dict[str, Any]]):
+    """Snapshot Store that migrates older layouts when they are loaded."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Convert a STORAGE_VERSION 2 snapshot to short keys and epoch seconds."""
+        if old_major_version >= 3:
+            return old_data
+        migrated = dict(old_data)
+        for section in SECTIONS:
+            entries = old_data.get(section)
+            if isinstance(entries, dict):
+                migrated[section] = {
+                    entity_id: compact_stored_entry(entry) if isinstance(entry, dict) else entry
+                    for entity_id, entry in entries.items()
+                }
+        _LOGGER.info("Migrated AutoSnooze storage from version %d to %d", old_major_version, STORAGE_VERSION)
+        return migrated
+
+
+def create_store(hass: HomeAssistant, backend: str) -> JournalStore | SqliteStore:
+    """Create the persistence store for the configured storage backend.
+
+    The snapshot and journal backends share the snapshot file and journal
+    path, so switching between them replays or compacts whatever the other
+    one left behind. Switching to or from the SQLite backend imports the
+    other backend's data on the next load and removes the old copy.
+    """
+    snapshot_store = AutoSnoozeStore(hass, STORAGE_VERSION, f"{DOMAIN}.storage")
+    journal_path = hass.config.path(STORAGE_DIR, f"{DOMAIN}.journal")
+    database_path = hass.config.path(STORAGE_DIR, f"{DOMAIN}.db")
+    if backend == STORAGE_BACKEND_SQLITE:
+        legacy = JournalStore(hass, snapshot_store, journal_path, compact_threshold=0)
+        return SqliteStore(hass, database_path, legacy=legacy)
+    return JournalStore(
+        hass,
+        snapshot_store,
+        journal_path,
+        compact_threshold=JOURNAL_COMPACT_THRESHOLD if backend == STORAGE_BACKEND_JOURNAL else 0,
+        legacy=SqliteStore(hass, database_path),
+    )
+
+
+class SaveWriter:
+    """Group-commit writer that merges save requests into one physical write.
+
+    The first request opens a commit and waits up to the entry's save
+    coalesce window; every request made before the snapshot is taken joins
+    that commit and receives its result. Requests arriving while a write is
+    in flight open the next commit, which runs after the write completes.
+    """
+
+    def __init__(self, data: AutomationPauseData) -> None:
+        self._data = data
+        self._pending: asyncio.Future[bool] | None = None
+        self._flush_requested = asyncio.Event()
+        self._commits: set[asyncio.Task[None]] = set()
+        self.requested_saves = 0
+        self.coalesced_saves = 0
+        self.physical_writes = 0
+
+    async def async_save(self, *, sleep: Sleep = asyncio.sleep) -> bool:
+        """Join the open commit, or open one, and wait until it is written."""
+        self.requested_saves += 1
+        if self._pending is None:
+            self._pending = asyncio.get_running_loop().create_future()
+            commit = asyncio.create_task(self._async_commit(self._pending, sleep))
+            self._commits.add(commit)
+            commit.add_done_callback(self._commits.discard)
+        else:
+            self.coalesced_saves += 1
+        return await asyncio.shield(self._pending)
+
+    async def async_flush(self) -> None:
+        """Write any open commit immediately and wait for in-flight writes."""
+        self._flush_requested.set()
+        while self._commits:
+            await asyncio.gather(*self._commits, return_exceptions=True)
+        self._flush_requested.clear()
+
+    async def _async_commit(self, pending: asyncio.Future[bool], sleep: Sleep) -> None:
+        window = self._data.save_coalesce_window.total_seconds()
+        if window > 0 and not self._flush_requested.is_set():
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), window)
+            except TimeoutError:
+                pass
+        try:
+            async with self._data.save_lock:
+                if self._pending is pending:
+                    self._pending = None
+                self.physical_writes += 1
+                result = await _async_write(self._data, sleep)
+        except asyncio.CancelledError:
+            if self._pending is pending:
+                self._pending = None
+            pending.cancel()
+            raise
+        except Exception as err:
+            if self._pending is pending:
+                self._pending = None
+            pending.set_exception(err)
+            return
+        pending.set_result(result)
+
+
+def _save_writer(data: AutomationPauseData) -> SaveWriter:
+    if data.save_writer is None:
+        data.save_writer = SaveWriter(data)
+    return data.save_writer
+
 
 async def async_save(
     data: AutomationPauseData,
     *,
-    sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    sleep: Sleep = asyncio.sleep,
 ) -> bool:
-    """Save snoozed automations to storage with retry logic."""
+    """Save snoozed automations to storage with retry logic.
+
+    Saves requested within the coalesce window share one physical write;
+    the call returns once the write covering this request has finished.
+    """
     if data.store is None:
         return True
+    return await _save_writer(data).async_save(sleep=sleep)
 
-    async with data.save_lock:
-        save_data = {
-            "paused": data.get_paused_dict(),
-            "scheduled": data.get_scheduled_dict(),
-        }
 
-        for attempt, delay in enumerate(SAVE_RETRY_DELAYS, start=1):
-            try:
-                result = data.store.async_save(save_data)
-                if isawaitable(result):
-                    await result
-                return True
-            except TRANSIENT_ERRORS as err:
-                _LOGGER.warning(
-                    "Save attempt %d failed, retrying in %.1fs: %s",
-                    attempt,
-                    delay,
-                    err,
-                )
-                await sleep(delay)
-            except Exception as err:
-                _LOGGER.error("Failed to save data: %s", err)
-                return False
+def save_stats(data: AutomationPauseData) -> dict[str, int]:
+    """Return how many saves were requested, merged into another write, and written."""
+    writer = data.save_writer
+    if writer is None:
+        return {"requested": 0, "coalesced": 0, "physical_writes": 0}
+    return {
+        "requested": writer.requested_saves,
+        "coalesced": writer.coalesced_saves,
+        "physical_writes": writer.physical_writes,
+    }
+
+
+async def async_flush_saves(data: AutomationPauseData) -> None:
+    """Write pending saves now and wait until storage is up to date."""
+    if data.save_writer is not None:
+        await data.save_writer.async_flush()
+
+
+async def async_export_store(data: AutomationPauseData) -> dict[str, dict[str, dict[str, Any]]] | None:
+    """Return the SQLite rows as a STORAGE_VERSION 2 snapshot, or None for the JSON backends."""
+    if isinstance(data.store, SqliteStore):
+        return await data.store.async_export()
+    return None
+
+
+async def async_close_store(data: AutomationPauseData) -> None:
+    """Release the store's open resources, such as a SQLite connection.
 
+    The JSON backends keep the SQLite store they import from as their
+    legacy store, so closing them closes its connection too.
+    """
+    if isinstance(data.store, (JournalStore, SqliteStore)):
+        await data.store.async_close()
+
+
+async def _async_write(data: AutomationPauseData, sleep: Sleep) -> bool:
+    """Write the current snapshot with retry logic; the caller holds save_lock."""
+    if data.store is None:
+        return True
+    save_data = data.get_storage_snapshot()
+
+    store = data.store
+    write = store.async_save_changes if isinstance(store, (JournalStore, SqliteStore)) else store.async_save
+
+    for attempt, delay in enumerate(SAVE_RETRY_DELAYS, start=1):
         try:
-            result = data.store.async_save(save_data)
+            result = write(save_data)
             if isawaitable(result):
                 await result
             return True
         except TRANSIENT_ERRORS as err:
-            _LOGGER.error(
-                "Failed to save data after %d attempts: %s",
-                MAX_SAVE_RETRIES + 1,
+            _LOGGER.warning(
+                "Save attempt %d failed, retrying in %.1fs: %s",
+                attempt,
+                delay,
                 err,
             )
-            return False
+            await sleep(delay)
         except Exception as err:
             _LOGGER.error("Failed to save data: %s", err)
             return False
+
+    try:
+        result = write(save_data)
+        if isawaitable(result):
+            await result
+        return True
+    except TRANSIENT_ERRORS as err:
+        _LOGGER.error(
+            "Failed to save data after %d attempts: %s",
+            MAX_SAVE_RETRIES + 1,
+            err,
+        )
+        return False
+    except Exception as err:
+        _LOGGER.error("Failed to save data: %s", err)
+        return False
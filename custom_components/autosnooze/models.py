@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from math import ceil
 from typing import Any
 
 from homeassistant.util import dt as dt_util
@@ -31,6 +33,12 @@ def parse_datetime_utc(dt_str: str) -> datetime:
     Raises:
         ValueError: If the string cannot be parsed as a datetime
     """
+    if isinstance(dt_str, str) and dt_str.endswith("+00:00"):
+        # Fast path for the exact format we persist: isoformat() of a UTC value.
+        try:
+            return datetime.fromisoformat(dt_str)
+        except ValueError:
+            pass
     parsed = dt_util.parse_datetime(dt_str)
     if parsed is None:
         raise ValueError(f"Invalid datetime string: {dt_str}")
@@ -70,8 +78,128 @@ def ensure_utc_aware(dt: datetime | None) -> datetime | None:
     return dt.astimezone(timezone.utc)
 
 
+# STORAGE_VERSION 3 stores entries under these short keys, with datetimes as
+# integer epoch seconds and default values omitted.
+STORAGE_KEYS: dict[str, str] = {
+    "friendly_name": "n",
+    "resume_at": "r",
+    "paused_at": "p",
+    "disable_at": "d",
+    "days": "D",
+    "hours": "H",
+    "minutes": "M",
+    "notification_trigger": "t",
+    "notification_lead_minutes": "l",
+    "resume_retries": "x",
+    "cohort_id": "c",
+}
+_STORAGE_FIELDS = {short: name for name, short in STORAGE_KEYS.items()}
+_DATETIME_FIELDS = frozenset({"resume_at", "paused_at", "disable_at"})
+
+
+def to_epoch(dt: datetime) -> int:
+    """Return a UTC-aware datetime as epoch seconds, rounded up to the next second.
+
+    Rounding up keeps a restored deadline from falling before the one that
+    was stored, so a reloaded snooze never resumes early.
+    """
+    return ceil(dt.timestamp())
+
+
+def parse_stored_datetime(value: Any) -> datetime:
+    """Parse a stored datetime given as epoch seconds or an ISO string.
+
+    Raises:
+        ValueError: If a string cannot be parsed as a datetime
+        TypeError: If the value is neither a number nor a string
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value, timezone.utc)
+    if isinstance(value, str):
+        return parse_datetime_utc(value)
+    raise TypeError(f"Invalid stored datetime: {value!r}")
+
+
+def compact_stored_entry(entry: dict[str, Any]) -> dict[str, Any]:
+    """Convert a STORAGE_VERSION 2 entry dict to the version 3 layout.
+
+    Unparseable datetimes are kept as-is so load validation still rejects them.
+    """
+    result: dict[str, Any] = {}
+    for name, value in entry.items():
+        if name in _DATETIME_FIELDS and isinstance(value, str):
+            try:
+                value = to_epoch(parse_datetime_utc(value))
+            except ValueError:
+                pass
+        result[STORAGE_KEYS.get(name, name)] = value
+    return result
+
+
+def expand_stored_entry(entry: dict[str, Any]) -> dict[str, Any]:
+    """Map short version 3 keys back to field names, leaving other keys alone."""
+    return {_STORAGE_FIELDS.get(key, key): value for key, value in entry.items()}
+
+
+def legacy_stored_entry(entry: dict[str, Any], cohort: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Convert a stored entry in either layout to the STORAGE_VERSION 2 layout.
+
+    Epoch-second datetimes become ISO strings. Version 2 has no cohorts, so a
+    cohort member given its stored cohort takes the cohort's shared fields.
+    """
+    result = expand_stored_entry(entry)
+    if cohort is not None:
+        result = {**expand_stored_entry(cohort), **result}
+        result.pop("cohort_id", None)
+    for name in _DATETIME_FIELDS:
+        value = result.get(name)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            result[name] = parse_stored_datetime(value).isoformat()
+    return result
+
+
+class _SerializedEntry(ABC):
+    """Cache an entry's serialized forms until one of its fields is reassigned.
+
+    The to_dict() result is shared by sensor attributes and the to_storage()
+    result by storage snapshots, so callers must treat both as read-only.
+    """
+
+    _serialized: dict[str, Any] | None
+    _stored: dict[str, Any] | None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Writes go straight to the instance dict: this runs for every field in __init__.
+        attributes = vars(self)
+        attributes[name] = value
+        if name != "_serialized" and name != "_stored":
+            attributes["_serialized"] = attributes["_stored"] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for attributes."""
+        if (serialized := self._serialized) is None:
+            serialized = self._serialize()
+            vars(self)["_serialized"] = serialized
+        return serialized
+
+    def to_storage(self) -> dict[str, Any]:
+        """Convert to the compact STORAGE_VERSION 3 dictionary."""
+        if (stored := self._stored) is None:
+            stored = self._serialize_storage()
+            vars(self)["_stored"] = stored
+        return stored
+
+    @abstractmethod
+    def _serialize(self) -> dict[str, Any]:
+        """Build the to_dict() form."""
+
+    @abstractmethod
+    def _serialize_storage(self) -> dict[str, Any]:
+        """Build the to_storage() form."""
+
+
 @dataclass
-class PausedAutomation:
+class PausedAutomation(_SerializedEntry):
     """Represent a snoozed automation."""
 
     entity_id: str
@@ -85,9 +213,11 @@ class PausedAutomation:
     notification_trigger: NotificationTrigger = NOTIFICATION_TRIGGER_NONE
     notification_lead_minutes: int | None = None
     resume_retries: int = 0
+    cohort_id: str | None = None  # Set while the snooze shares a SnoozeCohort deadline
+    _serialized: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _stored: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for storage/attributes."""
+    def _serialize(self) -> dict[str, Any]:
         result = {
             "friendly_name": self.friendly_name,
             "resume_at": self.resume_at.isoformat(),
@@ -102,22 +232,52 @@ class PausedAutomation:
             result["disable_at"] = self.disable_at.isoformat()
         if self.notification_lead_minutes is not None:
             result["notification_lead_minutes"] = self.notification_lead_minutes
+        if self.cohort_id is not None:
+            result["cohort_id"] = self.cohort_id
+        return result
+
+    def _serialize_storage(self) -> dict[str, Any]:
+        if self.cohort_id is not None:
+            # Cohort members mirror the shared fields stored with the cohort.
+            member: dict[str, Any] = {"n": self.friendly_name, "c": self.cohort_id}
+            if self.resume_retries:
+                member["x"] = self.resume_retries
+            return member
+        result: dict[str, Any] = {
+            "n": self.friendly_name,
+            "r": to_epoch(self.resume_at),
+            "p": to_epoch(self.paused_at),
+        }
+        if self.days:
+            result["D"] = self.days
+        if self.hours:
+            result["H"] = self.hours
+        if self.minutes:
+            result["M"] = self.minutes
+        if self.disable_at is not None:
+            result["d"] = to_epoch(self.disable_at)
+        if self.notification_trigger != NOTIFICATION_TRIGGER_NONE:
+            result["t"] = self.notification_trigger
+        if self.notification_lead_minutes is not None:
+            result["l"] = self.notification_lead_minutes
+        if self.resume_retries:
+            result["x"] = self.resume_retries
         return result
 
     @classmethod
     def from_dict(cls, entity_id: str, data: dict[str, Any]) -> PausedAutomation:
-        """Create from dictionary."""
+        """Create from a dictionary with ISO or epoch-second datetimes."""
         disable_at = None
         if "disable_at" in data:
-            disable_at = parse_datetime_utc(data["disable_at"])
+            disable_at = parse_stored_datetime(data["disable_at"])
         notification_trigger = data.get("notification_trigger", NOTIFICATION_TRIGGER_NONE)
         notification_lead_minutes = data.get("notification_lead_minutes")
         validate_notification_config(notification_trigger, notification_lead_minutes)
         return cls(
             entity_id=entity_id,
             friendly_name=data.get("friendly_name", entity_id),
-            resume_at=parse_datetime_utc(data["resume_at"]),
-            paused_at=parse_datetime_utc(data["paused_at"]),
+            resume_at=parse_stored_datetime(data["resume_at"]),
+            paused_at=parse_stored_datetime(data["paused_at"]),
             days=data.get("days", 0),
             hours=data.get("hours", 0),
             minutes=data.get("minutes", 0),
@@ -125,11 +285,91 @@ class PausedAutomation:
             notification_trigger=notification_trigger,
             notification_lead_minutes=notification_lead_minutes,
             resume_retries=data.get("resume_retries", 0),
+            cohort_id=data.get("cohort_id"),
         )
 
 
+# Fields a cohort shares with its members; members keep their own copies so
+# attributes and flows can read an entry without looking up its cohort.
+COHORT_FIELDS = (
+    "resume_at",
+    "paused_at",
+    "days",
+    "hours",
+    "minutes",
+    "disable_at",
+    "notification_trigger",
+    "notification_lead_minutes",
+)
+
+
 @dataclass
-class ScheduledSnooze:
+class SnoozeCohort(_SerializedEntry):
+    """Represent automations snoozed together under one shared deadline.
+
+    Members are the PausedAutomation entries whose cohort_id names this
+    cohort. The members mapping is runtime bookkeeping and is not part of
+    the serialized forms; stored members reference the cohort instead.
+    """
+
+    cohort_id: str
+    resume_at: datetime
+    paused_at: datetime
+    days: int = 0
+    hours: int = 0
+    minutes: int = 0
+    disable_at: datetime | None = None
+    notification_trigger: NotificationTrigger = NOTIFICATION_TRIGGER_NONE
+    notification_lead_minutes: int | None = None
+    members: dict[str, None] = field(default_factory=dict, repr=False, compare=False)
+    _serialized: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _stored: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_member(cls, cohort_id: str, paused: PausedAutomation) -> SnoozeCohort:
+        """Create a cohort sharing the fields of one of its members."""
+        return cls(cohort_id, **{name: getattr(paused, name) for name in COHORT_FIELDS})
+
+    def mirror(self, paused: PausedAutomation) -> None:
+        """Copy the shared fields onto a member entry."""
+        for name in COHORT_FIELDS:
+            if getattr(paused, name) != (value := getattr(self, name)):
+                setattr(paused, name, value)
+
+    def _serialize(self) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "resume_at": self.resume_at.isoformat(),
+            "paused_at": self.paused_at.isoformat(),
+            "days": self.days,
+            "hours": self.hours,
+            "minutes": self.minutes,
+            "notification_trigger": self.notification_trigger,
+        }
+        if self.disable_at is not None:
+            result["disable_at"] = self.disable_at.isoformat()
+        if self.notification_lead_minutes is not None:
+            result["notification_lead_minutes"] = self.notification_lead_minutes
+        return result
+
+    def _serialize_storage(self) -> dict[str, Any]:
+        result: dict[str, Any] = {"r": to_epoch(self.resume_at), "p": to_epoch(self.paused_at)}
+        if self.days:
+            result["D"] = self.days
+        if self.hours:
+            result["H"] = self.hours
+        if self.minutes:
+            result["M"] = self.minutes
+        if self.disable_at is not None:
+            result["d"] = to_epoch(self.disable_at)
+        if self.notification_trigger != NOTIFICATION_TRIGGER_NONE:
+            result["t"] = self.notification_trigger
+        if self.notification_lead_minutes is not None:
+            result["l"] = self.notification_lead_minutes
+        return result
+
+
+@dataclass
+class ScheduledSnooze(_SerializedEntry):
     """Represent a scheduled future snooze."""
 
     entity_id: str
@@ -138,9 +378,10 @@ class ScheduledSnooze:
     resume_at: datetime
     notification_trigger: NotificationTrigger = NOTIFICATION_TRIGGER_NONE
     notification_lead_minutes: int | None = None
+    _serialized: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _stored: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for storage/attributes."""
+    def _serialize(self) -> dict[str, Any]:
         result: dict[str, Any] = {
             "friendly_name": self.friendly_name,
             "disable_at": self.disable_at.isoformat(),
@@ -151,17 +392,29 @@ class ScheduledSnooze:
             result["notification_lead_minutes"] = self.notification_lead_minutes
         return result
 
+    def _serialize_storage(self) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "n": self.friendly_name,
+            "d": to_epoch(self.disable_at),
+            "r": to_epoch(self.resume_at),
+        }
+        if self.notification_trigger != NOTIFICATION_TRIGGER_NONE:
+            result["t"] = self.notification_trigger
+        if self.notification_lead_minutes is not None:
+            result["l"] = self.notification_lead_minutes
+        return result
+
     @classmethod
     def from_dict(cls, entity_id: str, data: dict[str, Any]) -> ScheduledSnooze:
-        """Create from dictionary."""
+        """Create from a dictionary with ISO or epoch-second datetimes."""
         notification_trigger = data.get("notification_trigger", NOTIFICATION_TRIGGER_NONE)
         notification_lead_minutes = data.get("notification_lead_minutes")
         validate_notification_config(notification_trigger, notification_lead_minutes)
         return cls(
             entity_id=entity_id,
             friendly_name=data.get("friendly_name", entity_id),
-            disable_at=parse_datetime_utc(data["disable_at"]),
-            resume_at=parse_datetime_utc(data["resume_at"]),
+            disable_at=parse_stored_datetime(data["disable_at"]),
+            resume_at=parse_stored_datetime(data["resume_at"]),
             notification_trigger=notification_trigger,
             notification_lead_minutes=notification_lead_minutes,
         )
@@ -0,0 +1,71 @@
+"""Cohort bookkeeping for snoozes that share one resume deadline."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from homeassistant.util.ulid import ulid_now
+
+from ..models import PausedAutomation, SnoozeCohort
+from .state import AutomationPauseData
+
+
+def form_cohort(data: AutomationPauseData, members: list[PausedAutomation]) -> SnoozeCohort:
+    """Register a cohort for paused entries that share every cohort field.
+
+    Callers cancel each member's previous deadline before forming the cohort
+    and arm the cohort deadline afterwards.
+    """
+    cohort = SnoozeCohort.from_member(ulid_now(), members[0])
+    for paused in members:
+        paused.cohort_id = cohort.cohort_id
+        cohort.members[paused.entity_id] = None
+    data.cohorts[cohort.cohort_id] = cohort
+    return cohort
+
+
+def leave_cohort(data: AutomationPauseData, entity_id: str) -> None:
+    """Detach an entity from its cohort, dropping the cohort once it is empty."""
+    paused = data.paused.get(entity_id)
+    if paused is None or (cohort_id := paused.cohort_id) is None:
+        return
+    paused.cohort_id = None
+    cohort = data.cohorts.get(cohort_id)
+    if cohort is None:
+        return
+    cohort.members.pop(entity_id, None)
+    if not cohort.members:
+        del data.cohorts[cohort_id]
+        if unsub := data.cohort_timers.pop(cohort_id, None):
+            unsub()
+
+
+def sync_cohort_members(data: AutomationPauseData, cohort: SnoozeCohort) -> list[str]:
+    """Drop members whose entry no longer references the cohort; return the rest.
+
+    A cohort left without members is removed from runtime state.
+    """
+    live = [
+        entity_id
+        for entity_id in cohort.members
+        if (paused := data.paused.get(entity_id)) is not None and paused.cohort_id == cohort.cohort_id
+    ]
+    if len(live) != len(cohort.members):
+        cohort.members = dict.fromkeys(live)
+    if not live and data.cohorts.get(cohort.cohort_id) is cohort:
+        del data.cohorts[cohort.cohort_id]
+    return live
+
+
+def covered_cohorts(data: AutomationPauseData, entity_ids: Iterable[str]) -> list[SnoozeCohort]:
+    """Return the cohorts whose members are all among the given entities."""
+    targeted = set(entity_ids)
+    covered: dict[str, SnoozeCohort] = {}
+    for entity_id in targeted:
+        paused = data.paused.get(entity_id)
+        if paused is None or (cohort_id := paused.cohort_id) is None or cohort_id in covered:
+            continue
+        cohort = data.cohorts.get(cohort_id)
+        if cohort is not None and targeted.issuperset(cohort.members):
+            covered[cohort_id] = cohort
+    return list(covered.values())
@@ -3,21 +3,30 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from inspect import isawaitable
 import logging
 
-from homeassistant.const import ATTR_ENTITY_ID, ATTR_FRIENDLY_NAME
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_FRIENDLY_NAME, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import async_track_point_in_time
 
-from ..infrastructure.storage import async_save as infrastructure_async_save
-from ..models import ScheduledSnooze
-from .state import AutomationPauseData
+from ..const import STATE_CHANGE_BATCH_SIZE
+from ..infrastructure.storage import (
+    async_close_store as infrastructure_async_close_store,
+    async_flush_saves as infrastructure_async_flush_saves,
+    async_save as infrastructure_async_save,
+)
+from ..models import ScheduledSnooze, SnoozeCohort
+from .state import AutomationPauseData, ServiceCallStats
 from .timers import (
     NotificationCallback,
+    ResumeBatchCallback,
     ResumeCallback,
+    ScheduledDisableBatchCallback,
     ScheduledDisableCallback,
+    schedule_cohort_resume as runtime_schedule_cohort_resume,
     schedule_disable as runtime_schedule_disable,
     schedule_pre_resume_notification as runtime_schedule_pre_resume_notification,
     schedule_resume as runtime_schedule_resume,
@@ -26,13 +35,31 @@ from .timers import (
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_set_automation_state(hass: HomeAssistant, entity_id: str, *, enabled: bool) -> bool:
-    """Enable or disable an automation."""
+async def async_set_automation_state(
+    hass: HomeAssistant,
+    entity_id: str,
+    *,
+    enabled: bool,
+    force: bool = False,
+    stats: ServiceCallStats | None = None,
+) -> bool:
+    """Enable or disable an automation, skipping the call if it is already in that state.
+
+    Requests and skipped calls are counted in stats, whose strict flag forces
+    the call like force does.
+    """
+    if stats is None:
+        stats = ServiceCallStats()
+    stats.requested += 1
     state = hass.states.get(entity_id)
     if state is None:
         _LOGGER.warning("Automation not found: %s", entity_id)
         return False
 
+    if not (force or stats.strict) and state.state == (STATE_ON if enabled else STATE_OFF):
+        stats.skipped += 1
+        return True
+
     try:
         result = hass.services.async_call(
             "automation",
@@ -48,6 +75,129 @@ async def async_set_automation_state(hass: HomeAssistant, entity_id: str, *, ena
         return False
 
 
+async def async_set_automation_states_bulk(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    *,
+    enabled: bool,
+    force: bool = False,
+    stats: ServiceCallStats | None = None,
+) -> dict[str, bool]:
+    """Enable or disable automations with one multi-entity service call.
+
+    Missing automations and automations already in the target state are
+    resolved without a call, as in async_set_automation_state. After the
+    call, each targeted automation counts as changed only if the state
+    machine now reports the target state, so one automation that ignored
+    the call does not hide behind the others.
+    """
+    if stats is None:
+        stats = ServiceCallStats()
+    target_state = STATE_ON if enabled else STATE_OFF
+    results: dict[str, bool] = {}
+    targets: list[str] = []
+    for entity_id in dict.fromkeys(entity_ids):
+        stats.requested += 1
+        state = hass.states.get(entity_id)
+        if state is None:
+            _LOGGER.warning("Automation not found: %s", entity_id)
+            results[entity_id] = False
+        elif not (force or stats.strict) and state.state == target_state:
+            stats.skipped += 1
+            results[entity_id] = True
+        else:
+            targets.append(entity_id)
+    if not targets:
+        return results
+
+    error: Exception | None = None
+    try:
+        result = hass.services.async_call(
+            "automation",
+            "turn_on" if enabled else "turn_off",
+            {ATTR_ENTITY_ID: targets},
+            blocking=True,
+        )
+        if isawaitable(result):
+            await result
+    except Exception as err:
+        error = err
+    for entity_id in targets:
+        state = hass.states.get(entity_id)
+        results[entity_id] = state is not None and state.state == target_state
+        if not results[entity_id]:
+            _LOGGER.error(
+                "Failed to %s %s: %s",
+                "wake" if enabled else "snooze",
+                entity_id,
+                error or "state did not change",
+            )
+    return results
+
+
+async def async_set_automation_states(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    *,
+    enabled: bool,
+    limit: int,
+    batch_size: int = STATE_CHANGE_BATCH_SIZE,
+    results: dict[str, bool] | None = None,
+    stats: ServiceCallStats | None = None,
+    set_state: Callable[..., Awaitable[bool]] | None = None,
+    set_states: Callable[..., Awaitable[dict[str, bool]]] | None = None,
+) -> dict[str, bool]:
+    """Enable or disable automations, recording per-entity outcomes in results.
+
+    Without a per-entity set_state, entities go through bulk calls of at
+    most batch_size entities each (set_states, defaulting to
+    async_set_automation_states_bulk), which count their requests in stats.
+    With one, each entity gets its own call. Either way at most limit calls
+    run at a time. If the caller is cancelled, no further calls start,
+    calls already in flight complete and are recorded, and CancelledError
+    is re-raised so the caller can roll back the entities recorded as
+    changed.
+    """
+    if results is None:
+        results = {}
+    entity_ids = list(dict.fromkeys(entity_ids))
+    if not entity_ids:
+        return results
+
+    if set_state is None:
+        bulk_setter = set_states or async_set_automation_states_bulk
+        size = max(batch_size, 1)
+        batches = [entity_ids[start : start + size] for start in range(0, len(entity_ids), size)]
+
+        async def _call(batch: list[str]) -> dict[str, bool]:
+            return await bulk_setter(hass, batch, enabled=enabled, stats=stats)
+
+    else:
+        setter = set_state
+        batches = [[entity_id] for entity_id in entity_ids]
+
+        async def _call(batch: list[str]) -> dict[str, bool]:
+            return {batch[0]: await setter(hass, batch[0], enabled=enabled)}
+
+    semaphore = asyncio.Semaphore(max(limit, 1))
+    stopped = False
+
+    async def _set(batch: list[str]) -> None:
+        async with semaphore:
+            if stopped:
+                return
+            results.update(await _call(batch))
+
+    tasks = [asyncio.ensure_future(_set(batch)) for batch in batches]
+    try:
+        await asyncio.shield(asyncio.gather(*tasks))
+    except asyncio.CancelledError:
+        stopped = True
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return results
+
+
 def get_friendly_name(hass: HomeAssistant, entity_id: str) -> str:
     """Get friendly name for entity."""
     if state := hass.states.get(entity_id):
@@ -62,6 +212,7 @@ def schedule_resume(
     resume_at: datetime,
     *,
     resume_callback: ResumeCallback,
+    resume_batch_callback: ResumeBatchCallback | None = None,
     reason: str = "expired",
 ) -> None:
     """Schedule automation to resume at specified time."""
@@ -72,6 +223,26 @@ def schedule_resume(
         resume_at,
         reason=reason,  # type: ignore[arg-type]
         resume_callback=resume_callback,
+        resume_batch_callback=resume_batch_callback,
+        track_point_in_time=async_track_point_in_time,
+    )
+
+
+def schedule_cohort_resume(
+    hass: HomeAssistant,
+    data: AutomationPauseData,
+    cohort: SnoozeCohort,
+    *,
+    resume_callback: ResumeCallback,
+    resume_batch_callback: ResumeBatchCallback | None = None,
+) -> None:
+    """Schedule every member of a cohort to resume at the cohort deadline."""
+    runtime_schedule_cohort_resume(
+        hass,
+        data,
+        cohort,
+        resume_callback=resume_callback,
+        resume_batch_callback=resume_batch_callback,
         track_point_in_time=async_track_point_in_time,
     )
 
@@ -83,6 +254,7 @@ def schedule_disable(
     scheduled: ScheduledSnooze,
     *,
     disable_callback: ScheduledDisableCallback,
+    disable_batch_callback: ScheduledDisableBatchCallback | None = None,
 ) -> None:
     """Schedule automation to be disabled at a future time."""
     runtime_schedule_disable(
@@ -91,6 +263,7 @@ def schedule_disable(
         entity_id,
         scheduled,
         disable_callback=disable_callback,
+        disable_batch_callback=disable_batch_callback,
         track_point_in_time=async_track_point_in_time,
     )
 
@@ -115,3 +288,13 @@ def schedule_pre_resume_notification(
 async def async_save(data: AutomationPauseData) -> bool:
     """Save runtime state to storage with retry logic."""
     return await infrastructure_async_save(data, sleep=asyncio.sleep)
+
+
+async def async_flush_saves(data: AutomationPauseData) -> None:
+    """Write any coalesced saves that are still pending."""
+    await infrastructure_async_flush_saves(data)
+
+
+async def async_close_store(data: AutomationPauseData) -> None:
+    """Release the resources held open by the runtime store."""
+    await infrastructure_async_close_store(data)
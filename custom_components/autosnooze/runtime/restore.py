@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 from typing import Any
@@ -14,7 +14,9 @@ from homeassistant.util import dt as dt_util
 from ..domain.notifications import NOTIFICATION_TRIGGER_NONE, validate_notification_config
 from ..infrastructure.telemetry import track_if_enabled
 from ..infrastructure.storage import async_save
-from ..models import PausedAutomation, ScheduledSnooze, parse_datetime_utc
+from ..models import PausedAutomation, ScheduledSnooze, SnoozeCohort, expand_stored_entry, parse_stored_datetime
+from .cohorts import sync_cohort_members
+from .ports import async_set_automation_states
 from .state import AutomationPauseData
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,73 +26,196 @@ _LOGGER = logging.getLogger(__name__)
 class RestoreCallbacks:
     """Explicit application and HA callbacks used during restore."""
 
-    set_automation_state: Callable[..., Awaitable[bool]]
+    set_automation_states: Callable[..., Awaitable[dict[str, bool]]]
     schedule_resume: Callable[[HomeAssistant, AutomationPauseData, str, datetime], None]
+    schedule_cohort_resume: Callable[[HomeAssistant, AutomationPauseData, SnoozeCohort], None]
     schedule_disable: Callable[[HomeAssistant, AutomationPauseData, str, ScheduledSnooze], None]
     schedule_pre_resume_notification: Callable[[HomeAssistant, AutomationPauseData, PausedAutomation], bool]
     notify_started: Callable[..., Awaitable[None]]
 
 
-def validate_stored_entry(
+REJECT_ENTITY_ID = "invalid_entity_id"
+REJECT_NOT_A_DICT = "not_a_dict"
+REJECT_MISSING_FIELD = "missing_field"
+REJECT_INVALID_DATETIME = "invalid_datetime"
+REJECT_INVALID_DURATION = "invalid_duration"
+REJECT_INVALID_RESUME_RETRIES = "invalid_resume_retries"
+REJECT_INVALID_NOTIFICATION = "invalid_notification"
+REJECT_SCHEDULE_ORDER = "schedule_order"
+REJECT_INVALID_SCHEMA = "invalid_schema"
+REJECT_MISSING_COHORT = "missing_cohort"
+
+_REQUIRED_FIELDS = {"paused": ("resume_at", "paused_at"), "scheduled": ("disable_at", "resume_at")}
+
+
+@dataclass
+class ParsedStoredData:
+    """Model objects built from stored data plus per-reason rejection counts.
+
+    unreadable_paused lists rejected paused entries whose automation should
+    still be re-enabled and dropped from storage like an expired pause.
+    cohorts holds the cohorts referenced by parsed paused entries, with
+    those entries as members.
+    """
+
+    paused: dict[str, PausedAutomation] = field(default_factory=dict)
+    scheduled: dict[str, ScheduledSnooze] = field(default_factory=dict)
+    cohorts: dict[str, SnoozeCohort] = field(default_factory=dict)
+    rejections: dict[str, int] = field(default_factory=dict)
+    unreadable_paused: list[str] = field(default_factory=list)
+
+    def reject(self, reason: str) -> None:
+        self.rejections[reason] = self.rejections.get(reason, 0) + 1
+
+
+class _RejectedEntry(Exception):
+    """A stored entry failed validation for the given reason."""
+
+    def __init__(self, reason: str, message: str, *, expire: bool = False) -> None:
+        super().__init__(message)
+        self.reason = reason
+        self.expire = expire
+
+
+def _parse_stored_entry(
     entity_id: str,
     entry_data: Any,
     entry_type: str,
-) -> bool:
+) -> PausedAutomation | ScheduledSnooze:
+    """Validate one stored entry and build its model, parsing each field once."""
     if not entity_id.startswith("automation."):
-        _LOGGER.warning("Invalid entity_id %s: not an automation entity", entity_id)
-        return False
+        raise _RejectedEntry(REJECT_ENTITY_ID, f"Invalid entity_id {entity_id}: not an automation entity")
 
     if not isinstance(entry_data, dict):
-        _LOGGER.warning("Invalid data for %s: expected dict, got %s", entity_id, type(entry_data).__name__)
-        return False
+        raise _RejectedEntry(
+            REJECT_NOT_A_DICT, f"Invalid data for {entity_id}: expected dict, got {type(entry_data).__name__}"
+        )
 
-    required = ["resume_at", "paused_at"] if entry_type == "paused" else ["disable_at", "resume_at"]
+    required = _REQUIRED_FIELDS[entry_type]
     for field_name in required:
         if field_name not in entry_data:
-            _LOGGER.warning("Invalid data for %s: missing required field '%s'", entity_id, field_name)
-            return False
+            raise _RejectedEntry(
+                REJECT_MISSING_FIELD, f"Invalid data for {entity_id}: missing required field '{field_name}'"
+            )
 
+    parsed: dict[str, datetime] = {}
     for field_name in required:
         try:
-            parse_datetime_utc(entry_data[field_name])
+            parsed[field_name] = parse_stored_datetime(entry_data[field_name])
         except (ValueError, TypeError) as err:
-            _LOGGER.warning("Invalid data for %s: invalid datetime in '%s': %s", entity_id, field_name, err)
-            return False
-
-    if entry_type == "paused":
-        for field_name in ["days", "hours", "minutes"]:
-            value = entry_data.get(field_name, 0)
-            if not isinstance(value, (int, float)) or value < 0:
-                _LOGGER.warning("Invalid data for %s: %s must be non-negative, got %s", entity_id, field_name, value)
-                return False
-        resume_retries = entry_data.get("resume_retries", 0)
-        if type(resume_retries) is not int or resume_retries < 0:
-            _LOGGER.warning(
-                "Invalid data for %s: resume_retries must be a non-negative integer, got %s",
-                entity_id,
-                resume_retries,
+            raise _RejectedEntry(
+                REJECT_INVALID_DATETIME, f"Invalid data for {entity_id}: invalid datetime in '{field_name}': {err}"
+            ) from None
+
+    notification_trigger = entry_data.get("notification_trigger", NOTIFICATION_TRIGGER_NONE)
+    notification_lead_minutes = entry_data.get("notification_lead_minutes")
+
+    if entry_type == "scheduled":
+        try:
+            validate_notification_config(notification_trigger, notification_lead_minutes)
+        except ValueError as err:
+            raise _RejectedEntry(REJECT_INVALID_NOTIFICATION, f"Invalid data for {entity_id}: {err}") from None
+        if parsed["resume_at"] <= parsed["disable_at"]:
+            raise _RejectedEntry(
+                REJECT_SCHEDULE_ORDER,
+                f"Invalid scheduled snooze for {entity_id}: resume_at must be after disable_at",
             )
-            return False
+        return ScheduledSnooze(
+            entity_id=entity_id,
+            friendly_name=entry_data.get("friendly_name", entity_id),
+            disable_at=parsed["disable_at"],
+            resume_at=parsed["resume_at"],
+            notification_trigger=notification_trigger,
+            notification_lead_minutes=notification_lead_minutes,
+        )
 
-    try:
-        validate_notification_config(
-            entry_data.get("notification_trigger", NOTIFICATION_TRIGGER_NONE),
-            entry_data.get("notification_lead_minutes"),
+    durations: dict[str, Any] = {}
+    for field_name in ("days", "hours", "minutes"):
+        value = entry_data.get(field_name, 0)
+        if not isinstance(value, (int, float)) or value < 0:
+            raise _RejectedEntry(
+                REJECT_INVALID_DURATION, f"Invalid data for {entity_id}: {field_name} must be non-negative, got {value}"
+            )
+        durations[field_name] = value
+    resume_retries = entry_data.get("resume_retries", 0)
+    if type(resume_retries) is not int or resume_retries < 0:
+        raise _RejectedEntry(
+            REJECT_INVALID_RESUME_RETRIES,
+            f"Invalid data for {entity_id}: resume_retries must be a non-negative integer, got {resume_retries}",
         )
+    try:
+        validate_notification_config(notification_trigger, notification_lead_minutes)
     except ValueError as err:
-        _LOGGER.warning("Invalid data for %s: %s", entity_id, err)
-        return False
+        raise _RejectedEntry(REJECT_INVALID_NOTIFICATION, f"Invalid data for {entity_id}: {err}") from None
+    disable_at = None
+    if "disable_at" in entry_data:
+        try:
+            disable_at = parse_stored_datetime(entry_data["disable_at"])
+        except (ValueError, TypeError) as err:
+            raise _RejectedEntry(
+                REJECT_INVALID_DATETIME,
+                f"Invalid stored data for {entity_id}: invalid datetime in 'disable_at': {err}",
+                expire=True,
+            ) from None
+    return PausedAutomation(
+        entity_id=entity_id,
+        friendly_name=entry_data.get("friendly_name", entity_id),
+        resume_at=parsed["resume_at"],
+        paused_at=parsed["paused_at"],
+        disable_at=disable_at,
+        notification_trigger=notification_trigger,
+        notification_lead_minutes=notification_lead_minutes,
+        resume_retries=resume_retries,
+        cohort_id=entry_data.get("cohort_id"),
+        **durations,
+    )
+
+
+def _merge_cohort(entity_id: str, entry_data: Any, cohorts: dict[str, Any]) -> Any:
+    """Fill a stored cohort member with the fields stored on its cohort."""
+    if not isinstance(entry_data, dict) or "cohort_id" not in entry_data:
+        return entry_data
+    cohort_id = entry_data["cohort_id"]
+    cohort_data = cohorts.get(cohort_id) if isinstance(cohort_id, str) else None
+    if not isinstance(cohort_data, dict):
+        raise _RejectedEntry(
+            REJECT_MISSING_COHORT, f"Invalid stored data for {entity_id}: unknown cohort {cohort_id!r}", expire=True
+        )
+    return {**expand_stored_entry(cohort_data), **entry_data}
+
+
+def _stored_cohorts(stored: dict[str, Any]) -> dict[str, Any]:
+    cohorts = stored.get("cohorts", {})
+    if isinstance(cohorts, dict):
+        return cohorts
+    _LOGGER.warning("Invalid 'cohorts' schema: expected dict, got %s", type(cohorts).__name__)
+    return {}
 
-    if entry_type == "scheduled":
-        disable_at = parse_datetime_utc(entry_data["disable_at"])
-        resume_at = parse_datetime_utc(entry_data["resume_at"])
-        if resume_at <= disable_at:
-            _LOGGER.warning("Invalid scheduled snooze for %s: resume_at must be after disable_at", entity_id)
-            return False
 
+def validate_stored_entry(
+    entity_id: str,
+    entry_data: Any,
+    entry_type: str,
+) -> bool:
+    try:
+        _parse_stored_entry(entity_id, entry_data, entry_type)
+    except _RejectedEntry as err:
+        _LOGGER.warning("%s", err)
+        return False
     return True
 
 
+def _stored_sections(stored: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
+    sections: list[tuple[str, dict[str, Any]]] = []
+    for entry_type in ("paused", "scheduled"):
+        entries = stored.get(entry_type, {})
+        if isinstance(entries, dict):
+            sections.append((entry_type, entries))
+        else:
+            _LOGGER.warning("Invalid '%s' schema: expected dict, got %s", entry_type, type(entries).__name__)
+    return sections
+
+
 def validate_stored_data(stored: Any) -> dict[str, Any]:
     if not isinstance(stored, dict):
         _LOGGER.error("Corrupted storage: expected dict, got %s", type(stored).__name__)
@@ -98,26 +223,23 @@ def validate_stored_data(stored: Any) -> dict[str, Any]:
 
     result: dict[str, Any] = {"paused": {}, "scheduled": {}}
     invalid_count = 0
-
-    paused = stored.get("paused", {})
-    if isinstance(paused, dict):
-        for entity_id, entry_data in paused.items():
-            if validate_stored_entry(entity_id, entry_data, "paused"):
-                result["paused"][entity_id] = entry_data
-            else:
-                invalid_count += 1
-    else:
-        _LOGGER.warning("Invalid 'paused' schema: expected dict, got %s", type(paused).__name__)
-
-    scheduled = stored.get("scheduled", {})
-    if isinstance(scheduled, dict):
-        for entity_id, entry_data in scheduled.items():
-            if validate_stored_entry(entity_id, entry_data, "scheduled"):
-                result["scheduled"][entity_id] = entry_data
+    cohorts = _stored_cohorts(stored)
+
+    for entry_type, entries in _stored_sections(stored):
+        for entity_id, entry_data in entries.items():
+            if isinstance(entry_data, dict):
+                entry_data = expand_stored_entry(entry_data)
+            if entry_type == "paused":
+                try:
+                    entry_data = _merge_cohort(entity_id, entry_data, cohorts)
+                except _RejectedEntry as err:
+                    _LOGGER.warning("%s", err)
+                    invalid_count += 1
+                    continue
+            if validate_stored_entry(entity_id, entry_data, entry_type):
+                result[entry_type][entity_id] = entry_data
             else:
                 invalid_count += 1
-    else:
-        _LOGGER.warning("Invalid 'scheduled' schema: expected dict, got %s", type(scheduled).__name__)
 
     if invalid_count > 0:
         _LOGGER.info("Skipped %d invalid entries during storage load", invalid_count)
@@ -125,24 +247,133 @@ def validate_stored_data(stored: Any) -> dict[str, Any]:
     return result
 
 
-async def async_load_stored(
+def parse_stored_data(stored: Any) -> ParsedStoredData:
+    """Validate stored data and build model objects in a single pass."""
+    result = ParsedStoredData()
+    if not isinstance(stored, dict):
+        _LOGGER.error("Corrupted storage: expected dict, got %s", type(stored).__name__)
+        result.reject(REJECT_INVALID_SCHEMA)
+        return result
+
+    cohorts = _stored_cohorts(stored)
+    for entry_type, entries in _stored_sections(stored):
+        models: dict[str, Any] = getattr(result, entry_type)
+        for entity_id, entry_data in entries.items():
+            if isinstance(entry_data, dict):
+                entry_data = expand_stored_entry(entry_data)
+            try:
+                if entry_type == "paused":
+                    entry_data = _merge_cohort(entity_id, entry_data, cohorts)
+                models[entity_id] = _parse_stored_entry(entity_id, entry_data, entry_type)
+            except _RejectedEntry as err:
+                _LOGGER.warning("%s", err)
+                result.reject(err.reason)
+                if err.expire:
+                    result.unreadable_paused.append(entity_id)
+
+    for paused in result.paused.values():
+        if (cohort_id := paused.cohort_id) is None:
+            continue
+        if (cohort := result.cohorts.get(cohort_id)) is None:
+            cohort = result.cohorts[cohort_id] = SnoozeCohort.from_member(cohort_id, paused)
+        cohort.members[paused.entity_id] = None
+
+    if result.rejections:
+        _LOGGER.info(
+            "Skipped %d invalid entries during storage load: %s",
+            sum(result.rejections.values()),
+            result.rejections,
+        )
+
+    return result
+
+
+async def _async_set_states(
     hass: HomeAssistant,
     data: AutomationPauseData,
     callbacks: RestoreCallbacks,
-) -> None:
+    entity_ids: list[str],
+    *,
+    enabled: bool,
+) -> dict[str, bool]:
+    """Enable or disable automations with one bulk service call."""
+    return await async_set_automation_states(
+        hass,
+        entity_ids,
+        enabled=enabled,
+        limit=data.state_change_concurrency,
+        stats=data.service_call_stats,
+        set_states=callbacks.set_automation_states,
+    )
+
+
+async def _async_read_store(data: AutomationPauseData) -> ParsedStoredData | None:
     if data.store is None:
-        return
+        return None
 
     try:
         stored = await data.store.async_load()
     except Exception as err:
         _LOGGER.error("Failed to load stored data: %s", err)
-        return
+        return None
 
     if not stored:
+        return None
+
+    return parse_stored_data(stored)
+
+
+async def async_preload_stored(hass: HomeAssistant, data: AutomationPauseData) -> None:
+    """Index live stored entries into runtime state without any side effects.
+
+    This is the first restore phase and runs during setup, so the sensor and
+    services see stored snoozes before Home Assistant has started. No service
+    calls are made and no timers are armed; async_load_stored reconciles the
+    indexed entries later.
+    """
+    parsed = await _async_read_store(data)
+    if parsed is None:
+        return
+
+    now = dt_util.utcnow()
+    async with data.lock:
+        for entity_id, paused in parsed.paused.items():
+            if paused.resume_at > now:
+                data.paused.setdefault(entity_id, paused)
+        for entity_id, scheduled in parsed.scheduled.items():
+            if scheduled.resume_at > now and entity_id not in data.paused:
+                data.scheduled.setdefault(entity_id, scheduled)
+        for cohort_id, cohort in parsed.cohorts.items():
+            if cohort.resume_at > now:
+                data.cohorts.setdefault(cohort_id, cohort)
+    data.pending_restore = parsed
+    data.notify([*parsed.paused, *parsed.scheduled])
+
+
+def _changed_since_preload(entries: dict[str, Any], entity_id: str, restored: Any, *, live: bool) -> bool:
+    """Return whether a preloaded entry was replaced, or removed while still live."""
+    current = entries.get(entity_id)
+    if current is None:
+        return live
+    return current is not restored
+
+
+async def async_load_stored(
+    hass: HomeAssistant,
+    data: AutomationPauseData,
+    callbacks: RestoreCallbacks,
+) -> None:
+    """Reconcile stored entries with automation states and arm their timers.
+
+    Uses the entries indexed by async_preload_stored when present, in which
+    case those entries are runtime state and any later change to them wins.
+    """
+    preloaded = data.pending_restore
+    data.pending_restore = None
+    parsed = preloaded if preloaded is not None else await _async_read_store(data)
+    if parsed is None:
         return
 
-    validated = validate_stored_data(stored)
     now = dt_util.utcnow()
     expired: list[str] = []
     expired_scheduled: list[str] = []
@@ -155,51 +386,56 @@ async def async_load_stored(
     failed_schedule_ids: set[str] = set()
     restored_started: list[PausedAutomation] = []
 
-    for entity_id, info in validated.get("paused", {}).items():
-        try:
-            if hass.states.get(entity_id) is None:
-                _LOGGER.info("Cleaning up deleted automation from storage: %s", entity_id)
-                expired.append(entity_id)
-                continue
-
-            paused = PausedAutomation.from_dict(entity_id, info)
-            if paused.resume_at <= now:
-                expired.append(entity_id)
-            else:
-                paused_to_restore.append(paused)
-        except (KeyError, ValueError) as err:
-            _LOGGER.warning("Invalid stored data for %s: %s", entity_id, err)
+    for entity_id, paused in parsed.paused.items():
+        if preloaded is not None and _changed_since_preload(
+            data.paused, entity_id, paused, live=paused.resume_at > now
+        ):
+            _LOGGER.info("Skipping stale stored pause for %s; runtime state changed during restore", entity_id)
+            continue
+        if hass.states.get(entity_id) is None:
+            _LOGGER.info("Cleaning up deleted automation from storage: %s", entity_id)
             expired.append(entity_id)
-
-    for entity_id, info in validated.get("scheduled", {}).items():
-        try:
-            if hass.states.get(entity_id) is None:
-                _LOGGER.info("Cleaning up deleted automation from scheduled storage: %s", entity_id)
+        elif paused.resume_at <= now:
+            expired.append(entity_id)
+        else:
+            paused_to_restore.append(paused)
+
+    expired.extend(parsed.unreadable_paused)
+
+    for entity_id, scheduled in parsed.scheduled.items():
+        if preloaded is not None and _changed_since_preload(
+            data.scheduled, entity_id, scheduled, live=scheduled.resume_at > now
+        ):
+            _LOGGER.info("Skipping stale stored schedule for %s; runtime state changed during restore", entity_id)
+            continue
+        if hass.states.get(entity_id) is None:
+            _LOGGER.info("Cleaning up deleted automation from scheduled storage: %s", entity_id)
+            expired_scheduled.append(entity_id)
+        elif scheduled.disable_at <= now:
+            if scheduled.resume_at <= now:
                 expired_scheduled.append(entity_id)
-                continue
-
-            scheduled = ScheduledSnooze.from_dict(entity_id, info)
-            if scheduled.disable_at <= now:
-                if scheduled.resume_at <= now:
-                    expired_scheduled.append(entity_id)
-                else:
-                    scheduled_to_execute.append(scheduled)
             else:
-                scheduled_to_restore.append(scheduled)
-        except (KeyError, ValueError) as err:
-            _LOGGER.warning("Invalid scheduled data for %s: %s", entity_id, err)
-            expired_scheduled.append(entity_id)
+                scheduled_to_execute.append(scheduled)
+        else:
+            scheduled_to_restore.append(scheduled)
+
+    disabled = await _async_set_states(
+        hass,
+        data,
+        callbacks,
+        [paused.entity_id for paused in paused_to_restore]
+        + [scheduled.entity_id for scheduled in scheduled_to_execute],
+        enabled=False,
+    )
 
     for paused in paused_to_restore:
-        if await callbacks.set_automation_state(hass, paused.entity_id, enabled=False):
-            restored_paused.append(paused)
-        else:
+        restored_paused.append(paused)
+        if not disabled[paused.entity_id]:
             _LOGGER.warning("Failed to restore paused state for %s; preserving entry", paused.entity_id)
-            restored_paused.append(paused)
             failed_pause_ids.add(paused.entity_id)
 
     for scheduled in scheduled_to_execute:
-        if await callbacks.set_automation_state(hass, scheduled.entity_id, enabled=False):
+        if disabled[scheduled.entity_id]:
             executed_scheduled.append(scheduled)
         else:
             _LOGGER.warning(
@@ -209,17 +445,29 @@ async def async_load_stored(
             scheduled_to_restore.append(scheduled)
             failed_schedule_ids.add(scheduled.entity_id)
 
-    for entity_id in expired:
-        await callbacks.set_automation_state(hass, entity_id, enabled=True)
+    await _async_set_states(hass, data, callbacks, expired, enabled=True)
 
     pre_resume_targets: list[PausedAutomation] = []
     should_save = False
     async with data.lock:
+        if preloaded is not None:
+            for entity_id in expired:
+                if (current := data.paused.get(entity_id)) is not None and current is preloaded.paused.get(entity_id):
+                    del data.paused[entity_id]
+            for entity_id in expired_scheduled:
+                current_scheduled = data.scheduled.get(entity_id)
+                if current_scheduled is not None and current_scheduled is preloaded.scheduled.get(entity_id):
+                    del data.scheduled[entity_id]
+
         for paused in restored_paused:
             current_paused = data.paused.get(paused.entity_id)
-            if data.scheduled.get(paused.entity_id) is not None or (
-                current_paused is not None and current_paused != paused
-            ):
+            if preloaded is not None:
+                stale = current_paused is not paused
+            else:
+                stale = data.scheduled.get(paused.entity_id) is not None or (
+                    current_paused is not None and current_paused != paused
+                )
+            if stale:
                 _LOGGER.info(
                     "Skipping stale stored pause for %s; runtime state changed during restore",
                     paused.entity_id,
@@ -227,10 +475,17 @@ async def async_load_stored(
                 continue
 
             data.paused[paused.entity_id] = paused
-            callbacks.schedule_resume(hass, data, paused.entity_id, paused.resume_at)
+            if paused.cohort_id is None:
+                callbacks.schedule_resume(hass, data, paused.entity_id, paused.resume_at)
             if paused.entity_id not in failed_pause_ids:
                 pre_resume_targets.append(paused)
 
+        # Each restored cohort keeps the members restored above and arms one deadline.
+        for cohort_id, cohort in parsed.cohorts.items():
+            data.cohorts.setdefault(cohort_id, cohort)
+            if data.cohorts[cohort_id] is cohort and sync_cohort_members(data, cohort):
+                callbacks.schedule_cohort_resume(hass, data, cohort)
+
         for scheduled in executed_scheduled:
             paused = PausedAutomation(
                 entity_id=scheduled.entity_id,
@@ -243,15 +498,21 @@ async def async_load_stored(
             )
             current_paused = data.paused.get(scheduled.entity_id)
             current_scheduled = data.scheduled.get(scheduled.entity_id)
-            if (current_paused is not None and current_paused != paused) or (
-                current_scheduled is not None and current_scheduled != scheduled
-            ):
+            if preloaded is not None:
+                stale = current_paused is not None or current_scheduled is not scheduled
+            else:
+                stale = (current_paused is not None and current_paused != paused) or (
+                    current_scheduled is not None and current_scheduled != scheduled
+                )
+            if stale:
                 _LOGGER.info(
                     "Skipping stale stored scheduled execution for %s; runtime state changed during restore",
                     scheduled.entity_id,
                 )
                 continue
 
+            if preloaded is not None:
+                del data.scheduled[scheduled.entity_id]
             data.paused[scheduled.entity_id] = paused
             callbacks.schedule_resume(hass, data, scheduled.entity_id, scheduled.resume_at)
             pre_resume_targets.append(paused)
@@ -259,9 +520,13 @@ async def async_load_stored(
 
         for scheduled in scheduled_to_restore:
             current_scheduled = data.scheduled.get(scheduled.entity_id)
-            if data.paused.get(scheduled.entity_id) is not None or (
-                current_scheduled is not None and current_scheduled != scheduled
-            ):
+            if preloaded is not None:
+                stale = current_scheduled is not scheduled
+            else:
+                stale = data.paused.get(scheduled.entity_id) is not None or (
+                    current_scheduled is not None and current_scheduled != scheduled
+                )
+            if stale:
                 _LOGGER.info(
                     "Skipping stale stored schedule for %s; runtime state changed during restore",
                     scheduled.entity_id,
@@ -281,7 +546,7 @@ async def async_load_stored(
         if not await async_save(data):
             _LOGGER.warning("Failed to persist cleanup of expired entries during storage load")
 
-    data.notify()
+    data.notify([*parsed.paused, *parsed.scheduled])
     if restored_started:
         await callbacks.notify_started(hass, restored_started)
         for paused in restored_started:
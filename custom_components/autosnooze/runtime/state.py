@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, TypeAlias
 
 from homeassistant.config_entries import ConfigEntry
@@ -13,30 +14,79 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.storage import Store
 
-from ..const import SIGNAL_STATE_CHANGED
+from ..const import (
+    EXPIRY_COALESCE_WINDOW,
+    NOTIFY_COALESCE_WINDOW,
+    STATE_CHANGE_CONCURRENCY,
+    SAVE_COALESCE_WINDOW,
+    SIGNAL_STATE_CHANGED,
+    TIMER_ARMING_HORIZON,
+)
+from ..models import COHORT_FIELDS
 
 if TYPE_CHECKING:
+    from ..infrastructure.automation_catalog_cache import AutomationCatalogCache
+    from ..infrastructure.guardrail_cache import GuardrailCache
+    from ..infrastructure.registry_index import AutomationRegistryIndex
+    from ..infrastructure.resume_preset_cache import ResumePresetCache
+    from ..infrastructure.storage import SaveWriter
     from ..infrastructure.telemetry import TelemetryClient
-    from ..models import PausedAutomation, ScheduledSnooze
+    from ..models import PausedAutomation, ScheduledSnooze, SnoozeCohort
+    from .restore import ParsedStoredData
+    from .timers import DeadlineScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class ServiceCallStats:
+    """Counters for automation turn_on/turn_off requests.
+
+    With strict set, every request makes the service call even when the
+    automation already reports the target state.
+    """
+
+    strict: bool = False
+    requested: int = 0
+    skipped: int = 0
+
+
 @dataclass
 class AutomationPauseData:
     """Runtime data for AutoSnooze."""
 
     paused: dict[str, PausedAutomation] = field(default_factory=dict)
     scheduled: dict[str, ScheduledSnooze] = field(default_factory=dict)
+    cohorts: dict[str, SnoozeCohort] = field(default_factory=dict)
     timers: dict[str, Callable[[], None]] = field(default_factory=dict)
     scheduled_timers: dict[str, Callable[[], None]] = field(default_factory=dict)
     notification_timers: dict[str, Callable[[], None]] = field(default_factory=dict)
+    cohort_timers: dict[str, Callable[[], None]] = field(default_factory=dict)
+    deadline_scheduler: DeadlineScheduler | None = None
+    resume_batches: dict[str, dict[str, None]] = field(default_factory=dict)
+    disable_batch: dict[str, datetime] = field(default_factory=dict)
+    expiry_coalesce_window: timedelta = EXPIRY_COALESCE_WINDOW
+    timer_arming_horizon: timedelta = TIMER_ARMING_HORIZON
+    state_change_concurrency: int = STATE_CHANGE_CONCURRENCY
+    service_call_stats: ServiceCallStats = field(default_factory=ServiceCallStats)
+    pending_restore: ParsedStoredData | None = None
     listeners: list[Callable[[], None]] = field(default_factory=list)
     store: Store | None = None
     telemetry: TelemetryClient | None = None
+    registry_index: AutomationRegistryIndex | None = None
+    guardrail_cache: GuardrailCache | None = None
+    resume_preset_cache: ResumePresetCache | None = None
+    automation_catalog_cache: AutomationCatalogCache | None = None
     hass: HomeAssistant | None = None
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     save_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    save_writer: SaveWriter | None = None
+    save_coalesce_window: timedelta = SAVE_COALESCE_WINDOW
+    notify_coalesce_window: timedelta = NOTIFY_COALESCE_WINDOW
+    generation: int = 0
+    _notify_pending: bool = field(default=False, init=False, repr=False)
+    _pending_changes: set[str] | None = field(default=None, init=False, repr=False)
+    _notify_handle: asyncio.Handle | None = field(default=None, init=False, repr=False)
     unloaded: bool = False
     startup_listener_unsub: Callable[[], None] | None = None
 
@@ -51,22 +101,90 @@ class AutomationPauseData:
 
         return remove
 
-    def notify(self) -> None:
+    def notify(self, entity_ids: Iterable[str] | None = None) -> None:
+        """Queue a state change notification for the given automations.
+
+        Notifications queued before the next loop tick, or within
+        notify_coalesce_window when it is set, are sent once with
+        the union of their entity ids. Passing no entity ids marks the change
+        as unknown, and the signal then carries None instead of a set.
+        Without hass there is no loop to wait on, so the notification is
+        sent immediately.
+        """
         if self.unloaded:
             return
+        if not self._notify_pending:
+            self._notify_pending = True
+            self._pending_changes = set()
+        if entity_ids is None:
+            self._pending_changes = None
+        elif self._pending_changes is not None:
+            self._pending_changes.update(entity_ids)
+        if self.hass is None:
+            self.flush_notify()
+        elif self._notify_handle is None:
+            loop = self.hass.loop
+            if (window := self.notify_coalesce_window.total_seconds()) > 0:
+                self._notify_handle = loop.call_later(window, self.flush_notify)
+            else:
+                self._notify_handle = loop.call_soon(self.flush_notify)
+
+    def flush_notify(self) -> None:
+        """Send the queued state change notification now, if there is one."""
+        if self._notify_handle is not None:
+            self._notify_handle.cancel()
+            self._notify_handle = None
+        if not self._notify_pending:
+            return
+        changed = None if self._pending_changes is None else frozenset(self._pending_changes)
+        self._notify_pending = False
+        self._pending_changes = None
+        if self.unloaded:
+            return
+        self.generation += 1
         if self.hass is not None:
-            async_dispatcher_send(self.hass, SIGNAL_STATE_CHANGED)
+            async_dispatcher_send(self.hass, SIGNAL_STATE_CHANGED, changed)
         for listener in list(self.listeners):
             try:
                 listener()
             except Exception:
                 _LOGGER.exception("Error in state change listener")
 
-    def get_paused_dict(self) -> dict[str, dict[str, object]]:
-        return {key: value.to_dict() for key, value in self.paused.items()}
+    def get_paused_dict(self, *, expand_cohorts: bool = True) -> dict[str, dict[str, object]]:
+        if expand_cohorts:
+            return {key: value.to_dict() for key, value in self.paused.items()}
+        return {
+            key: (
+                value.to_dict()
+                if value.cohort_id is None
+                else {name: item for name, item in value.to_dict().items() if name not in COHORT_FIELDS}
+            )
+            for key, value in self.paused.items()
+        }
 
     def get_scheduled_dict(self) -> dict[str, dict[str, object]]:
         return {key: value.to_dict() for key, value in self.scheduled.items()}
 
+    def get_summary(self) -> dict[str, object]:
+        next_resume = min((paused.resume_at for paused in self.paused.values()), default=None)
+        next_disable = min((scheduled.disable_at for scheduled in self.scheduled.values()), default=None)
+        return {
+            "paused_count": len(self.paused),
+            "scheduled_count": len(self.scheduled),
+            "next_resume": next_resume.isoformat() if next_resume is not None else None,
+            "next_disable": next_disable.isoformat() if next_disable is not None else None,
+            "generation": self.generation,
+        }
+
+    def get_cohorts_dict(self) -> dict[str, dict[str, object]]:
+        return {key: {**value.to_dict(), "entity_ids": list(value.members)} for key, value in self.cohorts.items()}
+
+    def get_storage_snapshot(self) -> dict[str, dict[str, dict[str, object]]]:
+        return {
+            "paused": {key: value.to_storage() for key, value in self.paused.items()},
+            "scheduled": {key: value.to_storage() for key, value in self.scheduled.items()},
+            "cohorts": {key: value.to_storage() for key, value in self.cohorts.items()},
+        }
+
 
 AutomationPauseConfigEntry: TypeAlias = ConfigEntry[AutomationPauseData]
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from heapq import heapify, heappop, heappush
+from itertools import count
+import logging
 from typing import Any, Literal
 
 from homeassistant.core import HomeAssistant, callback
@@ -11,18 +15,235 @@ from homeassistant.helpers.event import async_track_point_in_time as ha_async_tr
 from homeassistant.util import dt as dt_util
 
 from ..domain.notifications import NOTIFICATION_TRIGGER_ABOUT_TO_END
-from ..models import PausedAutomation, ScheduledSnooze
+from ..models import PausedAutomation, ScheduledSnooze, SnoozeCohort
+from .cohorts import leave_cohort, sync_cohort_members
 from .state import AutomationPauseData
 
+_LOGGER = logging.getLogger(__name__)
+
 ResumeReason = Literal["manual", "expired"]
 ResumeCallback = Callable[..., Coroutine[Any, Any, None]]
+ResumeBatchCallback = Callable[..., Coroutine[Any, Any, None]]
 ScheduledDisableCallback = Callable[[HomeAssistant, AutomationPauseData, str, datetime], Coroutine[Any, Any, None]]
+ScheduledDisableBatchCallback = Callable[
+    [HomeAssistant, AutomationPauseData, dict[str, datetime]], Coroutine[Any, Any, None]
+]
 NotificationCallback = Callable[[HomeAssistant, AutomationPauseData, str, PausedAutomation], Coroutine[Any, Any, None]]
+TrackPointInTime = Callable[[HomeAssistant, Callable[[datetime], None], datetime], Callable[[], None]]
+
+# Tombstones are compacted out of the heap, or out of the parked list, once
+# they outnumber its live deadlines by this margin; below it, dropping them
+# lazily at the head or on refill is cheaper.
+_TOMBSTONE_COMPACT_MIN = 64
 
 
 async_track_point_in_time = ha_async_track_point_in_time
 
 
+@dataclass(eq=False, slots=True)
+class _Deadline:
+    """One pending unit of timer work inside the deadline heap."""
+
+    action: Callable[[], None]
+    track_point_in_time: TrackPointInTime | None = None
+    done: bool = False
+    parked: bool = False
+
+
+class DeadlineScheduler:
+    """Run resume, disable and notification deadlines from one Home Assistant timer.
+
+    Deadlines inside the arming horizon live in a min-heap ordered by due time
+    (insertion order breaks ties); only the earliest one is armed with
+    async_track_point_in_time, or with the tracker that deadline was scheduled
+    with. Deadlines beyond the horizon are parked in an unordered list and
+    promoted into the heap by a refill tick when the horizon moves.
+    Cancelling a deadline marks it as a tombstone; tombstones are dropped
+    when they reach the head of the heap, on refill, or when the heap or
+    parked list is compacted.
+    """
+
+    def __init__(self, hass: HomeAssistant, data: AutomationPauseData) -> None:
+        self._hass = hass
+        self._data = data
+        self._heap: list[tuple[datetime, int, _Deadline]] = []
+        self._parked: list[tuple[datetime, int, _Deadline]] = []
+        self._sequence = count()
+        self._live = 0
+        self._tombstones = 0
+        self._parked_tombstones = 0
+        self._horizon_end: datetime | None = None
+        self._generation = 0
+        self._armed_at: datetime | None = None
+        self._unsub_armed: Callable[[], None] | None = None
+
+    @property
+    def pending(self) -> int:
+        """Return the number of live (non-cancelled, unfired) deadlines."""
+        return self._live
+
+    @property
+    def parked(self) -> int:
+        """Return the number of deadlines waiting beyond the arming horizon."""
+        return len(self._parked) - self._parked_tombstones
+
+    @property
+    def armed_at(self) -> datetime | None:
+        """Return the deadline the Home Assistant timer is armed for, if any."""
+        return self._armed_at
+
+    def schedule(
+        self,
+        when: datetime,
+        action: Callable[[], None],
+        *,
+        track_point_in_time: TrackPointInTime | None = None,
+    ) -> Callable[[], None]:
+        """Queue an action for a deadline and return its cancel handle."""
+        horizon_end = self._horizon_end
+        if horizon_end is None:
+            horizon_end = self._horizon_end = dt_util.utcnow() + self._data.timer_arming_horizon
+        deadline = _Deadline(action, track_point_in_time)
+        entry = (when, next(self._sequence), deadline)
+        if when > horizon_end:
+            deadline.parked = True
+            self._parked.append(entry)
+        else:
+            heappush(self._heap, entry)
+        self._live += 1
+        self._arm()
+
+        def cancel() -> None:
+            if deadline.done:
+                return
+            deadline.done = True
+            self._live -= 1
+            if deadline.parked:
+                self._parked_tombstones += 1
+            else:
+                self._tombstones += 1
+            self._discard_tombstones()
+
+        return cancel
+
+    def shutdown(self) -> None:
+        """Drop every pending deadline and release the armed timer."""
+        for _when, _sequence, deadline in (*self._heap, *self._parked):
+            deadline.done = True
+        self._heap.clear()
+        self._parked.clear()
+        self._live = 0
+        self._tombstones = 0
+        self._parked_tombstones = 0
+        self._horizon_end = None
+        self._disarm()
+
+    def _discard_tombstones(self) -> None:
+        while self._heap and self._heap[0][2].done:
+            heappop(self._heap)
+            self._tombstones -= 1
+        if self._tombstones > max(self._live, _TOMBSTONE_COMPACT_MIN):
+            self._heap = [entry for entry in self._heap if not entry[2].done]
+            heapify(self._heap)
+            self._tombstones = 0
+        if self._parked_tombstones > max(self.parked, _TOMBSTONE_COMPACT_MIN):
+            self._parked = [entry for entry in self._parked if not entry[2].done]
+            self._parked_tombstones = 0
+        if not self._live:
+            self._heap.clear()
+            self._parked.clear()
+            self._tombstones = 0
+            self._parked_tombstones = 0
+            self._horizon_end = None
+            self._disarm()
+
+    def _refill(self, now: datetime) -> None:
+        """Advance the horizon and promote parked deadlines that fall inside it."""
+        self._horizon_end = now + self._data.timer_arming_horizon
+        still_parked: list[tuple[datetime, int, _Deadline]] = []
+        for entry in self._parked:
+            when, _sequence, deadline = entry
+            if deadline.done:
+                continue
+            if when > self._horizon_end:
+                still_parked.append(entry)
+                continue
+            deadline.parked = False
+            heappush(self._heap, entry)
+        self._parked = still_parked
+        self._parked_tombstones = 0
+
+    def _disarm(self) -> None:
+        self._generation += 1
+        self._armed_at = None
+        if self._unsub_armed is not None:
+            unsub, self._unsub_armed = self._unsub_armed, None
+            unsub()
+
+    def _arm(self) -> None:
+        self._discard_tombstones()
+        target: datetime | None = None
+        track: TrackPointInTime | None = None
+        if self._heap:
+            target, _sequence, head = self._heap[0]
+            track = head.track_point_in_time
+        if self.parked and self._horizon_end is not None and (target is None or self._horizon_end < target):
+            target = self._horizon_end
+            # The refill tick is armed with the tracker of a deadline it will look at.
+            track = next(
+                deadline.track_point_in_time for _when, _sequence, deadline in self._parked if not deadline.done
+            )
+        if target is None:
+            return
+        if self._armed_at is not None and self._armed_at <= target:
+            return
+        self._disarm()
+        generation = self._generation
+        armed_at = target
+
+        @callback
+        def on_timer(now: datetime) -> None:
+            if generation != self._generation:
+                return
+            self._fire(max(now, armed_at))
+
+        self._armed_at = armed_at
+        self._unsub_armed = (track or async_track_point_in_time)(self._hass, on_timer, armed_at)
+
+    def _fire(self, due_at: datetime) -> None:
+        self._generation += 1
+        self._armed_at = None
+        self._unsub_armed = None
+        if self._data.unloaded:
+            return
+
+        if self._horizon_end is not None and due_at >= self._horizon_end:
+            self._refill(due_at)
+
+        due: list[Callable[[], None]] = []
+        while self._heap and self._heap[0][0] <= due_at:
+            _when, _sequence, deadline = heappop(self._heap)
+            if deadline.done:
+                self._tombstones -= 1
+                continue
+            deadline.done = True
+            self._live -= 1
+            due.append(deadline.action)
+
+        self._arm()
+        for action in due:
+            try:
+                action()
+            except Exception:
+                _LOGGER.exception("Error running AutoSnooze timer callback")
+
+
+def _deadline_scheduler(hass: HomeAssistant, data: AutomationPauseData) -> DeadlineScheduler:
+    if data.deadline_scheduler is None:
+        data.deadline_scheduler = DeadlineScheduler(hass, data)
+    return data.deadline_scheduler
+
+
 def _cancel_timer_from_dict(timers: dict[str, Callable[[], None]], entity_id: str) -> None:
     if unsub := timers.pop(entity_id, None):
         unsub()
@@ -30,16 +251,68 @@ def _cancel_timer_from_dict(timers: dict[str, Callable[[], None]], entity_id: st
 
 def cancel_timer(data: AutomationPauseData, entity_id: str) -> None:
     _cancel_timer_from_dict(data.timers, entity_id)
+    leave_cohort(data, entity_id)
+    for batch in data.resume_batches.values():
+        batch.pop(entity_id, None)
 
 
 def cancel_scheduled_timer(data: AutomationPauseData, entity_id: str) -> None:
     _cancel_timer_from_dict(data.scheduled_timers, entity_id)
+    data.disable_batch.pop(entity_id, None)
 
 
 def cancel_notification_timer(data: AutomationPauseData, entity_id: str) -> None:
     _cancel_timer_from_dict(data.notification_timers, entity_id)
 
 
+def cancel_all_timers(data: AutomationPauseData) -> None:
+    """Cancel every resume, disable and notification deadline and the shared timer."""
+    for timers in (data.timers, data.scheduled_timers, data.notification_timers, data.cohort_timers):
+        for unsub in timers.values():
+            unsub()
+        timers.clear()
+    data.resume_batches.clear()
+    data.disable_batch.clear()
+    if data.deadline_scheduler is not None:
+        data.deadline_scheduler.shutdown()
+
+
+def _queue_expiry(
+    hass: HomeAssistant,
+    data: AutomationPauseData,
+    batch: dict[str, Any],
+    entity_id: str,
+    value: Any,
+    due_at: datetime,
+    flush: Callable[[], None],
+    track_point_in_time: TrackPointInTime | None,
+) -> None:
+    """Collect a due entity so expiries inside the coalesce window run together."""
+    opened = not batch
+    batch[entity_id] = value
+    if opened:
+        _deadline_scheduler(hass, data).schedule(
+            max(dt_util.utcnow(), due_at) + data.expiry_coalesce_window,
+            flush,
+            track_point_in_time=track_point_in_time,
+        )
+
+
+def _resume_batch_flusher(
+    hass: HomeAssistant,
+    data: AutomationPauseData,
+    reason: ResumeReason,
+    resume_batch_callback: ResumeBatchCallback | None,
+) -> Callable[[], None]:
+    def on_batch_due() -> None:
+        entity_ids = list(data.resume_batches.pop(reason, {}))
+        if data.unloaded or not entity_ids or resume_batch_callback is None:
+            return
+        hass.async_create_task(resume_batch_callback(hass, data, entity_ids, reason=reason))
+
+    return on_batch_due
+
+
 def schedule_resume(
     hass: HomeAssistant,
     data: AutomationPauseData,
@@ -48,20 +321,79 @@ def schedule_resume(
     reason: ResumeReason = "expired",
     *,
     resume_callback: ResumeCallback,
-    track_point_in_time: Callable[[HomeAssistant, Callable[[datetime], None], datetime], Callable[[], None]] | None = (
-        None
-    ),
+    resume_batch_callback: ResumeBatchCallback | None = None,
+    track_point_in_time: TrackPointInTime | None = None,
 ) -> None:
+    """Schedule a resume deadline, coalescing expiries when a batch callback is given.
+
+    An entity that was a cohort member leaves its cohort and gets its own deadline.
+    """
     cancel_timer(data, entity_id)
-    schedule_at = track_point_in_time or async_track_point_in_time
+    on_batch_due = _resume_batch_flusher(hass, data, reason, resume_batch_callback)
 
-    @callback
-    def on_timer(_now: datetime) -> None:
+    def on_resume_due() -> None:
         if data.unloaded:
             return
+        if resume_batch_callback is not None:
+            _queue_expiry(
+                hass,
+                data,
+                data.resume_batches.setdefault(reason, {}),
+                entity_id,
+                None,
+                resume_at,
+                on_batch_due,
+                track_point_in_time,
+            )
+            return
         hass.async_create_task(resume_callback(hass, data, entity_id, reason=reason))
 
-    data.timers[entity_id] = schedule_at(hass, on_timer, resume_at)
+    data.timers[entity_id] = _deadline_scheduler(hass, data).schedule(
+        resume_at, on_resume_due, track_point_in_time=track_point_in_time
+    )
+
+
+def schedule_cohort_resume(
+    hass: HomeAssistant,
+    data: AutomationPauseData,
+    cohort: SnoozeCohort,
+    reason: ResumeReason = "expired",
+    *,
+    resume_callback: ResumeCallback,
+    resume_batch_callback: ResumeBatchCallback | None = None,
+    track_point_in_time: TrackPointInTime | None = None,
+) -> None:
+    """Schedule one resume deadline shared by every member of a cohort.
+
+    Members are resolved when the deadline fires, so entities that left the
+    cohort in the meantime are not resumed by it.
+    """
+    cohort_id = cohort.cohort_id
+    _cancel_timer_from_dict(data.cohort_timers, cohort_id)
+    on_batch_due = _resume_batch_flusher(hass, data, reason, resume_batch_callback)
+
+    def on_resume_due() -> None:
+        data.cohort_timers.pop(cohort_id, None)
+        if data.unloaded:
+            return
+        for entity_id in sync_cohort_members(data, cohort):
+            if resume_batch_callback is not None:
+                _queue_expiry(
+                    hass,
+                    data,
+                    data.resume_batches.setdefault(reason, {}),
+                    entity_id,
+                    None,
+                    cohort.resume_at,
+                    on_batch_due,
+                    track_point_in_time,
+                )
+            else:
+                hass.async_create_task(resume_callback(hass, data, entity_id, reason=reason))
+
+    data.cohort_timers[cohort_id] = _deadline_scheduler(hass, data).schedule(
+        cohort.resume_at, on_resume_due, track_point_in_time=track_point_in_time
+    )
 
 
 def schedule_pre_resume_notification(
@@ -70,9 +402,7 @@ def schedule_pre_resume_notification(
     paused: PausedAutomation,
     *,
     notification_callback: NotificationCallback,
-    track_point_in_time: Callable[[HomeAssistant, Callable[[datetime], None], datetime], Callable[[], None]] | None = (
-        None
-    ),
+    track_point_in_time: TrackPointInTime | None = None,
 ) -> bool:
     """Schedule a notification callback before an active snooze resumes."""
     cancel_notification_timer(data, paused.entity_id)
@@ -88,15 +418,14 @@ def schedule_pre_resume_notification(
         hass.async_create_task(notification_callback(hass, data, paused.entity_id, paused))
         return True
 
-    schedule_at = track_point_in_time or async_track_point_in_time
-
-    @callback
-    def on_notification_timer(_now: datetime) -> None:
+    def on_notification_due() -> None:
         if data.unloaded:
             return
         hass.async_create_task(notification_callback(hass, data, paused.entity_id, paused))
 
-    data.notification_timers[paused.entity_id] = schedule_at(hass, on_notification_timer, notify_at)
+    data.notification_timers[paused.entity_id] = _deadline_scheduler(hass, data).schedule(
+        notify_at, on_notification_due, track_point_in_time=track_point_in_time
+    )
     return True
 
 
@@ -107,19 +436,38 @@ def schedule_disable(
     scheduled: ScheduledSnooze,
     *,
     disable_callback: ScheduledDisableCallback,
-    track_point_in_time: Callable[[HomeAssistant, Callable[[datetime], None], datetime], Callable[[], None]] | None = (
-        None
-    ),
+    disable_batch_callback: ScheduledDisableBatchCallback | None = None,
+    track_point_in_time: TrackPointInTime | None = None,
 ) -> None:
+    """Schedule a disable deadline, coalescing expiries when a batch callback is given."""
     cancel_scheduled_timer(data, entity_id)
-    schedule_at = track_point_in_time or async_track_point_in_time
 
-    @callback
-    def on_disable_timer(_now: datetime) -> None:
+    def on_batch_due() -> None:
+        targets = dict(data.disable_batch)
+        data.disable_batch.clear()
+        if data.unloaded or not targets or disable_batch_callback is None:
+            return
+        hass.async_create_task(disable_batch_callback(hass, data, targets))
+
+    def on_disable_due() -> None:
         if data.unloaded:
             return
         current = data.scheduled.get(entity_id)
         resume_at = current.resume_at if current is not None else scheduled.resume_at
+        if disable_batch_callback is not None:
+            _queue_expiry(
+                hass,
+                data,
+                data.disable_batch,
+                entity_id,
+                resume_at,
+                scheduled.disable_at,
+                on_batch_due,
+                track_point_in_time,
+            )
+            return
         hass.async_create_task(disable_callback(hass, data, entity_id, resume_at))
 
-    data.scheduled_timers[entity_id] = schedule_at(hass, on_disable_timer, scheduled.disable_at)
+    data.scheduled_timers[entity_id] = _deadline_scheduler(hass, data).schedule(
+        scheduled.disable_at, on_disable_due, track_point_in_time=track_point_in_time
+    )
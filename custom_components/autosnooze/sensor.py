@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+import logging
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
@@ -10,11 +11,16 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.json import json_bytes
 
 from .const import (
     CRITICAL_AUTOMATION_TERMS,
     DEFAULT_DURATION_PRESETS,
     DOMAIN,
+    OPTION_SENSOR_ATTRIBUTES,
+    SENSOR_ATTRIBUTE_BUDGET,
+    SENSOR_ATTRIBUTES_COMPACT,
+    SENSOR_ATTRIBUTES_FULL,
     SENSOR_SCHEMA_VERSION,
     SIGNAL_STATE_CHANGED,
     VERSION,
@@ -22,6 +28,8 @@ from .const import (
 from .infrastructure.telemetry import OPTION_TELEMETRY_ENABLED
 from .runtime.state import AutomationPauseConfigEntry
 
+_LOGGER = logging.getLogger(__name__)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -39,6 +47,9 @@ class AutoSnoozeCountSensor(SensorEntity):
     _attr_translation_key = "snoozed_count"
     _attr_icon = "mdi:sleep"
     _attr_should_poll = False  # Updates via listener, no polling needed
+    # Entry detail and static configuration stay out of the recorder; the
+    # summary attributes are small and are recorded with every change.
+    _unrecorded_attributes = frozenset({"paused", "scheduled", "cohorts", "duration_presets", "critical_terms"})
 
     def __init__(self, entry: AutomationPauseConfigEntry) -> None:
         """Initialize sensor."""
@@ -51,12 +62,15 @@ class AutoSnoozeCountSensor(SensorEntity):
             sw_version=VERSION,
         )
         self._unsub: Callable[[], None] | None = None
+        self._over_budget = False
 
     async def async_added_to_hass(self) -> None:
         """Register listener when added."""
 
         @callback
-        def update() -> None:
+        def update(changed: frozenset[str] | None = None) -> None:
+            if changed is not None and not changed:
+                return
             self.async_write_ha_state()
 
         if self.hass is not None:
@@ -84,14 +98,29 @@ class AutoSnoozeCountSensor(SensorEntity):
         if not presets:
             presets = DEFAULT_DURATION_PRESETS
 
-        paused = self._entry.runtime_data.get_paused_dict()
-        scheduled = self._entry.runtime_data.get_scheduled_dict()
-
-        return {
-            "schema_version": SENSOR_SCHEMA_VERSION,
-            "paused": paused,
-            "scheduled": scheduled,
-            "duration_presets": presets,
-            "critical_terms": list(CRITICAL_AUTOMATION_TERMS),
-            OPTION_TELEMETRY_ENABLED: bool(self._entry.options.get(OPTION_TELEMETRY_ENABLED, True)),
-        }
+        data = self._entry.runtime_data
+        attributes: dict[str, Any] = {"schema_version": SENSOR_SCHEMA_VERSION, **data.get_summary()}
+        compact = self._entry.options.get(OPTION_SENSOR_ATTRIBUTES, SENSOR_ATTRIBUTES_FULL) == SENSOR_ATTRIBUTES_COMPACT
+        if not compact:
+            attributes["paused"] = data.get_paused_dict(expand_cohorts=False)
+            attributes["scheduled"] = data.get_scheduled_dict()
+            attributes["cohorts"] = data.get_cohorts_dict()
+        attributes["duration_presets"] = presets
+        attributes["critical_terms"] = list(CRITICAL_AUTOMATION_TERMS)
+        attributes[OPTION_TELEMETRY_ENABLED] = bool(self._entry.options.get(OPTION_TELEMETRY_ENABLED, True))
+        if not compact:
+            self._check_attribute_budget(attributes)
+        return attributes
+
+    def _check_attribute_budget(self, attributes: dict[str, Any]) -> None:
+        """Warn once each time the full attributes grow past the size budget."""
+        size = len(json_bytes(attributes))
+        over_budget = size > SENSOR_ATTRIBUTE_BUDGET
+        if over_budget and not self._over_budget:
+            _LOGGER.warning(
+                "AutoSnooze sensor attributes are %d bytes, over the %d byte budget; "
+                "switch the sensor attributes option to compact and read details with autosnooze.get_snoozes",
+                size,
+                SENSOR_ATTRIBUTE_BUDGET,
+            )
+        self._over_budget = over_budget
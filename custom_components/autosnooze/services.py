@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 
 from .const import (
     ADJUST_SCHEMA,
     CANCEL_SCHEMA,
     DOMAIN,
     PAUSE_BY_AREA_SCHEMA,
+    PAUSE_BY_DEVICE_SCHEMA,
+    PAUSE_BY_FLOOR_SCHEMA,
     PAUSE_BY_LABEL_SCHEMA,
     PAUSE_SCHEMA,
     REPORT_TELEMETRY_SCHEMA,
 )
 from .application.pause import (
+    async_handle_get_resume_presets_service,
     async_handle_pause_by_area_service,
+    async_handle_pause_by_device_service,
+    async_handle_pause_by_floor_service,
     async_handle_pause_by_label_service,
     async_handle_pause_service,
 )
@@ -26,6 +34,7 @@ from .application.resume import (
 from .application.scheduled import async_handle_cancel_scheduled_service
 from .application.adjust import async_handle_adjust_service
 from .application.report_telemetry import async_handle_report_telemetry
+from .application.snapshot import async_handle_get_snoozes_service
 from .runtime.state import AutomationPauseData
 
 SERVICE_NAMES = (
@@ -34,18 +43,22 @@ SERVICE_NAMES = (
     "cancel_all",
     "pause_by_area",
     "pause_by_label",
+    "pause_by_device",
+    "pause_by_floor",
     "cancel_scheduled",
     "clear_notification",
     "adjust",
     "report_telemetry",
+    "get_resume_presets",
+    "get_snoozes",
 )
 
 
 def register_services(hass: HomeAssistant, data: AutomationPauseData) -> None:
     """Register integration services."""
 
-    async def handle_pause(call: ServiceCall) -> None:
-        await async_handle_pause_service(hass, data, call)
+    async def handle_pause(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_pause_service(hass, data, call)
 
     async def handle_cancel(call: ServiceCall) -> None:
         """Handle wake service call (FR-10: Early Wake Up)."""
@@ -55,11 +68,17 @@ def register_services(hass: HomeAssistant, data: AutomationPauseData) -> None:
         """Handle wake all service call."""
         await async_handle_cancel_all_service(hass, data)
 
-    async def handle_pause_by_area(call: ServiceCall) -> None:
-        await async_handle_pause_by_area_service(hass, data, call)
+    async def handle_pause_by_area(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_pause_by_area_service(hass, data, call)
+
+    async def handle_pause_by_label(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_pause_by_label_service(hass, data, call)
+
+    async def handle_pause_by_device(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_pause_by_device_service(hass, data, call)
 
-    async def handle_pause_by_label(call: ServiceCall) -> None:
-        await async_handle_pause_by_label_service(hass, data, call)
+    async def handle_pause_by_floor(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_pause_by_floor_service(hass, data, call)
 
     async def handle_cancel_scheduled(call: ServiceCall) -> None:
         """Handle cancel scheduled snooze service call."""
@@ -76,25 +95,64 @@ def register_services(hass: HomeAssistant, data: AutomationPauseData) -> None:
     async def handle_report_telemetry(call: ServiceCall) -> None:
         await async_handle_report_telemetry(hass, data, call)
 
-    hass.services.async_register(DOMAIN, "pause", handle_pause, schema=PAUSE_SCHEMA)
-    hass.services.async_register(DOMAIN, "cancel", handle_cancel, schema=CANCEL_SCHEMA)
-    hass.services.async_register(DOMAIN, "cancel_all", handle_cancel_all)
-    hass.services.async_register(DOMAIN, "pause_by_area", handle_pause_by_area, schema=PAUSE_BY_AREA_SCHEMA)
-    hass.services.async_register(DOMAIN, "pause_by_label", handle_pause_by_label, schema=PAUSE_BY_LABEL_SCHEMA)
-    hass.services.async_register(DOMAIN, "cancel_scheduled", handle_cancel_scheduled, schema=CANCEL_SCHEMA)
+    async def handle_get_resume_presets(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_get_resume_presets_service(hass, data, call)
+
+    async def handle_get_snoozes(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_get_snoozes_service(hass, data, call)
+
+    def flushed(
+        handler: Callable[[ServiceCall], Coroutine[Any, Any, ServiceResponse]],
+    ) -> Callable[[ServiceCall], Coroutine[Any, Any, ServiceResponse]]:
+        # State notifications are coalesced; send the pending one before a
+        # state-changing call returns so callers read the updated sensor.
+        async def handle(call: ServiceCall) -> ServiceResponse:
+            try:
+                return await handler(call)
+            finally:
+                data.flush_notify()
+
+        return handle
+
+    # Pause services can report the fields each in-place re-pause changed.
+    for service, handler, schema in (
+        ("pause", handle_pause, PAUSE_SCHEMA),
+        ("pause_by_area", handle_pause_by_area, PAUSE_BY_AREA_SCHEMA),
+        ("pause_by_label", handle_pause_by_label, PAUSE_BY_LABEL_SCHEMA),
+        ("pause_by_device", handle_pause_by_device, PAUSE_BY_DEVICE_SCHEMA),
+        ("pause_by_floor", handle_pause_by_floor, PAUSE_BY_FLOOR_SCHEMA),
+    ):
+        hass.services.async_register(
+            DOMAIN, service, flushed(handler), schema=schema, supports_response=SupportsResponse.OPTIONAL
+        )
+    hass.services.async_register(DOMAIN, "cancel", flushed(handle_cancel), schema=CANCEL_SCHEMA)
+    hass.services.async_register(DOMAIN, "cancel_all", flushed(handle_cancel_all))
+    hass.services.async_register(DOMAIN, "cancel_scheduled", flushed(handle_cancel_scheduled), schema=CANCEL_SCHEMA)
     hass.services.async_register(
         DOMAIN,
         "clear_notification",
-        handle_clear_notification,
+        flushed(handle_clear_notification),
         schema=CANCEL_SCHEMA,
     )
-    hass.services.async_register(DOMAIN, "adjust", handle_adjust, schema=ADJUST_SCHEMA)
+    hass.services.async_register(DOMAIN, "adjust", flushed(handle_adjust), schema=ADJUST_SCHEMA)
     hass.services.async_register(
         DOMAIN,
         "report_telemetry",
         handle_report_telemetry,
         schema=REPORT_TELEMETRY_SCHEMA,
     )
+    hass.services.async_register(
+        DOMAIN,
+        "get_resume_presets",
+        handle_get_resume_presets,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "get_snoozes",
+        handle_get_snoozes,
+        supports_response=SupportsResponse.ONLY,
+    )
 
 
 def unregister_services(hass: HomeAssistant) -> None:
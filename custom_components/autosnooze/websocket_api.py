@@ -0,0 +1,85 @@
+"""Home Assistant websocket commands for AutoSnooze."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
+from homeassistant.components.websocket_api.decorators import websocket_command
+from homeassistant.components.websocket_api.messages import event_message
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .application.catalog import automation_catalog_response
+from .application.snapshot import SnoozeDeltaTracker, build_snapshot
+from .const import DOMAIN, SIGNAL_STATE_CHANGED
+from .runtime.state import AutomationPauseData
+
+
+def register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register AutoSnooze websocket commands; registering again replaces them."""
+    websocket_api.async_register_command(hass, websocket_catalog)
+    websocket_api.async_register_command(hass, websocket_snapshot)
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+def _loaded_data(hass: HomeAssistant) -> AutomationPauseData | None:
+    entries = hass.config_entries.async_loaded_entries(DOMAIN)
+    return entries[0].runtime_data if entries else None
+
+
+@callback
+def _send_not_loaded(connection: ActiveConnection, msg: dict[str, Any]) -> None:
+    connection.send_error(msg["id"], ERR_NOT_FOUND, "AutoSnooze is not loaded")
+
+
+@websocket_command({vol.Required("type"): "autosnooze/snapshot"})
+@callback
+def websocket_snapshot(hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]) -> None:
+    """Return every paused, scheduled and cohort entry with the current generation."""
+    if (data := _loaded_data(hass)) is None:
+        _send_not_loaded(connection, msg)
+        return
+    data.flush_notify()
+    connection.send_result(msg["id"], build_snapshot(data))
+
+
+@websocket_command({vol.Required("type"): "autosnooze/subscribe"})
+@callback
+def websocket_subscribe(hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]) -> None:
+    """Send a snapshot of paused and scheduled entries, then a delta per state change."""
+    if (data := _loaded_data(hass)) is None:
+        _send_not_loaded(connection, msg)
+        return
+    # Send any pending notification first so the snapshot starts at its generation.
+    data.flush_notify()
+    tracker = SnoozeDeltaTracker()
+
+    @callback
+    def forward(changed: frozenset[str] | None = None) -> None:
+        if (current := _loaded_data(hass)) is None:
+            return
+        if (message := tracker.update(current, changed)) is not None:
+            connection.send_message(event_message(msg["id"], message))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(hass, SIGNAL_STATE_CHANGED, forward)
+    connection.send_result(msg["id"])
+    connection.send_message(event_message(msg["id"], tracker.snapshot(data)))
+
+
+@websocket_command(
+    {
+        vol.Required("type"): "autosnooze/catalog",
+        vol.Optional("if_version"): str,
+    }
+)
+@callback
+def websocket_catalog(hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]) -> None:
+    """Return the automation catalog, or not_modified when if_version is current."""
+    if (data := _loaded_data(hass)) is None:
+        _send_not_loaded(connection, msg)
+        return
+    connection.send_result(msg["id"], automation_catalog_response(hass, data, msg.get("if_version")))
@@ -571,7 +571,7 @@ function e(e,t,o,a){var i,s=arguments.length,r=s<3?t:null===a?a=Object.getOwnPro
       font-size: 0.85em;
       color: var(--secondary-text-color);
     }
-`,ve=1e3,xe=6e4,we=36e5,ze=864e5,$e=60,Ae=1440,ke=300,Se=300,Te=3e3,Ce=5e3,je=1e3,Ee=5e3,De=1e3,Me=3e4,Pe=[{label:"30m",minutes:30},{label:"1h",minutes:60},{label:"Custom",minutes:null}],Re=[30,60,120,240],Ie="autosnooze_exclude",Le="autosnooze_include";function Ne(e,t){const o=1e3-Date.now()%1e3;e.syncTimeout=globalThis.setTimeout(()=>{e.syncTimeout=null,t(),e.interval=globalThis.setInterval(()=>{t();Date.now()%1e3>50&&(Fe(e),Ne(e,t))},je)},o)}function Oe(e){const t={interval:null,syncTimeout:null};return Ne(t,e),t}function Fe(e){null!==e.interval&&(globalThis.clearInterval(e.interval),e.interval=null),null!==e.syncTimeout&&(globalThis.clearTimeout(e.syncTimeout),e.syncTimeout=null)}const Ue="autosnooze_last_duration";const He="autosnooze_recent_snoozes";function Be(){try{const e=localStorage.getItem(He);if(!e)return[];const t=JSON.parse(e);if(!Array.isArray(t))return[];const o=Date.now()-2592e6;return t.filter(e=>"string"==typeof e.id&&"number"==typeof e.timestamp&&e.timestamp>o)}catch{return[]}}const Ge="autosnooze_hide_snoozed";const qe="sensor.autosnooze_snoozed_automations",We={},Ve={},Ye=[];let Ke=null,Ze=null,Je=null,Xe=null,Qe=null,et=null;function tt(e){return!e||"object"!=typeof e||Array.isArray(e)?null:e}function ot(e){return tt(e)}function at(e){return tt(e)}function it(e){const t=tt(e?.attributes);return!!t&&(1===t.schema_version?null!==tt(t.paused)&&null!==tt(t.scheduled):"paused"in t||"scheduled"in t||"paused_automations"in t||"scheduled_snoozes"in t||"duration_presets"in t||"critical_terms"in t)}function st(e){const t=e?.states?.[qe];if(it(t))return t;const o=Object.values(e?.states??{}).filter(it);return o.find(e=>e.entity_id.startsWith(qe))??o[0]}function rt(e){if(0===Object.keys(e).length)return Ye;const t={};return Object.entries(e).forEach(([e,o])=>{const a=o.resume_at;t[a]||(t[a]={resumeAt:a,disableAt:o.disable_at,automations:[]}),t[a].automations.push({entity_id:e,friendly_name:o.friendly_name,resume_at:o.resume_at,paused_at:o.paused_at,days:o.days,hours:o.hours,minutes:o.minutes,disable_at:o.disable_at,notification_trigger:o.notification_trigger})}),Object.values(t).sort((e,t)=>new Date(e.resumeAt).getTime()-new Date(t.resumeAt).getTime())}function nt(e){const t=st(e),o=t?.attributes,a=t?.entity_id??null,i=tt(o),s=i?.schema_version,r=i?.paused??i?.paused_automations,n=i?.scheduled??i?.scheduled_snoozes;if(o===Ke&&s===Ze&&r===Je&&n===Xe&&a===Qe&&et)return et;const l=function(e){const t=tt(e);if(!t)return{paused:We,scheduled:Ve};const o=t.schema_version;if(1===o){const e=ot(t.paused),o=at(t.scheduled);return e&&o?{paused:e,scheduled:o}:{paused:We,scheduled:Ve}}if(void 0===o){const e=ot(t.paused)??ot(t.paused_automations)??{},o=at(t.scheduled)??at(t.scheduled_snoozes)??{};if(Object.keys(e).length>0||Object.keys(o).length>0)return{paused:e,scheduled:o}}const a=ot(t.paused_automations),i=at(t.scheduled_snoozes);return{paused:a??We,scheduled:i??Ve}}(o);return Ke=o,Ze=s,Je=r,Xe=n,Qe=a,et={paused:l.paused,scheduled:l.scheduled,groups:rt(l.paused)},et}function lt(){const e=globalThis.navigator,t=e?.userAgent??"",o=(e?.maxTouchPoints??0)>1;return/iPad/i.test(t)||"MacIntel"===e?.platform&&o?"tablet":/Android/i.test(t)?/Mobile/i.test(t)?"mobile":"tablet":/iPhone|iPod|Mobile/i.test(t)?"mobile":"web"}function dt(e,t){if(e.services?.autosnooze?.report_telemetry&&"function"==typeof e.callService&&function(e){const t=e.states?.["sensor.autosnooze_snoozed_automations"]?.attributes,o=t?.telemetry_enabled;return!1!==o}(e))try{const o={event:t.event,source:t.source??"card",platform:t.platform??lt()};"properties"in t&&void 0!==t.properties&&null!==t.properties&&(o.properties=t.properties),"card_type"in t&&void 0!==t.card_type&&null!==t.card_type&&(o.card_type=t.card_type);const a=e.callService("autosnooze","report_telemetry",o,void 0,!1);Promise.resolve(a).catch(()=>{})}catch{}}function ct(e){return`${e.getFullYear()}-${String(e.getMonth()+1).padStart(2,"0")}-${String(e.getDate()).padStart(2,"0")}`}function ut(e){return`${String(e.getHours()).padStart(2,"0")}:${String(e.getMinutes()).padStart(2,"0")}`}function ht(e){return{adjustModalOpen:!0,adjustModalEntityId:e.entityId??"",adjustModalFriendlyName:e.friendlyName??"",adjustModalResumeAt:e.resumeAt,adjustModalEntityIds:e.entityIds??[],adjustModalFriendlyNames:e.friendlyNames??[]}}function pt(e){return Oe(e)}function mt(e){Fe(e)}function gt(){return function(){try{const e=localStorage.getItem(Ue);if(!e)return null;const t=JSON.parse(e);return"number"!=typeof t.minutes||"number"!=typeof t.duration?.days||"number"!=typeof t.duration?.hours||"number"!=typeof t.duration?.minutes||"number"!=typeof t.timestamp?null:Date.now()-t.timestamp>6048e5?(localStorage.removeItem(Ue),null):t}catch{return null}}()}function bt(){return Be().map(e=>e.id)}function _t(e){return nt(e)}function ft(e){return Boolean(st(e))}function yt(e){return st(e)}function vt(e,t){dt(e,{event:"card_viewed",card_type:t,source:"card"})}function xt(e,t){dt(e,{event:"wake_clicked",properties:{scope:t},source:"card"})}function wt(e,t){dt(e,{event:"adjust_opened",properties:{scope:t},source:"card"})}function zt(e,t,o,a){dt(e,{event:"notification_options_changed",properties:{trigger:t,enabled:o,notification_lead_minutes:a},source:"card"})}function $t(e){return e.replace(/_/g," ").replace(/\b\w/g,e=>e.toUpperCase())}function At(e,t,o="Unassigned"){return e?t.areas?.[e]?.name??$t(e):o}function kt(e,t){return t[e]?.name??$t(e)}function St(e,t,o="Uncategorized"){return e?t[e]?.name??$t(e):o}function Tt(e,t,o){return!(!e.labels||0===e.labels.length)&&e.labels.some(e=>{const a=o[e]?.name;return a?.toLowerCase()===t})}function Ct(e,t,o){const a={};return e.forEach(e=>{const i=t(e);if(!i||0===i.length)return a[o]||(a[o]=[]),void a[o].push(e.automation);i.forEach(t=>{a[t]||(a[t]=[]),a[t].push(e.automation)})}),Object.entries(a).sort((e,t)=>e[0]===o?1:t[0]===o?-1:e[0].localeCompare(t[0]))}function jt(e){const t=new Set([Ie.toLowerCase(),Le.toLowerCase()]),o=e.search.toLowerCase(),a=e.automations.map(o=>{const a=function(e,t,o){return e.labels?.length?e.labels.map(e=>kt(e,t)).filter(e=>!o.has(e.toLowerCase())):[]}(o,e.labelRegistry,t);return{automation:o,areaName:o.area_id?e.hass?At(o.area_id,e.hass,e.emptyAreaLabel):$t(o.area_id):e.emptyAreaLabel,categoryName:o.category_id?St(o.category_id,e.categoryRegistry,e.emptyCategoryLabel):e.emptyCategoryLabel,visibleLabelNames:a,hasIncludeLabel:Tt(o,Le,e.labelRegistry),hasExcludeLabel:Tt(o,Ie,e.labelRegistry)}}),i=a.some(e=>e.hasIncludeLabel),s=e.pausedEntityIds,r=Boolean(e.hideSnoozed),n=a.filter(e=>!!(i?e.hasIncludeLabel:!e.hasExcludeLabel)&&((!r||!s?.has(e.automation.id))&&(!o||(e.automation.name.toLowerCase().includes(o)||e.automation.id.toLowerCase().includes(o))))),l="areas"===e.filterTab?Ct(n,e=>e.automation.area_id?[e.areaName]:null,e.emptyAreaLabel):"categories"===e.filterTab?Ct(n,e=>e.automation.category_id?[e.categoryName]:null,e.emptyCategoryLabel):"labels"===e.filterTab?Ct(n,e=>e.visibleLabelNames.length>0?e.visibleLabelNames:null,e.emptyLabelLabel):[],d=new Set,c=new Set,u=new Set;return n.forEach(o=>{o.automation.area_id&&d.add(o.automation.area_id),o.automation.category_id&&u.add(o.automation.category_id),o.automation.labels?.length&&o.automation.labels.forEach(o=>{const a=kt(o,e.labelRegistry).toLowerCase();t.has(a)||c.add(o)})}),{filtered:n.map(e=>e.automation),grouped:l,areaCount:d.size,labelCount:c.size,categoryCount:u.size}}function Et(e,t){const o=new Date(e),a=new Date,i={weekday:"short",month:"short",day:"numeric",hour:"2-digit",minute:"2-digit"};return o.getFullYear()>a.getFullYear()&&(i.year="numeric"),o.toLocaleString(t,i)}function Dt(e,t="Resuming..."){const o=new Date(e).getTime()-Date.now();if(o<=0)return t;const a=Math.floor(o/ze),i=Math.floor(o%ze/we),s=Math.floor(o%we/xe),r=Math.floor(o%xe/ve);return a>0?`${a}d ${i}h ${s}m`:i>0?`${i}h ${s}m ${r}s`:`${s}m ${r}s`}function Mt(e,t,o){const a=[];return e>0&&a.push(`${e} day${1!==e?"s":""}`),t>0&&a.push(`${t} hour${1!==t?"s":""}`),o>0&&a.push(`${o} minute${1!==o?"s":""}`),a.join(", ")}function Pt(e,t,o){const a=[];return e>0&&a.push(`${e}d`),t>0&&a.push(`${t}h`),o>0&&a.push(`${o}m`),a.join(" ")||"0m"}function Rt(e){const t=e.toLowerCase().replace(/\s+/g,"");if(!t)return null;let o=0,a=!1;const i=t.match(/(\d+(?:\.\d+)?)\s*d/),s=t.match(/(\d+(?:\.\d+)?)\s*h/),r=t.match(/(\d+(?:\.\d+)?)\s*m(?!i)/);if(i?.[1]){const e=parseFloat(i[1]);if(isNaN(e)||e<0)return null;o+=e*Ae,a=!0}if(s?.[1]){const e=parseFloat(s[1]);if(isNaN(e)||e<0)return null;o+=e*$e,a=!0}if(r?.[1]){const e=parseFloat(r[1]);if(isNaN(e)||e<0)return null;o+=e,a=!0}if(!a){if(!/^\d+(?:\.\d+)?$/.test(t))return null;const e=parseFloat(t);if(isNaN(e)||!(e>0))return null;o=e}if(o=Math.round(o),o<=0)return null;const n=Math.floor(o/Ae),l=o%Ae;return{days:n,hours:Math.floor(l/$e),minutes:l%$e}}function It(e){return null!==Rt(e)}function Lt(e){return e.days*Ae+e.hours*$e+e.minutes}function Nt(e){const t=Math.floor(e/Ae),o=e%Ae;return{days:t,hours:Math.floor(o/$e),minutes:o%$e}}function Ot(e="light"){!function(e,t,o){const a=new CustomEvent(`hass-${t}`,{bubbles:!0,composed:!0,detail:o});e.dispatchEvent(a)}(window,"haptic",e)}const Ft=Symbol.for("autosnooze.customElements.define.patched"),Ut=Symbol.for("autosnooze.customElements.registeredCtors");function Ht(){return navigator.userAgent.toLowerCase().includes("jsdom")}function Bt(){if(!Ht())return;const e=customElements;if(e[Ft])return;const t=e.define.bind(e);e.define=(o,a,i)=>{const s=function(){const e=customElements;return e[Ut]??=new WeakSet,e[Ut]}();if(s.has(a)&&!e.get(o)){const e=class extends a{};return t(o,e,i),void s.add(e)}try{t(o,a,i),s.add(a)}catch(e){if(!function(e){return e instanceof Error&&e.message.includes("constructor has already been registered")}(e))throw e;const r=class extends a{};t(o,r,i),s.add(r)}},e[Ft]=!0}function Gt(e,t){Ht()&&Bt(),customElements.get(e)||customElements.define(e,t)}async function qt(e,t){try{await e.callService("autosnooze","cancel",{entity_id:t})}catch(e){throw console.error("[AutoSnooze] Failed to wake automation:",e),e}}async function Wt(e,t){try{await e.callService("autosnooze","cancel_scheduled",{entity_id:t})}catch(e){throw console.error("[AutoSnooze] Failed to cancel scheduled snooze:",e),e}}function Vt(e,t){if(!e||!t)return null;const o=new Date(`${e}T${t}`);if(Number.isNaN(o.getTime()))return null;const a=`${o.getFullYear()}-${String(o.getMonth()+1).padStart(2,"0")}-${String(o.getDate()).padStart(2,"0")}`,i=`${String(o.getHours()).padStart(2,"0")}:${String(o.getMinutes()).padStart(2,"0")}`;if(a!==e||i!==t)return null;const s=o.getTimezoneOffset(),r=s<=0?"+":"-",n=Math.abs(s);return`${e}T${t}${`${r}${String(Math.floor(n/60)).padStart(2,"0")}:${String(n%60).padStart(2,"0")}`}`}function Yt(e,t){const o=new Date(e.getFullYear(),e.getMonth(),e.getDate()+1,t,0);return{date:`${o.getFullYear()}-${String(o.getMonth()+1).padStart(2,"0")}-${String(o.getDate()).padStart(2,"0")}`,time:`${String(t).padStart(2,"0")}:00`}}function Kt(e,t,o){return t&&"none"!==t?"about_to_end"===t?void 0===o?{...e,notification_trigger:t}:{...e,notification_trigger:t,notification_lead_minutes:o}:{...e,notification_trigger:t}:e}const Zt="autosnooze_confirm",Jt=["alarm","security","siren","lock","smoke","carbon monoxide","co2","leak","flood","fire","gas"];function Xt(e){if(!e)return null;const t=new Date(e).getTime();return Number.isFinite(t)?t:null}function Qt(e,t){return _e(e.hass,"Resume time is required"===t?e.resumeAtDate||e.resumeAtTime?"toast.error.invalid_datetime":"toast.error.resume_time_required":"Resume time must be in the future"===t?"toast.error.resume_time_past":"toast.error.snooze_before_resume")}function eo(e,t){return t.some(t=>{const o=t.replace(/[.*+?^${}()|[\]\\]/g,"\\$&");return new RegExp(`(?<![a-z0-9])${o}(?![a-z0-9])`,"i").test(e)})}function to(e){const t=st(e)?.attributes?.critical_terms;return Array.isArray(t)&&t.length>0&&t.every(e=>"string"==typeof e)?t:Jt}function oo(e){const t=new Set(e.selected),o=e.criticalTerms??Jt;return e.automations.some(a=>{return!!t.has(a.id)&&(i=a.labels,s=e.labelRegistry,i.some(e=>e===Zt||s[e]?.name===Zt)||eo(a.id,o)||eo(a.name,o));var i,s})}async function ao(e){const t=function(e){if(e.untilTomorrow&&!e.scheduleMode){const t=Yt(new Date,8);return{...e,scheduleMode:!0,resumeAtDate:t.date,resumeAtTime:t.time,disableAtDate:"",disableAtTime:""}}return e}(e);if(t.scheduleMode){const e=function(e){const t=Xt(Vt(e.resumeAtDate,e.resumeAtTime));if(null===t)return{status:"error",message:"Resume time is required"};if(t<=e.nowMs)return{status:"error",message:"Resume time must be in the future"};const o=e.disableAtDate&&e.disableAtTime?Vt(e.disableAtDate,e.disableAtTime):null,a=Xt(o);return e.disableAtDate&&e.disableAtTime&&null===o||null!==a&&a>=t?{status:"error",message:"Snooze time must be before resume time"}:{status:"valid"}}({...t,nowMs:t.nowMs??0});if("error"===e.status)return{status:"validation_error",toastMessage:Qt(t,e.message)}}if(!t.forceConfirm&&t.automations&&oo({selected:t.selected,automations:t.automations,labelRegistry:t.labelRegistry??{},criticalTerms:to(t.hass)}))return{status:"confirm_required"};const o=t.scheduleMode?function(e){const t=e.disableAtDate&&e.disableAtTime?Vt(e.disableAtDate,e.disableAtTime):null,o=Vt(e.resumeAtDate,e.resumeAtTime);if(!o)return null;const a=Kt({entity_id:e.selected,resume_at:o,...t&&{disable_at:t},...e.forceConfirm&&{confirm:!0}},e.notificationTrigger,e.notificationLeadMinutes),i=e.selected.length;return{request:a,toastMessage:t?1===i?_e(e.hass,"toast.success.scheduled_one"):_e(e.hass,"toast.success.scheduled_many",{count:i}):1===i?_e(e.hass,"toast.success.snoozed_until_one",{time:Et(o,e.hass.locale?.language)}):_e(e.hass,"toast.success.snoozed_until_many",{count:i,time:Et(o,e.hass.locale?.language)})}}(t):function(e){const{days:t,hours:o,minutes:a}=e.customDuration,i={minutes:Lt(e.customDuration),duration:e.customDuration,timestamp:Date.now()};return{request:Kt({entity_id:e.selected,days:t,hours:o,minutes:a,...e.forceConfirm&&{confirm:!0}},e.notificationTrigger,e.notificationLeadMinutes),toastMessage:1===e.selected.length?_e(e.hass,"toast.success.snoozed_for_one",{duration:Mt(t,o,a)}):_e(e.hass,"toast.success.snoozed_for_many",{count:e.selected.length,duration:Mt(t,o,a)}),lastDuration:i}}(t);if(!o)return{status:"aborted"};try{await async function(e,t){try{await e.callService("autosnooze","pause",t)}catch(e){throw console.error("[AutoSnooze] Failed to pause automations:",e),e}}(t.hass,o.request)}catch(e){if("confirm_required"===function(e){const t=e;return t?.translation_key??t?.data?.translation_key}(e))return{status:"confirm_required"};throw e}return function(e){try{const t=Date.now(),o=Be(),a=e.map(e=>({id:e,timestamp:t})),i=new Set(e),s=[...a,...o.filter(e=>!i.has(e.id))].slice(0,10);localStorage.setItem(He,JSON.stringify(s))}catch{}}(t.selected),function(e){return"lastDuration"in e}(o)?(function(e,t){try{const o={minutes:t,duration:e,timestamp:Date.now()};localStorage.setItem(Ue,JSON.stringify(o))}catch{}}(o.lastDuration.duration,o.lastDuration.minutes),{status:"submitted",toastMessage:o.toastMessage,lastDuration:o.lastDuration}):{status:"submitted",toastMessage:o.toastMessage}}async function io(e){await async function(e){try{await e.callService("autosnooze","cancel_all",{})}catch(e){throw console.error("[AutoSnooze] Failed to wake all automations:",e),e}}(e)}async function so(e,t){await async function(e,t){try{await e.callService("autosnooze","clear_notification",{entity_id:t})}catch(e){throw console.error("[AutoSnooze] Failed to clear snooze notification:",e),e}}(e,t)}async function ro(e,t,o){const{entityId:a,entityIds:i,...s}=t,r=i||a||"";await async function(e,t,o){try{await e.callService("autosnooze","adjust",{entity_id:t,...o})}catch(e){throw console.error("[AutoSnooze] Failed to adjust snooze:",e),e}}(e,r,s);const n=24*(s.days||0)*60*60*1e3+60*(s.hours||0)*60*1e3+60*(s.minutes||0)*1e3;return{nextResumeAt:new Date(new Date(o).getTime()+n).toISOString()}}const no={loadLabels:async function(e){try{const t=await e.connection.sendMessagePromise({type:"config/label_registry/list"}),o={};return Array.isArray(t)&&t.forEach(e=>{o[e.label_id]=e}),o}catch(e){return console.warn("[AutoSnooze] Failed to fetch label registry:",e),null}},loadCategories:async function(e){try{const t=await e.connection.sendMessagePromise({type:"config/category_registry/list",scope:"automation"}),o={};return Array.isArray(t)&&t.forEach(e=>{o[e.category_id]=e}),o}catch(e){return console.warn("[AutoSnooze] Failed to fetch category registry:",e),{}}},loadEntities:async function(e){try{const t=await e.connection.sendMessagePromise({type:"config/entity_registry/list"}),o={};return Array.isArray(t)&&t.filter(e=>e.entity_id.startsWith("automation.")).forEach(e=>{o[e.entity_id]=e}),o}catch(e){return console.warn("[AutoSnooze] Failed to fetch entity registry:",e),{}}},getAutomations:function(e,t){return e.states?Object.keys(e.states).filter(e=>e.startsWith("automation.")).map(o=>{const a=e.states[o];if(!a)return null;const i=t[o],s=e.entities?.[o];return{id:o,name:a.attributes?.friendly_name??o.replace("automation.",""),area_id:i?.area_id??s?.area_id??null,category_id:i?.categories?.automation??null,labels:i?.labels??s?.labels??[]}}).filter(e=>null!==e).sort((e,t)=>e.name.localeCompare(t.name)):[]},setTimeout:setTimeout,clearTimeout:clearTimeout};class lo{constructor(e,t={}){this.changed=e,this.labels={},this.labelsUnavailable=!1,this.categories={},this.entities={},this.cacheVersion=0,this.connected=!1,this.labelsLoaded=!1,this.categoriesLoaded=!1,this.entitiesLoaded=!1,this.retryDelay=De,this.cachedVersion=-1,this.deps={...no,...t}}get snapshot(){return{labels:this.labels,labelsUnavailable:this.labelsUnavailable,categories:this.categories,entities:this.entities,cacheVersion:this.cacheVersion}}connect(e){return this.connected=!0,this.hass=e,e.connection?Promise.all([this.loadLabels(),this.loadCategories(),this.loadEntities()]).then(()=>{}):Promise.resolve()}disconnect(){this.connected=!1,void 0!==this.retryTimer&&this.deps.clearTimeout(this.retryTimer),this.retryTimer=void 0}getAutomations(e){return this.cachedStates===e.states&&this.cachedVersion===this.cacheVersion&&this.automations||(this.automations=this.deps.getAutomations(e,this.entities),this.cachedStates=e.states,this.cachedVersion=this.cacheVersion),this.automations}shouldUpdate(e,t){if(!e||!t)return!0;if(st(e)!==st(t)||e.entities!==t.entities||e.areas!==t.areas||(e.language??e.locale?.language)!==(t.language??t.locale?.language))return!0;if(!e.states||!t.states)return!0;if(e.states===t.states)return!1;const o=Object.entries(e.states).filter(([e])=>e.startsWith("automation.")),a=Object.keys(t.states).filter(e=>e.startsWith("automation.")).length;return o.length!==a||o.some(([e,o])=>t.states[e]!==o)}loadLabels(e){return e&&(this.hass=e),this.labelsLoaded||void 0!==this.retryTimer?Promise.resolve():this.labelsPromise??=this.deps.loadLabels(this.hass).then(e=>{if(null===e)return this.labelsUnavailable=!0,void 0===this.retryTimer&&(this.retryTimer=this.deps.setTimeout(()=>{this.finishRetry(),this.loadLabels()},this.retryDelay),this.retryDelay=Math.min(2*this.retryDelay,Me)),void this.changed();this.labels=e,this.labelsLoaded=!0,this.labelsUnavailable=!1,this.retryDelay=De,this.finishRetry(),this.invalidate()}).finally(()=>{this.labelsPromise=void 0})}loadCategories(e){return e&&(this.hass=e),this.categoriesLoaded?Promise.resolve():this.categoriesPromise??=this.deps.loadCategories(this.hass).then(e=>{this.categories=e,this.categoriesLoaded=!0,this.changed()}).finally(()=>{this.categoriesPromise=void 0})}loadEntities(e){return e&&(this.hass=e),this.entitiesLoaded?Promise.resolve():this.entitiesPromise??=this.deps.loadEntities(this.hass).then(e=>{this.entities=e,this.entitiesLoaded=!0,this.invalidate()}).finally(()=>{this.entitiesPromise=void 0})}finishRetry(){void 0!==this.retryTimer&&this.deps.clearTimeout(this.retryTimer),this.retryTimer=void 0}invalidate(){this.cacheVersion++,this.connected&&this.changed()}}class co extends HTMLElement{show(e,t,o=t,a){this.clear();const i=document.createElement("div");if(i.className="toast",i.setAttribute("role","alert"),i.setAttribute("aria-live","polite"),i.setAttribute("aria-atomic","true"),a){const s=document.createElement("span");s.textContent=e,i.appendChild(s);const r=document.createElement("button");r.className="toast-undo-btn",r.textContent=t,r.setAttribute("aria-label",o),r.onclick=e=>{e.stopPropagation(),a(),this.clear()},i.appendChild(r)}else i.textContent=e;this.appendChild(i),this.durationTimer=setTimeout(()=>{i.style.animation=`slideUp ${Se}ms ease-out reverse`,this.fadeTimer=setTimeout(()=>this.clear(),Se),this.durationTimer=void 0},Ce)}disconnectedCallback(){this.clear()}clear(){void 0!==this.durationTimer&&clearTimeout(this.durationTimer),void 0!==this.fadeTimer&&clearTimeout(this.fadeTimer),this.durationTimer=this.fadeTimer=void 0,this.replaceChildren()}}Gt("autosnooze-toast",co);class uo extends ne{constructor(){super(...arguments),this.scheduled={}}createRenderRoot(){return this}render(){const e=Object.entries(this.scheduled);return e.length?B`
+`,ve=1e3,xe=6e4,we=36e5,ze=864e5,$e=60,Ae=1440,ke=300,Se=300,Te=3e3,Ce=5e3,je=1e3,Ee=5e3,De=1e3,Me=3e4,Pe=[{label:"30m",minutes:30},{label:"1h",minutes:60},{label:"Custom",minutes:null}],Re=[30,60,120,240],Ie="autosnooze_exclude",Le="autosnooze_include";function Ne(e,t){const o=1e3-Date.now()%1e3;e.syncTimeout=globalThis.setTimeout(()=>{e.syncTimeout=null,t(),e.interval=globalThis.setInterval(()=>{t();Date.now()%1e3>50&&(Fe(e),Ne(e,t))},je)},o)}function Oe(e){const t={interval:null,syncTimeout:null};return Ne(t,e),t}function Fe(e){null!==e.interval&&(globalThis.clearInterval(e.interval),e.interval=null),null!==e.syncTimeout&&(globalThis.clearTimeout(e.syncTimeout),e.syncTimeout=null)}const Ue="autosnooze_last_duration";const He="autosnooze_recent_snoozes";function Be(){try{const e=localStorage.getItem(He);if(!e)return[];const t=JSON.parse(e);if(!Array.isArray(t))return[];const o=Date.now()-2592e6;return t.filter(e=>"string"==typeof e.id&&"number"==typeof e.timestamp&&e.timestamp>o)}catch{return[]}}const Ge="autosnooze_hide_snoozed";const qe="sensor.autosnooze_snoozed_automations",We={},Ve={},Ye=[];let Ke=null,Ze=null,Je=null,Xe=null,Mo=null,Qe=null,et=null;function tt(e){return!e||"object"!=typeof e||Array.isArray(e)?null:e}function ot(e){return tt(e)}function at(e){return tt(e)}function Po(e,t){if(!t)return e;let o=null;for(const[a,i]of Object.entries(e)){const s=i.cohort_id?t[i.cohort_id]:void 0;if(!s)continue;const{entity_ids:r,...n}=s;Array.isArray(r)&&!r.includes(a)||(o??={...e},o[a]={...n,...i})}return o??e}function it(e){const t=tt(e?.attributes);return!!t&&(1===t.schema_version?null!==tt(t.paused)&&null!==tt(t.scheduled):"paused"in t||"scheduled"in t||"paused_automations"in t||"scheduled_snoozes"in t||"duration_presets"in t||"critical_terms"in t)}function st(e){const t=e?.states?.[qe];if(it(t))return t;const o=Object.values(e?.states??{}).filter(it);return o.find(e=>e.entity_id.startsWith(qe))??o[0]}function rt(e){if(0===Object.keys(e).length)return Ye;const t={};return Object.entries(e).forEach(([e,o])=>{const a=o.resume_at;t[a]||(t[a]={resumeAt:a,disableAt:o.disable_at,automations:[]}),t[a].automations.push({entity_id:e,friendly_name:o.friendly_name,resume_at:o.resume_at,paused_at:o.paused_at,days:o.days,hours:o.hours,minutes:o.minutes,disable_at:o.disable_at,notification_trigger:o.notification_trigger})}),Object.values(t).sort((e,t)=>new Date(e.resumeAt).getTime()-new Date(t.resumeAt).getTime())}function nt(e){const t=st(e),o=t?.attributes,a=t?.entity_id??null,i=tt(o),s=i?.schema_version,r=i?.paused??i?.paused_automations,n=i?.scheduled??i?.scheduled_snoozes,c=i?.cohorts;if(o===Ke&&s===Ze&&r===Je&&n===Xe&&c===Mo&&a===Qe&&et)return et;const l=function(e){const t=tt(e);if(!t)return{paused:We,scheduled:Ve};const o=t.schema_version;if(1===o){const e=ot(t.paused),o=at(t.scheduled);return e&&o?{paused:Po(e,tt(t.cohorts)),scheduled:o}:{paused:We,scheduled:Ve}}if(void 0===o){const e=ot(t.paused)??ot(t.paused_automations)??{},o=at(t.scheduled)??at(t.scheduled_snoozes)??{};if(Object.keys(e).length>0||Object.keys(o).length>0)return{paused:e,scheduled:o}}const a=ot(t.paused_automations),i=at(t.scheduled_snoozes);return{paused:a??We,scheduled:i??Ve}}(o);return Ke=o,Ze=s,Je=r,Xe=n,Mo=c,Qe=a,et={paused:l.paused,scheduled:l.scheduled,groups:rt(l.paused)},et}function lt(){const e=globalThis.navigator,t=e?.userAgent??"",o=(e?.maxTouchPoints??0)>1;return/iPad/i.test(t)||"MacIntel"===e?.platform&&o?"tablet":/Android/i.test(t)?/Mobile/i.test(t)?"mobile":"tablet":/iPhone|iPod|Mobile/i.test(t)?"mobile":"web"}function dt(e,t){if(e.services?.autosnooze?.report_telemetry&&"function"==typeof e.callService&&function(e){const t=e.states?.["sensor.autosnooze_snoozed_automations"]?.attributes,o=t?.telemetry_enabled;return!1!==o}(e))try{const o={event:t.event,source:t.source??"card",platform:t.platform??lt()};"properties"in t&&void 0!==t.properties&&null!==t.properties&&(o.properties=t.properties),"card_type"in t&&void 0!==t.card_type&&null!==t.card_type&&(o.card_type=t.card_type);const a=e.callService("autosnooze","report_telemetry",o,void 0,!1);Promise.resolve(a).catch(()=>{})}catch{}}function ct(e){return`${e.getFullYear()}-${String(e.getMonth()+1).padStart(2,"0")}-${String(e.getDate()).padStart(2,"0")}`}function ut(e){return`${String(e.getHours()).padStart(2,"0")}:${String(e.getMinutes()).padStart(2,"0")}`}function ht(e){return{adjustModalOpen:!0,adjustModalEntityId:e.entityId??"",adjustModalFriendlyName:e.friendlyName??"",adjustModalResumeAt:e.resumeAt,adjustModalEntityIds:e.entityIds??[],adjustModalFriendlyNames:e.friendlyNames??[]}}function pt(e){return Oe(e)}function mt(e){Fe(e)}function gt(){return function(){try{const e=localStorage.getItem(Ue);if(!e)return null;const t=JSON.parse(e);return"number"!=typeof t.minutes||"number"!=typeof t.duration?.days||"number"!=typeof t.duration?.hours||"number"!=typeof t.duration?.minutes||"number"!=typeof t.timestamp?null:Date.now()-t.timestamp>6048e5?(localStorage.removeItem(Ue),null):t}catch{return null}}()}function bt(){return Be().map(e=>e.id)}function _t(e){return nt(e)}function ft(e){return Boolean(st(e))}function yt(e){return st(e)}function vt(e,t){dt(e,{event:"card_viewed",card_type:t,source:"card"})}function xt(e,t){dt(e,{event:"wake_clicked",properties:{scope:t},source:"card"})}function wt(e,t){dt(e,{event:"adjust_opened",properties:{scope:t},source:"card"})}function zt(e,t,o,a){dt(e,{event:"notification_options_changed",properties:{trigger:t,enabled:o,notification_lead_minutes:a},source:"card"})}function $t(e){return e.replace(/_/g," ").replace(/\b\w/g,e=>e.toUpperCase())}function At(e,t,o="Unassigned"){return e?t.areas?.[e]?.name??$t(e):o}function kt(e,t){return t[e]?.name??$t(e)}function St(e,t,o="Uncategorized"){return e?t[e]?.name??$t(e):o}function Tt(e,t,o){return!(!e.labels||0===e.labels.length)&&e.labels.some(e=>{const a=o[e]?.name;return a?.toLowerCase()===t})}function Ct(e,t,o){const a={};return e.forEach(e=>{const i=t(e);if(!i||0===i.length)return a[o]||(a[o]=[]),void a[o].push(e.automation);i.forEach(t=>{a[t]||(a[t]=[]),a[t].push(e.automation)})}),Object.entries(a).sort((e,t)=>e[0]===o?1:t[0]===o?-1:e[0].localeCompare(t[0]))}function jt(e){const t=new Set([Ie.toLowerCase(),Le.toLowerCase()]),o=e.search.toLowerCase(),a=e.automations.map(o=>{const a=function(e,t,o){return e.labels?.length?e.labels.map(e=>kt(e,t)).filter(e=>!o.has(e.toLowerCase())):[]}(o,e.labelRegistry,t);return{automation:o,areaName:o.area_id?e.hass?At(o.area_id,e.hass,e.emptyAreaLabel):$t(o.area_id):e.emptyAreaLabel,categoryName:o.category_id?St(o.category_id,e.categoryRegistry,e.emptyCategoryLabel):e.emptyCategoryLabel,visibleLabelNames:a,hasIncludeLabel:Tt(o,Le,e.labelRegistry),hasExcludeLabel:Tt(o,Ie,e.labelRegistry)}}),i=a.some(e=>e.hasIncludeLabel),s=e.pausedEntityIds,r=Boolean(e.hideSnoozed),n=a.filter(e=>!!(i?e.hasIncludeLabel:!e.hasExcludeLabel)&&((!r||!s?.has(e.automation.id))&&(!o||(e.automation.name.toLowerCase().includes(o)||e.automation.id.toLowerCase().includes(o))))),l="areas"===e.filterTab?Ct(n,e=>e.automation.area_id?[e.areaName]:null,e.emptyAreaLabel):"categories"===e.filterTab?Ct(n,e=>e.automation.category_id?[e.categoryName]:null,e.emptyCategoryLabel):"labels"===e.filterTab?Ct(n,e=>e.visibleLabelNames.length>0?e.visibleLabelNames:null,e.emptyLabelLabel):[],d=new Set,c=new Set,u=new Set;return n.forEach(o=>{o.automation.area_id&&d.add(o.automation.area_id),o.automation.category_id&&u.add(o.automation.category_id),o.automation.labels?.length&&o.automation.labels.forEach(o=>{const a=kt(o,e.labelRegistry).toLowerCase();t.has(a)||c.add(o)})}),{filtered:n.map(e=>e.automation),grouped:l,areaCount:d.size,labelCount:c.size,categoryCount:u.size}}function Et(e,t){const o=new Date(e),a=new Date,i={weekday:"short",month:"short",day:"numeric",hour:"2-digit",minute:"2-digit"};return o.getFullYear()>a.getFullYear()&&(i.year="numeric"),o.toLocaleString(t,i)}function Dt(e,t="Resuming..."){const o=new Date(e).getTime()-Date.now();if(o<=0)return t;const a=Math.floor(o/ze),i=Math.floor(o%ze/we),s=Math.floor(o%we/xe),r=Math.floor(o%xe/ve);return a>0?`${a}d ${i}h ${s}m`:i>0?`${i}h ${s}m ${r}s`:`${s}m ${r}s`}function Mt(e,t,o){const a=[];return e>0&&a.push(`${e} day${1!==e?"s":""}`),t>0&&a.push(`${t} hour${1!==t?"s":""}`),o>0&&a.push(`${o} minute${1!==o?"s":""}`),a.join(", ")}function Pt(e,t,o){const a=[];return e>0&&a.push(`${e}d`),t>0&&a.push(`${t}h`),o>0&&a.push(`${o}m`),a.join(" ")||"0m"}function Rt(e){const t=e.toLowerCase().replace(/\s+/g,"");if(!t)return null;let o=0,a=!1;const i=t.match(/(\d+(?:\.\d+)?)\s*d/),s=t.match(/(\d+(?:\.\d+)?)\s*h/),r=t.match(/(\d+(?:\.\d+)?)\s*m(?!i)/);if(i?.[1]){const e=parseFloat(i[1]);if(isNaN(e)||e<0)return null;o+=e*Ae,a=!0}if(s?.[1]){const e=parseFloat(s[1]);if(isNaN(e)||e<0)return null;o+=e*$e,a=!0}if(r?.[1]){const e=parseFloat(r[1]);if(isNaN(e)||e<0)return null;o+=e,a=!0}if(!a){if(!/^\d+(?:\.\d+)?$/.test(t))return null;const e=parseFloat(t);if(isNaN(e)||!(e>0))return null;o=e}if(o=Math.round(o),o<=0)return null;const n=Math.floor(o/Ae),l=o%Ae;return{days:n,hours:Math.floor(l/$e),minutes:l%$e}}function It(e){return null!==Rt(e)}function Lt(e){return e.days*Ae+e.hours*$e+e.minutes}function Nt(e){const t=Math.floor(e/Ae),o=e%Ae;return{days:t,hours:Math.floor(o/$e),minutes:o%$e}}function Ot(e="light"){!function(e,t,o){const a=new CustomEvent(`hass-${t}`,{bubbles:!0,composed:!0,detail:o});e.dispatchEvent(a)}(window,"haptic",e)}const Ft=Symbol.for("autosnooze.customElements.define.patched"),Ut=Symbol.for("autosnooze.customElements.registeredCtors");function Ht(){return navigator.userAgent.toLowerCase().includes("jsdom")}function Bt(){if(!Ht())return;const e=customElements;if(e[Ft])return;const t=e.define.bind(e);e.define=(o,a,i)=>{const s=function(){const e=customElements;return e[Ut]??=new WeakSet,e[Ut]}();if(s.has(a)&&!e.get(o)){const e=class extends a{};return t(o,e,i),void s.add(e)}try{t(o,a,i),s.add(a)}catch(e){if(!function(e){return e instanceof Error&&e.message.includes("constructor has already been registered")}(e))throw e;const r=class extends a{};t(o,r,i),s.add(r)}},e[Ft]=!0}function Gt(e,t){Ht()&&Bt(),customElements.get(e)||customElements.define(e,t)}async function qt(e,t){try{await e.callService("autosnooze","cancel",{entity_id:t})}catch(e){throw console.error("[AutoSnooze] Failed to wake automation:",e),e}}async function Wt(e,t){try{await e.callService("autosnooze","cancel_scheduled",{entity_id:t})}catch(e){throw console.error("[AutoSnooze] Failed to cancel scheduled snooze:",e),e}}function Vt(e,t){if(!e||!t)return null;const o=new Date(`${e}T${t}`);if(Number.isNaN(o.getTime()))return null;const a=`${o.getFullYear()}-${String(o.getMonth()+1).padStart(2,"0")}-${String(o.getDate()).padStart(2,"0")}`,i=`${String(o.getHours()).padStart(2,"0")}:${String(o.getMinutes()).padStart(2,"0")}`;if(a!==e||i!==t)return null;const s=o.getTimezoneOffset(),r=s<=0?"+":"-",n=Math.abs(s);return`${e}T${t}${`${r}${String(Math.floor(n/60)).padStart(2,"0")}:${String(n%60).padStart(2,"0")}`}`}function Yt(e,t){const o=new Date(e.getFullYear(),e.getMonth(),e.getDate()+1,t,0);return{date:`${o.getFullYear()}-${String(o.getMonth()+1).padStart(2,"0")}-${String(o.getDate()).padStart(2,"0")}`,time:`${String(t).padStart(2,"0")}:00`}}function Kt(e,t,o){return t&&"none"!==t?"about_to_end"===t?void 0===o?{...e,notification_trigger:t}:{...e,notification_trigger:t,notification_lead_minutes:o}:{...e,notification_trigger:t}:e}const Zt="autosnooze_confirm",Jt=["alarm","security","siren","lock","smoke","carbon monoxide","co2","leak","flood","fire","gas"];function Xt(e){if(!e)return null;const t=new Date(e).getTime();return Number.isFinite(t)?t:null}function Qt(e,t){return _e(e.hass,"Resume time is required"===t?e.resumeAtDate||e.resumeAtTime?"toast.error.invalid_datetime":"toast.error.resume_time_required":"Resume time must be in the future"===t?"toast.error.resume_time_past":"toast.error.snooze_before_resume")}function eo(e,t){return t.some(t=>{const o=t.replace(/[.*+?^${}()|[\]\\]/g,"\\$&");return new RegExp(`(?<![a-z0-9])${o}(?![a-z0-9])`,"i").test(e)})}function to(e){const t=st(e)?.attributes?.critical_terms;return Array.isArray(t)&&t.length>0&&t.every(e=>"string"==typeof e)?t:Jt}function oo(e){const t=new Set(e.selected),o=e.criticalTerms??Jt;return e.automations.some(a=>{return!!t.has(a.id)&&(i=a.labels,s=e.labelRegistry,i.some(e=>e===Zt||s[e]?.name===Zt)||eo(a.id,o)||eo(a.name,o));var i,s})}async function ao(e){const t=function(e){if(e.untilTomorrow&&!e.scheduleMode){const t=Yt(new Date,8);return{...e,scheduleMode:!0,resumeAtDate:t.date,resumeAtTime:t.time,disableAtDate:"",disableAtTime:""}}return e}(e);if(t.scheduleMode){const e=function(e){const t=Xt(Vt(e.resumeAtDate,e.resumeAtTime));if(null===t)return{status:"error",message:"Resume time is required"};if(t<=e.nowMs)return{status:"error",message:"Resume time must be in the future"};const o=e.disableAtDate&&e.disableAtTime?Vt(e.disableAtDate,e.disableAtTime):null,a=Xt(o);return e.disableAtDate&&e.disableAtTime&&null===o||null!==a&&a>=t?{status:"error",message:"Snooze time must be before resume time"}:{status:"valid"}}({...t,nowMs:t.nowMs??0});if("error"===e.status)return{status:"validation_error",toastMessage:Qt(t,e.message)}}if(!t.forceConfirm&&t.automations&&oo({selected:t.selected,automations:t.automations,labelRegistry:t.labelRegistry??{},criticalTerms:to(t.hass)}))return{status:"confirm_required"};const o=t.scheduleMode?function(e){const t=e.disableAtDate&&e.disableAtTime?Vt(e.disableAtDate,e.disableAtTime):null,o=Vt(e.resumeAtDate,e.resumeAtTime);if(!o)return null;const a=Kt({entity_id:e.selected,resume_at:o,...t&&{disable_at:t},...e.forceConfirm&&{confirm:!0}},e.notificationTrigger,e.notificationLeadMinutes),i=e.selected.length;return{request:a,toastMessage:t?1===i?_e(e.hass,"toast.success.scheduled_one"):_e(e.hass,"toast.success.scheduled_many",{count:i}):1===i?_e(e.hass,"toast.success.snoozed_until_one",{time:Et(o,e.hass.locale?.language)}):_e(e.hass,"toast.success.snoozed_until_many",{count:i,time:Et(o,e.hass.locale?.language)})}}(t):function(e){const{days:t,hours:o,minutes:a}=e.customDuration,i={minutes:Lt(e.customDuration),duration:e.customDuration,timestamp:Date.now()};return{request:Kt({entity_id:e.selected,days:t,hours:o,minutes:a,...e.forceConfirm&&{confirm:!0}},e.notificationTrigger,e.notificationLeadMinutes),toastMessage:1===e.selected.length?_e(e.hass,"toast.success.snoozed_for_one",{duration:Mt(t,o,a)}):_e(e.hass,"toast.success.snoozed_for_many",{count:e.selected.length,duration:Mt(t,o,a)}),lastDuration:i}}(t);if(!o)return{status:"aborted"};try{await async function(e,t){try{await e.callService("autosnooze","pause",t)}catch(e){throw console.error("[AutoSnooze] Failed to pause automations:",e),e}}(t.hass,o.request)}catch(e){if("confirm_required"===function(e){const t=e;return t?.translation_key??t?.data?.translation_key}(e))return{status:"confirm_required"};throw e}return function(e){try{const t=Date.now(),o=Be(),a=e.map(e=>({id:e,timestamp:t})),i=new Set(e),s=[...a,...o.filter(e=>!i.has(e.id))].slice(0,10);localStorage.setItem(He,JSON.stringify(s))}catch{}}(t.selected),function(e){return"lastDuration"in e}(o)?(function(e,t){try{const o={minutes:t,duration:e,timestamp:Date.now()};localStorage.setItem(Ue,JSON.stringify(o))}catch{}}(o.lastDuration.duration,o.lastDuration.minutes),{status:"submitted",toastMessage:o.toastMessage,lastDuration:o.lastDuration}):{status:"submitted",toastMessage:o.toastMessage}}async function io(e){await async function(e){try{await e.callService("autosnooze","cancel_all",{})}catch(e){throw console.error("[AutoSnooze] Failed to wake all automations:",e),e}}(e)}async function so(e,t){await async function(e,t){try{await e.callService("autosnooze","clear_notification",{entity_id:t})}catch(e){throw console.error("[AutoSnooze] Failed to clear snooze notification:",e),e}}(e,t)}async function ro(e,t,o){const{entityId:a,entityIds:i,...s}=t,r=i||a||"";await async function(e,t,o){try{await e.callService("autosnooze","adjust",{entity_id:t,...o})}catch(e){throw console.error("[AutoSnooze] Failed to adjust snooze:",e),e}}(e,r,s);const n=24*(s.days||0)*60*60*1e3+60*(s.hours||0)*60*1e3+60*(s.minutes||0)*1e3;return{nextResumeAt:new Date(new Date(o).getTime()+n).toISOString()}}const no={loadLabels:async function(e){try{const t=await e.connection.sendMessagePromise({type:"config/label_registry/list"}),o={};return Array.isArray(t)&&t.forEach(e=>{o[e.label_id]=e}),o}catch(e){return console.warn("[AutoSnooze] Failed to fetch label registry:",e),null}},loadCategories:async function(e){try{const t=await e.connection.sendMessagePromise({type:"config/category_registry/list",scope:"automation"}),o={};return Array.isArray(t)&&t.forEach(e=>{o[e.category_id]=e}),o}catch(e){return console.warn("[AutoSnooze] Failed to fetch category registry:",e),{}}},loadEntities:async function(e){try{const t=await e.connection.sendMessagePromise({type:"config/entity_registry/list"}),o={};return Array.isArray(t)&&t.filter(e=>e.entity_id.startsWith("automation.")).forEach(e=>{o[e.entity_id]=e}),o}catch(e){return console.warn("[AutoSnooze] Failed to fetch entity registry:",e),{}}},getAutomations:function(e,t){return e.states?Object.keys(e.states).filter(e=>e.startsWith("automation.")).map(o=>{const a=e.states[o];if(!a)return null;const i=t[o],s=e.entities?.[o];return{id:o,name:a.attributes?.friendly_name??o.replace("automation.",""),area_id:i?.area_id??s?.area_id??null,category_id:i?.categories?.automation??null,labels:i?.labels??s?.labels??[]}}).filter(e=>null!==e).sort((e,t)=>e.name.localeCompare(t.name)):[]},setTimeout:setTimeout,clearTimeout:clearTimeout};class lo{constructor(e,t={}){this.changed=e,this.labels={},this.labelsUnavailable=!1,this.categories={},this.entities={},this.cacheVersion=0,this.connected=!1,this.labelsLoaded=!1,this.categoriesLoaded=!1,this.entitiesLoaded=!1,this.retryDelay=De,this.cachedVersion=-1,this.deps={...no,...t}}get snapshot(){return{labels:this.labels,labelsUnavailable:this.labelsUnavailable,categories:this.categories,entities:this.entities,cacheVersion:this.cacheVersion}}connect(e){return this.connected=!0,this.hass=e,e.connection?Promise.all([this.loadLabels(),this.loadCategories(),this.loadEntities()]).then(()=>{}):Promise.resolve()}disconnect(){this.connected=!1,void 0!==this.retryTimer&&this.deps.clearTimeout(this.retryTimer),this.retryTimer=void 0}getAutomations(e){return this.cachedStates===e.states&&this.cachedVersion===this.cacheVersion&&this.automations||(this.automations=this.deps.getAutomations(e,this.entities),this.cachedStates=e.states,this.cachedVersion=this.cacheVersion),this.automations}shouldUpdate(e,t){if(!e||!t)return!0;if(st(e)!==st(t)||e.entities!==t.entities||e.areas!==t.areas||(e.language??e.locale?.language)!==(t.language??t.locale?.language))return!0;if(!e.states||!t.states)return!0;if(e.states===t.states)return!1;const o=Object.entries(e.states).filter(([e])=>e.startsWith("automation.")),a=Object.keys(t.states).filter(e=>e.startsWith("automation.")).length;return o.length!==a||o.some(([e,o])=>t.states[e]!==o)}loadLabels(e){return e&&(this.hass=e),this.labelsLoaded||void 0!==this.retryTimer?Promise.resolve():this.labelsPromise??=this.deps.loadLabels(this.hass).then(e=>{if(null===e)return this.labelsUnavailable=!0,void 0===this.retryTimer&&(this.retryTimer=this.deps.setTimeout(()=>{this.finishRetry(),this.loadLabels()},this.retryDelay),this.retryDelay=Math.min(2*this.retryDelay,Me)),void this.changed();this.labels=e,this.labelsLoaded=!0,this.labelsUnavailable=!1,this.retryDelay=De,this.finishRetry(),this.invalidate()}).finally(()=>{this.labelsPromise=void 0})}loadCategories(e){return e&&(this.hass=e),this.categoriesLoaded?Promise.resolve():this.categoriesPromise??=this.deps.loadCategories(this.hass).then(e=>{this.categories=e,this.categoriesLoaded=!0,this.changed()}).finally(()=>{this.categoriesPromise=void 0})}loadEntities(e){return e&&(this.hass=e),this.entitiesLoaded?Promise.resolve():this.entitiesPromise??=this.deps.loadEntities(this.hass).then(e=>{this.entities=e,this.entitiesLoaded=!0,this.invalidate()}).finally(()=>{this.entitiesPromise=void 0})}finishRetry(){void 0!==this.retryTimer&&this.deps.clearTimeout(this.retryTimer),this.retryTimer=void 0}invalidate(){this.cacheVersion++,this.connected&&this.changed()}}class co extends HTMLElement{show(e,t,o=t,a){this.clear();const i=document.createElement("div");if(i.className="toast",i.setAttribute("role","alert"),i.setAttribute("aria-live","polite"),i.setAttribute("aria-atomic","true"),a){const s=document.createElement("span");s.textContent=e,i.appendChild(s);const r=document.createElement("button");r.className="toast-undo-btn",r.textContent=t,r.setAttribute("aria-label",o),r.onclick=e=>{e.stopPropagation(),a(),this.clear()},i.appendChild(r)}else i.textContent=e;this.appendChild(i),this.durationTimer=setTimeout(()=>{i.style.animation=`slideUp ${Se}ms ease-out reverse`,this.fadeTimer=setTimeout(()=>this.clear(),Se),this.durationTimer=void 0},Ce)}disconnectedCallback(){this.clear()}clear(){void 0!==this.durationTimer&&clearTimeout(this.durationTimer),void 0!==this.fadeTimer&&clearTimeout(this.fadeTimer),this.durationTimer=this.fadeTimer=void 0,this.replaceChildren()}}Gt("autosnooze-toast",co);class uo extends ne{constructor(){super(...arguments),this.scheduled={}}createRenderRoot(){return this}render(){const e=Object.entries(this.scheduled);return e.length?B`
       <div class="scheduled-list" role="region" aria-label="${_e(this.hass,"a11y.scheduled_region")}">
         <div class="list-header">
           <ha-icon icon="mdi:calendar-clock" aria-hidden="true"></ha-icon>
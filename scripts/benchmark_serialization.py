@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark per-save snapshot building for large AutoSnooze snooze sets.
+
+Times AutomationPauseData.get_storage_snapshot() at 1k and 10k
+entries for a cold build (every entry serialized) and for a save after a single
+entry changed, which reuses every other entry's cached serialized form.
+
+Run from the repository root with Home Assistant installed:
+
+    python scripts/benchmark_serialization.py
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.autosnooze.models import PausedAutomation, ScheduledSnooze  # noqa: E402
+from custom_components.autosnooze.runtime.state import AutomationPauseData  # noqa: E402
+
+SIZES = (1_000, 10_000)
+ROUNDS = 20
+
+
+def build_data(size: int) -> AutomationPauseData:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    data = AutomationPauseData()
+    for index in range(size):
+        entity_id = f"automation.bench_{index}"
+        data.paused[entity_id] = PausedAutomation(
+            entity_id=entity_id,
+            friendly_name=f"Bench {index}",
+            resume_at=now + timedelta(minutes=index),
+            paused_at=now,
+            disable_at=now,
+        )
+        data.scheduled[entity_id] = ScheduledSnooze(
+            entity_id=entity_id,
+            friendly_name=f"Bench {index}",
+            disable_at=now + timedelta(minutes=index),
+            resume_at=now + timedelta(minutes=index + 30),
+        )
+    return data
+
+
+def snapshot(data: AutomationPauseData) -> None:
+    data.get_storage_snapshot()
+
+
+def invalidate_all(data: AutomationPauseData) -> None:
+    for entry in [*data.paused.values(), *data.scheduled.values()]:
+        entry.friendly_name = entry.friendly_name
+
+
+def cold(data: AutomationPauseData) -> None:
+    invalidate_all(data)
+    snapshot(data)
+
+
+def one_changed(data: AutomationPauseData) -> None:
+    data.paused["automation.bench_0"].resume_retries += 1
+    snapshot(data)
+
+
+def time_ms(func, data: AutomationPauseData) -> float:
+    return min(repeat(lambda: func(data), number=1, repeat=ROUNDS)) * 1000
+
+
+def main() -> None:
+    print(f"{'entries':>8}  {'cold save':>12}  {'one changed':>12}")
+    for size in SIZES:
+        data = build_data(size)
+        cold_ms = time_ms(cold, data)
+        snapshot(data)
+        warm_ms = time_ms(one_changed, data)
+        print(f"{size:>8}  {cold_ms:>10.2f}ms  {warm_ms:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
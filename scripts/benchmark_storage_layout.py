@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Compare the STORAGE_VERSION 2 and 3 layouts for large AutoSnooze snooze sets.
+
+Reports the JSON file size and the time to validate and rebuild every entry
+on load at 1k and 10k entries, both for the two-pass path (validate_stored_data()
+then from_dict()) and for the single-pass parse_stored_data() used by restore.
+
+Run from the repository root with Home Assistant installed:
+
+    python scripts/benchmark_storage_layout.py
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+import sys
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.autosnooze.models import PausedAutomation, ScheduledSnooze  # noqa: E402
+from custom_components.autosnooze.runtime.restore import parse_stored_data, validate_stored_data  # noqa: E402
+
+SIZES = (1_000, 10_000)
+ROUNDS = 5
+
+
+def build_entries(size: int) -> tuple[list[PausedAutomation], list[ScheduledSnooze]]:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    paused = [
+        PausedAutomation(
+            entity_id=f"automation.bench_{index}",
+            friendly_name=f"Bench {index}",
+            resume_at=now + timedelta(minutes=index),
+            paused_at=now,
+            hours=1,
+        )
+        for index in range(size)
+    ]
+    scheduled = [
+        ScheduledSnooze(
+            entity_id=f"automation.bench_{index}",
+            friendly_name=f"Bench {index}",
+            disable_at=now + timedelta(minutes=index),
+            resume_at=now + timedelta(minutes=index + 30),
+        )
+        for index in range(size)
+    ]
+    return paused, scheduled
+
+
+def load_two_pass(stored: dict) -> None:
+    validated = validate_stored_data(stored)
+    for entity_id, info in validated["paused"].items():
+        PausedAutomation.from_dict(entity_id, info)
+    for entity_id, info in validated["scheduled"].items():
+        ScheduledSnooze.from_dict(entity_id, info)
+
+
+def main() -> None:
+    print(f"{'entries':>8}  {'layout':>6}  {'file size':>10}  {'two-pass':>10}  {'single-pass':>11}")
+    for size in SIZES:
+        paused, scheduled = build_entries(size)
+        for layout, serialize in (("v2", "to_dict"), ("v3", "to_storage")):
+            stored = {
+                "paused": {entry.entity_id: getattr(entry, serialize)() for entry in paused},
+                "scheduled": {entry.entity_id: getattr(entry, serialize)() for entry in scheduled},
+            }
+            file_kb = len(json.dumps({"version": 3, "data": stored})) / 1024
+            two_pass_ms = min(repeat(lambda stored=stored: load_two_pass(stored), number=1, repeat=ROUNDS)) * 1000
+            single_ms = min(repeat(lambda stored=stored: parse_stored_data(stored), number=1, repeat=ROUNDS)) * 1000
+            print(f"{size:>8}  {layout:>6}  {file_kb:>8.0f}KB  {two_pass_ms:>8.1f}ms  {single_ms:>9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ import type {
   HomeAssistant,
   PausedAutomationAttribute,
   ScheduledSnoozeAttribute,
+  SnoozeCohortAttribute,
 } from '../types/hass.js';
 import { SENSOR_SCHEMA_VERSION, type PauseGroup } from '../types/automation.js';
 
@@ -30,6 +31,7 @@ let lastAttributes: unknown = null;
 let lastSchemaVersion: unknown = null;
 let lastPausedRoot: unknown = null;
 let lastScheduledRoot: unknown = null;
+let lastCohortsRoot: unknown = null;
 let lastSensorEntityId: string | null = null;
 let lastSnapshot: PausedSnapshot | null = null;
 
@@ -50,6 +52,38 @@ function asScheduledMap(value: unknown): Record<string, ScheduledSnoozeAttribute
   return record as Record<string, ScheduledSnoozeAttribute> | null;
 }
 
+function asCohortMap(value: unknown): Record<string, SnoozeCohortAttribute> | null {
+  const record = asRecord(value);
+  return record as Record<string, SnoozeCohortAttribute> | null;
+}
+
+/**
+ * Fill cohort members' rows with the deadline fields the sensor sends once per cohort.
+ */
+function withCohortFields(
+  paused: Record<string, PausedAutomationAttribute>,
+  cohorts: Record<string, SnoozeCohortAttribute> | null
+): Record<string, PausedAutomationAttribute> {
+  if (!cohorts) {
+    return paused;
+  }
+
+  let merged: Record<string, PausedAutomationAttribute> | null = null;
+  for (const [id, data] of Object.entries(paused)) {
+    const cohort = data.cohort_id ? cohorts[data.cohort_id] : undefined;
+    if (!cohort) {
+      continue;
+    }
+    const { entity_ids: members, ...shared } = cohort;
+    if (Array.isArray(members) && !members.includes(id)) {
+      continue;
+    }
+    merged ??= { ...paused };
+    merged[id] = { ...shared, ...data };
+  }
+  return merged ?? paused;
+}
+
 function hasPausedSensorContract(entity?: HassEntity): boolean {
   const root = asRecord(entity?.attributes);
   if (!root) {
@@ -97,7 +131,8 @@ export function parsePausedContract(attributes: unknown): ParsedPausedContract {
     if (!paused || !scheduled) {
       return { paused: EMPTY_PAUSED, scheduled: EMPTY_SCHEDULED };
     }
-    return { paused, scheduled };
+    // Cohort members carry only cohort_id and their own fields.
+    return { paused: withCohortFields(paused, asCohortMap(root.cohorts)), scheduled };
   }
 
   // Unversioned transitional contract: accept normalized keys if present.
@@ -162,12 +197,14 @@ export function getPausedSnapshot(hass: HomeAssistant): PausedSnapshot {
   const schemaVersion = root?.schema_version;
   const pausedRoot = root?.paused ?? root?.paused_automations;
   const scheduledRoot = root?.scheduled ?? root?.scheduled_snoozes;
+  const cohortsRoot = root?.cohorts;
 
   if (
     attributes === lastAttributes &&
     schemaVersion === lastSchemaVersion &&
     pausedRoot === lastPausedRoot &&
     scheduledRoot === lastScheduledRoot &&
+    cohortsRoot === lastCohortsRoot &&
     sensorEntityId === lastSensorEntityId &&
     lastSnapshot
   ) {
@@ -179,6 +216,7 @@ export function getPausedSnapshot(hass: HomeAssistant): PausedSnapshot {
   lastSchemaVersion = schemaVersion;
   lastPausedRoot = pausedRoot;
   lastScheduledRoot = scheduledRoot;
+  lastCohortsRoot = cohortsRoot;
   lastSensorEntityId = sensorEntityId;
   lastSnapshot = {
     paused: parsed.paused,
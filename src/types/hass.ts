@@ -87,6 +87,20 @@ export interface PausedAutomationAttribute {
   minutes: number;
   disable_at?: string;
   notification_trigger?: 'none' | 'start' | 'about_to_end' | 'end';
+  cohort_id?: string;
+}
+
+/** Deadline fields shared by the paused rows whose cohort_id names the cohort. */
+export interface SnoozeCohortAttribute {
+  resume_at: string;
+  paused_at: string;
+  days: number;
+  hours: number;
+  minutes: number;
+  disable_at?: string;
+  notification_trigger?: 'none' | 'start' | 'about_to_end' | 'end';
+  notification_lead_minutes?: number;
+  entity_ids: string[];
 }
 
 export interface ScheduledSnoozeAttribute {
@@ -0,0 +1,42 @@
+"""Fakes for the bulk automation state port used by batch flows."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+BULK_PORT = "custom_components.autosnooze.runtime.ports.async_set_automation_states_bulk"
+
+
+def bulk_result(ok: bool) -> AsyncMock:
+    """Return a bulk port fake that reports the same outcome for every entity."""
+
+    async def set_states(
+        _hass: Any, entity_ids: list[str], *, enabled: bool, force: bool = False, stats: Any = None
+    ) -> dict[str, bool]:
+        return dict.fromkeys(entity_ids, ok)
+
+    return AsyncMock(side_effect=set_states)
+
+
+def bulk_port(set_state: Callable[..., Awaitable[bool]]) -> AsyncMock:
+    """Return a bulk port fake that answers each entity through set_state(hass, entity_id, enabled=...)."""
+
+    async def set_states(
+        hass: Any, entity_ids: list[str], *, enabled: bool, force: bool = False, stats: Any = None
+    ) -> dict[str, bool]:
+        return {entity_id: await set_state(hass, entity_id, enabled=enabled) for entity_id in entity_ids}
+
+    return AsyncMock(side_effect=set_states)
+
+
+def automation_service(hass: MagicMock) -> AsyncMock:
+    """Return a hass.services.async_call fake that applies automation turn_on/turn_off to hass.states.get."""
+
+    async def async_call(_domain: str, service: str, data: dict[str, Any], **_kwargs: Any) -> None:
+        entity_ids = data["entity_id"]
+        for entity_id in [entity_ids] if isinstance(entity_ids, str) else entity_ids:
+            hass.states.get(entity_id).state = "on" if service == "turn_on" else "off"
+
+    return AsyncMock(side_effect=async_call)
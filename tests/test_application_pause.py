@@ -23,6 +23,7 @@ async def test_handle_pause_service_forwards_full_contract_fields() -> None:
     disable_at = datetime(2030, 1, 1, 10, 0, tzinfo=UTC)
     resume_at = datetime(2030, 1, 1, 12, 0, tzinfo=UTC)
     call = MagicMock()
+    call.return_response = False
     call.data = {
         ATTR_ENTITY_ID: ["automation.a", "automation.b"],
         "days": 1,
@@ -42,7 +43,9 @@ async def test_handle_pause_service_forwards_full_contract_fields() -> None:
     ):
         await async_handle_pause_service(mock_hass, data, call)
 
-    validate_guardrails.assert_called_once_with(mock_hass, ["automation.a", "automation.b"], confirm=True)
+    validate_guardrails.assert_called_once_with(
+        mock_hass, ["automation.a", "automation.b"], confirm=True, cache=data.guardrail_cache
+    )
     pause_automations.assert_called_once_with(
         mock_hass,
         data,
@@ -230,3 +233,210 @@ async def test_pause_deduplicates_backend_targets() -> None:
     set_state.assert_awaited_once_with(hass, "automation.test", False)
     notify_started.assert_awaited_once()
     assert [paused.entity_id for paused in notify_started.await_args.args[1]] == ["automation.test"]
+
+
+@pytest.mark.asyncio
+async def test_pause_disables_concurrently_and_rolls_back_only_initially_enabled() -> None:
+    """Disables overlap up to the limit; cancellation restores exactly the enabled ones it disabled."""
+    from custom_components.autosnooze.application.pause import async_pause_automations
+    from custom_components.autosnooze.runtime.state import AutomationPauseData
+
+    states = {
+        "automation.a": "on",
+        "automation.b": "off",
+        "automation.c": "on",
+        "automation.d": "on",
+    }
+    hass = MagicMock()
+    hass.states.get.side_effect = lambda entity_id: MagicMock(state=states[entity_id], attributes={})
+    data = AutomationPauseData(store=MagicMock(), state_change_concurrency=3)
+    in_flight = 0
+    peak = 0
+    release = asyncio.Event()
+    state_calls: list[tuple[str, bool]] = []
+
+    async def set_state(_hass, entity_id: str, enabled: bool) -> bool:
+        nonlocal in_flight, peak
+        state_calls.append((entity_id, enabled))
+        if enabled:
+            return True
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await release.wait()
+        in_flight -= 1
+        return entity_id != "automation.c"
+
+    save = AsyncMock(return_value=True)
+    task = asyncio.create_task(
+        async_pause_automations(
+            hass,
+            data,
+            list(states),
+            minutes=5,
+            set_automation_state=set_state,
+            save_data=save,
+            notify_started_automations=AsyncMock(),
+            schedule_resume_callback=MagicMock(),
+            schedule_disable_callback=MagicMock(),
+            schedule_pre_resume_notification_callback=MagicMock(),
+        )
+    )
+    while in_flight < 3:
+        await asyncio.sleep(0)
+
+    task.cancel()
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert peak == 3
+    assert ("automation.d", False) not in state_calls
+    assert sorted(entity_id for entity_id, enabled in state_calls if enabled) == ["automation.a"]
+    assert data.paused == {}
+    save.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_repause_extends_active_snooze_in_place() -> None:
+    """A snoozed automation that is still off is extended without a state call."""
+    from custom_components.autosnooze.application.pause import async_pause_automations
+    from custom_components.autosnooze.models import PausedAutomation
+    from custom_components.autosnooze.runtime.state import AutomationPauseData
+
+    now = datetime.now(UTC).replace(microsecond=0)
+    states = {"automation.a": "off", "automation.b": "on"}
+    hass = MagicMock()
+    hass.states.get.side_effect = lambda entity_id: MagicMock(state=states[entity_id], attributes={})
+    data = AutomationPauseData(store=MagicMock())
+    for entity_id in states:
+        data.paused[entity_id] = PausedAutomation(
+            entity_id=entity_id,
+            friendly_name=entity_id,
+            resume_at=now + timedelta(minutes=5),
+            paused_at=now - timedelta(minutes=1),
+        )
+    original = data.paused["automation.a"]
+    set_state = AsyncMock(return_value=True)
+    save = AsyncMock(return_value=True)
+    schedule_resume = MagicMock()
+    schedule_pre_resume = MagicMock()
+    notify_started = AsyncMock()
+    resume_at = now + timedelta(hours=1)
+
+    async def pause() -> dict[str, list[str]]:
+        return await async_pause_automations(
+            hass,
+            data,
+            list(states),
+            resume_at_dt=resume_at,
+            set_automation_state=set_state,
+            save_data=save,
+            notify_started_automations=notify_started,
+            schedule_resume_callback=schedule_resume,
+            schedule_disable_callback=MagicMock(),
+            schedule_pre_resume_notification_callback=schedule_pre_resume,
+        )
+
+    assert await pause() == {"automation.a": ["resume_at"]}
+
+    set_state.assert_awaited_once_with(hass, "automation.b", False)
+    extended = data.paused["automation.a"]
+    assert extended is not original
+    assert extended.resume_at == resume_at
+    assert extended.paused_at == original.paused_at
+    assert [call.args[2] for call in schedule_resume.call_args_list] == ["automation.a", "automation.b"]
+    save.assert_awaited_once()
+
+    states["automation.b"] = "off"
+    set_state.reset_mock()
+    save.reset_mock()
+    schedule_resume.reset_mock()
+    schedule_pre_resume.reset_mock()
+    notify_started.reset_mock()
+    data.notify = MagicMock()
+    assert await pause() == {"automation.a": [], "automation.b": []}
+
+    set_state.assert_not_awaited()
+    schedule_resume.assert_not_called()
+    schedule_pre_resume.assert_not_called()
+    save.assert_not_awaited()
+    data.notify.assert_not_called()
+    notify_started.assert_awaited_once_with(hass, [])
+    assert data.paused["automation.a"] is extended
+
+
+@pytest.mark.asyncio
+async def test_pause_service_responds_with_the_fields_each_repause_changed() -> None:
+    """The pause handler returns the extended snoozes only when the caller asks for a response."""
+    from custom_components.autosnooze.application.pause import async_handle_pause_service
+    from custom_components.autosnooze.runtime.state import AutomationPauseData
+
+    data = AutomationPauseData(store=MagicMock())
+    call = MagicMock(return_response=True)
+    call.data = {ATTR_ENTITY_ID: ["automation.a", "automation.b"], "hours": 1}
+    changes = {"automation.a": ["resume_at", "hours"], "automation.b": []}
+
+    with (
+        patch("custom_components.autosnooze.application.pause._validate_guardrails"),
+        patch(
+            "custom_components.autosnooze.application.pause.async_pause_automations",
+            AsyncMock(return_value=changes),
+        ),
+    ):
+        assert await async_handle_pause_service(MagicMock(), data, call) == {"extended": changes}
+        call.return_response = False
+        assert await async_handle_pause_service(MagicMock(), data, call) is None
+
+    data.unloaded = True
+    call.return_response = True
+    assert await async_handle_pause_service(MagicMock(), data, call) == {"extended": {}}
+
+
+@pytest.mark.asyncio
+async def test_automations_paused_together_share_one_cohort_deadline() -> None:
+    """One pause call arms one cohort deadline; a group adjust moves only that deadline."""
+    from custom_components.autosnooze.application.adjust import async_adjust_snooze_batch
+    from custom_components.autosnooze.application.pause import async_pause_automations
+    from custom_components.autosnooze.runtime.state import AutomationPauseData
+
+    entity_ids = ["automation.a", "automation.b", "automation.c"]
+    hass = MagicMock()
+    hass.states.get.side_effect = lambda entity_id: MagicMock(state="on", attributes={})
+    data = AutomationPauseData(store=MagicMock())
+
+    with patch("custom_components.autosnooze.runtime.ports.async_track_point_in_time", return_value=MagicMock()):
+        await async_pause_automations(
+            hass,
+            data,
+            entity_ids,
+            minutes=30,
+            set_automation_state=AsyncMock(return_value=True),
+            save_data=AsyncMock(return_value=True),
+            notify_started_automations=AsyncMock(),
+        )
+
+        (cohort,) = data.cohorts.values()
+        assert list(cohort.members) == entity_ids
+        assert {data.paused[entity_id].cohort_id for entity_id in entity_ids} == {cohort.cohort_id}
+        assert data.timers == {}
+        assert set(data.cohort_timers) == {cohort.cohort_id}
+        assert data.deadline_scheduler.pending == 1
+        snapshot = data.get_storage_snapshot()
+        assert snapshot["paused"]["automation.a"] == {"n": "automation.a", "c": cohort.cohort_id}
+        assert snapshot["cohorts"] == {cohort.cohort_id: cohort.to_storage()}
+
+        resume_at = cohort.resume_at
+        with patch(
+            "custom_components.autosnooze.application.adjust.async_save", new_callable=AsyncMock, return_value=True
+        ):
+            await async_adjust_snooze_batch(hass, data, entity_ids, timedelta(minutes=15))
+            assert cohort.resume_at == resume_at + timedelta(minutes=15)
+            assert all(data.paused[entity_id].resume_at == cohort.resume_at for entity_id in entity_ids)
+            assert data.deadline_scheduler.pending == 1
+
+            await async_adjust_snooze_batch(hass, data, ["automation.a"], timedelta(minutes=5))
+
+    assert data.paused["automation.a"].cohort_id is None
+    assert set(data.timers) == {"automation.a"}
+    assert list(cohort.members) == ["automation.b", "automation.c"]
+    assert data.deadline_scheduler.pending == 2
@@ -14,6 +14,7 @@ from custom_components.autosnooze.application.resume import (
 )
 from custom_components.autosnooze.models import PausedAutomation
 from custom_components.autosnooze.runtime.state import AutomationPauseData
+from tests.helpers.automation_ports import BULK_PORT, automation_service, bulk_port, bulk_result
 
 UTC = timezone.utc
 
@@ -55,7 +56,7 @@ async def test_batch_resume_wakes_entities_and_persists_once() -> None:
     data.add_listener(listener)
 
     with (
-        patch("custom_components.autosnooze.runtime.ports.async_set_automation_state", AsyncMock(return_value=True)),
+        patch(BULK_PORT, bulk_result(True)),
         patch("custom_components.autosnooze.runtime.ports.async_save", AsyncMock(return_value=True)) as save,
         patch("custom_components.autosnooze.application.resume.cancel_timer") as cancel_timer,
     ):
@@ -83,7 +84,7 @@ async def test_batch_resume_releases_lock_before_waiting_on_async_save() -> None
         return True
 
     with (
-        patch("custom_components.autosnooze.runtime.ports.async_set_automation_state", AsyncMock(return_value=True)),
+        patch(BULK_PORT, bulk_result(True)),
         patch("custom_components.autosnooze.runtime.ports.async_save", side_effect=slow_save),
     ):
         resume_task = asyncio.create_task(async_resume_batch(hass, data, ["automation.one"]))
@@ -112,7 +113,7 @@ async def test_batch_resume_retries_failures_and_retains_exhausted_entities() ->
     data.paused["automation.exhausted"] = _paused("automation.exhausted", retries=5)
 
     with (
-        patch("custom_components.autosnooze.runtime.ports.async_set_automation_state", AsyncMock(return_value=False)),
+        patch(BULK_PORT, bulk_result(False)),
         patch("custom_components.autosnooze.runtime.ports.async_save", AsyncMock(return_value=True)),
         patch("custom_components.autosnooze.runtime.ports.schedule_resume") as schedule_resume,
     ):
@@ -130,7 +131,7 @@ async def test_batch_resume_raises_when_persistence_fails() -> None:
     data.paused["automation.test"] = _paused("automation.test")
 
     with (
-        patch("custom_components.autosnooze.runtime.ports.async_set_automation_state", AsyncMock(return_value=True)),
+        patch(BULK_PORT, bulk_result(True)),
         patch("custom_components.autosnooze.runtime.ports.async_save", AsyncMock(return_value=False)),
         pytest.raises(ServiceValidationError, match="Failed to persist autosnooze state"),
     ):
@@ -151,54 +152,70 @@ async def test_batch_resume_redisables_entity_when_a_newer_pause_wins() -> None:
         return enabled
 
     with (
-        patch(
-            "custom_components.autosnooze.runtime.ports.async_set_automation_state", side_effect=replace_pause
-        ) as set_state,
+        patch(BULK_PORT, bulk_port(replace_pause)) as set_states,
         patch("custom_components.autosnooze.runtime.ports.async_save", AsyncMock(return_value=True)),
     ):
         await async_resume_batch(hass, data, ["automation.test"])
 
     assert data.paused["automation.test"] is newer
-    assert [call.kwargs["enabled"] for call in set_state.await_args_list] == [True, False]
+    assert [call.kwargs["enabled"] for call in set_states.await_args_list] == [True, False]
 
 
 @pytest.mark.asyncio
-async def test_batch_resume_cancellation_restores_entities_woken_before_commit() -> None:
+async def test_batch_resume_cancellation_restores_woken_entities() -> None:
     hass = MagicMock()
-    data = AutomationPauseData(store=MagicMock())
-    data.paused["automation.one"] = _paused("automation.one")
-    data.paused["automation.two"] = _paused("automation.two")
-    second_started = asyncio.Event()
-    allow_second_finish = asyncio.Event()
-
-    async def set_state(_hass: object, entity_id: str, *, enabled: bool) -> bool:
-        if entity_id == "automation.two" and enabled:
-            second_started.set()
-            await allow_second_finish.wait()
-        return True
+    data = AutomationPauseData(store=MagicMock(), state_change_concurrency=2)
+    entity_ids = ["automation.one", "automation.two", "automation.three"]
+    for entity_id in entity_ids:
+        data.paused[entity_id] = _paused(entity_id)
+    wake_started = asyncio.Event()
+    allow_wake_finish = asyncio.Event()
+
+    async def set_states(
+        _hass: object, entity_ids: list[str], *, enabled: bool, stats: object = None
+    ) -> dict[str, bool]:
+        if enabled:
+            wake_started.set()
+            await allow_wake_finish.wait()
+        return dict.fromkeys(entity_ids, True)
 
     with (
-        patch("custom_components.autosnooze.runtime.ports.async_set_automation_state", side_effect=set_state) as state,
+        patch(BULK_PORT, AsyncMock(side_effect=set_states)) as state,
         patch("custom_components.autosnooze.runtime.ports.async_save", AsyncMock(return_value=True)) as save,
     ):
-        task = asyncio.create_task(async_resume_batch(hass, data, ["automation.one", "automation.two"]))
-        await asyncio.wait_for(second_started.wait(), timeout=1)
+        task = asyncio.create_task(async_resume_batch(hass, data, entity_ids))
+        await asyncio.wait_for(wake_started.wait(), timeout=1)
         task.cancel()
-        allow_second_finish.set()
+        allow_wake_finish.set()
 
         with pytest.raises(asyncio.CancelledError):
             await task
 
-    assert list(data.paused) == ["automation.one", "automation.two"]
+    assert list(data.paused) == entity_ids
     assert [(call.args[1], call.kwargs["enabled"]) for call in state.await_args_list] == [
-        ("automation.one", True),
-        ("automation.two", True),
-        ("automation.one", False),
-        ("automation.two", False),
+        (entity_ids, True),
+        (entity_ids, False),
     ]
     save.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_batch_resume_wakes_all_entities_with_one_service_call() -> None:
+    hass = MagicMock()
+    hass.states.get.return_value = MagicMock(state="off")
+    hass.services.async_call = automation_service(hass)
+    data = AutomationPauseData(store=MagicMock())
+    entity_ids = ["automation.one", "automation.two", "automation.three"]
+    for entity_id in entity_ids:
+        data.paused[entity_id] = _paused(entity_id)
+
+    with patch("custom_components.autosnooze.runtime.ports.async_save", AsyncMock(return_value=True)):
+        await async_resume_batch(hass, data, entity_ids)
+
+    assert data.paused == {}
+    hass.services.async_call.assert_awaited_once_with("automation", "turn_on", {"entity_id": entity_ids}, blocking=True)
+
+
 @pytest.mark.asyncio
 async def test_single_resume_retries_then_retains_an_exhausted_entity() -> None:
     hass = MagicMock()
@@ -74,6 +74,7 @@ async def test_application_setup_defers_startup_work_until_home_assistant_starte
     register_lovelace_resource = AsyncMock()
     ensure_labels_exist = AsyncMock()
     load_stored = AsyncMock()
+    preload_stored = AsyncMock()
     store = MagicMock()
     data = AutomationPauseData(store=store, hass=hass)
 
@@ -89,8 +90,10 @@ async def test_application_setup_defers_startup_work_until_home_assistant_starte
         platforms=["sensor"],
         update_listener=AsyncMock(),
         data_factory=MagicMock(return_value=data),
+        preload_stored=preload_stored,
     )
 
+    preload_stored.assert_awaited_once_with(hass, data)
     hass.bus.async_listen_once.assert_called_once()
     event_name, callback = hass.bus.async_listen_once.call_args.args
     assert event_name == "homeassistant_started"
@@ -212,3 +212,42 @@ class TestAutoSnoozeOptionsFlow:
         assert result["type"] == "create_entry"
         assert result["data"]["telemetry_enabled"] is False
         assert result["data"]["duration_presets"] == [{"label": "30m", "minutes": 30}]
+
+    @pytest.mark.asyncio
+    async def test_step_init_sets_storage_backend(self, mock_config_entry):
+        mock_config_entry.options = {"storage_backend": "journal"}
+        flow = AutoSnoozeOptionsFlow(mock_config_entry)
+        result = await flow.async_step_init(None)
+        assert "storage_backend" in result["data_schema"].schema
+
+        preserved = await flow.async_step_init({"preset_1": "30m"})
+        assert preserved["data"]["storage_backend"] == "journal"
+
+        changed = await flow.async_step_init({"preset_1": "30m", "storage_backend": "snapshot"})
+        assert changed["data"]["storage_backend"] == "snapshot"
+
+    @pytest.mark.asyncio
+    async def test_step_init_sets_sensor_attributes(self, mock_config_entry):
+        mock_config_entry.options = {"sensor_attributes": "compact"}
+        flow = AutoSnoozeOptionsFlow(mock_config_entry)
+        result = await flow.async_step_init(None)
+        assert "sensor_attributes" in result["data_schema"].schema
+
+        preserved = await flow.async_step_init({"preset_1": "30m"})
+        assert preserved["data"]["sensor_attributes"] == "compact"
+
+        changed = await flow.async_step_init({"preset_1": "30m", "sensor_attributes": "full"})
+        assert changed["data"]["sensor_attributes"] == "full"
+
+    @pytest.mark.asyncio
+    async def test_step_init_sets_strict_service_calls(self, mock_config_entry):
+        mock_config_entry.options = {"strict_service_calls": True}
+        flow = AutoSnoozeOptionsFlow(mock_config_entry)
+        result = await flow.async_step_init(None)
+        assert "strict_service_calls" in result["data_schema"].schema
+
+        preserved = await flow.async_step_init({"preset_1": "30m"})
+        assert preserved["data"]["strict_service_calls"] is True
+
+        changed = await flow.async_step_init({"preset_1": "30m", "strict_service_calls": False})
+        assert changed["data"]["strict_service_calls"] is False
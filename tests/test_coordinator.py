@@ -16,8 +16,11 @@ from homeassistant.const import ATTR_ENTITY_ID, ATTR_FRIENDLY_NAME
 from homeassistant.exceptions import ServiceValidationError
 
 from custom_components.autosnooze import async_load_stored
-from custom_components.autosnooze.application.resume import async_resume
-from custom_components.autosnooze.application.scheduled import async_execute_scheduled_disable
+from custom_components.autosnooze.application.resume import async_resume, async_resume_batch
+from custom_components.autosnooze.application.scheduled import (
+    async_execute_scheduled_disable,
+    async_execute_scheduled_disable_batch,
+)
 from custom_components.autosnooze.runtime.ports import (
     async_save,
     async_set_automation_state,
@@ -34,7 +37,8 @@ from custom_components.autosnooze.models import (
     PausedAutomation,
     ScheduledSnooze,
 )
-from custom_components.autosnooze.runtime.state import AutomationPauseData
+from custom_components.autosnooze.runtime.state import AutomationPauseData, ServiceCallStats
+from tests.helpers.automation_ports import BULK_PORT, automation_service, bulk_port, bulk_result
 
 UTC = timezone.utc
 
@@ -553,7 +557,7 @@ class TestAsyncLoadStoredLocking:
             return True
 
         with (
-            patch("custom_components.autosnooze.runtime.ports.async_set_automation_state", side_effect=_set_state),
+            patch(BULK_PORT, bulk_port(_set_state)),
             patch("custom_components.autosnooze.runtime.ports.schedule_resume") as schedule_resume_mock,
             patch("custom_components.autosnooze.runtime.ports.schedule_disable") as schedule_disable_mock,
         ):
@@ -659,7 +663,69 @@ class TestScheduleResume:
             schedule_resume(mock_hass, data, "automation.test", resume_at, resume_callback=AsyncMock())
 
         mock_track.assert_called_once()
-        assert data.timers["automation.test"] == new_unsub
+        assert set(data.timers) == {"automation.test"}
+        assert data.deadline_scheduler is not None
+        assert data.deadline_scheduler.armed_at == resume_at
+
+        # Cancelling the only pending deadline releases the shared HA timer.
+        cancel_timer(data, "automation.test")
+        new_unsub.assert_called_once()
+        assert data.deadline_scheduler.pending == 0
+
+    def test_coalesces_expiries_into_one_batch_callback(self) -> None:
+        """Expiries due within the coalesce window wake through a single batch call."""
+        mock_hass = MagicMock()
+        data = AutomationPauseData()
+        resume_at = datetime.now(UTC) + timedelta(hours=1)
+        armed: list[tuple[object, datetime]] = []
+        batch_calls: list[tuple[list[str], str]] = []
+
+        def track_time(_hass: object, callback: object, when: datetime) -> MagicMock:
+            armed.append((callback, when))
+            return MagicMock()
+
+        def create_task(coro: object) -> None:
+            coro.close()
+
+        async def resume_batch(_hass: object, _data: object, entity_ids: list[str], *, reason: str) -> None:
+            return None
+
+        def record_batch(hass: object, data: object, entity_ids: list[str], *, reason: str) -> object:
+            batch_calls.append((entity_ids, reason))
+            return resume_batch(hass, data, entity_ids, reason=reason)
+
+        mock_hass.async_create_task = MagicMock(side_effect=create_task)
+        resume_callback = AsyncMock()
+        with patch("custom_components.autosnooze.runtime.ports.async_track_point_in_time", side_effect=track_time):
+            for index in range(3):
+                schedule_resume(
+                    mock_hass,
+                    data,
+                    f"automation.test_{index}",
+                    resume_at + timedelta(milliseconds=100 * index),
+                    resume_callback=resume_callback,
+                    resume_batch_callback=record_batch,
+                )
+            schedule_resume(
+                mock_hass,
+                data,
+                "automation.cancelled",
+                resume_at,
+                resume_callback=resume_callback,
+                resume_batch_callback=record_batch,
+            )
+
+            armed[-1][0](resume_at)
+            cancel_timer(data, "automation.cancelled")
+            armed[-1][0](resume_at + timedelta(milliseconds=200))
+            assert batch_calls == []
+            assert armed[-1][1] > resume_at
+
+            armed[-1][0](armed[-1][1])
+
+        assert batch_calls == [(["automation.test_0", "automation.test_1", "automation.test_2"], "expired")]
+        resume_callback.assert_not_called()
+        assert data.resume_batches == {}
 
 
 class TestScheduleDisable:
@@ -705,7 +771,13 @@ class TestScheduleDisable:
             schedule_disable(mock_hass, data, "automation.test", scheduled, disable_callback=AsyncMock())
 
         mock_track.assert_called_once()
-        assert data.scheduled_timers["automation.test"] == new_unsub
+        assert set(data.scheduled_timers) == {"automation.test"}
+        assert data.deadline_scheduler is not None
+        assert data.deadline_scheduler.armed_at == scheduled.disable_at
+
+        cancel_scheduled_timer(data, "automation.test")
+        new_unsub.assert_called_once()
+        assert data.deadline_scheduler.pending == 0
 
     def test_disable_callback_uses_latest_scheduled_resume_at(self) -> None:
         """Timer callback should use the latest scheduled resume time from state."""
@@ -744,6 +816,47 @@ class TestScheduleDisable:
 
         execute_disable.assert_called_once_with(mock_hass, data, "automation.test", updated.resume_at)
 
+    def test_disables_sharing_disable_at_coalesce_into_one_batch_callback(self) -> None:
+        """Scheduled disables due together are handed to the batch callback as one cohort."""
+        mock_hass = MagicMock()
+        mock_hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+        data = AutomationPauseData()
+        now = datetime.now(UTC).replace(microsecond=0)
+        disable_at = now + timedelta(minutes=30)
+        cohort = {
+            entity_id: ScheduledSnooze(
+                entity_id=entity_id,
+                friendly_name=entity_id,
+                disable_at=disable_at,
+                resume_at=now + timedelta(hours=2),
+            )
+            for entity_id in ("automation.one", "automation.two")
+        }
+        data.scheduled.update(cohort)
+        execute_disable = AsyncMock()
+        execute_batch = AsyncMock()
+
+        with patch("custom_components.autosnooze.runtime.ports.async_track_point_in_time") as mock_track:
+            mock_track.return_value = MagicMock()
+            for entity_id, scheduled in cohort.items():
+                schedule_disable(
+                    mock_hass,
+                    data,
+                    entity_id,
+                    scheduled,
+                    disable_callback=execute_disable,
+                    disable_batch_callback=execute_batch,
+                )
+            mock_track.call_args.args[1](disable_at)
+            flush_at = mock_track.call_args.args[2]
+            mock_track.call_args.args[1](flush_at)
+
+        assert flush_at == disable_at + data.expiry_coalesce_window
+        execute_disable.assert_not_called()
+        execute_batch.assert_called_once_with(
+            mock_hass, data, {entity_id: scheduled.resume_at for entity_id, scheduled in cohort.items()}
+        )
+
 
 # =============================================================================
 # Automation State Management
@@ -829,6 +942,201 @@ class TestAsyncSetAutomationState:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("enabled,current", [(True, "on"), (False, "off")], ids=["already-on", "already-off"])
+    async def test_skips_call_when_already_in_target_state(self, enabled: bool, current: str) -> None:
+        """A request that would change nothing succeeds without a service call and is counted."""
+        mock_hass = MagicMock()
+        mock_hass.states.get.return_value = MagicMock(state=current)
+        mock_hass.services.async_call = AsyncMock()
+        stats = ServiceCallStats()
+
+        result = await async_set_automation_state(mock_hass, "automation.test", enabled=enabled, stats=stats)
+
+        assert result is True
+        mock_hass.services.async_call.assert_not_called()
+        assert (stats.requested, stats.skipped) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_force_and_strict_mode_still_call_service(self) -> None:
+        """force=True or strict stats make the call even when the state already matches."""
+        mock_hass = MagicMock()
+        mock_hass.states.get.return_value = MagicMock(state="on")
+        mock_hass.services.async_call = AsyncMock()
+        stats = ServiceCallStats()
+
+        await async_set_automation_state(mock_hass, "automation.test", enabled=True, force=True, stats=stats)
+        stats.strict = True
+        await async_set_automation_state(mock_hass, "automation.test", enabled=True, stats=stats)
+
+        assert mock_hass.services.async_call.await_count == 2
+        assert (stats.requested, stats.skipped) == (2, 0)
+
+
+class TestAsyncSetAutomationStatesBulk:
+    """Tests for async_set_automation_states_bulk function."""
+
+    @pytest.mark.asyncio
+    async def test_one_call_for_entities_that_need_a_change(self) -> None:
+        """Missing and already-off automations are resolved without joining the single call."""
+        from custom_components.autosnooze.runtime.ports import async_set_automation_states_bulk
+
+        states = {"automation.on_1": "on", "automation.off": "off", "automation.on_2": "on"}
+        mock_hass = MagicMock()
+        mock_hass.states.get.side_effect = lambda entity_id: (
+            MagicMock(state=states[entity_id]) if entity_id in states else None
+        )
+
+        async def turn_off(_domain: str, _service: str, service_data: dict, **_kwargs) -> None:
+            states.update(dict.fromkeys(service_data[ATTR_ENTITY_ID], "off"))
+
+        mock_hass.services.async_call = AsyncMock(side_effect=turn_off)
+
+        results = await async_set_automation_states_bulk(
+            mock_hass, ["automation.on_1", "automation.missing", "automation.off", "automation.on_2"], enabled=False
+        )
+
+        assert results == {
+            "automation.on_1": True,
+            "automation.missing": False,
+            "automation.off": True,
+            "automation.on_2": True,
+        }
+        mock_hass.services.async_call.assert_awaited_once_with(
+            "automation", "turn_off", {ATTR_ENTITY_ID: ["automation.on_1", "automation.on_2"]}, blocking=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_call_checks_each_entity_against_state_machine(self) -> None:
+        """When the call raises, only entities now in the target state count as changed."""
+        from custom_components.autosnooze.runtime.ports import async_set_automation_states_bulk
+
+        states = {"automation.a": "on", "automation.b": "on"}
+        mock_hass = MagicMock()
+        mock_hass.states.get.side_effect = lambda entity_id: MagicMock(state=states[entity_id])
+
+        async def partial_turn_off(*_args, **_kwargs) -> None:
+            states["automation.a"] = "off"
+            raise RuntimeError("automation.b failed")
+
+        mock_hass.services.async_call = AsyncMock(side_effect=partial_turn_off)
+
+        results = await async_set_automation_states_bulk(mock_hass, ["automation.a", "automation.b"], enabled=False)
+
+        assert results == {"automation.a": True, "automation.b": False}
+        mock_hass.services.async_call.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_successful_call_still_checks_each_entity_against_state_machine(self) -> None:
+        """An automation that ignores a call that did not raise is reported as unchanged."""
+        from custom_components.autosnooze.runtime.ports import async_set_automation_states_bulk
+
+        states = {"automation.a": "on", "automation.b": "on"}
+        mock_hass = MagicMock()
+        mock_hass.states.get.side_effect = lambda entity_id: MagicMock(state=states[entity_id])
+
+        async def turn_off_a_only(*_args, **_kwargs) -> None:
+            states["automation.a"] = "off"
+
+        mock_hass.services.async_call = AsyncMock(side_effect=turn_off_a_only)
+
+        results = await async_set_automation_states_bulk(mock_hass, ["automation.a", "automation.b"], enabled=False)
+
+        assert results == {"automation.a": True, "automation.b": False}
+
+
+class TestAsyncSetAutomationStates:
+    """Tests for async_set_automation_states function."""
+
+    @pytest.mark.asyncio
+    async def test_default_path_sends_one_multi_entity_service_call(self) -> None:
+        """Without injected setters all targets go through one automation service call."""
+        from custom_components.autosnooze.runtime.ports import async_set_automation_states
+
+        entity_ids = [f"automation.a{index}" for index in range(5)]
+        states = {entity_id: MagicMock(state="on") for entity_id in entity_ids}
+        mock_hass = MagicMock()
+        mock_hass.states.get.side_effect = states.get
+        mock_hass.services.async_call = automation_service(mock_hass)
+        stats = ServiceCallStats()
+
+        results = await async_set_automation_states(mock_hass, entity_ids, enabled=False, limit=2, stats=stats)
+
+        assert results == dict.fromkeys(entity_ids, True)
+        mock_hass.services.async_call.assert_awaited_once_with(
+            "automation", "turn_off", {ATTR_ENTITY_ID: entity_ids}, blocking=True
+        )
+        assert stats.requested == 5
+
+    @pytest.mark.asyncio
+    async def test_bulk_batches_run_concurrently_up_to_limit(self) -> None:
+        """Batches of batch_size entities run at most limit at a time."""
+        from custom_components.autosnooze.runtime.ports import async_set_automation_states
+
+        entity_ids = [f"automation.a{index}" for index in range(5)]
+        in_flight = 0
+        peak = 0
+        calls: list[list[str]] = []
+
+        async def set_states(
+            _hass: object, batch: list[str], *, enabled: bool, stats: object = None
+        ) -> dict[str, bool]:
+            nonlocal in_flight, peak
+            calls.append(batch)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return dict.fromkeys(batch, True)
+
+        results = await async_set_automation_states(
+            MagicMock(), entity_ids, enabled=False, limit=2, batch_size=2, set_states=set_states
+        )
+
+        assert results == dict.fromkeys(entity_ids, True)
+        assert calls == [entity_ids[0:2], entity_ids[2:4], entity_ids[4:]]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_cancellation_skips_batches_not_yet_started(self) -> None:
+        """A cancelled caller records the batches in flight and starts no further batches."""
+        from custom_components.autosnooze.runtime.ports import async_set_automation_states
+
+        entity_ids = ["automation.one", "automation.two", "automation.three"]
+        started = asyncio.Event()
+        release = asyncio.Event()
+        calls: list[list[str]] = []
+
+        async def set_states(
+            _hass: object, batch: list[str], *, enabled: bool, stats: object = None
+        ) -> dict[str, bool]:
+            calls.append(batch)
+            started.set()
+            await release.wait()
+            return dict.fromkeys(batch, True)
+
+        results: dict[str, bool] = {}
+        task = asyncio.create_task(
+            async_set_automation_states(
+                MagicMock(),
+                entity_ids,
+                enabled=True,
+                limit=1,
+                batch_size=2,
+                results=results,
+                set_states=set_states,
+            )
+        )
+        await asyncio.wait_for(started.wait(), timeout=1)
+        task.cancel()
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert calls == [["automation.one", "automation.two"]]
+        assert results == {"automation.one": True, "automation.two": True}
+
 
 class TestGetFriendlyName:
     """Tests for get_friendly_name function."""
@@ -1085,6 +1393,8 @@ class TestAsyncResume:
 
         assert "automation.test" in data.paused
         mock_schedule_resume.assert_called_once()
+        assert mock_schedule_resume.call_args.kwargs["resume_callback"] is async_resume
+        assert mock_schedule_resume.call_args.kwargs["resume_batch_callback"] is async_resume_batch
         mock_store.async_save.assert_called_once()
 
     @pytest.mark.asyncio
@@ -1210,7 +1520,7 @@ class TestAsyncResume:
 
         state_calls: list[bool] = []
 
-        async def record_state_change(*_args, enabled: bool) -> bool:
+        async def record_state_change(*_args, enabled: bool, **_kwargs) -> bool:
             state_calls.append(enabled)
             if enabled:
                 return await slow_turn_on()
@@ -1259,7 +1569,7 @@ class TestAsyncResume:
         allow_service_finish = asyncio.Event()
         state_calls: list[bool] = []
 
-        async def record_state_change(*_args, enabled: bool) -> bool:
+        async def record_state_change(*_args, enabled: bool, **_kwargs) -> bool:
             state_calls.append(enabled)
             if enabled:
                 service_started.set()
@@ -1295,7 +1605,7 @@ class TestAsyncExecuteScheduledDisable:
         """Test that scheduled timer is cancelled during execution."""
         mock_hass = MagicMock()
         mock_hass.states.get.return_value = MagicMock()
-        mock_hass.services.async_call = AsyncMock()
+        mock_hass.services.async_call = automation_service(mock_hass)
         mock_store = MagicMock()
         mock_store.async_save = AsyncMock()
         data = AutomationPauseData(store=mock_store)
@@ -1315,7 +1625,7 @@ class TestAsyncExecuteScheduledDisable:
         """Test that automation is added to paused dict on successful disable."""
         mock_hass = MagicMock()
         mock_hass.states.get.return_value = MagicMock(attributes={"friendly_name": "Test"})
-        mock_hass.services.async_call = AsyncMock()
+        mock_hass.services.async_call = automation_service(mock_hass)
         mock_store = MagicMock()
         mock_store.async_save = AsyncMock()
         data = AutomationPauseData(store=mock_store)
@@ -1331,7 +1641,7 @@ class TestAsyncExecuteScheduledDisable:
         """Test that friendly name from scheduled snooze is used."""
         mock_hass = MagicMock()
         mock_hass.states.get.return_value = MagicMock()
-        mock_hass.services.async_call = AsyncMock()
+        mock_hass.services.async_call = automation_service(mock_hass)
         mock_store = MagicMock()
         mock_store.async_save = AsyncMock()
         data = AutomationPauseData(store=mock_store)
@@ -1385,9 +1695,7 @@ class TestAsyncExecuteScheduledDisable:
         )
 
         with (
-            patch(
-                "custom_components.autosnooze.runtime.ports.async_set_automation_state", AsyncMock(return_value=False)
-            ),
+            patch(BULK_PORT, bulk_result(False)),
             patch("custom_components.autosnooze.runtime.ports.schedule_disable") as mock_schedule_disable,
         ):
             await async_execute_scheduled_disable(mock_hass, data, "automation.test", now + timedelta(hours=1))
@@ -1414,9 +1722,7 @@ class TestAsyncExecuteScheduledDisable:
         )
 
         with (
-            patch(
-                "custom_components.autosnooze.runtime.ports.async_set_automation_state", AsyncMock(return_value=False)
-            ),
+            patch(BULK_PORT, bulk_result(False)),
             patch("custom_components.autosnooze.runtime.ports.schedule_disable") as mock_schedule_disable,
             patch("custom_components.autosnooze.application.scheduled.dt_util.utcnow", return_value=now),
         ):
@@ -1444,9 +1750,7 @@ class TestAsyncExecuteScheduledDisable:
         )
 
         with (
-            patch(
-                "custom_components.autosnooze.runtime.ports.async_set_automation_state", AsyncMock(return_value=False)
-            ),
+            patch(BULK_PORT, bulk_result(False)),
             patch("custom_components.autosnooze.runtime.ports.schedule_disable") as mock_schedule_disable,
             patch("custom_components.autosnooze.application.scheduled.dt_util.utcnow", return_value=now),
         ):
@@ -1475,9 +1779,7 @@ class TestAsyncExecuteScheduledDisable:
         )
 
         with (
-            patch(
-                "custom_components.autosnooze.runtime.ports.async_set_automation_state", AsyncMock(return_value=True)
-            ),
+            patch(BULK_PORT, bulk_result(True)),
             patch("custom_components.autosnooze.runtime.ports.schedule_resume"),
             patch("custom_components.autosnooze.runtime.ports.async_save", AsyncMock(return_value=False)),
             pytest.raises(ServiceValidationError, match="Failed to persist autosnooze state"),
@@ -1509,7 +1811,7 @@ class TestAsyncExecuteScheduledDisable:
             return True
 
         with (
-            patch("custom_components.autosnooze.runtime.ports.async_set_automation_state", side_effect=slow_turn_off),
+            patch(BULK_PORT, bulk_port(slow_turn_off)),
             patch("custom_components.autosnooze.runtime.ports.schedule_resume"),
         ):
             disable_task = asyncio.create_task(
@@ -1557,11 +1859,7 @@ class TestAsyncExecuteScheduledDisable:
             return True
 
         with (
-            patch(
-                "custom_components.autosnooze.runtime.ports.async_set_automation_state",
-                new_callable=AsyncMock,
-                return_value=True,
-            ),
+            patch(BULK_PORT, bulk_result(True)),
             patch("custom_components.autosnooze.runtime.ports.schedule_resume"),
             patch("custom_components.autosnooze.runtime.ports.schedule_pre_resume_notification"),
             patch("custom_components.autosnooze.runtime.ports.async_save", side_effect=slow_save),
@@ -1609,7 +1907,7 @@ class TestAsyncExecuteScheduledDisable:
         allow_service_finish = asyncio.Event()
         state_calls: list[bool] = []
 
-        async def record_state_change(*_args, enabled: bool) -> bool:
+        async def record_state_change(*_args, enabled: bool, **_kwargs) -> bool:
             state_calls.append(enabled)
             if not enabled:
                 service_started.set()
@@ -1617,10 +1915,7 @@ class TestAsyncExecuteScheduledDisable:
             return True
 
         with (
-            patch(
-                "custom_components.autosnooze.runtime.ports.async_set_automation_state",
-                side_effect=record_state_change,
-            ),
+            patch(BULK_PORT, bulk_port(record_state_change)),
             patch("custom_components.autosnooze.runtime.ports.schedule_resume"),
         ):
             disable_task = asyncio.create_task(
@@ -1658,7 +1953,7 @@ class TestAsyncExecuteScheduledDisable:
         allow_service_finish = asyncio.Event()
         external_enabled = True
 
-        async def slow_turn_off(*_args, enabled: bool) -> bool:
+        async def slow_turn_off(*_args, enabled: bool, **_kwargs) -> bool:
             nonlocal external_enabled
             external_enabled = enabled
             service_started.set()
@@ -1666,10 +1961,7 @@ class TestAsyncExecuteScheduledDisable:
             return True
 
         with (
-            patch(
-                "custom_components.autosnooze.runtime.ports.async_set_automation_state",
-                side_effect=slow_turn_off,
-            ),
+            patch(BULK_PORT, bulk_port(slow_turn_off)),
             patch("custom_components.autosnooze.runtime.ports.schedule_resume") as schedule_resume,
             patch("custom_components.autosnooze.runtime.ports.schedule_pre_resume_notification"),
         ):
@@ -1711,7 +2003,7 @@ class TestAsyncExecuteScheduledDisable:
         allow_service_finish = asyncio.Event()
         state_calls: list[bool] = []
 
-        async def slow_turn_off(*_args, enabled: bool) -> bool:
+        async def slow_turn_off(*_args, enabled: bool, **_kwargs) -> bool:
             state_calls.append(enabled)
             if not enabled:
                 service_started.set()
@@ -1719,10 +2011,7 @@ class TestAsyncExecuteScheduledDisable:
             return True
 
         with (
-            patch(
-                "custom_components.autosnooze.runtime.ports.async_set_automation_state",
-                side_effect=slow_turn_off,
-            ),
+            patch(BULK_PORT, bulk_port(slow_turn_off)),
             patch("custom_components.autosnooze.runtime.ports.schedule_resume") as schedule_resume,
             patch("custom_components.autosnooze.runtime.ports.schedule_pre_resume_notification"),
             patch(
@@ -1746,6 +2035,150 @@ class TestAsyncExecuteScheduledDisable:
         notify.assert_not_awaited()
 
 
+class TestAsyncExecuteScheduledDisableBatch:
+    """Tests for async_execute_scheduled_disable_batch function."""
+
+    @staticmethod
+    def _scheduled(data: AutomationPauseData, entity_id: str, now: datetime) -> ScheduledSnooze:
+        scheduled = ScheduledSnooze(
+            entity_id=entity_id,
+            friendly_name=entity_id.split(".")[1],
+            disable_at=now,
+            resume_at=now + timedelta(hours=1),
+        )
+        data.scheduled[entity_id] = scheduled
+        return scheduled
+
+    @pytest.mark.asyncio
+    async def test_cohort_moves_to_paused_with_one_save_and_notification(self) -> None:
+        """A cohort sharing disable_at is disabled with one save, signal and started notification."""
+        mock_hass = MagicMock()
+        mock_store = MagicMock()
+        mock_store.async_save = AsyncMock()
+        data = AutomationPauseData(store=mock_store)
+        listener = MagicMock()
+        data.add_listener(listener)
+
+        now = datetime.now(UTC)
+        entity_ids = [f"automation.test_{index}" for index in range(3)]
+        for entity_id in entity_ids:
+            self._scheduled(data, entity_id, now)
+        resume_at = now + timedelta(hours=1)
+
+        with (
+            patch(BULK_PORT, bulk_result(True)) as set_states,
+            patch("custom_components.autosnooze.runtime.ports.schedule_resume") as schedule_resume,
+            patch("custom_components.autosnooze.runtime.ports.schedule_pre_resume_notification"),
+            patch(
+                "custom_components.autosnooze.application.scheduled.notify_started", new_callable=AsyncMock
+            ) as notify,
+        ):
+            await async_execute_scheduled_disable_batch(mock_hass, data, dict.fromkeys(entity_ids, resume_at))
+
+        set_states.assert_awaited_once()
+        assert set_states.await_args.args[1] == entity_ids
+        assert data.scheduled == {}
+        assert list(data.paused) == entity_ids
+        assert schedule_resume.call_count == 3
+        mock_store.async_save.assert_awaited_once()
+        listener.assert_called_once()
+        notify.assert_awaited_once()
+        assert [paused.entity_id for paused in notify.await_args.args[1]] == entity_ids
+
+    @pytest.mark.asyncio
+    async def test_failed_and_stale_entries_keep_single_path_guarantees(self) -> None:
+        """Failed disables are rescheduled and stale entries are turned back on."""
+        mock_hass = MagicMock()
+        mock_store = MagicMock()
+        mock_store.async_save = AsyncMock()
+        data = AutomationPauseData(store=mock_store)
+
+        now = datetime.now(UTC)
+        resume_at = now + timedelta(hours=1)
+        self._scheduled(data, "automation.ok", now)
+        failing = self._scheduled(data, "automation.failing", now)
+        self._scheduled(data, "automation.stale", now)
+        state_calls: list[tuple[str, bool]] = []
+
+        async def set_state(_hass: object, entity_id: str, *, enabled: bool) -> bool:
+            state_calls.append((entity_id, enabled))
+            if entity_id == "automation.stale" and not enabled:
+                # A concurrent re-schedule replaces the entry mid-flight.
+                self._scheduled(data, "automation.stale", now + timedelta(minutes=5))
+            return entity_id != "automation.failing"
+
+        with (
+            patch(BULK_PORT, bulk_port(set_state)),
+            patch("custom_components.autosnooze.runtime.ports.schedule_resume"),
+            patch("custom_components.autosnooze.runtime.ports.schedule_disable") as schedule_disable,
+            patch("custom_components.autosnooze.runtime.ports.schedule_pre_resume_notification"),
+            patch(
+                "custom_components.autosnooze.application.scheduled.notify_started", new_callable=AsyncMock
+            ) as notify,
+        ):
+            await async_execute_scheduled_disable_batch(
+                mock_hass,
+                data,
+                {"automation.ok": resume_at, "automation.failing": resume_at, "automation.stale": resume_at},
+            )
+
+        assert list(data.paused) == ["automation.ok"]
+        assert data.scheduled["automation.failing"] is failing
+        assert failing.disable_at > now
+        schedule_disable.assert_called_once()
+        assert ("automation.stale", True) in state_calls
+        assert "automation.stale" in data.scheduled
+        mock_store.async_save.assert_awaited_once()
+        notify.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancellation_commits_the_in_flight_bulk_disable(self) -> None:
+        """Cancelling the batch finishes the in-flight bulk disable and commits its outcome."""
+        mock_hass = MagicMock()
+        mock_store = MagicMock()
+        mock_store.async_save = AsyncMock()
+        data = AutomationPauseData(store=mock_store)
+
+        now = datetime.now(UTC)
+        resume_at = now + timedelta(hours=1)
+        self._scheduled(data, "automation.first", now)
+        self._scheduled(data, "automation.second", now)
+        service_started = asyncio.Event()
+        allow_service_finish = asyncio.Event()
+
+        async def slow_turn_off(
+            _hass: object, entity_ids: list[str], *, enabled: bool, stats: object = None
+        ) -> dict[str, bool]:
+            service_started.set()
+            await allow_service_finish.wait()
+            return dict.fromkeys(entity_ids, True)
+
+        with (
+            patch(BULK_PORT, AsyncMock(side_effect=slow_turn_off)) as set_states,
+            patch("custom_components.autosnooze.runtime.ports.schedule_resume"),
+            patch("custom_components.autosnooze.runtime.ports.schedule_disable") as schedule_disable,
+            patch("custom_components.autosnooze.runtime.ports.schedule_pre_resume_notification"),
+            patch("custom_components.autosnooze.application.scheduled.notify_started", new_callable=AsyncMock),
+        ):
+            batch_task = asyncio.create_task(
+                async_execute_scheduled_disable_batch(
+                    mock_hass, data, {"automation.first": resume_at, "automation.second": resume_at}
+                )
+            )
+            await asyncio.wait_for(service_started.wait(), timeout=1)
+
+            batch_task.cancel()
+            allow_service_finish.set()
+            with pytest.raises(asyncio.CancelledError):
+                await batch_task
+
+        set_states.assert_awaited_once()
+        assert list(data.paused) == ["automation.first", "automation.second"]
+        assert data.scheduled == {}
+        schedule_disable.assert_not_called()
+        mock_store.async_save.assert_awaited_once()
+
+
 # =============================================================================
 # Cancel Scheduled Operations
 # =============================================================================
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import timezone
+import asyncio
+from datetime import timedelta, timezone
 from unittest.mock import MagicMock
 
 import pytest
@@ -21,8 +22,9 @@ class MockConfigEntry:
 
 
 @pytest.mark.asyncio
-async def test_dispatcher_updates_once_per_notify_and_unsubscribes_on_remove(monkeypatch) -> None:
+async def test_dispatcher_updates_once_per_tick_and_unsubscribes_on_remove(monkeypatch) -> None:
     callbacks: dict[str, list] = {}
+    sent: list[frozenset[str] | None] = []
 
     def fake_connect(_hass, signal: str, callback):
         callbacks.setdefault(signal, []).append(callback)
@@ -32,14 +34,17 @@ async def test_dispatcher_updates_once_per_notify_and_unsubscribes_on_remove(mon
 
         return _remove
 
-    def fake_send(_hass, signal: str) -> None:
+    def fake_send(_hass, signal: str, changed: frozenset[str] | None) -> None:
+        sent.append(changed)
         for callback in list(callbacks.get(signal, [])):
-            callback()
+            callback(changed)
 
     monkeypatch.setattr("custom_components.autosnooze.sensor.async_dispatcher_connect", fake_connect)
     monkeypatch.setattr("custom_components.autosnooze.runtime.state.async_dispatcher_send", fake_send)
 
-    data = AutomationPauseData(hass=MagicMock())
+    hass = MagicMock()
+    hass.loop = asyncio.get_running_loop()
+    data = AutomationPauseData(hass=hass)
     entry = MockConfigEntry(data)
     sensor = AutoSnoozeCountSensor(entry)
     sensor.hass = data.hass
@@ -47,12 +52,49 @@ async def test_dispatcher_updates_once_per_notify_and_unsubscribes_on_remove(mon
 
     await sensor.async_added_to_hass()
 
-    data.notify()
+    data.notify(["automation.a"])
+    data.notify(["automation.b", "automation.a"])
+    sensor.async_write_ha_state.assert_not_called()
+    await asyncio.sleep(0)
     sensor.async_write_ha_state.assert_called_once()
+    assert sent == [frozenset({"automation.a", "automation.b"})]
 
+    data.notify(["automation.a"])
     data.notify()
+    await asyncio.sleep(0)
+    assert sensor.async_write_ha_state.call_count == 2
+    assert sent[-1] is None
+
+    data.notify([])
+    await asyncio.sleep(0)
+    assert sent[-1] == frozenset()
     assert sensor.async_write_ha_state.call_count == 2
 
     await sensor.async_will_remove_from_hass()
-    data.notify()
+    data.notify(["automation.a"])
+    await asyncio.sleep(0)
     assert sensor.async_write_ha_state.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_notify_waits_for_coalesce_window_unless_flushed(monkeypatch) -> None:
+    sent: list[frozenset[str] | None] = []
+    monkeypatch.setattr(
+        "custom_components.autosnooze.runtime.state.async_dispatcher_send",
+        lambda _hass, _signal, changed: sent.append(changed),
+    )
+    hass = MagicMock()
+    hass.loop = asyncio.get_running_loop()
+    data = AutomationPauseData(hass=hass, notify_coalesce_window=timedelta(milliseconds=10))
+
+    data.notify(["automation.a"])
+    await asyncio.sleep(0)
+    assert sent == []
+    await asyncio.sleep(0.02)
+    assert sent == [frozenset({"automation.a"})]
+
+    data.notify(["automation.b"])
+    data.flush_notify()
+    data.flush_notify()
+    await asyncio.sleep(0.02)
+    assert sent == [frozenset({"automation.a"}), frozenset({"automation.b"})]
@@ -33,11 +33,13 @@ TELEMETRY_TS_PATH = REPO_ROOT / "src/services/telemetry.ts"
 SENSOR_ENTITY_ID = "sensor.autosnooze_snoozed_automations"
 ENTITY_ONE = "automation.test_automation_1"
 
-PAUSE_FAMILY = ("pause", "pause_by_area", "pause_by_label")
+PAUSE_FAMILY = ("pause", "pause_by_area", "pause_by_label", "pause_by_device", "pause_by_floor")
 PAUSE_TARGET_FIELDS = {
     "pause": "entity_id",
     "pause_by_area": "area_id",
     "pause_by_label": "label_id",
+    "pause_by_device": "device_id",
+    "pause_by_floor": "floor_id",
 }
 PAUSE_OPTIONAL_FIELDS = frozenset(
     {
@@ -53,7 +55,9 @@ PAUSE_OPTIONAL_FIELDS = frozenset(
         "confirm",
     }
 )
-HA_UI_ONLY_SERVICES = frozenset({"pause_by_area", "pause_by_label"})
+HA_UI_ONLY_SERVICES = frozenset(
+    {"pause_by_area", "pause_by_label", "pause_by_device", "pause_by_floor", "get_resume_presets", "get_snoozes"}
+)
 CALL_SERVICE_RE = re.compile(r"""callService\(\s*['"]autosnooze['"]\s*,\s*['"]([^'"]+)['"]""")
 
 
@@ -223,7 +227,7 @@ async def test_card_duration_payload_publishes_v1_sensor(paused_setup) -> None:
 
 async def test_card_scheduled_resume_at_payload_immediate_pause_in_v1_sensor(paused_setup) -> None:
     hass, turn_off, _ = paused_setup
-    resume_at = (dt_util.utcnow() + timedelta(hours=2)).isoformat()
+    resume_at = (dt_util.utcnow().replace(microsecond=0) + timedelta(hours=2)).isoformat()
     payload = {ATTR_ENTITY_ID: [ENTITY_ONE], "resume_at": resume_at}
 
     sensor = await _pause_and_read_sensor(hass, payload)
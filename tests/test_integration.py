@@ -14,12 +14,17 @@ from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import floor_registry as fr
 from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.autosnooze import DOMAIN
+from custom_components.autosnooze.application.pause import validate_guardrails
 from custom_components.autosnooze.const import VERSION
+from custom_components.autosnooze.infrastructure.guardrail_cache import GuardrailFlags
 
 
 # =============================================================================
@@ -62,8 +67,11 @@ async def mock_dependencies(hass: HomeAssistant):
     # Register mock automation services (turn_on, turn_off, toggle)
     # These are needed because the pause service calls automation.turn_off
     async def mock_automation_service(call):
-        """Mock automation service handler."""
-        pass
+        """Mock automation service handler that applies turn_on/turn_off to the state machine."""
+        entity_ids = call.data.get("entity_id", [])
+        for entity_id in [entity_ids] if isinstance(entity_ids, str) else entity_ids:
+            if call.service != "toggle" and (current := hass.states.get(entity_id)):
+                hass.states.async_set(entity_id, "on" if call.service == "turn_on" else "off", current.attributes)
 
     hass.services.async_register("automation", "turn_on", mock_automation_service)
     hass.services.async_register("automation", "turn_off", mock_automation_service)
@@ -476,6 +484,72 @@ class TestPauseByLabelService:
         assert "automation.test_label_automation" in data.paused
 
 
+class TestPauseByDeviceAndFloorServices:
+    """Test the pause_by_device and pause_by_floor services."""
+
+    async def test_pause_by_device_finds_automations(self, hass: HomeAssistant, setup_integration: ConfigEntry) -> None:
+        """pause_by_device snoozes automations attached to the device."""
+        entry = setup_integration
+        device = dr.async_get(hass).async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, "hallway_sensor")},
+        )
+        entity_reg = er.async_get(hass)
+        entity_reg.async_get_or_create(
+            "automation",
+            "test",
+            "automation_on_device",
+            suggested_object_id="test_device_automation",
+            device_id=device.id,
+        )
+        hass.states.async_set("automation.test_device_automation", "on", {"friendly_name": "Device Automation"})
+
+        await hass.services.async_call(
+            DOMAIN,
+            "pause_by_device",
+            {"device_id": device.id, "hours": 1},
+            blocking=True,
+        )
+
+        assert "automation.test_device_automation" in entry.runtime_data.paused
+
+    async def test_pause_by_floor_follows_area_floor_changes(
+        self, hass: HomeAssistant, setup_integration: ConfigEntry
+    ) -> None:
+        """pause_by_floor resolves automations through their area's current floor."""
+        entry = setup_integration
+        upstairs = fr.async_get(hass).async_create("Upstairs")
+        downstairs = fr.async_get(hass).async_create("Downstairs")
+        area = ar.async_get(hass).async_create("Bedroom", floor_id=downstairs.floor_id)
+        entity_reg = er.async_get(hass)
+        entity_reg.async_get_or_create(
+            "automation",
+            "test",
+            "automation_in_bedroom",
+            suggested_object_id="test_floor_automation",
+        )
+        entity_reg.async_update_entity("automation.test_floor_automation", area_id=area.id)
+        hass.states.async_set("automation.test_floor_automation", "on", {"friendly_name": "Floor Automation"})
+        ar.async_get(hass).async_update(area.id, floor_id=upstairs.floor_id)
+        await hass.async_block_till_done()
+
+        await hass.services.async_call(
+            DOMAIN,
+            "pause_by_floor",
+            {"floor_id": downstairs.floor_id, "hours": 1},
+            blocking=True,
+        )
+        assert entry.runtime_data.paused == {}
+
+        await hass.services.async_call(
+            DOMAIN,
+            "pause_by_floor",
+            {"floor_id": upstairs.floor_id, "hours": 1},
+            blocking=True,
+        )
+        assert "automation.test_floor_automation" in entry.runtime_data.paused
+
+
 class TestCancelScheduledService:
     """Test the cancel_scheduled service."""
 
@@ -793,6 +867,30 @@ class TestGuardrailLabels:
         )
         assert "automation.smoke_detector_hallway" in data.paused
 
+    async def test_guardrail_cache_follows_label_and_name_changes(
+        self, hass: HomeAssistant, setup_integration: ConfigEntry
+    ) -> None:
+        """Cached classifications are dropped when labels or friendly names change."""
+        cache = setup_integration.runtime_data.guardrail_cache
+        entity_reg = er.async_get(hass)
+        entity_reg.async_get_or_create("automation", "test", "porch", suggested_object_id="porch")
+        entity_reg.async_update_entity("automation.porch", labels={"autosnooze_confirm"})
+        hass.states.async_set("automation.porch", "on", {"friendly_name": "Porch"})
+        await hass.async_block_till_done()
+
+        with pytest.raises(ServiceValidationError):
+            validate_guardrails(hass, ["automation.porch"], cache=cache)
+        assert cache.get("automation.porch", "Porch") == GuardrailFlags(confirm=True, critical=False)
+
+        entity_reg.async_update_entity("automation.porch", labels=set())
+        await hass.async_block_till_done()
+        validate_guardrails(hass, ["automation.porch"], cache=cache)
+        assert cache.get("automation.porch", "Porch") == GuardrailFlags(confirm=False, critical=False)
+
+        hass.states.async_set("automation.porch", "on", {"friendly_name": "Porch Alarm"})
+        with pytest.raises(ServiceValidationError):
+            validate_guardrails(hass, ["automation.porch"], cache=cache)
+
     async def test_pause_by_area_requires_confirm_for_critical_automation(
         self, hass: HomeAssistant, setup_integration: ConfigEntry
     ) -> None:
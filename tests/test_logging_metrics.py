@@ -12,6 +12,7 @@ from custom_components.autosnooze.application.resume import async_resume_batch
 from custom_components.autosnooze.application.pause import async_pause_automations
 from custom_components.autosnooze.runtime.state import AutomationPauseData
 from custom_components.autosnooze.models import PausedAutomation
+from tests.helpers.automation_ports import BULK_PORT, bulk_result
 
 UTC = timezone.utc
 
@@ -31,11 +32,7 @@ async def test_pause_path_emits_structured_log_fields(caplog: pytest.LogCaptureF
     data = AutomationPauseData(store=MagicMock())
 
     with (
-        patch(
-            "custom_components.autosnooze.application.pause.async_set_automation_state",
-            new_callable=AsyncMock,
-            return_value=True,
-        ),
+        patch(BULK_PORT, bulk_result(True)),
         patch("custom_components.autosnooze.application.pause.schedule_resume"),
         patch(
             "custom_components.autosnooze.application.pause.runtime_async_save",
@@ -63,11 +60,7 @@ async def test_cancel_batch_path_emits_structured_log_fields(caplog: pytest.LogC
     )
 
     with (
-        patch(
-            "custom_components.autosnooze.runtime.ports.async_set_automation_state",
-            new_callable=AsyncMock,
-            return_value=True,
-        ),
+        patch(BULK_PORT, bulk_result(True)),
         patch("custom_components.autosnooze.runtime.ports.async_save", new_callable=AsyncMock, return_value=True),
         patch("custom_components.autosnooze.application.resume.cancel_timer"),
     ):
@@ -5,6 +5,7 @@ These tests focus on edge cases and branches not covered by existing tests.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import os
 import time
@@ -15,7 +16,10 @@ import pytest
 from custom_components.autosnooze.models import (
     PausedAutomation,
     ScheduledSnooze,
+    _SerializedEntry,
+    compact_stored_entry,
     ensure_utc_aware,
+    expand_stored_entry,
     parse_datetime_utc,
 )
 from custom_components.autosnooze.runtime.state import AutomationPauseData
@@ -145,7 +149,7 @@ class TestPausedAutomationWithDisableAt:
 
     def test_to_dict_includes_disable_at_when_set(self) -> None:
         """Test that to_dict includes disable_at when it's set."""
-        now = datetime.now(UTC)
+        now = datetime.now(UTC).replace(microsecond=0)
         disable_at = now - timedelta(hours=1)
         resume_at = now + timedelta(hours=1)
 
@@ -263,6 +267,151 @@ class TestScheduledSnoozeEdgeCases:
         assert result.resume_at.tzinfo is not None
 
 
+class TestSerializationCache:
+    """Tests for the cached serialized form of paused and scheduled entries."""
+
+    def test_paused_to_dict_is_cached_until_a_field_changes(self) -> None:
+        """Repeated serialization reuses the cached dict; a field write invalidates it."""
+        now = datetime(2024, 6, 15, 12, 0, tzinfo=UTC)
+        paused = PausedAutomation(
+            entity_id="automation.test",
+            friendly_name="Test",
+            resume_at=now + timedelta(hours=1),
+            paused_at=now,
+        )
+
+        first = paused.to_dict()
+        assert paused.to_dict() is first
+
+        paused.resume_retries += 1
+        retried = paused.to_dict()
+        assert retried is not first
+        assert retried["resume_retries"] == 1
+
+        paused.resume_at = now + timedelta(hours=2)
+        assert paused.to_dict()["resume_at"] == (now + timedelta(hours=2)).isoformat()
+
+    def test_scheduled_to_dict_is_cached_until_a_field_changes(self) -> None:
+        """ScheduledSnooze shares the same invalidate-on-write cache."""
+        now = datetime(2024, 6, 15, 12, 0, tzinfo=UTC)
+        scheduled = ScheduledSnooze(
+            entity_id="automation.test",
+            friendly_name="Test",
+            disable_at=now,
+            resume_at=now + timedelta(hours=1),
+        )
+
+        first = scheduled.to_dict()
+        assert scheduled.to_dict() is first
+
+        scheduled.disable_at = now + timedelta(minutes=5)
+        assert scheduled.to_dict()["disable_at"] == (now + timedelta(minutes=5)).isoformat()
+
+    def test_cache_is_excluded_from_equality_and_repr(self) -> None:
+        """Serializing one copy does not make otherwise equal entries differ."""
+        now = datetime(2024, 6, 15, 12, 0, tzinfo=UTC)
+        first = PausedAutomation(entity_id="automation.test", friendly_name="Test", resume_at=now, paused_at=now)
+        second = PausedAutomation(entity_id="automation.test", friendly_name="Test", resume_at=now, paused_at=now)
+
+        first.to_dict()
+
+        assert first == second
+        assert "_serialized" not in repr(first)
+
+    def test_entry_without_serializers_cannot_be_built(self) -> None:
+        """A subclass that misses a serializer override fails at construction."""
+
+        @dataclass
+        class Incomplete(_SerializedEntry):
+            entity_id: str
+
+            def _serialize(self) -> dict[str, object]:
+                return {}
+
+        with pytest.raises(TypeError, match="_serialize_storage"):
+            Incomplete(entity_id="automation.test")
+
+
+class TestStorageLayout:
+    """Tests for the compact STORAGE_VERSION 3 entry layout."""
+
+    def test_paused_to_storage_round_trips_through_from_dict(self) -> None:
+        """Short keys and epoch seconds restore the same entry; defaults are omitted."""
+        now = datetime(2024, 6, 15, 12, 0, tzinfo=UTC)
+        paused = PausedAutomation(
+            entity_id="automation.test",
+            friendly_name="Test",
+            resume_at=now + timedelta(hours=1),
+            paused_at=now,
+            hours=1,
+        )
+
+        stored = paused.to_storage()
+
+        assert stored == {
+            "n": "Test",
+            "r": int((now + timedelta(hours=1)).timestamp()),
+            "p": int(now.timestamp()),
+            "H": 1,
+        }
+        assert PausedAutomation.from_dict("automation.test", expand_stored_entry(stored)) == paused
+
+    def test_sub_second_deadlines_stay_exact_in_memory_and_never_load_early(self) -> None:
+        """Assigned deadlines keep their microseconds; only storage rounds them, and always up."""
+        now = datetime(2024, 6, 15, 12, 0, 0, 300_000, tzinfo=UTC)
+        paused = PausedAutomation(
+            entity_id="automation.test",
+            friendly_name="Test",
+            resume_at=now + timedelta(hours=1),
+            paused_at=now,
+            disable_at=now - timedelta(microseconds=200_000),
+        )
+        scheduled = ScheduledSnooze(
+            entity_id="automation.test",
+            friendly_name="Test",
+            disable_at=now,
+            resume_at=now + timedelta(minutes=1),
+        )
+
+        assert paused.paused_at == now
+        assert paused.resume_at == now + timedelta(hours=1)
+        paused.resume_at = now + timedelta(hours=2)
+        assert paused.resume_at == now + timedelta(hours=2)
+
+        loaded = PausedAutomation.from_dict("automation.test", expand_stored_entry(paused.to_storage()))
+        loaded_scheduled = ScheduledSnooze.from_dict("automation.test", expand_stored_entry(scheduled.to_storage()))
+
+        assert loaded.resume_at == datetime(2024, 6, 15, 14, 0, 1, tzinfo=UTC)
+        assert loaded.disable_at == datetime(2024, 6, 15, 12, 0, 1, tzinfo=UTC)
+        assert loaded_scheduled.disable_at == datetime(2024, 6, 15, 12, 0, 1, tzinfo=UTC)
+        assert loaded_scheduled.resume_at == datetime(2024, 6, 15, 12, 1, 1, tzinfo=UTC)
+
+    def test_compact_stored_entry_converts_v2_entries(self) -> None:
+        """Version 2 entries migrate to the same dict the model would store."""
+        now = datetime(2024, 6, 15, 12, 0, tzinfo=UTC)
+        scheduled = ScheduledSnooze(
+            entity_id="automation.test",
+            friendly_name="Test",
+            disable_at=now,
+            resume_at=now + timedelta(hours=1),
+            notification_trigger="end",
+        )
+
+        assert compact_stored_entry(scheduled.to_dict()) == scheduled.to_storage()
+        assert compact_stored_entry({"resume_at": "garbage"}) == {"r": "garbage"}
+
+    def test_to_storage_cache_is_invalidated_by_field_writes(self) -> None:
+        """The storage form shares the to_dict() invalidate-on-write cache."""
+        now = datetime(2024, 6, 15, 12, 0, tzinfo=UTC)
+        paused = PausedAutomation(entity_id="automation.test", friendly_name="Test", resume_at=now, paused_at=now)
+
+        first = paused.to_storage()
+        assert paused.to_storage() is first
+
+        paused.resume_retries = 2
+        assert paused.to_storage()["x"] == 2
+
+
 class TestAutomationPauseDataEdgeCases:
     """Edge case tests for AutomationPauseData."""
 
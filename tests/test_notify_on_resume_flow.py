@@ -10,6 +10,7 @@ from homeassistant.const import ATTR_ENTITY_ID
 
 from custom_components.autosnooze.runtime.state import AutomationPauseData
 from custom_components.autosnooze.models import PausedAutomation, ScheduledSnooze
+from tests.helpers.automation_ports import automation_service
 
 UTC = timezone.utc
 
@@ -22,6 +23,7 @@ async def test_handle_pause_service_forwards_notification_trigger() -> None:
     mock_hass = MagicMock()
     data = AutomationPauseData(store=MagicMock())
     call = MagicMock()
+    call.return_response = False
     call.data = {
         ATTR_ENTITY_ID: ["automation.a"],
         "hours": 1,
@@ -60,7 +62,7 @@ async def test_async_pause_automations_sets_notification_trigger_for_immediate_p
 
     mock_hass = MagicMock()
     mock_hass.states.get.return_value = MagicMock(attributes={"friendly_name": "Kitchen"})
-    mock_hass.services.async_call = AsyncMock()
+    mock_hass.services.async_call = automation_service(mock_hass)
     data = AutomationPauseData(store=MagicMock(async_save=AsyncMock()))
 
     with (
@@ -115,7 +117,7 @@ async def test_async_execute_scheduled_disable_copies_notification_trigger() ->
 
     mock_hass = MagicMock()
     mock_hass.states.get.return_value = MagicMock(attributes={"friendly_name": "Kitchen"})
-    mock_hass.services.async_call = AsyncMock()
+    mock_hass.services.async_call = automation_service(mock_hass)
     data = AutomationPauseData(store=MagicMock(async_save=AsyncMock()))
 
     now = datetime.now(UTC)
@@ -12,6 +12,7 @@ from homeassistant.exceptions import ServiceValidationError
 
 from custom_components.autosnooze.runtime.state import AutomationPauseData
 from custom_components.autosnooze.models import PausedAutomation
+from tests.helpers.automation_ports import BULK_PORT, bulk_result
 
 UTC = timezone.utc
 RESUME_NOTIFICATION_ID = "autosnooze_resume_finished"
@@ -419,9 +420,7 @@ async def test_async_pause_automations_sends_start_notification_for_immediate_st
     data = AutomationPauseData(store=MagicMock())
 
     with (
-        patch(
-            "custom_components.autosnooze.application.pause.async_set_automation_state", AsyncMock(return_value=True)
-        ),
+        patch(BULK_PORT, bulk_result(True)),
         patch("custom_components.autosnooze.application.pause.schedule_resume"),
         patch("custom_components.autosnooze.application.pause.schedule_pre_resume_notification"),
         patch("custom_components.autosnooze.application.pause.runtime_async_save", AsyncMock(return_value=True)),
@@ -489,7 +488,7 @@ async def test_async_execute_scheduled_disable_sends_start_notification_for_star
     )
 
     with (
-        patch("custom_components.autosnooze.runtime.ports.async_set_automation_state", AsyncMock(return_value=True)),
+        patch(BULK_PORT, bulk_result(True)),
         patch("custom_components.autosnooze.runtime.ports.schedule_resume"),
         patch("custom_components.autosnooze.runtime.ports.schedule_pre_resume_notification"),
         patch("custom_components.autosnooze.runtime.ports.async_save", AsyncMock(return_value=True)),
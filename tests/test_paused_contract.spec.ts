@@ -49,6 +49,45 @@ describe('Paused Contract Parser', () => {
     expect(parsed.scheduled['automation.porch']?.friendly_name).toBe('Porch');
   });
 
+  test('fills cohort member rows with their cohort deadline fields', () => {
+    const standalone = pausedEntry({ friendly_name: 'Standalone' });
+    const parsed = parsePausedContract({
+      schema_version: SENSOR_SCHEMA_VERSION,
+      paused: {
+        'automation.a': { friendly_name: 'A', cohort_id: 'c1' },
+        'automation.b': { friendly_name: 'B', cohort_id: 'c1' },
+        'automation.c': standalone,
+      },
+      scheduled: {},
+      cohorts: {
+        c1: {
+          ...pausedEntry({ hours: 2, resume_at: '2030-01-01T13:00:00+00:00' }),
+          entity_ids: ['automation.a', 'automation.b'],
+        },
+      },
+    });
+
+    expect(parsed.paused['automation.a']).toEqual({
+      ...pausedEntry({ friendly_name: 'A', hours: 2, resume_at: '2030-01-01T13:00:00+00:00' }),
+      cohort_id: 'c1',
+    });
+    expect(parsed.paused['automation.b']?.resume_at).toBe('2030-01-01T13:00:00+00:00');
+    expect(parsed.paused['automation.b']).not.toHaveProperty('entity_ids');
+    expect(parsed.paused['automation.c']).toBe(standalone);
+  });
+
+  test('keeps the paused map when no row belongs to a cohort', () => {
+    const paused = { 'automation.kitchen': pausedEntry() };
+    const parsed = parsePausedContract({
+      schema_version: SENSOR_SCHEMA_VERSION,
+      paused,
+      scheduled: {},
+      cohorts: {},
+    });
+
+    expect(parsed.paused).toBe(paused);
+  });
+
   test('returns empty maps when versioned payload is missing required roots', () => {
     const parsed = parsePausedContract({ schema_version: SENSOR_SCHEMA_VERSION });
     expect(parsed.paused).toEqual({});
@@ -14,6 +14,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from tests.helpers.automation_ports import automation_service
+
 UTC = timezone.utc
 
 
@@ -196,6 +198,7 @@ class TestDeletedAutomationCleanup:
         mock_state = MagicMock()
         mock_state.attributes = {"friendly_name": "Existing Scheduled"}
         mock_hass.states.get.return_value = mock_state
+        mock_hass.services.async_call = automation_service(mock_hass)
 
         with (
             patch("custom_components.autosnooze.runtime.ports.schedule_resume"),
@@ -453,3 +456,490 @@ class TestSaveFailureRecovery:
         assert await older_save is True
         assert await newer_save is True
         assert writes[-1] == {"automation.first", "automation.second"}
+
+
+class TestGroupCommitSaves:
+    """Tests for merging concurrent save requests into one physical write."""
+
+    @staticmethod
+    def _data(seconds: float):
+        from custom_components.autosnooze.runtime.state import AutomationPauseData
+
+        store = MagicMock()
+        store.async_save = AsyncMock()
+        return AutomationPauseData(store=store, save_coalesce_window=timedelta(seconds=seconds))
+
+    @pytest.mark.asyncio
+    async def test_saves_within_window_share_one_write(self) -> None:
+        """Concurrent save requests resolve together from a single write."""
+        from custom_components.autosnooze.infrastructure.storage import async_save, save_stats
+
+        assert save_stats(self._data(0.01)) == {"requested": 0, "coalesced": 0, "physical_writes": 0}
+
+        data = self._data(0.01)
+
+        results = await asyncio.gather(*(async_save(data) for _ in range(5)))
+
+        assert results == [True] * 5
+        data.store.async_save.assert_awaited_once()
+        assert save_stats(data) == {"requested": 5, "coalesced": 4, "physical_writes": 1}
+
+    @pytest.mark.asyncio
+    async def test_save_during_in_flight_write_gets_a_later_write(self) -> None:
+        """A request made while a write is running is covered by the next commit."""
+        from custom_components.autosnooze.infrastructure.storage import async_save
+
+        data = self._data(0)
+        write_started = asyncio.Event()
+        release_write = asyncio.Event()
+        snapshots: list[int] = []
+
+        async def slow_save(payload: dict[str, dict[str, object]]) -> None:
+            snapshots.append(len(payload["paused"]))
+            write_started.set()
+            await release_write.wait()
+
+        data.store.async_save = slow_save
+        first = asyncio.create_task(async_save(data))
+        await asyncio.wait_for(write_started.wait(), timeout=1)
+        second = asyncio.create_task(async_save(data))
+        third = asyncio.create_task(async_save(data))
+        await asyncio.sleep(0)
+        release_write.set()
+
+        assert await asyncio.gather(first, second, third) == [True, True, True]
+        assert data.save_writer.physical_writes == 2
+
+    @pytest.mark.asyncio
+    async def test_flush_skips_the_remaining_window(self) -> None:
+        """Flushing writes an open commit without waiting for the window."""
+        from custom_components.autosnooze.infrastructure.storage import async_flush_saves, async_save
+
+        data = self._data(60)
+        pending = asyncio.create_task(async_save(data))
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(async_flush_saves(data), timeout=1)
+
+        assert await pending is True
+        data.store.async_save.assert_awaited_once()
+
+
+class TestJournalStore:
+    """Tests for the append-only journal storage mode."""
+
+    @staticmethod
+    def _hass() -> MagicMock:
+        hass = MagicMock()
+
+        async def run_in_executor(target, *args):
+            return target(*args)
+
+        hass.async_add_executor_job = run_in_executor
+        return hass
+
+    @staticmethod
+    def _entry(minutes: int) -> dict[str, object]:
+        return {"friendly_name": "Test", "resume_at": f"2026-01-01T00:{minutes:02d}:00+00:00"}
+
+    @pytest.mark.asyncio
+    async def test_saves_append_only_changed_entries(self, tmp_path) -> None:
+        """Each save appends records for changed entries instead of rewriting the snapshot."""
+        from custom_components.autosnooze.infrastructure.journal import JournalStore
+
+        store = MagicMock()
+        store.async_load = AsyncMock(return_value={"paused": {"automation.a": self._entry(1)}, "scheduled": {}})
+        store.async_save = AsyncMock()
+        journal_path = tmp_path / "autosnooze.journal"
+        journal = JournalStore(self._hass(), store, str(journal_path), compact_threshold=10)
+        await journal.async_load()
+
+        await journal.async_save_changes(
+            {"paused": {"automation.a": self._entry(1), "automation.b": self._entry(2)}, "scheduled": {}}
+        )
+        await journal.async_save_changes({"paused": {"automation.b": self._entry(3)}, "scheduled": {}})
+
+        store.async_save.assert_not_awaited()
+        lines = journal_path.read_text().splitlines()
+        assert len(lines) == 3
+        assert journal.journal_records == 3
+
+        reloaded = JournalStore(self._hass(), store, str(journal_path), compact_threshold=10)
+        assert await reloaded.async_load() == {
+            "paused": {"automation.b": self._entry(3)},
+            "scheduled": {},
+            "cohorts": {},
+        }
+
+    @pytest.mark.asyncio
+    async def test_compacts_into_snapshot_past_threshold(self, tmp_path) -> None:
+        """Passing the record threshold writes a snapshot and removes the journal."""
+        from custom_components.autosnooze.infrastructure.journal import JournalStore
+
+        store = MagicMock()
+        store.async_load = AsyncMock(return_value=None)
+        store.async_save = AsyncMock()
+        journal_path = tmp_path / "autosnooze.journal"
+        journal = JournalStore(self._hass(), store, str(journal_path), compact_threshold=2)
+        await journal.async_load()
+
+        await journal.async_save_changes({"paused": {"automation.a": self._entry(1)}, "scheduled": {}})
+        assert journal_path.exists()
+
+        snapshot = {
+            "paused": {"automation.a": self._entry(1), "automation.b": self._entry(2), "automation.c": self._entry(3)},
+            "scheduled": {},
+        }
+        await journal.async_save_changes(snapshot)
+
+        store.async_save.assert_awaited_once_with(snapshot)
+        assert not journal_path.exists()
+        assert journal.journal_records == 0
+
+    @pytest.mark.asyncio
+    async def test_crash_before_journal_removal_replays_to_compacted_snapshot(self, tmp_path) -> None:
+        """A journal that outlives its compaction snapshot does not resurrect deleted entries."""
+        from custom_components.autosnooze.infrastructure.journal import JournalStore
+
+        saved: dict[str, object] = {}
+        store = MagicMock()
+        store.async_load = AsyncMock(return_value=None)
+
+        async def save(data) -> None:
+            saved["data"] = data
+
+        store.async_save = AsyncMock(side_effect=save)
+        journal_path = tmp_path / "autosnooze.journal"
+        journal = JournalStore(self._hass(), store, str(journal_path), compact_threshold=2)
+        await journal.async_load()
+        await journal.async_save_changes(
+            {"paused": {"automation.a": self._entry(1), "automation.b": self._entry(2)}, "scheduled": {}}
+        )
+
+        # Crash after the snapshot write but before the journal is removed.
+        with patch("custom_components.autosnooze.infrastructure.journal._remove_journal"):
+            await journal.async_save_changes({"paused": {}, "scheduled": {}})
+        assert journal_path.exists()
+
+        store.async_load = AsyncMock(return_value=saved["data"])
+        reloaded = JournalStore(self._hass(), store, str(journal_path), compact_threshold=2)
+        assert await reloaded.async_load() == {"paused": {}, "scheduled": {}, "cohorts": {}}
+
+    @pytest.mark.asyncio
+    async def test_load_ignores_torn_trailing_record(self, tmp_path) -> None:
+        """A partially written final line does not break replay."""
+        from custom_components.autosnooze.infrastructure.journal import JournalStore
+
+        journal_path = tmp_path / "autosnooze.journal"
+        journal_path.write_text(
+            '{"op":"put","section":"paused","entity_id":"automation.a","entry":{"friendly_name":"A"}}\n'
+            '{"op":"del","section":"paus'
+        )
+        store = MagicMock()
+        store.async_load = AsyncMock(return_value=None)
+        journal = JournalStore(self._hass(), store, str(journal_path), compact_threshold=10)
+
+        assert await journal.async_load() == {
+            "paused": {"automation.a": {"friendly_name": "A"}},
+            "scheduled": {},
+            "cohorts": {},
+        }
+
+    @pytest.mark.asyncio
+    async def test_appends_after_torn_record_survive_reload(self, tmp_path) -> None:
+        """Loading cuts off a torn line so later appends replay on the next load."""
+        from custom_components.autosnooze.infrastructure.journal import JournalStore
+
+        good = '{"op":"put","section":"paused","entity_id":"automation.a","entry":{"friendly_name":"A"}}\n'
+        journal_path = tmp_path / "autosnooze.journal"
+        journal_path.write_text(good + '{"op":"del","section":"paus')
+        store = MagicMock()
+        store.async_load = AsyncMock(return_value=None)
+        store.async_save = AsyncMock()
+        journal = JournalStore(self._hass(), store, str(journal_path), compact_threshold=10)
+        await journal.async_load()
+        assert journal_path.read_text() == good
+
+        await journal.async_save_changes(
+            {"paused": {"automation.a": {"friendly_name": "A"}, "automation.b": self._entry(2)}, "scheduled": {}}
+        )
+
+        store.async_save.assert_not_awaited()
+        reloaded = JournalStore(self._hass(), store, str(journal_path), compact_threshold=10)
+        assert await reloaded.async_load() == {
+            "paused": {"automation.a": {"friendly_name": "A"}, "automation.b": self._entry(2)},
+            "scheduled": {},
+            "cohorts": {},
+        }
+
+
+class TestSqliteStore:
+    """Tests for the SQLite storage mode."""
+
+    @staticmethod
+    def _hass() -> MagicMock:
+        hass = MagicMock()
+
+        async def run_in_executor(target, *args):
+            return target(*args)
+
+        hass.async_add_executor_job = run_in_executor
+        return hass
+
+    @staticmethod
+    def _paused(hour: int) -> dict[str, object]:
+        return {"friendly_name": "Test", "resume_at": f"2099-01-01T{hour:02d}:00:00+00:00"}
+
+    @staticmethod
+    def _scheduled(year: int) -> dict[str, object]:
+        return {
+            "friendly_name": "Test",
+            "disable_at": f"{year}-01-01T00:00:00+00:00",
+            "resume_at": f"{year}-01-02T00:00:00+00:00",
+        }
+
+    @pytest.mark.asyncio
+    async def test_saves_update_only_changed_rows(self, tmp_path) -> None:
+        """Saves upsert and delete changed rows; reloads return live rows ordered by deadline."""
+        from custom_components.autosnooze.infrastructure.sqlite_store import SqliteStore
+
+        database_path = str(tmp_path / "autosnooze.db")
+        store = SqliteStore(self._hass(), database_path)
+        assert await store.async_load() is None
+
+        await store.async_save_changes(
+            {
+                "paused": {"automation.late": self._paused(5), "automation.gone": self._paused(1)},
+                "scheduled": {"automation.expired": self._scheduled(2020), "automation.next": self._scheduled(2099)},
+            }
+        )
+        assert store.row_writes == 4
+        await store.async_save_changes(
+            {
+                "paused": {"automation.late": self._paused(5), "automation.early": self._paused(2)},
+                "scheduled": {"automation.expired": self._scheduled(2020), "automation.next": self._scheduled(2099)},
+            }
+        )
+        assert store.row_writes == 6
+
+        reloaded = await SqliteStore(self._hass(), database_path).async_load()
+
+        assert list(reloaded["paused"]) == ["automation.early", "automation.late"]
+        assert reloaded["scheduled"] == {"automation.next": self._scheduled(2099)}
+
+    @pytest.mark.asyncio
+    async def test_imports_and_exports_json_snapshot(self, tmp_path) -> None:
+        """Switching to SQLite imports the JSON snapshot, and switching back exports the rows."""
+        from custom_components.autosnooze.infrastructure.journal import JournalStore
+        from custom_components.autosnooze.infrastructure.sqlite_store import SqliteStore
+
+        snapshot = {
+            "paused": {"automation.a": self._paused(3)},
+            "scheduled": {"automation.b": self._scheduled(2099)},
+            "cohorts": {},
+        }
+        database_path = str(tmp_path / "autosnooze.db")
+        json_store = MagicMock()
+        json_store.async_load = AsyncMock(return_value=snapshot)
+        json_store.async_save = AsyncMock()
+        json_store.async_remove = AsyncMock()
+        legacy = JournalStore(self._hass(), json_store, str(tmp_path / "autosnooze.journal"), compact_threshold=0)
+
+        store = SqliteStore(self._hass(), database_path, legacy=legacy)
+        assert await store.async_load() == snapshot
+        json_store.async_remove.assert_awaited_once()
+        assert await store.async_export() == {"paused": snapshot["paused"], "scheduled": snapshot["scheduled"]}
+
+        json_store.async_load = AsyncMock(return_value=None)
+        journal = JournalStore(
+            self._hass(),
+            json_store,
+            str(tmp_path / "autosnooze.journal"),
+            compact_threshold=0,
+            legacy=SqliteStore(self._hass(), database_path),
+        )
+        assert await journal.async_load() == snapshot
+        json_store.async_save.assert_awaited_with(snapshot)
+        assert not (tmp_path / "autosnooze.db").exists()
+
+    @pytest.mark.asyncio
+    async def test_exports_v2_json_that_imports_back(self, tmp_path) -> None:
+        """Compact rows export as version 2 entries, with cohort fields folded into members."""
+        from custom_components.autosnooze.infrastructure.sqlite_store import SqliteStore
+
+        epoch = int(datetime(2099, 1, 1, tzinfo=UTC).timestamp())
+        store = SqliteStore(self._hass(), str(tmp_path / "autosnooze.db"))
+        await store.async_save(
+            {
+                "paused": {
+                    "automation.a": {"n": "A", "r": epoch + 3600, "p": epoch, "M": 60},
+                    "automation.b": {"n": "B", "c": "cohort"},
+                },
+                "scheduled": {"automation.c": {"n": "C", "d": epoch + 7200, "r": epoch + 10800}},
+                "cohorts": {"cohort": {"r": epoch + 1800, "p": epoch, "M": 30}},
+            }
+        )
+
+        exported = await store.async_export()
+
+        assert exported == {
+            "paused": {
+                "automation.a": {
+                    "friendly_name": "A",
+                    "resume_at": "2099-01-01T01:00:00+00:00",
+                    "paused_at": "2099-01-01T00:00:00+00:00",
+                    "minutes": 60,
+                },
+                "automation.b": {
+                    "friendly_name": "B",
+                    "resume_at": "2099-01-01T00:30:00+00:00",
+                    "paused_at": "2099-01-01T00:00:00+00:00",
+                    "minutes": 30,
+                },
+            },
+            "scheduled": {
+                "automation.c": {
+                    "friendly_name": "C",
+                    "disable_at": "2099-01-01T02:00:00+00:00",
+                    "resume_at": "2099-01-01T03:00:00+00:00",
+                }
+            },
+        }
+        imported = SqliteStore(self._hass(), str(tmp_path / "imported.db"))
+        await imported.async_import(exported)
+        assert await imported.async_export() == exported
+        await store.async_close()
+        await imported.async_close()
+
+    @pytest.mark.asyncio
+    async def test_empty_database_loads_as_none_and_is_not_imported(self, tmp_path) -> None:
+        """A database without rows never replaces the JSON snapshot it would be imported into."""
+        from custom_components.autosnooze.infrastructure.journal import JournalStore
+        from custom_components.autosnooze.infrastructure.sqlite_store import SqliteStore
+
+        database_path = str(tmp_path / "autosnooze.db")
+        empty = SqliteStore(self._hass(), database_path)
+        await empty.async_save({"paused": {}, "scheduled": {}, "cohorts": {}})
+        await empty.async_close()
+        assert (tmp_path / "autosnooze.db").exists()
+        assert await SqliteStore(self._hass(), database_path).async_load() is None
+
+        snapshot = {"paused": {"automation.a": self._paused(3)}, "scheduled": {}, "cohorts": {}}
+        json_store = MagicMock()
+        json_store.async_load = AsyncMock(return_value=snapshot)
+        json_store.async_save = AsyncMock()
+        journal = JournalStore(
+            self._hass(),
+            json_store,
+            str(tmp_path / "autosnooze.journal"),
+            compact_threshold=0,
+            legacy=SqliteStore(self._hass(), database_path),
+        )
+
+        assert await journal.async_load() == snapshot
+        json_store.async_save.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_store_reuses_one_connection_until_closed(self, tmp_path) -> None:
+        """Loads and saves share one connection, opened and given its schema once."""
+        from custom_components.autosnooze.infrastructure import sqlite_store
+        from custom_components.autosnooze.infrastructure.sqlite_store import SqliteStore
+
+        store = SqliteStore(self._hass(), str(tmp_path / "autosnooze.db"))
+        with patch.object(sqlite_store, "_open", wraps=sqlite_store._open) as open_database:
+            await store.async_save_changes({"paused": {"automation.a": self._paused(3)}})
+            await store.async_save_changes({"paused": {"automation.a": self._paused(4)}})
+            assert (await store.async_load())["paused"] == {"automation.a": self._paused(4)}
+            assert open_database.call_count == 1
+
+            await store.async_close()
+            await store.async_load()
+            assert open_database.call_count == 2
+        await store.async_remove()
+        assert not (tmp_path / "autosnooze.db").exists()
+
+    @pytest.mark.asyncio
+    async def test_closing_a_json_store_closes_its_legacy_connection(self, tmp_path) -> None:
+        """The SQLite store a JSON backend imports from does not keep its connection open."""
+        from custom_components.autosnooze.infrastructure.journal import JournalStore
+        from custom_components.autosnooze.infrastructure.sqlite_store import SqliteStore
+        from custom_components.autosnooze.infrastructure.storage import async_close_store
+        from custom_components.autosnooze.runtime.state import AutomationPauseData
+
+        database_path = str(tmp_path / "autosnooze.db")
+        empty = SqliteStore(self._hass(), database_path)
+        await empty.async_save({"paused": {}, "scheduled": {}, "cohorts": {}})
+        await empty.async_close()
+
+        legacy = SqliteStore(self._hass(), database_path)
+        json_store = MagicMock()
+        json_store.async_load = AsyncMock(return_value=None)
+        store = JournalStore(
+            self._hass(), json_store, str(tmp_path / "autosnooze.journal"), compact_threshold=0, legacy=legacy
+        )
+        await store.async_load()
+        assert legacy._connection is not None
+
+        data = AutomationPauseData(hass=self._hass())
+        data.store = store
+        await async_close_store(data)
+        assert legacy._connection is None
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_export_sqlite_rows(self, tmp_path) -> None:
+        """Diagnostics list SQLite rows as version 2 entries and nothing for the JSON backends."""
+        from custom_components.autosnooze.diagnostics import async_get_config_entry_diagnostics
+        from custom_components.autosnooze.infrastructure.sqlite_store import SqliteStore
+        from custom_components.autosnooze.runtime.state import AutomationPauseData
+
+        data = AutomationPauseData(hass=self._hass())
+        entry = MagicMock()
+        entry.options = {}
+        entry.runtime_data = data
+        assert (await async_get_config_entry_diagnostics(data.hass, entry))["sqlite_rows"] is None
+
+        data.store = SqliteStore(self._hass(), str(tmp_path / "autosnooze.db"))
+        await data.store.async_save({"paused": {"automation.a": self._paused(3)}, "scheduled": {}, "cohorts": {}})
+        diagnostics = await async_get_config_entry_diagnostics(data.hass, entry)
+        assert diagnostics["sqlite_rows"] == {"paused": {"automation.a": self._paused(3)}, "scheduled": {}}
+        await data.store.async_close()
+
+
+class TestStorageMigration:
+    """Tests for migrating stored snapshots to STORAGE_VERSION 3."""
+
+    @pytest.mark.asyncio
+    async def test_v2_snapshot_migrates_to_compact_layout(self) -> None:
+        """The Store migrate hook rewrites v2 entries with short keys and epoch seconds."""
+        from custom_components.autosnooze.infrastructure.storage import AutoSnoozeStore
+        from custom_components.autosnooze.runtime.restore import validate_stored_data
+
+        v2 = {
+            "paused": {
+                "automation.a": {
+                    "friendly_name": "A",
+                    "resume_at": "2026-01-01T01:00:00+00:00",
+                    "paused_at": "2026-01-01T00:00:00+00:00",
+                    "minutes": 60,
+                }
+            },
+            "scheduled": {
+                "automation.b": {
+                    "friendly_name": "B",
+                    "disable_at": "2026-01-01T02:00:00+00:00",
+                    "resume_at": "2026-01-01T03:00:00+00:00",
+                }
+            },
+        }
+        store = AutoSnoozeStore.__new__(AutoSnoozeStore)
+
+        migrated = await store._async_migrate_func(2, 1, v2)
+
+        epoch = int(datetime(2026, 1, 1, tzinfo=UTC).timestamp())
+        assert migrated == {
+            "paused": {"automation.a": {"n": "A", "r": epoch + 3600, "p": epoch, "M": 60}},
+            "scheduled": {"automation.b": {"n": "B", "d": epoch + 7200, "r": epoch + 10800}},
+        }
+        validated = validate_stored_data(migrated)
+        assert validated["paused"]["automation.a"]["resume_at"] == epoch + 3600
+        assert validated["scheduled"]["automation.b"]["disable_at"] == epoch + 7200
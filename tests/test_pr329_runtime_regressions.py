@@ -10,6 +10,7 @@ import pytest
 from custom_components.autosnooze.application.resume import async_resume_batch
 from custom_components.autosnooze.runtime.state import AutomationPauseData
 from custom_components.autosnooze.models import PausedAutomation
+from tests.helpers.automation_ports import BULK_PORT, bulk_port, bulk_result
 
 UTC = timezone.utc
 
@@ -36,10 +37,7 @@ async def test_resume_batch_deduplicates_entity_ids_before_wake_calls() -> None:
     data.paused["automation.test"] = _paused("automation.test")
 
     with (
-        patch(
-            "custom_components.autosnooze.runtime.ports.async_set_automation_state",
-            AsyncMock(return_value=True),
-        ) as set_state,
+        patch(BULK_PORT, bulk_result(True)) as set_states,
         patch(
             "custom_components.autosnooze.runtime.ports.async_save",
             AsyncMock(return_value=True),
@@ -47,9 +45,10 @@ async def test_resume_batch_deduplicates_entity_ids_before_wake_calls() -> None:
     ):
         await async_resume_batch(mock_hass, data, ["automation.test", "automation.test"])
 
-    assert set_state.await_count == 1
+    set_states.assert_awaited_once()
+    assert set_states.await_args.args[1] == ["automation.test"]
     save_state.assert_awaited_once_with(data)
-    data.notify.assert_called_once_with()
+    data.notify.assert_called_once_with(["automation.test"])
     assert "automation.test" not in data.paused
 
 
@@ -60,10 +59,7 @@ async def test_resume_batch_skips_wake_calls_for_unknown_entity_ids() -> None:
     data.notify = MagicMock()
 
     with (
-        patch(
-            "custom_components.autosnooze.runtime.ports.async_set_automation_state",
-            AsyncMock(return_value=True),
-        ) as set_state,
+        patch(BULK_PORT, bulk_result(True)) as set_states,
         patch(
             "custom_components.autosnooze.runtime.ports.async_save",
             AsyncMock(return_value=True),
@@ -71,9 +67,9 @@ async def test_resume_batch_skips_wake_calls_for_unknown_entity_ids() -> None:
     ):
         await async_resume_batch(MagicMock(), data, ["automation.missing"])
 
-    set_state.assert_not_awaited()
+    set_states.assert_not_awaited()
     save_state.assert_awaited_once_with(data)
-    data.notify.assert_called_once_with()
+    data.notify.assert_called_once_with([])
 
 
 @pytest.mark.asyncio
@@ -89,10 +85,7 @@ async def test_resume_batch_keeps_failed_entities_and_persists_once() -> None:
         return entity_id == "automation.success"
 
     with (
-        patch(
-            "custom_components.autosnooze.runtime.ports.async_set_automation_state",
-            AsyncMock(side_effect=_set_state),
-        ) as set_state,
+        patch(BULK_PORT, bulk_port(_set_state)) as set_states,
         patch(
             "custom_components.autosnooze.runtime.ports.async_save",
             AsyncMock(return_value=True),
@@ -105,10 +98,10 @@ async def test_resume_batch_keeps_failed_entities_and_persists_once() -> None:
             ["automation.success", "automation.missing", "automation.retry"],
         )
 
-    assert set_state.await_args_list[0].args[1] == "automation.success"
-    assert set_state.await_args_list[1].args[1] == "automation.retry"
+    set_states.assert_awaited_once()
+    assert set_states.await_args.args[1] == ["automation.success", "automation.retry"]
     save_state.assert_awaited_once_with(data)
-    data.notify.assert_called_once_with()
+    data.notify.assert_called_once_with(["automation.success", "automation.retry"])
     schedule_resume.assert_called_once()
     assert "automation.success" not in data.paused
     assert data.paused["automation.retry"].resume_retries == 2
@@ -0,0 +1,82 @@
+"""Tests for the automation registry index."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from homeassistant.components.automation import EVENT_AUTOMATION_RELOADED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import label_registry as lr
+
+from custom_components.autosnooze.infrastructure.registry_index import (
+    INDEX_AREA,
+    INDEX_DEVICE,
+    INDEX_LABEL,
+    AutomationRegistryIndex,
+)
+
+
+async def test_index_builds_from_registry_and_ignores_other_domains(hass: HomeAssistant) -> None:
+    area = ar.async_get(hass).async_create("Kitchen")
+    entity_reg = er.async_get(hass)
+    for domain, object_id in (("automation", "kitchen_lights"), ("light", "kitchen")):
+        entity_reg.async_get_or_create(domain, "test", object_id, suggested_object_id=object_id)
+        entity_reg.async_update_entity(f"{domain}.{object_id}", area_id=area.id)
+
+    index = AutomationRegistryIndex(hass)
+    unsubscribe = index.async_listen()
+
+    assert index.lookup(INDEX_AREA, [area.id, "missing"]) == ["automation.kitchen_lights"]
+    unsubscribe()
+
+
+async def test_index_follows_entity_and_label_updates(hass: HomeAssistant) -> None:
+    index = AutomationRegistryIndex(hass)
+    unsubscribe = index.async_listen()
+    label = lr.async_get(hass).async_create("Vacation")
+    entity_reg = er.async_get(hass)
+    entity_reg.async_get_or_create("automation", "test", "porch", suggested_object_id="porch")
+    entity_reg.async_update_entity("automation.porch", labels={label.label_id})
+    await hass.async_block_till_done()
+    assert index.lookup(INDEX_LABEL, [label.label_id]) == ["automation.porch"]
+
+    entity_reg.async_update_entity("automation.porch", new_entity_id="automation.front_porch")
+    await hass.async_block_till_done()
+    assert index.lookup(INDEX_LABEL, [label.label_id]) == ["automation.front_porch"]
+
+    lr.async_get(hass).async_delete(label.label_id)
+    await hass.async_block_till_done()
+    assert index.lookup(INDEX_LABEL, [label.label_id]) == []
+
+    entity_reg.async_remove("automation.front_porch")
+    await hass.async_block_till_done()
+    assert index._keys == {}
+
+    unsubscribe()
+    entity_reg.async_get_or_create("automation", "test", "late", suggested_object_id="late")
+    await hass.async_block_till_done()
+    assert index._keys == {}
+
+
+async def test_index_devices_referenced_by_automations_until_reload(hass: HomeAssistant) -> None:
+    er.async_get(hass).async_get_or_create("automation", "test", "doorbell", suggested_object_id="doorbell")
+    references = {"automation.doorbell": ["doorbell_device"]}
+    index = AutomationRegistryIndex(hass)
+    unsubscribe = index.async_listen()
+
+    with patch(
+        "custom_components.autosnooze.infrastructure.registry_index.devices_in_automation",
+        side_effect=lambda _hass, entity_id: references.get(entity_id, []),
+    ):
+        assert index.lookup(INDEX_DEVICE, ["doorbell_device"]) == ["automation.doorbell"]
+
+        references["automation.doorbell"] = ["chime_device"]
+        assert index.lookup(INDEX_DEVICE, ["chime_device"]) == []
+
+        hass.bus.async_fire(EVENT_AUTOMATION_RELOADED)
+        await hass.async_block_till_done()
+        assert index.lookup(INDEX_DEVICE, ["chime_device"]) == ["automation.doorbell"]
+        assert index.lookup(INDEX_DEVICE, ["doorbell_device"]) == []
+    unsubscribe()
@@ -26,6 +26,7 @@ from custom_components.autosnooze import DOMAIN
 from custom_components.autosnooze.application.pause import (
     next_local_time_occurrence,
     resolve_resume_at,
+    resolve_resume_presets,
 )
 from custom_components.autosnooze.const import (
     PAUSE_BY_AREA_SCHEMA,
@@ -35,7 +36,9 @@ from custom_components.autosnooze.const import (
     RESUME_PRESET_NEXT_MORNING,
     RESUME_PRESET_NEXT_SUNRISE,
     RESUME_PRESET_NEXT_SUNSET,
+    RESUME_PRESET_VALUES,
 )
+from custom_components.autosnooze.infrastructure.resume_preset_cache import ResumePresetCache
 
 ENTITY = "automation.test_automation_1"
 
@@ -69,7 +72,11 @@ async def mock_dependencies(hass: HomeAssistant):
         hass.config.components.add(dep)
 
     async def mock_automation_service(call):
-        pass
+        """Mock automation service handler that applies turn_on/turn_off to the state machine."""
+        entity_ids = call.data.get("entity_id", [])
+        for entity_id in [entity_ids] if isinstance(entity_ids, str) else entity_ids:
+            if call.service != "toggle" and (current := hass.states.get(entity_id)):
+                hass.states.async_set(entity_id, "on" if call.service == "turn_on" else "off", current.attributes)
 
     hass.services.async_register("automation", "turn_on", mock_automation_service)
     hass.services.async_register("automation", "turn_off", mock_automation_service)
@@ -86,7 +93,10 @@ async def setup_integration(hass: HomeAssistant):
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
     hass.states.async_set(ENTITY, "on", {"friendly_name": "Test Automation 1"})
-    return hass.config_entries.async_get_entry(entry.entry_id)
+    loaded = hass.config_entries.async_get_entry(entry.entry_id)
+    # Frozen-clock tests never let the save coalesce window elapse; commit immediately.
+    loaded.runtime_data.save_coalesce_window = timedelta(0)
+    return loaded
 
 
 # =============================================================================
@@ -292,6 +302,50 @@ class TestResumeStrategyResolution:
         assert resolved == datetime(2026, 3, 9, 6, 30, tzinfo=timezone.utc)
 
 
+class TestResumePresetCache:
+    """Cached preset targets are reused until their boundary or a config change."""
+
+    async def test_cached_target_is_reused_until_it_passes(
+        self, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+    ) -> None:
+        await hass.config.async_set_time_zone("America/New_York")
+        freezer.move_to("2026-07-07 05:00:00-04:00")
+        cache = ResumePresetCache(hass)
+        call_data = {"resume_preset": RESUME_PRESET_NEXT_MORNING}
+
+        first = resolve_resume_at(hass, call_data, cache)
+        freezer.move_to("2026-07-07 07:59:00-04:00")
+        assert cache.get(RESUME_PRESET_NEXT_MORNING, dt_util.utcnow()) == first
+        assert resolve_resume_at(hass, call_data, cache) == first
+
+        freezer.move_to("2026-07-07 08:00:00-04:00")
+        assert resolve_resume_at(hass, call_data, cache) == datetime(2026, 7, 8, 12, 0, tzinfo=timezone.utc)
+
+    async def test_core_config_update_clears_cache(self, hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+        await hass.config.async_set_time_zone("America/New_York")
+        freezer.move_to("2026-07-07 15:00:00-04:00")
+        cache = ResumePresetCache(hass)
+        unsubscribe = cache.async_listen()
+        resolve_resume_at(hass, {"resume_preset": RESUME_PRESET_END_OF_DAY}, cache)
+
+        await hass.config.async_update(time_zone="America/Los_Angeles")
+        await hass.async_block_till_done()
+
+        assert cache.get(RESUME_PRESET_END_OF_DAY, dt_util.utcnow()) is None
+        resolved = resolve_resume_at(hass, {"resume_preset": RESUME_PRESET_END_OF_DAY}, cache)
+        assert resolved == datetime(2026, 7, 8, 7, 0, tzinfo=timezone.utc)  # 00:00 PDT
+        unsubscribe()
+
+    async def test_resolve_resume_presets_covers_every_preset(self, hass: HomeAssistant) -> None:
+        cache = ResumePresetCache(hass)
+
+        targets = resolve_resume_presets(hass, cache)
+
+        assert set(targets) == set(RESUME_PRESET_VALUES)
+        assert targets == resolve_resume_presets(hass, cache)
+        assert all(target > dt_util.utcnow() for target in targets.values())
+
+
 # =============================================================================
 # End-to-end service behavior
 # =============================================================================
@@ -404,3 +458,17 @@ class TestPauseServiceResumeStrategies:
                 blocking=True,
             )
         assert ENTITY not in setup_integration.runtime_data.paused
+
+    async def test_get_resume_presets_returns_every_target(
+        self, hass: HomeAssistant, setup_integration, freezer: FrozenDateTimeFactory
+    ) -> None:
+        """get_resume_presets responds with each preset's UTC target."""
+        await hass.config.async_set_time_zone("America/New_York")
+        freezer.move_to("2026-07-07 15:00:00-04:00")
+
+        response = await hass.services.async_call(DOMAIN, "get_resume_presets", {}, blocking=True, return_response=True)
+
+        presets = response["presets"]
+        assert set(presets) == set(RESUME_PRESET_VALUES)
+        assert presets[RESUME_PRESET_END_OF_DAY] == "2026-07-08T04:00:00+00:00"
+        assert presets[RESUME_PRESET_NEXT_MORNING] == "2026-07-08T12:00:00+00:00"
@@ -80,13 +80,161 @@ def test_schedule_resume_requires_and_invokes_explicit_callback() -> None:
     )
     scheduled_callbacks[0](datetime.now(UTC))
 
-    assert data.timers == {"automation.test": timer_unsubscribe}
+    assert set(data.timers) == {"automation.test"}
+    timer_unsubscribe.assert_not_called()
     assert len(created_tasks) == 1
     hass.async_create_task.assert_called_once()
     resume_callback.assert_called_once_with(hass, data, "automation.test", reason="expired")
     assert not hasattr(timers, "async_resume")
 
 
+def test_deadline_scheduler_arms_one_timer_for_earliest_deadline() -> None:
+    """Many pending deadlines share a single HA timer armed for the earliest one."""
+    from custom_components.autosnooze.runtime.state import AutomationPauseData
+    from custom_components.autosnooze.runtime.timers import DeadlineScheduler
+
+    now = datetime.now(UTC)
+    data = AutomationPauseData()
+    armed: list[tuple[object, datetime, MagicMock]] = []
+
+    def track_time(_hass: object, callback: object, when: datetime) -> MagicMock:
+        unsub = MagicMock()
+        armed.append((callback, when, unsub))
+        return unsub
+
+    scheduler = DeadlineScheduler(MagicMock(), data)
+    fired: list[str] = []
+    for minutes, name in ((30, "c"), (20, "b"), (40, "d"), (10, "a")):
+        scheduler.schedule(
+            now + timedelta(minutes=minutes),
+            lambda name=name: fired.append(name),
+            track_point_in_time=track_time,
+        )
+
+    # Re-armed only when a strictly earlier deadline arrived: 30m, 20m, 10m.
+    assert [when for _cb, when, _unsub in armed] == [now + timedelta(minutes=m) for m in (30, 20, 10)]
+    assert [unsub.call_count for _cb, _when, unsub in armed] == [1, 1, 0]
+    assert scheduler.pending == 4
+
+    armed[-1][0](now + timedelta(minutes=25))
+
+    assert fired == ["a", "b"]
+    assert scheduler.pending == 2
+    assert scheduler.armed_at == now + timedelta(minutes=30)
+
+
+def test_deadline_scheduler_arms_each_deadline_with_its_own_tracker() -> None:
+    """A tracker passed for one deadline is not reused to arm later deadlines."""
+    from custom_components.autosnooze.runtime import timers
+    from custom_components.autosnooze.runtime.state import AutomationPauseData
+    from custom_components.autosnooze.runtime.timers import DeadlineScheduler
+
+    now = datetime.now(UTC)
+    scheduler = DeadlineScheduler(MagicMock(), AutomationPauseData())
+    custom_track = MagicMock()
+
+    with patch.object(timers, "async_track_point_in_time") as default_track:
+        scheduler.schedule(now + timedelta(minutes=30), lambda: None, track_point_in_time=custom_track)
+        scheduler.schedule(now + timedelta(minutes=10), lambda: None)
+
+    assert [call.args[2] for call in custom_track.call_args_list] == [now + timedelta(minutes=30)]
+    assert [call.args[2] for call in default_track.call_args_list] == [now + timedelta(minutes=10)]
+
+
+def test_deadline_scheduler_cancel_and_shutdown_release_timer() -> None:
+    """Cancelled deadlines never fire and shutdown drops the armed timer."""
+    from custom_components.autosnooze.runtime.state import AutomationPauseData
+    from custom_components.autosnooze.runtime.timers import DeadlineScheduler
+
+    now = datetime.now(UTC)
+    data = AutomationPauseData()
+    armed: list[tuple[object, MagicMock]] = []
+
+    def track_time(_hass: object, callback: object, _when: datetime) -> MagicMock:
+        unsub = MagicMock()
+        armed.append((callback, unsub))
+        return unsub
+
+    scheduler = DeadlineScheduler(MagicMock(), data)
+    fired: list[str] = []
+    cancel_first = scheduler.schedule(
+        now + timedelta(minutes=5), lambda: fired.append("first"), track_point_in_time=track_time
+    )
+    scheduler.schedule(now + timedelta(minutes=15), lambda: fired.append("second"), track_point_in_time=track_time)
+
+    cancel_first()
+    cancel_first()
+    assert scheduler.pending == 1
+
+    # The stale arm for the cancelled head fires and only the live deadline runs once due.
+    armed[0][0](now + timedelta(minutes=5))
+    assert fired == []
+    assert scheduler.armed_at == now + timedelta(minutes=15)
+
+    scheduler.shutdown()
+    armed[-1][1].assert_called_once()
+    assert scheduler.pending == 0
+    assert scheduler.armed_at is None
+
+
+def test_deadline_scheduler_parks_far_deadlines_until_refill_tick() -> None:
+    """Deadlines beyond the arming horizon are parked and promoted by a refill tick."""
+    from custom_components.autosnooze.runtime.state import AutomationPauseData
+    from custom_components.autosnooze.runtime.timers import DeadlineScheduler
+
+    now = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    data = AutomationPauseData(timer_arming_horizon=timedelta(hours=6))
+    armed: list[tuple[object, datetime]] = []
+
+    def track_time(_hass: object, callback: object, when: datetime) -> MagicMock:
+        armed.append((callback, when))
+        return MagicMock()
+
+    scheduler = DeadlineScheduler(MagicMock(), data)
+    fired: list[str] = []
+    with patch("custom_components.autosnooze.runtime.timers.dt_util.utcnow", return_value=now):
+        scheduler.schedule(now + timedelta(days=30), lambda: fired.append("far"), track_point_in_time=track_time)
+        scheduler.schedule(now + timedelta(hours=8), lambda: fired.append("soon"), track_point_in_time=track_time)
+
+    # Nothing is inside the horizon yet, so only the refill tick is armed.
+    assert scheduler.parked == 2
+    assert [when for _cb, when in armed] == [now + timedelta(hours=6)]
+
+    armed[-1][0](now + timedelta(hours=6))
+
+    assert fired == []
+    assert scheduler.parked == 1
+    assert scheduler.armed_at == now + timedelta(hours=8)
+
+    armed[-1][0](now + timedelta(hours=8))
+
+    assert fired == ["soon"]
+    assert scheduler.pending == 1
+    assert scheduler.armed_at == now + timedelta(hours=12)
+
+
+def test_deadline_scheduler_compacts_cancelled_parked_deadlines() -> None:
+    """Cancelled parked deadlines are compacted before the refill tick once they outnumber live ones."""
+    from custom_components.autosnooze.runtime.state import AutomationPauseData
+    from custom_components.autosnooze.runtime.timers import DeadlineScheduler
+
+    now = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    data = AutomationPauseData(timer_arming_horizon=timedelta(hours=6))
+    scheduler = DeadlineScheduler(MagicMock(), data)
+    with patch("custom_components.autosnooze.runtime.timers.dt_util.utcnow", return_value=now):
+        cancels = [
+            scheduler.schedule(now + timedelta(days=1, minutes=i), lambda: None, track_point_in_time=MagicMock())
+            for i in range(200)
+        ]
+
+    for cancel in cancels[:150]:
+        cancel()
+
+    assert scheduler.parked == 50
+    assert scheduler.pending == 50
+    assert len(scheduler._parked) < 100
+
+
 def test_runtime_resume_timer_runs_callback_unless_unloaded() -> None:
     """Runtime resume timer fires the injected callback, and noops once unloaded."""
     from custom_components.autosnooze.runtime.state import AutomationPauseData
@@ -389,3 +537,87 @@ async def test_runtime_port_returns_false_when_state_change_service_fails() -> N
     result = await async_set_automation_state(hass, "automation.test", enabled=True)
 
     assert result is False
+
+
+def test_cohort_deadline_resumes_remaining_members_in_one_batch() -> None:
+    """A cohort deadline batches the members still in the cohort and drops empty cohorts."""
+    from custom_components.autosnooze.models import PausedAutomation
+    from custom_components.autosnooze.runtime.cohorts import form_cohort
+    from custom_components.autosnooze.runtime.state import AutomationPauseData
+    from custom_components.autosnooze.runtime.timers import cancel_timer, schedule_cohort_resume
+
+    now = datetime.now(UTC)
+    hass = MagicMock()
+    data = AutomationPauseData(expiry_coalesce_window=timedelta(0))
+    members = [
+        PausedAutomation(entity_id=entity_id, friendly_name=entity_id, resume_at=now, paused_at=now)
+        for entity_id in ("automation.a", "automation.b", "automation.c")
+    ]
+    for paused in members:
+        data.paused[paused.entity_id] = paused
+    armed: list[object] = []
+
+    def track_time(_hass: object, callback: object, _when: datetime) -> MagicMock:
+        armed.append(callback)
+        return MagicMock()
+
+    resume_batch = MagicMock()
+    cohort = form_cohort(data, members)
+    schedule_cohort_resume(
+        hass,
+        data,
+        cohort,
+        resume_callback=MagicMock(),
+        resume_batch_callback=resume_batch,
+        track_point_in_time=track_time,
+    )
+    cancel_timer(data, "automation.b")
+    assert data.paused["automation.b"].cohort_id is None
+    assert list(cohort.members) == ["automation.a", "automation.c"]
+
+    armed[0](now)
+    armed[-1](now)
+
+    resume_batch.assert_called_once_with(hass, data, ["automation.a", "automation.c"], reason="expired")
+    hass.async_create_task.assert_called_once()
+    assert data.cohort_timers == {}
+
+    cancel_timer(data, "automation.a")
+    cancel_timer(data, "automation.c")
+    assert data.cohorts == {}
+
+
+def test_stored_cohort_members_restore_with_their_cohort() -> None:
+    """Compact cohort members are filled from the stored cohort; unknown cohorts expire the entry."""
+    from custom_components.autosnooze.models import PausedAutomation
+    from custom_components.autosnooze.runtime.cohorts import form_cohort
+    from custom_components.autosnooze.runtime.restore import REJECT_MISSING_COHORT, parse_stored_data
+    from custom_components.autosnooze.runtime.state import AutomationPauseData
+
+    now = datetime(2030, 1, 1, 12, 0, tzinfo=UTC)
+    data = AutomationPauseData()
+    members = [
+        PausedAutomation(
+            entity_id=entity_id,
+            friendly_name=entity_id,
+            resume_at=now + timedelta(hours=1),
+            paused_at=now,
+            hours=1,
+        )
+        for entity_id in ("automation.a", "automation.b")
+    ]
+    for paused in members:
+        data.paused[paused.entity_id] = paused
+    cohort = form_cohort(data, members)
+    stored = data.get_storage_snapshot()
+    stored["paused"]["automation.orphan"] = {"n": "Orphan", "c": "missing"}
+
+    parsed = parse_stored_data(stored)
+
+    assert parsed.paused["automation.a"] == data.paused["automation.a"]
+    assert parsed.paused["automation.b"].cohort_id == cohort.cohort_id
+    assert list(parsed.cohorts) == [cohort.cohort_id]
+    assert parsed.cohorts[cohort.cohort_id] == cohort
+    assert list(parsed.cohorts[cohort.cohort_id].members) == ["automation.a", "automation.b"]
+    assert parsed.rejections == {REJECT_MISSING_COHORT: 1}
+    assert parsed.unreadable_paused == ["automation.orphan"]
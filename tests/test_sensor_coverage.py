@@ -10,10 +10,18 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from custom_components.autosnooze.const import DOMAIN, SIGNAL_STATE_CHANGED, VERSION
+from custom_components.autosnooze.const import (
+    DOMAIN,
+    OPTION_SENSOR_ATTRIBUTES,
+    SENSOR_ATTRIBUTES_COMPACT,
+    SENSOR_ATTRIBUTES_FULL,
+    SIGNAL_STATE_CHANGED,
+    VERSION,
+)
 from custom_components.autosnooze.models import (
     PausedAutomation,
     ScheduledSnooze,
+    SnoozeCohort,
 )
 from custom_components.autosnooze.runtime.state import AutomationPauseData
 from custom_components.autosnooze.sensor import AutoSnoozeCountSensor
@@ -122,6 +130,86 @@ class TestAutoSnoozeCountSensor:
         assert attrs["paused"]["automation.test1"]["friendly_name"] == "Test 1"
         assert attrs["scheduled"]["automation.test2"]["friendly_name"] == "Test 2"
 
+    def test_cohort_member_rows_leave_shared_fields_to_the_cohort(
+        self, sensor: AutoSnoozeCountSensor, data: AutomationPauseData
+    ) -> None:
+        """Member rows carry only cohort_id and per-entity fields; the cohort holds the deadline."""
+        now = datetime.now(UTC)
+        for entity_id in ("automation.a", "automation.b"):
+            data.paused[entity_id] = PausedAutomation(
+                entity_id=entity_id,
+                friendly_name=entity_id,
+                resume_at=now + timedelta(hours=1),
+                paused_at=now,
+                hours=1,
+                cohort_id="c1",
+            )
+        data.cohorts["c1"] = SnoozeCohort.from_member("c1", data.paused["automation.a"])
+        data.cohorts["c1"].members.update(dict.fromkeys(data.paused))
+
+        attrs = sensor.extra_state_attributes
+        assert attrs["paused"]["automation.a"] == {
+            "friendly_name": "automation.a",
+            "resume_retries": 0,
+            "cohort_id": "c1",
+        }
+        assert attrs["cohorts"]["c1"]["resume_at"] == (now + timedelta(hours=1)).isoformat()
+        assert attrs["cohorts"]["c1"]["entity_ids"] == ["automation.a", "automation.b"]
+
+    def test_extra_state_attributes_summary(self, sensor: AutoSnoozeCountSensor, data: AutomationPauseData) -> None:
+        """Both attribute modes carry the counts, next deadlines and generation."""
+        now = datetime.now(UTC).replace(microsecond=0)
+        data.paused["automation.test1"] = PausedAutomation(
+            entity_id="automation.test1",
+            friendly_name="Test 1",
+            resume_at=now + timedelta(hours=1),
+            paused_at=now,
+        )
+        data.scheduled["automation.test2"] = ScheduledSnooze(
+            entity_id="automation.test2",
+            friendly_name="Test 2",
+            disable_at=now + timedelta(hours=2),
+            resume_at=now + timedelta(hours=3),
+        )
+        data.generation = 7
+
+        for mode in (SENSOR_ATTRIBUTES_FULL, SENSOR_ATTRIBUTES_COMPACT):
+            sensor._entry.options = {OPTION_SENSOR_ATTRIBUTES: mode}
+            attrs = sensor.extra_state_attributes
+            assert attrs["paused_count"] == 1
+            assert attrs["scheduled_count"] == 1
+            assert attrs["next_resume"] == (now + timedelta(hours=1)).isoformat()
+            assert attrs["next_disable"] == (now + timedelta(hours=2)).isoformat()
+            assert attrs["generation"] == 7
+
+        assert not {"paused", "scheduled", "cohorts"} & set(attrs)
+        assert {"paused", "scheduled", "cohorts"} <= sensor._unrecorded_attributes
+
+    def test_attribute_budget_warns_once_while_exceeded(
+        self, sensor: AutoSnoozeCountSensor, data: AutomationPauseData, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Full attributes over the budget log one warning until they shrink again."""
+        now = datetime.now(UTC)
+        data.paused["automation.test1"] = PausedAutomation(
+            entity_id="automation.test1",
+            friendly_name="Test 1",
+            resume_at=now + timedelta(hours=1),
+            paused_at=now,
+        )
+
+        data_entry = data.paused["automation.test1"]
+        with patch("custom_components.autosnooze.sensor.SENSOR_ATTRIBUTE_BUDGET", 100):
+            assert sensor.extra_state_attributes["paused_count"] == 1
+            assert sensor.extra_state_attributes["paused_count"] == 1
+            assert caplog.text.count("over the 100 byte budget") == 1
+
+            data.paused.clear()
+            with patch("custom_components.autosnooze.sensor.SENSOR_ATTRIBUTE_BUDGET", 100000):
+                assert sensor.extra_state_attributes["paused_count"] == 0
+            data.paused["automation.test1"] = data_entry
+            assert sensor.extra_state_attributes["paused_count"] == 1
+            assert caplog.text.count("over the 100 byte budget") == 2
+
     @pytest.mark.asyncio
     async def test_async_added_to_hass_registers_listener(
         self, sensor: AutoSnoozeCountSensor, data: AutomationPauseData
@@ -18,11 +18,11 @@ if TYPE_CHECKING:
 import pytest
 
 from custom_components.autosnooze.application.pause import (
-    _contains_guardrail_term,
     _is_critical_automation,
     get_automations_by_area,
     get_automations_by_label,
 )
+from tests.helpers.automation_ports import BULK_PORT, automation_service, bulk_port, bulk_result
 
 UTC = timezone.utc
 
@@ -265,7 +265,7 @@ class TestAsyncPauseAutomations:
 
         mock_hass = MagicMock()
         mock_hass.states.get.return_value = MagicMock(attributes={"friendly_name": "Test"})
-        mock_hass.services.async_call = AsyncMock()
+        mock_hass.services.async_call = automation_service(mock_hass)
 
         mock_store = MagicMock()
         mock_store.async_save = AsyncMock()
@@ -331,7 +331,7 @@ class TestAsyncPauseAutomations:
 
         mock_hass = MagicMock()
         mock_hass.states.get.return_value = MagicMock(attributes={"friendly_name": "Test"})
-        mock_hass.services.async_call = AsyncMock()
+        mock_hass.services.async_call = automation_service(mock_hass)
 
         mock_store = MagicMock()
         mock_store.async_save = AsyncMock()
@@ -386,10 +386,7 @@ class TestAsyncPauseAutomations:
             return True
 
         with (
-            patch(
-                "custom_components.autosnooze.application.pause.async_set_automation_state",
-                side_effect=record_state_change,
-            ),
+            patch(BULK_PORT, bulk_port(record_state_change)),
             patch("custom_components.autosnooze.application.pause.schedule_disable"),
         ):
             await async_pause_automations(
@@ -437,7 +434,7 @@ class TestAsyncPauseAutomations:
             return False
 
         with (
-            patch("custom_components.autosnooze.application.pause.async_set_automation_state", side_effect=fail_wake),
+            patch(BULK_PORT, bulk_port(fail_wake)),
             patch("custom_components.autosnooze.application.pause.schedule_disable") as schedule_disable,
         ):
             await async_pause_automations(
@@ -464,10 +461,12 @@ class TestAsyncPauseAutomations:
         mock_hass = MagicMock()
 
         # First automation doesn't exist (state is None), second one does
+        test2_state = MagicMock(attributes={"friendly_name": "Test 2"})
+
         def get_state(entity_id):
             if entity_id == "automation.test1":
                 return None  # Doesn't exist
-            return MagicMock(attributes={"friendly_name": "Test 2"})
+            return test2_state
 
         mock_hass.states.get.side_effect = get_state
 
@@ -476,7 +475,7 @@ class TestAsyncPauseAutomations:
             if data.get("entity_id") == "automation.test1":
                 raise Exception("Failed")
 
-        mock_hass.services.async_call = AsyncMock()
+        mock_hass.services.async_call = automation_service(mock_hass)
 
         mock_store = MagicMock()
         mock_store.async_save = AsyncMock()
@@ -540,9 +539,7 @@ class TestAsyncPauseAutomations:
             await allow_service_finish.wait()
             return True
 
-        with patch(
-            "custom_components.autosnooze.application.pause.async_set_automation_state", side_effect=slow_turn_off
-        ):
+        with patch(BULK_PORT, bulk_port(slow_turn_off)):
             pause_task = asyncio.create_task(async_pause_automations(mock_hass, data, ["automation.test"], hours=1))
 
             await asyncio.wait_for(service_started.wait(), timeout=1)
@@ -579,11 +576,7 @@ class TestAsyncPauseAutomations:
             return True
 
         with (
-            patch(
-                "custom_components.autosnooze.application.pause.async_set_automation_state",
-                new_callable=AsyncMock,
-                return_value=True,
-            ),
+            patch(BULK_PORT, bulk_result(True)),
             patch("custom_components.autosnooze.application.pause.schedule_resume"),
             patch("custom_components.autosnooze.application.pause.runtime_async_save", side_effect=slow_save),
         ):
@@ -719,24 +712,6 @@ class TestAdjustLocking:
         assert lock_held_during_pre_resume == [False]
 
 
-class TestContainsGuardrailTerm:
-    """Tests for _contains_guardrail_term function."""
-
-    def test_case_insensitive(self) -> None:
-        """Matching should be case-insensitive."""
-        assert _contains_guardrail_term("ALARM_PANEL", "alarm") is True
-        assert _contains_guardrail_term("Smoke Detector", "smoke") is True
-
-    def test_no_substring_match(self) -> None:
-        """Term embedded in a larger word should NOT match."""
-        assert _contains_guardrail_term("fireplace_toggle", "fire") is False
-        assert _contains_guardrail_term("madagascar_lights", "gas") is False
-
-    def test_multi_word_term(self) -> None:
-        """Multi-word terms like 'carbon monoxide' should match."""
-        assert _contains_guardrail_term("carbon monoxide detector", "carbon monoxide") is True
-
-
 class TestIsCriticalAutomation:
     """Tests for _is_critical_automation function."""
 
@@ -757,6 +732,20 @@ class TestIsCriticalAutomation:
         assert _is_critical_automation("automation.fireplace_toggle", "Fireplace Toggle") is False
         assert _is_critical_automation("automation.madagascar_scene", "Madagascar Scene") is False
 
+    def test_case_insensitive(self) -> None:
+        """Matching should be case-insensitive."""
+        assert _is_critical_automation("automation.ALARM_PANEL", "Panel") is True
+        assert _is_critical_automation("automation.hallway", "Smoke Detector") is True
+
+    def test_no_substring_match_for_short_terms(self) -> None:
+        """Terms embedded in a larger word should NOT match."""
+        assert _is_critical_automation("automation.gaslight_scene", "Gaslight Scene") is False
+        assert _is_critical_automation("automation.blocked_timer", "Blocked Timer") is False
+
+    def test_multi_word_term(self) -> None:
+        """Multi-word terms like 'carbon monoxide' should match."""
+        assert _is_critical_automation("automation.hallway", "Carbon Monoxide Detector") is True
+
     def test_co_false_positive_not_in_terms(self) -> None:
         """'co' as standalone term should not be in CRITICAL_AUTOMATION_TERMS.
 
@@ -783,9 +772,7 @@ class TestUnloadGuards:
         data = AutomationPauseData(store=mock_store)
         data.unloaded = True
 
-        with patch(
-            "custom_components.autosnooze.application.pause.async_set_automation_state", new_callable=AsyncMock
-        ) as set_state:
+        with patch(BULK_PORT, bulk_result(True)) as set_state:
             await async_pause_automations(
                 mock_hass,
                 data,
@@ -806,7 +793,7 @@ class TestUnloadGuards:
 
         mock_hass = MagicMock()
         handlers: dict[str, object] = {}
-        mock_hass.services.async_register = lambda _domain, name, handler, schema=None: handlers.setdefault(
+        mock_hass.services.async_register = lambda _domain, name, handler, schema=None, **_kwargs: handlers.setdefault(
             name, handler
         )
 
@@ -837,7 +824,7 @@ class TestUnloadGuards:
 
         mock_hass = MagicMock()
         handlers: dict[str, object] = {}
-        mock_hass.services.async_register = lambda _domain, name, handler, schema=None: handlers.setdefault(
+        mock_hass.services.async_register = lambda _domain, name, handler, schema=None, **_kwargs: handlers.setdefault(
             name, handler
         )
 
@@ -875,7 +862,7 @@ class TestServiceHandlerContracts:
 
         mock_hass = MagicMock()
         handlers: dict[str, object] = {}
-        mock_hass.services.async_register = lambda _domain, name, handler, schema=None: handlers.setdefault(
+        mock_hass.services.async_register = lambda _domain, name, handler, schema=None, **_kwargs: handlers.setdefault(
             name, handler
         )
         data = AutomationPauseData(store=MagicMock())
@@ -891,6 +878,7 @@ class TestServiceHandlerContracts:
         disable_at = datetime(2030, 1, 1, 10, 0, tzinfo=UTC)
         resume_at = datetime(2030, 1, 1, 12, 0, tzinfo=UTC)
         call = MagicMock()
+        call.return_response = False
         call.data = {
             ATTR_ENTITY_ID: ["automation.a", "automation.b"],
             "days": 1,
@@ -914,6 +902,7 @@ class TestServiceHandlerContracts:
             mock_hass,
             ["automation.a", "automation.b"],
             confirm=True,
+            cache=data.guardrail_cache,
         )
         pause_automations.assert_called_once_with(
             mock_hass,
@@ -938,6 +927,7 @@ class TestServiceHandlerContracts:
         disable_at = datetime(2030, 1, 1, 10, 0, tzinfo=UTC)
         resume_at = datetime(2030, 1, 1, 12, 0, tzinfo=UTC)
         call = MagicMock()
+        call.return_response = False
         call.data = {
             ATTR_ENTITY_ID: ["automation.a"],
             "days": 1,
@@ -957,7 +947,9 @@ class TestServiceHandlerContracts:
         ):
             await pause_handler(call)
 
-        validate_guardrails.assert_called_once_with(mock_hass, ["automation.a"], confirm=False)
+        validate_guardrails.assert_called_once_with(
+            mock_hass, ["automation.a"], confirm=False, cache=data.guardrail_cache
+        )
         pause_automations.assert_called_once_with(
             mock_hass,
             data,
@@ -979,6 +971,7 @@ class TestServiceHandlerContracts:
         pause_by_area_handler = handlers["pause_by_area"]
 
         call = MagicMock()
+        call.return_response = False
         call.data = {
             "area_id": "living_room",
             "hours": 1,
@@ -1133,11 +1126,7 @@ class TestSaveFailurePropagation:
         data = AutomationPauseData(store=MagicMock())
 
         with (
-            patch(
-                "custom_components.autosnooze.application.pause.async_set_automation_state",
-                new_callable=AsyncMock,
-                return_value=True,
-            ),
+            patch(BULK_PORT, bulk_result(True)),
             patch("custom_components.autosnooze.application.pause.schedule_resume"),
             patch(
                 "custom_components.autosnooze.application.pause.runtime_async_save",
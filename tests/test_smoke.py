@@ -22,6 +22,8 @@ from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.autosnooze.const import DOMAIN
+from custom_components.autosnooze.diagnostics import async_get_config_entry_diagnostics
+from custom_components.autosnooze.models import to_epoch
 
 SERVICES = {
     "adjust",
@@ -29,8 +31,12 @@ SERVICES = {
     "cancel_all",
     "cancel_scheduled",
     "clear_notification",
+    "get_resume_presets",
+    "get_snoozes",
     "pause",
     "pause_by_area",
+    "pause_by_device",
+    "pause_by_floor",
     "pause_by_label",
     "report_telemetry",
 }
@@ -235,9 +241,10 @@ async def test_pause_service_changes_state_and_schedules_resume(smoke_hass) -> N
         "automation.kitchen",
         paused.resume_at,
         resume_callback=ANY,
+        resume_batch_callback=ANY,
     )
     turn_off.assert_awaited_once()
-    assert turn_off.await_args.args[0].data == {ATTR_ENTITY_ID: "automation.kitchen"}
+    assert turn_off.await_args.args[0].data == {ATTR_ENTITY_ID: ["automation.kitchen"]}
     turn_on.assert_not_awaited()
     assert hass.states.get("automation.kitchen").state == "off"
     sensor_state = hass.states.get("sensor.autosnooze_snoozed_automations")
@@ -246,14 +253,55 @@ async def test_pause_service_changes_state_and_schedules_resume(smoke_hass) -> N
     assert sensor_state.attributes["scheduled"] == {}
     save.assert_awaited_once()
     saved = save.await_args.args[0]
-    assert set(saved) == {"paused", "scheduled"}
+    assert set(saved) == {"paused", "scheduled", "cohorts"}
     assert saved["scheduled"] == {}
     assert set(saved["paused"]) == {"automation.kitchen"}
     saved_pause = saved["paused"]["automation.kitchen"]
-    assert saved_pause["friendly_name"] == "Kitchen"
-    assert saved_pause["resume_at"] == paused.resume_at.isoformat()
-    assert saved_pause["paused_at"] == paused.paused_at.isoformat()
-    assert (saved_pause["days"], saved_pause["hours"], saved_pause["minutes"]) == (0, 0, 5)
+    assert saved_pause["n"] == "Kitchen"
+    assert saved_pause["r"] == to_epoch(paused.resume_at)
+    assert saved_pause["p"] == to_epoch(paused.paused_at)
+    assert (saved_pause.get("D", 0), saved_pause.get("H", 0), saved_pause.get("M", 0)) == (0, 0, 5)
+
+
+@pytest.mark.parametrize(
+    ("strict", "turned_off", "skipped"),
+    [(False, ["automation.kitchen"], 1), (True, ["automation.kitchen", "automation.porch"], 0)],
+    ids=["default", "strict"],
+)
+async def test_diagnostics_report_service_calls_skipped_per_strict_option(
+    smoke_hass, strict: bool, turned_off: list[str], skipped: int
+) -> None:
+    """The strict option forces calls for already-off automations, and diagnostics count the skips."""
+    hass, turn_off, _ = smoke_hass
+    entry = MockConfigEntry(
+        domain=DOMAIN, title="AutoSnooze", data={}, unique_id=DOMAIN, options={"strict_service_calls": strict}
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    mock_storage(entry)
+    hass.states.async_set("automation.kitchen", "on", {"friendly_name": "Kitchen"})
+    hass.states.async_set("automation.porch", "off", {"friendly_name": "Porch"})
+
+    with patch(
+        "custom_components.autosnooze.application.pause.schedule_resume", side_effect=fake_resume_scheduler(MagicMock())
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            "pause",
+            {ATTR_ENTITY_ID: ["automation.kitchen", "automation.porch"], "minutes": 5},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+
+    assert turn_off.await_args.args[0].data == {ATTR_ENTITY_ID: turned_off}
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["options"] == {"strict_service_calls": strict}
+    assert diagnostics["summary"]["paused_count"] == 2
+    assert diagnostics["service_calls"] == {"strict": strict, "requested": 2, "skipped": skipped}
+    saves = diagnostics["saves"]
+    assert saves["physical_writes"] >= 1
+    assert saves["requested"] == saves["coalesced"] + saves["physical_writes"]
 
 
 async def test_invalid_pause_fails_without_mutating_runtime(smoke_hass) -> None:
@@ -319,13 +367,13 @@ async def test_cancel_resumes_automation_and_cleans_runtime(smoke_hass) -> None:
     timer_unsub.assert_called_once()
     turn_off.assert_awaited_once()
     turn_on.assert_awaited_once()
-    assert turn_on.await_args.args[0].data == {ATTR_ENTITY_ID: "automation.kitchen"}
+    assert turn_on.await_args.args[0].data == {ATTR_ENTITY_ID: ["automation.kitchen"]}
     assert hass.states.get("automation.kitchen").state == "on"
     sensor = hass.states.get("sensor.autosnooze_snoozed_automations")
     assert sensor.state == "0"
     assert sensor.attributes["paused"] == {}
     assert sensor.attributes["scheduled"] == {}
-    save.assert_awaited_once_with({"paused": {}, "scheduled": {}})
+    save.assert_awaited_once_with({"paused": {}, "scheduled": {}, "cohorts": {}})
 
 
 async def test_future_snooze_can_be_scheduled_and_canceled(smoke_hass) -> None:
@@ -335,7 +383,7 @@ async def test_future_snooze_can_be_scheduled_and_canceled(smoke_hass) -> None:
     save = mock_storage(entry)
     hass.states.async_set("automation.kitchen", "on", {"friendly_name": "Kitchen"})
     timer_unsub = MagicMock()
-    disable_at = dt_util.utcnow() + timedelta(minutes=10)
+    disable_at = dt_util.utcnow().replace(microsecond=0) + timedelta(minutes=10)
     resume_at = disable_at + timedelta(minutes=20)
 
     with patch(
@@ -364,6 +412,7 @@ async def test_future_snooze_can_be_scheduled_and_canceled(smoke_hass) -> None:
         "automation.kitchen",
         scheduled,
         disable_callback=ANY,
+        disable_batch_callback=ANY,
     )
     turn_off.assert_not_awaited()
     turn_on.assert_not_awaited()
@@ -377,9 +426,9 @@ async def test_future_snooze_can_be_scheduled_and_canceled(smoke_hass) -> None:
     assert saved["paused"] == {}
     assert set(saved["scheduled"]) == {"automation.kitchen"}
     saved_schedule = saved["scheduled"]["automation.kitchen"]
-    assert saved_schedule["friendly_name"] == "Kitchen"
-    assert saved_schedule["disable_at"] == disable_at.isoformat()
-    assert saved_schedule["resume_at"] == resume_at.isoformat()
+    assert saved_schedule["n"] == "Kitchen"
+    assert saved_schedule["d"] == int(disable_at.timestamp())
+    assert saved_schedule["r"] == int(resume_at.timestamp())
 
     save.reset_mock()
     await hass.services.async_call(
@@ -393,12 +442,80 @@ async def test_future_snooze_can_be_scheduled_and_canceled(smoke_hass) -> None:
     assert entry.runtime_data.scheduled_timers == {}
     timer_unsub.assert_called_once()
     assert hass.states.get("sensor.autosnooze_snoozed_automations").attributes["scheduled"] == {}
-    save.assert_awaited_once_with({"paused": {}, "scheduled": {}})
+    save.assert_awaited_once_with({"paused": {}, "scheduled": {}, "cohorts": {}})
+
+
+async def test_get_snoozes_returns_entries_with_sensor_generation(smoke_hass) -> None:
+    """get_snoozes returns the entries the compact sensor attributes summarize."""
+    hass, _turn_off, _turn_on = smoke_hass
+    entry = await setup_entry(hass)
+    hass.config_entries.async_update_entry(entry, options={"sensor_attributes": "compact"})
+    await hass.async_block_till_done()
+    mock_storage(entry)
+    hass.states.async_set("automation.kitchen", "on", {"friendly_name": "Kitchen"})
+
+    with patch(
+        "custom_components.autosnooze.application.pause.schedule_resume",
+        side_effect=fake_resume_scheduler(MagicMock()),
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            "pause",
+            {ATTR_ENTITY_ID: ["automation.kitchen"], "minutes": 5},
+            blocking=True,
+        )
+    response = await hass.services.async_call(DOMAIN, "get_snoozes", {}, blocking=True, return_response=True)
+
+    attributes = hass.states.get("sensor.autosnooze_snoozed_automations").attributes
+    assert "paused" not in attributes
+    assert attributes["paused_count"] == 1
+    assert attributes["next_resume"] == response["paused"]["automation.kitchen"]["resume_at"]
+    assert response["generation"] == attributes["generation"]
+    assert set(response["paused"]) == {"automation.kitchen"}
+    assert response["scheduled"] == {}
+
+
+async def test_repause_returns_extended_fields_when_response_requested(smoke_hass) -> None:
+    """A re-pause reports the fields it changed per automation, and the response is optional."""
+    hass, _, _ = smoke_hass
+    entry = await setup_entry(hass)
+    mock_storage(entry)
+    hass.states.async_set("automation.kitchen", "on", {"friendly_name": "Kitchen"})
+
+    with patch(
+        "custom_components.autosnooze.application.pause.schedule_resume",
+        side_effect=fake_resume_scheduler(MagicMock()),
+    ):
+        first = await hass.services.async_call(
+            DOMAIN,
+            "pause",
+            {ATTR_ENTITY_ID: ["automation.kitchen"], "minutes": 5},
+            blocking=True,
+            return_response=True,
+        )
+        extended = await hass.services.async_call(
+            DOMAIN,
+            "pause",
+            {ATTR_ENTITY_ID: ["automation.kitchen"], "hours": 1},
+            blocking=True,
+            return_response=True,
+        )
+        silent = await hass.services.async_call(
+            DOMAIN,
+            "pause",
+            {ATTR_ENTITY_ID: ["automation.kitchen"], "hours": 2},
+            blocking=True,
+        )
+
+    assert first == {"extended": {}}
+    assert extended == {"extended": {"automation.kitchen": ["resume_at", "hours", "minutes"]}}
+    assert silent is None
+    assert entry.runtime_data.paused["automation.kitchen"].hours == 2
 
 
 async def test_setup_recovers_active_storage_and_discards_expired(smoke_hass) -> None:
     """Setup restores only active persisted work and schedules it exactly once."""
-    now = dt_util.utcnow()
+    now = dt_util.utcnow().replace(microsecond=0)
     stored = {
         "paused": {
             "automation.active": {
@@ -429,8 +546,8 @@ async def test_setup_recovers_active_storage_and_discards_expired(smoke_hass) ->
     save = AsyncMock()
 
     with (
-        patch("custom_components.autosnooze.Store.async_load", load),
-        patch("custom_components.autosnooze.Store.async_save", save),
+        patch("custom_components.autosnooze.infrastructure.storage.Store.async_load", load),
+        patch("custom_components.autosnooze.infrastructure.storage.Store.async_save", save),
         patch(
             "custom_components.autosnooze.runtime.ports.async_track_point_in_time", side_effect=timer_unsubs
         ) as track,
@@ -449,12 +566,15 @@ async def test_setup_recovers_active_storage_and_discards_expired(smoke_hass) ->
         now + timedelta(minutes=30),
         now + timedelta(minutes=10),
     ]
-    assert entry.runtime_data.timers == {"automation.active": timer_unsubs[0]}
-    assert entry.runtime_data.scheduled_timers == {"automation.future": timer_unsubs[1]}
+    # One shared HA timer: the earlier scheduled disable supersedes the resume deadline.
+    timer_unsubs[0].assert_called_once()
+    timer_unsubs[1].assert_not_called()
+    assert entry.runtime_data.deadline_scheduler.armed_at == now + timedelta(minutes=10)
+    assert entry.runtime_data.deadline_scheduler.pending == 2
     turn_on.assert_awaited_once()
-    assert turn_on.await_args.args[0].data == {ATTR_ENTITY_ID: "automation.expired"}
-    turn_off.assert_awaited_once()
-    assert turn_off.await_args.args[0].data == {ATTR_ENTITY_ID: "automation.active"}
+    assert turn_on.await_args.args[0].data == {ATTR_ENTITY_ID: ["automation.expired"]}
+    # automation.active is already off, so restoring its pause makes no service call.
+    turn_off.assert_not_awaited()
     assert hass.states.get("automation.active").state == "off"
     assert hass.states.get("automation.expired").state == "on"
     assert hass.states.get("automation.future").state == "on"
@@ -467,12 +587,12 @@ async def test_setup_recovers_active_storage_and_discards_expired(smoke_hass) ->
         call.args[0] for call in save.await_args_list if isinstance(call.args[0], dict) and "paused" in call.args[0]
     )
     assert set(saved["paused"]) == {"automation.active"}
-    assert saved["paused"]["automation.active"]["friendly_name"] == "Active"
-    assert saved["paused"]["automation.active"]["resume_at"] == (now + timedelta(minutes=30)).isoformat()
+    assert saved["paused"]["automation.active"]["n"] == "Active"
+    assert saved["paused"]["automation.active"]["r"] == int((now + timedelta(minutes=30)).timestamp())
     assert set(saved["scheduled"]) == {"automation.future"}
-    assert saved["scheduled"]["automation.future"]["friendly_name"] == "Future"
-    assert saved["scheduled"]["automation.future"]["disable_at"] == (now + timedelta(minutes=10)).isoformat()
-    assert saved["scheduled"]["automation.future"]["resume_at"] == (now + timedelta(minutes=40)).isoformat()
+    assert saved["scheduled"]["automation.future"]["n"] == "Future"
+    assert saved["scheduled"]["automation.future"]["d"] == int((now + timedelta(minutes=10)).timestamp())
+    assert saved["scheduled"]["automation.future"]["r"] == int((now + timedelta(minutes=40)).timestamp())
 
 
 async def test_unload_reload_cleans_up_without_duplicates(smoke_hass) -> None:
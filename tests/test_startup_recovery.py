@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 
@@ -9,6 +10,7 @@ import pytest
 
 from custom_components.autosnooze import async_load_stored
 from custom_components.autosnooze.runtime.state import AutomationPauseData
+from tests.helpers.automation_ports import BULK_PORT, bulk_port, bulk_result
 
 UTC = timezone.utc
 
@@ -69,10 +71,7 @@ async def test_startup_recovery_restores_future_entries_and_skips_expired() -> N
         pytest.MonkeyPatch.context() as mp,
     ):
         mp.setattr("custom_components.autosnooze.runtime.ports.async_track_point_in_time", fake_track)
-        mp.setattr(
-            "custom_components.autosnooze.runtime.ports.async_set_automation_state",
-            AsyncMock(return_value=True),
-        )
+        mp.setattr(BULK_PORT, bulk_result(True))
         await async_load_stored(hass, data)
 
     assert "automation.future_paused" in data.paused
@@ -86,7 +85,7 @@ async def test_startup_recovery_restores_future_entries_and_skips_expired() -> N
 
 @pytest.mark.asyncio
 async def test_startup_recovery_replay_reregistration_is_idempotent() -> None:
-    now = datetime.now(UTC)
+    now = datetime.now(UTC).replace(microsecond=0)
     data = AutomationPauseData()
     data.store = MagicMock()
     data.store.async_load = AsyncMock(return_value=_stored_payload(now))
@@ -105,19 +104,21 @@ async def test_startup_recovery_replay_reregistration_is_idempotent() -> None:
         pytest.MonkeyPatch.context() as mp,
     ):
         mp.setattr("custom_components.autosnooze.runtime.ports.async_track_point_in_time", fake_track)
-        mp.setattr(
-            "custom_components.autosnooze.runtime.ports.async_set_automation_state",
-            AsyncMock(return_value=True),
-        )
+        mp.setattr(BULK_PORT, bulk_result(True))
         await async_load_stored(hass, data)
         await async_load_stored(hass, data)
 
-    # Exactly one active timer per entity after replay.
+    # Exactly one pending deadline per entity after replay.
     assert len(data.timers) == 1
     assert len(data.scheduled_timers) == 1
-    # First generation timers should have been cancelled on re-register.
+    assert data.deadline_scheduler is not None
+    assert data.deadline_scheduler.pending == 2
+    # Replay re-uses the one armed HA timer instead of re-arming per entity:
+    # the first arm (resume) was superseded by the earlier scheduled disable.
+    assert len(created_unsubs) == 2
     created_unsubs[0].assert_called_once()
-    created_unsubs[1].assert_called_once()
+    created_unsubs[1].assert_not_called()
+    assert data.deadline_scheduler.armed_at == now + timedelta(minutes=30)
 
 
 @pytest.mark.asyncio
@@ -152,10 +153,170 @@ async def test_startup_recovery_retains_entries_when_backend_state_changes_fail(
         return entity_id == "automation.restored_pause"
 
     with pytest.MonkeyPatch.context() as mp:
-        mp.setattr("custom_components.autosnooze.runtime.ports.async_set_automation_state", set_state)
+        mp.setattr(BULK_PORT, bulk_port(set_state))
         mp.setattr("custom_components.autosnooze.runtime.ports.schedule_resume", MagicMock())
         await async_load_stored(hass, data)
 
     assert set(data.paused) == {"automation.failed_pause", "automation.restored_pause"}
     assert set(data.scheduled) == {"automation.failed_schedule"}
     data.store.async_save.assert_not_awaited()
+
+
+def _live_payload(now: datetime, count: int) -> dict:
+    return {
+        "paused": {
+            f"automation.pause_{index}": {
+                "resume_at": (now + timedelta(hours=1)).isoformat(),
+                "paused_at": now.isoformat(),
+            }
+            for index in range(count)
+        },
+        "scheduled": {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_startup_recovery_disables_live_entries_in_one_bulk_call() -> None:
+    now = datetime.now(UTC)
+    data = AutomationPauseData(store=MagicMock(), state_change_concurrency=3)
+    data.store.async_load = AsyncMock(return_value=_live_payload(now, 10))
+    data.store.async_save = AsyncMock()
+    hass = _build_hass()
+
+    async def set_state(_hass: object, entity_id: str, *, enabled: bool) -> bool:
+        return entity_id != "automation.pause_4"
+
+    set_states = bulk_port(set_state)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(BULK_PORT, set_states)
+        mp.setattr("custom_components.autosnooze.runtime.ports.schedule_resume", MagicMock())
+        notification = MagicMock(return_value=True)
+        mp.setattr("custom_components.autosnooze.runtime.ports.schedule_pre_resume_notification", notification)
+        await async_load_stored(hass, data)
+
+    set_states.assert_awaited_once()
+    assert set_states.await_args.args[1] == [f"automation.pause_{index}" for index in range(10)]
+    assert set_states.await_args.kwargs == {"enabled": False, "stats": data.service_call_stats}
+    assert len(data.paused) == 10
+    notified = {call.args[2].entity_id for call in notification.call_args_list}
+    assert "automation.pause_4" not in notified
+    assert len(notified) == 9
+
+
+@pytest.mark.asyncio
+async def test_startup_recovery_runs_bulk_batches_concurrently_up_to_the_limit() -> None:
+    from custom_components.autosnooze.const import STATE_CHANGE_BATCH_SIZE
+
+    now = datetime.now(UTC)
+    count = STATE_CHANGE_BATCH_SIZE * 2 + 5
+    data = AutomationPauseData(store=MagicMock(), state_change_concurrency=2)
+    data.store.async_load = AsyncMock(return_value=_live_payload(now, count))
+    data.store.async_save = AsyncMock()
+    hass = _build_hass()
+    in_flight = 0
+    peak = 0
+
+    async def set_states(
+        _hass: object, entity_ids: list[str], *, enabled: bool, stats: object = None
+    ) -> dict[str, bool]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return dict.fromkeys(entity_ids, True)
+
+    bulk = AsyncMock(side_effect=set_states)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(BULK_PORT, bulk)
+        mp.setattr("custom_components.autosnooze.runtime.ports.schedule_resume", MagicMock())
+        await async_load_stored(hass, data)
+
+    entity_ids = [f"automation.pause_{index}" for index in range(count)]
+    assert [call.args[1] for call in bulk.await_args_list] == [
+        entity_ids[:STATE_CHANGE_BATCH_SIZE],
+        entity_ids[STATE_CHANGE_BATCH_SIZE : STATE_CHANGE_BATCH_SIZE * 2],
+        entity_ids[STATE_CHANGE_BATCH_SIZE * 2 :],
+    ]
+    assert peak == 2
+    assert len(data.paused) == count
+
+
+@pytest.mark.asyncio
+async def test_preload_indexes_live_entries_before_reconciling() -> None:
+    from custom_components.autosnooze.runtime.restore import async_preload_stored
+
+    now = datetime.now(UTC)
+    data = AutomationPauseData(store=MagicMock())
+    data.store.async_load = AsyncMock(return_value=_stored_payload(now))
+    data.store.async_save = AsyncMock()
+    data.notify = MagicMock()
+    hass = _build_hass()
+    set_state = AsyncMock(return_value=True)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(BULK_PORT, bulk_port(set_state))
+        mp.setattr("custom_components.autosnooze.runtime.ports.schedule_resume", MagicMock())
+        schedule_disable = MagicMock()
+        mp.setattr("custom_components.autosnooze.runtime.ports.schedule_disable", schedule_disable)
+
+        await async_preload_stored(hass, data)
+
+        assert set(data.paused) == {"automation.future_paused"}
+        assert set(data.scheduled) == {"automation.future_scheduled"}
+        set_state.assert_not_awaited()
+        schedule_disable.assert_not_called()
+        data.notify.assert_called_once()
+
+        await async_load_stored(hass, data)
+
+    data.store.async_load.assert_awaited_once()
+    assert data.pending_restore is None
+    assert set(data.paused) == {"automation.future_paused"}
+    assert set(data.scheduled) == {"automation.future_scheduled"}
+    schedule_disable.assert_called_once()
+    assert {(call.args[1], call.kwargs["enabled"]) for call in set_state.await_args_list} == {
+        ("automation.future_paused", False),
+        ("automation.expired_paused", True),
+    }
+
+
+@pytest.mark.asyncio
+async def test_changes_made_between_restore_phases_win() -> None:
+    from custom_components.autosnooze.models import PausedAutomation
+    from custom_components.autosnooze.runtime.restore import async_preload_stored
+
+    now = datetime.now(UTC)
+    data = AutomationPauseData(store=MagicMock())
+    data.store.async_load = AsyncMock(return_value=_stored_payload(now))
+    data.store.async_save = AsyncMock()
+    hass = _build_hass()
+    set_state = AsyncMock(return_value=True)
+
+    await async_preload_stored(hass, data)
+    # The user cancels the preloaded pause and replaces the scheduled snooze with an immediate one.
+    del data.paused["automation.future_paused"]
+    del data.scheduled["automation.future_scheduled"]
+    replacement = PausedAutomation(
+        entity_id="automation.future_scheduled",
+        friendly_name="Future Scheduled",
+        resume_at=now + timedelta(minutes=5),
+        paused_at=now,
+    )
+    data.paused["automation.future_scheduled"] = replacement
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(BULK_PORT, bulk_port(set_state))
+        schedule_resume = MagicMock()
+        mp.setattr("custom_components.autosnooze.runtime.ports.schedule_resume", schedule_resume)
+        schedule_disable = MagicMock()
+        mp.setattr("custom_components.autosnooze.runtime.ports.schedule_disable", schedule_disable)
+        await async_load_stored(hass, data)
+
+    assert data.paused == {"automation.future_scheduled": replacement}
+    assert data.scheduled == {}
+    schedule_resume.assert_not_called()
+    schedule_disable.assert_not_called()
+    assert [(call.args[1], call.kwargs["enabled"]) for call in set_state.await_args_list] == [
+        ("automation.expired_paused", True)
+    ]
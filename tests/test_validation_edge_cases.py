@@ -11,6 +11,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from custom_components.autosnooze.runtime.restore import (
+    parse_stored_data,
     validate_stored_data,
     validate_stored_entry,
 )
@@ -217,6 +218,69 @@ class TestValidateStoredDataEdgeCases:
         assert "automation.invalid2" not in result["paused"]
 
 
+class TestParseStoredData:
+    """Tests for the single-pass validate-and-build restore pipeline."""
+
+    def test_builds_models_and_counts_rejections_by_reason(self) -> None:
+        """Valid entries become models; invalid ones are tallied per reason."""
+        now = datetime(2026, 1, 1, tzinfo=UTC)
+        parsed = parse_stored_data(
+            {
+                "paused": {
+                    "automation.valid": {
+                        "friendly_name": "Valid",
+                        "resume_at": (now + timedelta(hours=1)).isoformat(),
+                        "paused_at": now.isoformat(),
+                        "hours": 1,
+                    },
+                    "automation.compact": {"n": "Compact", "r": int(now.timestamp()) + 60, "p": int(now.timestamp())},
+                    "light.kitchen": {"resume_at": now.isoformat(), "paused_at": now.isoformat()},
+                    "automation.bad_time": {"resume_at": "not-a-datetime", "paused_at": now.isoformat()},
+                    "automation.missing": {"paused_at": now.isoformat()},
+                },
+                "scheduled": {
+                    "automation.reversed": {"disable_at": now.isoformat(), "resume_at": now.isoformat()},
+                },
+            }
+        )
+
+        assert parsed.paused["automation.valid"] == PausedAutomation(
+            entity_id="automation.valid",
+            friendly_name="Valid",
+            resume_at=now + timedelta(hours=1),
+            paused_at=now,
+            hours=1,
+        )
+        assert parsed.paused["automation.compact"].resume_at == now + timedelta(minutes=1)
+        assert parsed.scheduled == {}
+        assert parsed.rejections == {
+            "invalid_entity_id": 1,
+            "invalid_datetime": 1,
+            "missing_field": 1,
+            "schedule_order": 1,
+        }
+        assert parsed.unreadable_paused == []
+
+    def test_unreadable_disable_at_marks_pause_for_cleanup(self) -> None:
+        """A paused entry with a corrupt disable_at is expired instead of kept disabled."""
+        now = datetime(2026, 1, 1, tzinfo=UTC)
+        parsed = parse_stored_data(
+            {
+                "paused": {
+                    "automation.test": {
+                        "resume_at": (now + timedelta(hours=1)).isoformat(),
+                        "paused_at": now.isoformat(),
+                        "disable_at": "garbage",
+                    }
+                }
+            }
+        )
+
+        assert parsed.paused == {}
+        assert parsed.unreadable_paused == ["automation.test"]
+        assert parsed.rejections == {"invalid_datetime": 1}
+
+
 class TestParseDatetimeUtc:
     """Tests for parse_datetime_utc function."""
 
@@ -0,0 +1,253 @@
+"""Tests for the AutoSnooze websocket commands."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import label_registry as lr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.autosnooze.const import DOMAIN
+from custom_components.autosnooze.infrastructure.automation_catalog_cache import AutomationCatalogCache
+from custom_components.autosnooze.infrastructure.guardrail_cache import GuardrailCache, GuardrailFlags
+from custom_components.autosnooze.models import PausedAutomation, ScheduledSnooze
+from custom_components.autosnooze.runtime.cohorts import form_cohort
+from custom_components.autosnooze.runtime.state import AutomationPauseData
+from custom_components.autosnooze.websocket_api import websocket_catalog, websocket_snapshot, websocket_subscribe
+
+UTC = timezone.utc
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _paused(entity_id: str, hours: int = 1) -> PausedAutomation:
+    return PausedAutomation(
+        entity_id=entity_id,
+        friendly_name=entity_id,
+        resume_at=NOW + timedelta(hours=hours),
+        paused_at=NOW,
+    )
+
+
+def _loaded_data(hass: HomeAssistant) -> AutomationPauseData:
+    data = AutomationPauseData(hass=hass)
+    entry = MockConfigEntry(domain=DOMAIN, state=ConfigEntryState.LOADED)
+    entry.add_to_hass(hass)
+    entry.runtime_data = data
+    return data
+
+
+def _connection() -> MagicMock:
+    connection = MagicMock()
+    connection.subscriptions = {}
+    return connection
+
+
+def _events(connection: MagicMock) -> list[dict]:
+    return [call.args[0]["event"] for call in connection.send_message.call_args_list]
+
+
+async def test_snapshot_returns_entries_and_generation(hass: HomeAssistant) -> None:
+    data = _loaded_data(hass)
+    data.paused["automation.a"] = _paused("automation.a")
+    data.notify(["automation.a"])
+    connection = _connection()
+
+    websocket_snapshot(hass, connection, {"id": 1, "type": "autosnooze/snapshot"})
+
+    result = connection.send_result.call_args.args[1]
+    assert result["generation"] == 1
+    assert set(result["paused"]) == {"automation.a"}
+    assert result["scheduled"] == {}
+    assert result["cohorts"] == {}
+
+
+async def test_commands_report_when_integration_is_not_loaded(hass: HomeAssistant) -> None:
+    connection = _connection()
+
+    websocket_snapshot(hass, connection, {"id": 1, "type": "autosnooze/snapshot"})
+    websocket_subscribe(hass, connection, {"id": 2, "type": "autosnooze/subscribe"})
+
+    assert [call.args[0] for call in connection.send_error.call_args_list] == [1, 2]
+    assert connection.subscriptions == {}
+
+
+async def test_subscribe_streams_add_update_and_remove_deltas(hass: HomeAssistant) -> None:
+    data = _loaded_data(hass)
+    data.paused["automation.a"] = _paused("automation.a")
+    connection = _connection()
+
+    websocket_subscribe(hass, connection, {"id": 1, "type": "autosnooze/subscribe"})
+    connection.send_result.assert_called_once_with(1)
+
+    data.paused["automation.b"] = _paused("automation.b")
+    data.paused["automation.a"] = _paused("automation.a", hours=2)
+    data.notify(["automation.a", "automation.b"])
+    data.flush_notify()
+
+    del data.paused["automation.a"]
+    data.scheduled["automation.a"] = ScheduledSnooze(
+        entity_id="automation.a",
+        friendly_name="automation.a",
+        disable_at=NOW + timedelta(hours=1),
+        resume_at=NOW + timedelta(hours=2),
+    )
+    data.notify(["automation.a"])
+    data.flush_notify()
+
+    snapshot, first, second = _events(connection)
+    assert snapshot["type"] == "snapshot"
+    assert snapshot["generation"] == 0
+    assert set(snapshot["paused"]) == {"automation.a"}
+    assert snapshot["cohorts"] == {}
+
+    assert first["type"] == "delta"
+    assert first["generation"] == 1
+    assert set(first["paused"]["add"]) == {"automation.b"}
+    assert first["paused"]["update"]["automation.a"]["resume_at"] == (NOW + timedelta(hours=2)).isoformat()
+    assert first["paused"]["remove"] == []
+    assert first["scheduled"] == {"add": {}, "update": {}, "remove": []}
+    assert first["cohorts"] == {"add": {}, "update": {}, "remove": []}
+
+    assert second["generation"] == 2
+    assert second["paused"] == {"add": {}, "update": {}, "remove": ["automation.a"]}
+    assert set(second["scheduled"]["add"]) == {"automation.a"}
+
+    connection.subscriptions[1]()
+    data.notify(["automation.b"])
+    data.flush_notify()
+    assert len(_events(connection)) == 3
+
+
+async def test_subscribe_resyncs_on_unknown_changes_and_skipped_generations(hass: HomeAssistant) -> None:
+    data = _loaded_data(hass)
+    connection = _connection()
+    websocket_subscribe(hass, connection, {"id": 1, "type": "autosnooze/subscribe"})
+
+    data.paused["automation.a"] = _paused("automation.a")
+    data.notify()
+    data.flush_notify()
+
+    # A generation the subscriber never saw forces a fresh snapshot.
+    data.generation += 1
+    data.paused["automation.b"] = _paused("automation.b")
+    data.notify(["automation.b"])
+    data.flush_notify()
+
+    _initial, unknown, skipped = _events(connection)
+    assert unknown["type"] == "snapshot"
+    assert unknown["generation"] == 1
+    assert set(unknown["paused"]) == {"automation.a"}
+    assert skipped["type"] == "snapshot"
+    assert skipped["generation"] == 3
+    assert set(skipped["paused"]) == {"automation.a", "automation.b"}
+
+
+async def test_subscribe_sends_cohort_deltas(hass: HomeAssistant) -> None:
+    data = _loaded_data(hass)
+    data.paused["automation.a"] = _paused("automation.a")
+    data.paused["automation.b"] = _paused("automation.b")
+    connection = _connection()
+    websocket_subscribe(hass, connection, {"id": 1, "type": "autosnooze/subscribe"})
+
+    cohort = form_cohort(data, [data.paused["automation.a"], data.paused["automation.b"]])
+    data.notify(["automation.a", "automation.b"])
+    data.flush_notify()
+
+    # Moving the shared deadline changes the cohort, not just its members.
+    cohort.resume_at = NOW + timedelta(hours=3)
+    for paused in data.paused.values():
+        cohort.mirror(paused)
+    data.notify(["automation.a", "automation.b"])
+    data.flush_notify()
+
+    del data.cohorts[cohort.cohort_id]
+    data.paused.clear()
+    data.notify(["automation.a", "automation.b"])
+    data.flush_notify()
+
+    _snapshot, formed, adjusted, removed = _events(connection)
+    assert formed["cohorts"]["add"][cohort.cohort_id]["entity_ids"] == ["automation.a", "automation.b"]
+    assert formed["cohorts"]["update"] == {}
+    assert adjusted["cohorts"]["add"] == {}
+    assert adjusted["cohorts"]["update"][cohort.cohort_id]["resume_at"] == (NOW + timedelta(hours=3)).isoformat()
+    assert removed["cohorts"] == {"add": {}, "update": {}, "remove": [cohort.cohort_id]}
+
+
+async def test_catalog_lists_automations_with_flags_and_honors_if_version(hass: HomeAssistant) -> None:
+    data = _loaded_data(hass)
+    data.automation_catalog_cache = AutomationCatalogCache(hass)
+    data.guardrail_cache = GuardrailCache(hass)
+    unsubscribe = data.automation_catalog_cache.async_listen()
+    include = lr.async_get(hass).async_create("AutoSnooze_Include")
+    entity_reg = er.async_get(hass)
+    entity_reg.async_get_or_create("automation", "test", "porch", suggested_object_id="porch")
+    entity_reg.async_update_entity(
+        "automation.porch", labels={include.label_id}, categories={"automation": "outdoor"}, area_id="garden"
+    )
+    hass.states.async_set("automation.porch", "on", {"friendly_name": "Porch lights"})
+    hass.states.async_set("automation.alarm", "on", {"friendly_name": "Alarm arm"})
+    hass.states.async_set("light.porch", "on", {"friendly_name": "Porch"})
+    await hass.async_block_till_done()
+    connection = _connection()
+
+    websocket_catalog(hass, connection, {"id": 1, "type": "autosnooze/catalog"})
+    result = connection.send_result.call_args.args[1]
+
+    assert result["not_modified"] is False
+    assert [automation["id"] for automation in result["automations"]] == ["automation.alarm", "automation.porch"]
+    alarm, porch = result["automations"]
+    assert alarm["critical"] is True
+    assert alarm["labels"] == []
+    assert porch == {
+        "id": "automation.porch",
+        "name": "Porch lights",
+        "area_id": "garden",
+        "category_id": "outdoor",
+        "labels": [include.label_id],
+        "include": True,
+        "exclude": False,
+        "confirm": False,
+        "critical": False,
+    }
+    assert data.guardrail_cache.get("automation.alarm", "Alarm arm") == GuardrailFlags(confirm=False, critical=True)
+    version = result["version"]
+
+    # Attribute-only state changes keep the cached catalog.
+    hass.states.async_set("automation.porch", "off", {"friendly_name": "Porch lights"})
+    await hass.async_block_till_done()
+    assert data.automation_catalog_cache.get() is not None
+    websocket_catalog(hass, connection, {"id": 2, "type": "autosnooze/catalog", "if_version": version})
+    assert connection.send_result.call_args.args[1] == {"version": version, "not_modified": True}
+
+    hass.states.async_set("automation.porch", "off", {"friendly_name": "Front porch"})
+    await hass.async_block_till_done()
+    assert data.automation_catalog_cache.get() is None
+    websocket_catalog(hass, connection, {"id": 3, "type": "autosnooze/catalog", "if_version": version})
+    renamed = connection.send_result.call_args.args[1]
+    assert renamed["not_modified"] is False
+    assert renamed["version"] != version
+    assert renamed["automations"][1]["name"] == "Front porch"
+
+    lr.async_get(hass).async_delete(include.label_id)
+    await hass.async_block_till_done()
+    assert data.automation_catalog_cache.get() is None
+    unsubscribe()
+
+
+async def test_subscribe_snapshot_matches_snapshot_command(hass: HomeAssistant) -> None:
+    data = _loaded_data(hass)
+    data.paused["automation.a"] = _paused("automation.a")
+    data.paused["automation.b"] = _paused("automation.b")
+    form_cohort(data, [data.paused["automation.a"], data.paused["automation.b"]])
+    connection = _connection()
+
+    websocket_snapshot(hass, connection, {"id": 1, "type": "autosnooze/snapshot"})
+    websocket_subscribe(hass, connection, {"id": 2, "type": "autosnooze/subscribe"})
+
+    (snapshot,) = _events(connection)
+    assert snapshot == {"type": "snapshot", **connection.send_result.call_args_list[0].args[1]}
+    assert len(snapshot["cohorts"]) == 1